@@ -2,7 +2,7 @@
 TODO: Add benches for higher number of tasks; blocked by engine deadlocks in CI.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 
 import anyio
 import pytest
@@ -93,6 +93,23 @@ def bench_flow_with_subflows(benchmark: "BenchmarkFixture", num_flows: int):
     benchmark(benchmark_flow)
 
 
+@pytest.mark.parametrize("num_flows", [5, 10, 20])
+def bench_flow_with_parametrized_subflows(
+    benchmark: "BenchmarkFixture", num_flows: int
+):
+    @flow
+    def test_flow(x: int, name: str, values: List[float], options: Dict[str, str]):
+        pass
+
+    # Parameters are validated on every call, with a validator built once per flow
+    @flow
+    def benchmark_flow():
+        for i in range(num_flows):
+            test_flow(i, name="subflow", values=[1.0, 2.0], options={"key": "value"})
+
+    benchmark(benchmark_flow)
+
+
 @pytest.mark.parametrize("num_flows", [5, 10, 20])
 def bench_async_flow_with_sequential_subflows(
     benchmark: "BenchmarkFixture", num_flows: int
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+import numpy as np
+import pytest
+
+from prefect.utilities.hashing import get_hash_algorithm, hash_inputs, hash_objects
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.fixture(scope="module")
+def large_inputs() -> Dict[str, Any]:
+    # 100 MB of float64
+    return {"x": np.random.default_rng(0).random(100 * 1024 * 1024 // 8)}
+
+
+@pytest.mark.benchmark(group="hashing")
+@pytest.mark.parametrize(
+    "hash_fn", [hash_objects, hash_inputs], ids=["serialized", "content"]
+)
+@pytest.mark.parametrize("algorithm", ["md5", "blake2b"])
+def bench_hash_large_array_inputs(
+    benchmark: "BenchmarkFixture",
+    large_inputs: Dict[str, Any],
+    hash_fn: Callable[..., Any],
+    algorithm: str,
+):
+    benchmark(hash_fn, large_inputs, hash_algo=get_hash_algorithm(algorithm))
+
+
+@pytest.mark.benchmark(group="hashing")
+def bench_hash_large_array_inputs_xxhash(
+    benchmark: "BenchmarkFixture", large_inputs: Dict[str, Any]
+):
+    pytest.importorskip("xxhash")
+
+    benchmark(hash_inputs, large_inputs, hash_algo=get_hash_algorithm("xxhash"))
@@ -1,6 +1,7 @@
 import importlib
+import subprocess
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 import pytest
 from prometheus_client import REGISTRY
@@ -8,6 +9,14 @@ from prometheus_client import REGISTRY
 if TYPE_CHECKING:
     from pytest_benchmark.fixture import BenchmarkFixture
 
+# The most time each module may take to import in a fresh interpreter, in seconds.
+# These leave room for slower machines; they are meant to catch an import that
+# pulls in a large part of Prefect, not small changes.
+IMPORT_TIME_BUDGETS = {
+    "prefect": 0.5,
+    "prefect.cli": 3.0,
+}
+
 
 def reset_imports():
     # Remove the module from sys.modules if it's there
@@ -42,3 +51,53 @@ def bench_import_prefect_flow(benchmark: "BenchmarkFixture"):
         from prefect import flow  # noqa
 
     benchmark(import_prefect_flow)
+
+
+@pytest.mark.benchmark(group="imports")
+def bench_import_prefect_cli(benchmark: "BenchmarkFixture"):
+    def import_prefect_cli():
+        reset_imports()
+
+        import prefect.cli  # noqa
+
+    benchmark(import_prefect_cli)
+
+
+def measure_import_times(module: str) -> Dict[str, float]:
+    """
+    Import a module in a fresh interpreter, returning the cumulative import time of
+    every module it imported, in seconds.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines are formatted as `import time: <self us> | <cumulative us> | <module>`
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative, name = line.split("|")
+        import_times[name.strip()] = int(cumulative) / 1_000_000
+    return import_times
+
+
+@pytest.mark.parametrize("module", IMPORT_TIME_BUDGETS)
+@pytest.mark.benchmark(group="import-budgets")
+def bench_import_time_budget(benchmark: "BenchmarkFixture", module: str):
+    import_times = benchmark(measure_import_times, module)
+
+    # Report the modules that took longest to import, so that it's clear where the
+    # time went when the budget is exceeded
+    slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)
+    benchmark.extra_info["slowest_imports"] = dict(slowest[:20])
+
+    budget = IMPORT_TIME_BUDGETS[module]
+    assert import_times[module] <= budget, (
+        f"Importing {module!r} took {import_times[module]:.2f}s, over its budget of "
+        f"{budget}s. Slowest imports:\n"
+        + "\n".join(f"  {name}: {seconds:.3f}s" for name, seconds in slowest[:20])
+    )
@@ -0,0 +1,64 @@
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List
+
+import pytest
+
+from prefect import flow
+from prefect.logging import get_run_logger
+from prefect.logging.handlers import APILogWorker
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+NUM_LOGS = 10_000
+
+
+class _StubClient:
+    async def create_logs(self, logs: List[Dict[str, Any]]) -> None:
+        pass
+
+
+class StubTransportAPILogWorker(APILogWorker):
+    @asynccontextmanager
+    async def _lifespan(self) -> AsyncGenerator[None, Any]:
+        self._client = _StubClient()
+        yield
+
+
+@pytest.mark.benchmark(group="logging")
+def bench_api_log_worker_throughput(benchmark: "BenchmarkFixture"):
+    log = {
+        "name": "prefect.task_runs",
+        "level": 20,
+        "message": "Finished in state Completed()",
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "flow_run_id": None,
+        "task_run_id": None,
+    }
+
+    def send_and_drain():
+        worker = StubTransportAPILogWorker.instance()
+        for _ in range(NUM_LOGS):
+            worker.send({**log, "__payload_size__": 200})
+        worker.drain()
+
+    benchmark(send_and_drain)
+
+    if benchmark.stats:
+        benchmark.extra_info["items_per_second"] = NUM_LOGS / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark(group="logging")
+def bench_run_logger_info(benchmark: "BenchmarkFixture"):
+    # Measures the cost on the logging thread; logs are sent to the API in the
+    # background
+    @flow
+    def benchmark_flow():
+        logger = get_run_logger()
+        benchmark(logger.info, "Finished in state Completed()")
+
+    benchmark_flow()
+
+    if benchmark.stats:
+        benchmark.extra_info["records_per_second"] = 1 / benchmark.stats.stats.mean
@@ -0,0 +1,75 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.utilities.messaging import Message, decode_message
+from prefect.server.utilities.messaging.memory import MemoryMessage, Topic
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+# the event persister, triggers, task run recorder, stream distributor and event
+# logger all consume the `events` topic
+NUM_CONSUMERS = 5
+NUM_EVENTS = 100
+
+
+def validate_independently(message: Message) -> ReceivedEvent:
+    return ReceivedEvent.model_validate_json(message.data)
+
+
+def validate_once(message: Message) -> ReceivedEvent:
+    return decode_message(message, ReceivedEvent)
+
+
+@pytest.mark.benchmark(group="messaging")
+@pytest.mark.parametrize(
+    "decode",
+    [validate_independently, validate_once],
+    ids=["independent", "shared"],
+)
+def bench_events_fanned_out_to_consumers(
+    benchmark: "BenchmarkFixture", decode: Callable[[Message], ReceivedEvent]
+):
+    topic = Topic(f"bench-{uuid4()}")
+    subscriptions = [topic.subscribe() for _ in range(NUM_CONSUMERS)]
+
+    encoded = [
+        ReceivedEvent(
+            id=uuid4(),
+            occurred=datetime.now(tz=timezone.utc),
+            event="prefect.flow-run.Completed",
+            resource={"prefect.resource.id": f"prefect.flow-run.{uuid4()}"},
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.flow.{uuid4()}",
+                    "prefect.resource.role": "flow",
+                },
+                {
+                    "prefect.resource.id": f"prefect.tag.tag-{i}",
+                    "prefect.resource.role": "tag",
+                },
+            ],
+            payload={"intended": {"from": "RUNNING", "to": "COMPLETED"}},
+        )
+        .model_dump_json()
+        .encode()
+        for i in range(NUM_EVENTS)
+    ]
+
+    async def publish_and_consume():
+        for data in encoded:
+            await topic.publish(MemoryMessage(data, {"event": "bench"}))
+            for subscription in subscriptions:
+                decode(await subscription.get())
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark(lambda: loop.run_until_complete(publish_and_consume()))
+    finally:
+        loop.close()
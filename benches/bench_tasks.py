@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+import pytest
+
 if TYPE_CHECKING:
     from pytest_benchmark.fixture import BenchmarkFixture
 
@@ -35,3 +37,62 @@ def bench_task_submit(benchmark: "BenchmarkFixture"):
         benchmark(noop_task.submit)
 
     benchmark_flow()
+
+
+async def async_noop_function(x):
+    pass
+
+
+@pytest.mark.parametrize("num_task_runs", [100, 1000])
+def bench_async_task_map(benchmark: "BenchmarkFixture", num_task_runs: int):
+    noop_task = task(async_noop_function)
+
+    # Async task runs share each worker thread's event loop and client, so this
+    # should stay close to the cost of mapping a sync task
+
+    @flow
+    def benchmark_flow():
+        benchmark(lambda: noop_task.map(range(num_task_runs)).wait())
+
+    benchmark_flow()
+
+
+def bench_default_cache_policy_key(benchmark: "BenchmarkFixture"):
+    from prefect.cache_policies import DEFAULT
+    from prefect.context import TaskRunContext
+
+    # The source portion of the key is computed once per task function, so each
+    # subsequent run only pays for hashing its inputs and run ID
+
+    @task
+    def compute_key(x):
+        benchmark(
+            DEFAULT.compute_key,
+            task_ctx=TaskRunContext.get(),
+            inputs={"x": x},
+            flow_parameters={},
+        )
+
+    @flow
+    def benchmark_flow():
+        compute_key(1)
+
+    benchmark_flow()
+
+
+@pytest.mark.parametrize("submit", ["apply_async", "apply_async_many"])
+def bench_deferred_task_submission(benchmark: "BenchmarkFixture", submit: str):
+    noop_task = task(async_noop_function)
+    parameters = [{"x": i} for i in range(500)]
+
+    def submit_one_at_a_time():
+        return [noop_task.apply_async(kwargs=kwargs) for kwargs in parameters]
+
+    def submit_in_bulk():
+        return noop_task.apply_async_many(parameters)
+
+    benchmark(submit_one_at_a_time if submit == "apply_async" else submit_in_bulk)
+
+    benchmark.extra_info["submissions_per_second"] = (
+        len(parameters) / benchmark.stats.stats.mean
+    )
@@ -0,0 +1,103 @@
+from typing import TYPE_CHECKING, List
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server.events import actions, triggers
+from prefect.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+NUM_AUTOMATIONS = 10_000
+NUM_EVENTS = 100
+
+
+@pytest.fixture
+def loaded_automations():
+    """Loads a realistic mix of automations: most watch a specific deployment's flow
+    runs, some watch every flow run by prefix, and a few match on labels only"""
+    for i in range(NUM_AUTOMATIONS):
+        if i % 100 == 0:
+            trigger = EventTrigger(
+                expect={"prefect.flow-run.*"},
+                match={"prefect.resource.id": "prefect.flow-run.*"},
+                posture=Posture.Reactive,
+                threshold=1,
+            )
+        elif i % 100 == 1:
+            trigger = EventTrigger(
+                expect={"prefect.flow-run.Failed"},
+                match={"prefect.resource.name": f"flow-{i}"},
+                posture=Posture.Reactive,
+                threshold=1,
+            )
+        else:
+            trigger = EventTrigger(
+                expect={"prefect.flow-run.Completed"},
+                match_related={
+                    "prefect.resource.id": f"prefect.deployment.{i}",
+                    "prefect.resource.role": "deployment",
+                },
+                match={"prefect.resource.id": f"prefect.flow-run.{i}"},
+                posture=Posture.Reactive,
+                threshold=1,
+            )
+        triggers.load_automation(
+            Automation(
+                name=f"automation-{i}",
+                trigger=trigger,
+                actions=[actions.DoNothing()],
+            )
+        )
+
+    yield
+
+    triggers.automations_by_id.clear()
+    triggers.triggers.clear()
+    triggers.trigger_index.clear()
+
+
+@pytest.fixture
+def events() -> List[ReceivedEvent]:
+    return [
+        ReceivedEvent(
+            occurred=pendulum.now("UTC"),
+            event="prefect.flow-run.Completed",
+            resource={
+                "prefect.resource.id": f"prefect.flow-run.{i * 97 % NUM_AUTOMATIONS}",
+                "prefect.resource.name": f"flow-{i}",
+            },
+            related=[
+                {
+                    "prefect.resource.id": f"prefect.deployment.{i}",
+                    "prefect.resource.role": "deployment",
+                }
+            ],
+            id=uuid4(),
+        )
+        for i in range(NUM_EVENTS)
+    ]
+
+
+@pytest.mark.benchmark(group="triggers")
+def bench_find_interested_triggers(
+    benchmark: "BenchmarkFixture", loaded_automations, events: List[ReceivedEvent]
+):
+    def find_for_all_events():
+        for event in events:
+            triggers.find_interested_triggers(event)
+
+    benchmark(find_for_all_events)
+
+    if benchmark.stats:
+        benchmark.extra_info["events_per_second"] = (
+            NUM_EVENTS / benchmark.stats.stats.mean
+        )
@@ -0,0 +1,123 @@
+import asyncio
+from typing import TYPE_CHECKING, List
+from uuid import uuid4
+
+import pendulum
+import pydantic
+import pytest
+
+from prefect import get_client
+from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas.actions import WorkPoolCreate
+from prefect.client.schemas.responses import SetStateStatus, WorkerFlowRunResponse
+from prefect.server.api.workers import REJECTED_CLAIMS_HEADER
+from prefect.states import Pending, Scheduled
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+NUM_WORKERS = 50
+NUM_FLOW_RUNS = 500
+FLOW_RUNS_PER_POLL = 10
+
+
+async def create_scheduled_flow_runs(client: PrefectClient) -> str:
+    work_pool_name = f"bench-{uuid4()}"
+    await client.create_work_pool(
+        work_pool=WorkPoolCreate(name=work_pool_name, type="bench")
+    )
+    flow_id = await client.create_flow_from_name(work_pool_name)
+    deployment_id = await client.create_deployment(
+        flow_id=flow_id,
+        name=work_pool_name,
+        work_pool_name=work_pool_name,
+    )
+    scheduled_time = pendulum.now("utc").subtract(minutes=1)
+    # created one at a time, since concurrent writes time out on SQLite
+    for _ in range(NUM_FLOW_RUNS):
+        await client.create_flow_run_from_deployment(
+            deployment_id, state=Scheduled(scheduled_time=scheduled_time)
+        )
+    return work_pool_name
+
+
+async def query_and_propose(client: PrefectClient, work_pool_name: str) -> List[int]:
+    """Polls like a worker that proposes `Pending` states for the flow runs it
+    reads, returning the numbers of submitted and rejected flow runs"""
+    submitted = rejected = 0
+    while True:
+        responses = await client.get_scheduled_flow_runs_for_work_pool(
+            work_pool_name=work_pool_name,
+            scheduled_before=pendulum.now("utc"),
+        )
+        if not responses:
+            return [submitted, rejected]
+        for response in responses[:FLOW_RUNS_PER_POLL]:
+            result = await client.set_flow_run_state(
+                response.flow_run.id, state=Pending()
+            )
+            if result.status == SetStateStatus.ACCEPT:
+                submitted += 1
+            else:
+                rejected += 1
+
+
+async def claim(client: PrefectClient, work_pool_name: str) -> List[int]:
+    """Polls like a worker that claims flow runs, returning the numbers of submitted
+    and rejected flow runs. Runs whose claims are rejected aren't returned, so they
+    are counted from the response headers"""
+    submitted = rejected = 0
+    while True:
+        # `claim_flow_runs_for_work_pool` drops the headers, so the request is made
+        # directly and its response validated the same way
+        response = await client._client.post(
+            f"/work_pools/{work_pool_name}/claim_flow_runs",
+            json={
+                "scheduled_before": str(pendulum.now("utc")),
+                "limit": FLOW_RUNS_PER_POLL,
+            },
+        )
+        responses = pydantic.TypeAdapter(List[WorkerFlowRunResponse]).validate_python(
+            response.json()
+        )
+        rejected_claims = int(response.headers[REJECTED_CLAIMS_HEADER])
+        if not responses and not rejected_claims:
+            return [submitted, rejected]
+        submitted += len(responses)
+        rejected += rejected_claims
+
+
+@pytest.mark.benchmark(group="workers")
+@pytest.mark.parametrize("poll", [query_and_propose, claim], ids=["query", "claim"])
+def bench_workers_polling_a_work_pool(benchmark: "BenchmarkFixture", poll):
+    # Each round needs its own scheduled flow runs, so the work pool is created in
+    # the round's setup and the round is run only once
+    loop = asyncio.new_event_loop()
+    counts: List[List[int]] = []
+
+    async def setup():
+        async with get_client() as client:
+            return (await create_scheduled_flow_runs(client),), {}
+
+    async def poll_with_all_workers(work_pool_name: str):
+        async with get_client() as client:
+            counts.extend(
+                await asyncio.gather(
+                    *(poll(client, work_pool_name) for _ in range(NUM_WORKERS))
+                )
+            )
+
+    try:
+        benchmark.pedantic(
+            lambda work_pool_name: loop.run_until_complete(
+                poll_with_all_workers(work_pool_name)
+            ),
+            setup=lambda: loop.run_until_complete(setup()),
+            rounds=1,
+        )
+    finally:
+        loop.close()
+
+    benchmark.extra_info["submitted_flow_runs"] = sum(s for s, _ in counts)
+    benchmark.extra_info["rejected_transitions"] = sum(r for _, r in counts)
@@ -1,12 +1,26 @@
 """Tasks for interacting with AWS S3"""
 
 import asyncio
+import hashlib
 import io
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union, get_args
-
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+)
+
+from boto3.s3.transfer import TransferConfig
 from botocore.paginate import PageIterator
 from botocore.response import StreamingBody
 from pydantic import Field, field_validator
@@ -771,6 +785,69 @@ def list_objects(
 
 s3_list_objects = list_objects  # backward compatibility
 
+# The default number of files transferred at once by the directory methods of
+# `S3Bucket`, which matches the size of boto3's default connection pool
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+def _file_etag(path: Union[str, Path], etag: str) -> str:
+    """
+    Computes the ETag S3 would give a local file, in the same form as `etag`.
+
+    Multipart ETags are computed with boto3's default part size, so files uploaded
+    with a different part size never match. Files are read one part at a time.
+    """
+    part_size = TransferConfig().multipart_chunksize
+    if "-" not in etag:
+        digest = hashlib.md5(usedforsecurity=False)
+        with open(path, "rb") as f:
+            while chunk := f.read(part_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    part_digests = []
+    with open(path, "rb") as f:
+        while part := f.read(part_size):
+            part_digests.append(hashlib.md5(part, usedforsecurity=False).digest())
+    combined = hashlib.md5(b"".join(part_digests), usedforsecurity=False)
+    return f"{combined.hexdigest()}-{len(part_digests)}"
+
+
+def _is_unchanged(path: Union[str, Path], obj: Dict[str, Any]) -> bool:
+    """
+    Whether a local file has the same size and ETag as an object listed from S3.
+    """
+    if not os.path.isfile(path) or os.path.getsize(path) != obj["Size"]:
+        return False
+    etag = obj["ETag"].strip('"')
+    return _file_etag(path, etag) == etag
+
+
+async def _arun_transfers(
+    transfers: List[Callable[[], Any]], max_concurrency: int
+) -> None:
+    """
+    Runs blocking transfers in worker threads, at most `max_concurrency` at a time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_transfer(transfer: Callable[[], Any]) -> None:
+        async with semaphore:
+            await run_sync_in_worker_thread(transfer)
+
+    await asyncio.gather(*(run_transfer(transfer) for transfer in transfers))
+
+
+def _run_transfers(transfers: List[Callable[[], Any]], max_concurrency: int) -> None:
+    """
+    Runs blocking transfers in a thread pool, at most `max_concurrency` at a time.
+    """
+    if not transfers:
+        return
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for future in [executor.submit(transfer) for transfer in transfers]:
+            future.result()
+
 
 class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock):
     """
@@ -894,7 +971,11 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         return bucket
 
     async def aget_directory(
-        self, from_path: Optional[str] = None, local_path: Optional[str] = None
+        self,
+        from_path: Optional[str] = None,
+        local_path: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Asynchronously copies a folder from the configured S3 bucket to a local directory.
@@ -907,6 +988,9 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
                 configured basepath.
             local_path: Local path to download S3 contents to. Defaults to the current
                 working directory.
+            max_concurrency: The maximum number of files to download at once.
+            skip_unchanged: If `True`, local files with the same size and ETag as
+                their object in S3 are not downloaded again.
         """
         bucket_folder = self.bucket_folder
         if from_path is None:
@@ -917,21 +1001,18 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         else:
             local_path = str(Path(local_path).expanduser())
 
-        bucket = self._get_bucket_resource()
-        for obj in bucket.objects.filter(Prefix=from_path):
-            if obj.key[-1] == "/":
-                # object is a folder and will be created if it contains any objects
-                continue
-            target = os.path.join(
-                local_path,
-                os.path.relpath(obj.key, from_path),
-            )
-            os.makedirs(os.path.dirname(target), exist_ok=True)
-            await run_sync_in_worker_thread(bucket.download_file, obj.key, target)
+        transfers = await run_sync_in_worker_thread(
+            self._plan_directory_download, from_path, local_path, skip_unchanged
+        )
+        await _arun_transfers(transfers, max_concurrency)
 
     @async_dispatch(aget_directory)
     def get_directory(
-        self, from_path: Optional[str] = None, local_path: Optional[str] = None
+        self,
+        from_path: Optional[str] = None,
+        local_path: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Copies a folder from the configured S3 bucket to a local directory.
@@ -944,6 +1025,9 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
                 configured basepath.
             local_path: Local path to download S3 contents to. Defaults to the current
                 working directory.
+            max_concurrency: The maximum number of files to download at once.
+            skip_unchanged: If `True`, local files with the same size and ETag as
+                their object in S3 are not downloaded again.
         """
         bucket_folder = self.bucket_folder
         if from_path is None:
@@ -954,23 +1038,54 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         else:
             local_path = str(Path(local_path).expanduser())
 
-        bucket = self._get_bucket_resource()
-        for obj in bucket.objects.filter(Prefix=from_path):
-            if obj.key[-1] == "/":
+        transfers = self._plan_directory_download(from_path, local_path, skip_unchanged)
+        _run_transfers(transfers, max_concurrency)
+
+    def _plan_directory_download(
+        self, from_path: str, local_path: str, skip_unchanged: bool
+    ) -> List[Callable[[], Any]]:
+        """
+        Lists the objects under `from_path` and returns a download for each of them,
+        creating the local directories they are downloaded to.
+
+        All downloads share a single client.
+        """
+        client = self._get_s3_client()
+        objects = self._list_objects_sync(
+            client.get_paginator("list_objects_v2").paginate(
+                Bucket=self.bucket_name, Prefix=from_path
+            )
+        )
+
+        transfers = []
+        for obj in objects:
+            if obj["Key"][-1] == "/":
                 # object is a folder and will be created if it contains any objects
                 continue
             target = os.path.join(
                 local_path,
-                os.path.relpath(obj.key, from_path),
+                os.path.relpath(obj["Key"], from_path),
             )
+            if skip_unchanged and _is_unchanged(target, obj):
+                continue
             os.makedirs(os.path.dirname(target), exist_ok=True)
-            bucket.download_file(obj.key, target)
+            transfers.append(
+                partial(
+                    client.download_file,
+                    Bucket=self.bucket_name,
+                    Key=obj["Key"],
+                    Filename=target,
+                )
+            )
+        return transfers
 
     async def aput_directory(
         self,
         local_path: Optional[str] = None,
         to_path: Optional[str] = None,
         ignore_file: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
     ) -> int:
         """
         Asynchronously uploads a directory from a given local path to the configured S3 bucket in a
@@ -985,40 +1100,23 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
                 basepath.
             ignore_file: Path to file containing gitignore style expressions for
                 filepaths to ignore.
+            max_concurrency: The maximum number of files to upload at once.
+            skip_unchanged: If `True`, files with the same size and ETag as their
+                object in S3 are not uploaded again.
 
+        Returns:
+            The number of files uploaded.
         """
-        to_path = "" if to_path is None else to_path
-
-        if local_path is None:
-            local_path = "."
-
-        included_files = None
-        if ignore_file:
-            with open(ignore_file, "r") as f:
-                ignore_patterns = f.readlines()
-
-            included_files = filter_files(local_path, ignore_patterns)
-
-        uploaded_file_count = 0
-        for local_file_path in Path(local_path).expanduser().rglob("*"):
-            if (
-                included_files is not None
-                and str(local_file_path.relative_to(local_path)) not in included_files
-            ):
-                continue
-            elif not local_file_path.is_dir():
-                remote_file_path = Path(to_path) / local_file_path.relative_to(
-                    local_path
-                )
-                with open(local_file_path, "rb") as local_file:
-                    local_file_content = local_file.read()
-
-                await self.awrite_path(
-                    remote_file_path.as_posix(), content=local_file_content
-                )
-                uploaded_file_count += 1
+        transfers = await run_sync_in_worker_thread(
+            self._plan_directory_upload,
+            local_path,
+            to_path,
+            ignore_file,
+            skip_unchanged,
+        )
+        await _arun_transfers(transfers, max_concurrency)
 
-        return uploaded_file_count
+        return len(transfers)
 
     @async_dispatch(aput_directory)
     def put_directory(
@@ -1026,6 +1124,8 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         local_path: Optional[str] = None,
         to_path: Optional[str] = None,
         ignore_file: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
     ) -> int:
         """
         Uploads a directory from a given local path to the configured S3 bucket in a
@@ -1040,7 +1140,31 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
                 basepath.
             ignore_file: Path to file containing gitignore style expressions for
                 filepaths to ignore.
+            max_concurrency: The maximum number of files to upload at once.
+            skip_unchanged: If `True`, files with the same size and ETag as their
+                object in S3 are not uploaded again.
 
+        Returns:
+            The number of files uploaded.
+        """
+        transfers = self._plan_directory_upload(
+            local_path, to_path, ignore_file, skip_unchanged
+        )
+        _run_transfers(transfers, max_concurrency)
+
+        return len(transfers)
+
+    def _plan_directory_upload(
+        self,
+        local_path: Optional[str],
+        to_path: Optional[str],
+        ignore_file: Optional[str],
+        skip_unchanged: bool,
+    ) -> List[Callable[[], Any]]:
+        """
+        Returns an upload for each file in `local_path` that is not ignored.
+
+        All uploads share a single client.
         """
         to_path = "" if to_path is None else to_path
 
@@ -1054,7 +1178,19 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
 
             included_files = filter_files(local_path, ignore_patterns)
 
-        uploaded_file_count = 0
+        client = self._get_s3_client()
+        remote_objects = {}
+        if skip_unchanged:
+            remote_objects = {
+                obj["Key"]: obj
+                for obj in self._list_objects_sync(
+                    client.get_paginator("list_objects_v2").paginate(
+                        Bucket=self.bucket_name, Prefix=self._resolve_path(to_path)
+                    )
+                )
+            }
+
+        transfers = []
         for local_file_path in Path(local_path).expanduser().rglob("*"):
             if (
                 included_files is not None
@@ -1062,18 +1198,22 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
             ):
                 continue
             elif not local_file_path.is_dir():
-                remote_file_path = Path(to_path) / local_file_path.relative_to(
-                    local_path
+                key = self._resolve_path(
+                    (Path(to_path) / local_file_path.relative_to(local_path)).as_posix()
                 )
-                with open(local_file_path, "rb") as local_file:
-                    local_file_content = local_file.read()
-
-                self.write_path(
-                    remote_file_path.as_posix(), content=local_file_content, _sync=True
+                if key in remote_objects and _is_unchanged(
+                    local_file_path, remote_objects[key]
+                ):
+                    continue
+                transfers.append(
+                    partial(
+                        client.upload_file,
+                        Filename=str(local_file_path),
+                        Bucket=self.bucket_name,
+                        Key=key,
+                    )
                 )
-                uploaded_file_count += 1
-
-        return uploaded_file_count
+        return transfers
 
     def _read_sync(self, key: str) -> bytes:
         """
@@ -1617,6 +1757,8 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         self,
         from_folder: str,
         to_folder: Optional[Union[str, Path]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
         **download_kwargs: Dict[str, Any],
     ) -> Path:
         """
@@ -1626,6 +1768,9 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         Args:
             from_folder: The path to the folder to download from.
             to_folder: The path to download the folder to.
+            max_concurrency: The maximum number of files to download at once.
+            skip_unchanged: If `True`, local files with the same size and ETag as
+                their object in S3 are not downloaded again.
             **download_kwargs: Additional keyword arguments to pass to
                 `Client.download_file`.
 
@@ -1653,31 +1798,16 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         # however, we still need to do it because we're using relative_to
         bucket_folder = self._join_bucket_folder(from_folder)
 
-        async_coros = []
-        for object in objects:
-            bucket_path = Path(object["Key"]).relative_to(bucket_folder)
-            # this skips the actual directory itself, e.g.
-            # `my_folder/` will be skipped
-            # `my_folder/notes.txt` will be downloaded
-            if bucket_path.is_dir():
-                continue
-            to_path = to_folder / bucket_path
-            to_path.parent.mkdir(parents=True, exist_ok=True)
-            to_path = str(to_path)  # must be string
-            self.logger.info(
-                f"Downloading object from bucket {self.bucket_name!r} path "
-                f"{bucket_path.as_posix()!r} to {to_path!r}."
-            )
-            async_coros.append(
-                run_sync_in_worker_thread(
-                    client.download_file,
-                    Bucket=self.bucket_name,
-                    Key=object["Key"],
-                    Filename=to_path,
-                    **download_kwargs,
-                )
-            )
-        await asyncio.gather(*async_coros)
+        transfers = await run_sync_in_worker_thread(
+            self._plan_folder_download,
+            client,
+            objects,
+            bucket_folder,
+            to_folder,
+            skip_unchanged,
+            **download_kwargs,
+        )
+        await _arun_transfers(transfers, max_concurrency)
 
         return Path(to_folder)
 
@@ -1686,6 +1816,8 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         self,
         from_folder: str,
         to_folder: Optional[Union[str, Path]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
         **download_kwargs: Dict[str, Any],
     ) -> Path:
         """
@@ -1696,6 +1828,9 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         Args:
             from_folder: The path to the folder to download from.
             to_folder: The path to download the folder to.
+            max_concurrency: The maximum number of files to download at once.
+            skip_unchanged: If `True`, local files with the same size and ETag as
+                their object in S3 are not downloaded again.
             **download_kwargs: Additional keyword arguments to pass to
                 `Client.download_file`.
 
@@ -1724,6 +1859,32 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         bucket_folder = self._join_bucket_folder(from_folder)
 
         assert isinstance(objects, list), "list of objects expected"
+        transfers = self._plan_folder_download(
+            client,
+            objects,
+            bucket_folder,
+            to_folder,
+            skip_unchanged,
+            **download_kwargs,
+        )
+        _run_transfers(transfers, max_concurrency)
+
+        return Path(to_folder)
+
+    def _plan_folder_download(
+        self,
+        client: Any,
+        objects: List[Dict[str, Any]],
+        bucket_folder: str,
+        to_folder: Path,
+        skip_unchanged: bool,
+        **download_kwargs: Dict[str, Any],
+    ) -> List[Callable[[], Any]]:
+        """
+        Returns a download for each of the listed objects within `bucket_folder`,
+        creating the local folders they are downloaded to.
+        """
+        transfers = []
         for object in objects:
             bucket_path = Path(object["Key"]).relative_to(bucket_folder)
             # this skips the actual directory itself, e.g.
@@ -1732,20 +1893,24 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
             if bucket_path.is_dir():
                 continue
             to_path = to_folder / bucket_path
+            if skip_unchanged and _is_unchanged(to_path, object):
+                continue
             to_path.parent.mkdir(parents=True, exist_ok=True)
             to_path = str(to_path)  # must be string
             self.logger.info(
                 f"Downloading object from bucket {self.bucket_name!r} path "
                 f"{bucket_path.as_posix()!r} to {to_path!r}."
             )
-            client.download_file(
-                Bucket=self.bucket_name,
-                Key=object["Key"],
-                Filename=to_path,
-                **download_kwargs,
+            transfers.append(
+                partial(
+                    client.download_file,
+                    Bucket=self.bucket_name,
+                    Key=object["Key"],
+                    Filename=to_path,
+                    **download_kwargs,
+                )
             )
-
-        return Path(to_folder)
+        return transfers
 
     async def astream_from(
         self,
@@ -2081,6 +2246,8 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         self,
         from_folder: Union[str, Path],
         to_folder: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
         **upload_kwargs: Dict[str, Any],
     ) -> Union[str, None]:
         """
@@ -2090,6 +2257,9 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         Args:
             from_folder: The path to the folder to upload from.
             to_folder: The path to upload the folder to.
+            max_concurrency: The maximum number of files to upload at once.
+            skip_unchanged: If `True`, files with the same size and ETag as their
+                object in S3 are not uploaded again.
             **upload_kwargs: Additional keyword arguments to pass to
                 `Client.upload_fileobj`.
 
@@ -2108,42 +2278,19 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         from_folder = Path(from_folder)
         bucket_folder = self._join_bucket_folder(to_folder or "")
 
-        num_uploaded = 0
         client = self.credentials.get_s3_client()
 
-        async_coros = []
-        for from_path in from_folder.rglob("**/*"):
-            # this skips the actual directory itself, e.g.
-            # `my_folder/` will be skipped
-            # `my_folder/notes.txt` will be uploaded
-            if from_path.is_dir():
-                continue
-            bucket_path = (
-                Path(bucket_folder) / from_path.relative_to(from_folder)
-            ).as_posix()
-            self.logger.info(
-                f"Uploading from {str(from_path)!r} to the bucket "
-                f"{self.bucket_name!r} path {bucket_path!r}."
-            )
-            async_coros.append(
-                run_sync_in_worker_thread(
-                    client.upload_file,
-                    Filename=str(from_path),
-                    Bucket=self.bucket_name,
-                    Key=bucket_path,
-                    **upload_kwargs,
-                )
-            )
-            num_uploaded += 1
-        await asyncio.gather(*async_coros)
+        transfers = await run_sync_in_worker_thread(
+            self._plan_folder_upload,
+            client,
+            from_folder,
+            bucket_folder,
+            skip_unchanged,
+            **upload_kwargs,
+        )
+        await _arun_transfers(transfers, max_concurrency)
 
-        if num_uploaded == 0:
-            self.logger.warning(f"No files were uploaded from {str(from_folder)!r}.")
-        else:
-            self.logger.info(
-                f"Uploaded {num_uploaded} files from {str(from_folder)!r} to "
-                f"the bucket {self.bucket_name!r} path {bucket_path!r}"
-            )
+        self._log_folder_upload(len(transfers), from_folder, bucket_folder)
 
         return to_folder
 
@@ -2152,6 +2299,8 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         self,
         from_folder: Union[str, Path],
         to_folder: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        skip_unchanged: bool = False,
         **upload_kwargs: Dict[str, Any],
     ) -> Union[str, None]:
         """
@@ -2161,6 +2310,9 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         Args:
             from_folder: The path to the folder to upload from.
             to_folder: The path to upload the folder to.
+            max_concurrency: The maximum number of files to upload at once.
+            skip_unchanged: If `True`, files with the same size and ETag as their
+                object in S3 are not uploaded again.
             **upload_kwargs: Additional keyword arguments to pass to
                 `Client.upload_fileobj`.
 
@@ -2179,9 +2331,40 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
         from_folder = Path(from_folder)
         bucket_folder = self._join_bucket_folder(to_folder or "")
 
-        num_uploaded = 0
         client = self.credentials.get_s3_client()
 
+        transfers = self._plan_folder_upload(
+            client, from_folder, bucket_folder, skip_unchanged, **upload_kwargs
+        )
+        _run_transfers(transfers, max_concurrency)
+
+        self._log_folder_upload(len(transfers), from_folder, bucket_folder)
+
+        return to_folder
+
+    def _plan_folder_upload(
+        self,
+        client: Any,
+        from_folder: Path,
+        bucket_folder: str,
+        skip_unchanged: bool,
+        **upload_kwargs: Dict[str, Any],
+    ) -> List[Callable[[], Any]]:
+        """
+        Returns an upload for each file within `from_folder`.
+        """
+        remote_objects = {}
+        if skip_unchanged:
+            remote_objects = {
+                obj["Key"]: obj
+                for obj in self._list_objects_sync(
+                    client.get_paginator("list_objects_v2").paginate(
+                        Bucket=self.bucket_name, Prefix=bucket_folder
+                    )
+                )
+            }
+
+        transfers = []
         for from_path in from_folder.rglob("**/*"):
             # this skips the actual directory itself, e.g.
             # `my_folder/` will be skipped
@@ -2191,28 +2374,36 @@ class S3Bucket(WritableFileSystem, WritableDeploymentStorage, ObjectStorageBlock
             bucket_path = (
                 Path(bucket_folder) / from_path.relative_to(from_folder)
             ).as_posix()
+            if bucket_path in remote_objects and _is_unchanged(
+                from_path, remote_objects[bucket_path]
+            ):
+                continue
             self.logger.info(
                 f"Uploading from {str(from_path)!r} to the bucket "
                 f"{self.bucket_name!r} path {bucket_path!r}."
             )
-            client.upload_file(
-                Filename=str(from_path),
-                Bucket=self.bucket_name,
-                Key=bucket_path,
-                **upload_kwargs,
+            transfers.append(
+                partial(
+                    client.upload_file,
+                    Filename=str(from_path),
+                    Bucket=self.bucket_name,
+                    Key=bucket_path,
+                    **upload_kwargs,
+                )
             )
-            num_uploaded += 1
+        return transfers
 
+    def _log_folder_upload(
+        self, num_uploaded: int, from_folder: Path, bucket_folder: str
+    ) -> None:
         if num_uploaded == 0:
             self.logger.warning(f"No files were uploaded from {str(from_folder)!r}.")
         else:
             self.logger.info(
                 f"Uploaded {num_uploaded} files from {str(from_folder)!r} to "
-                f"the bucket {self.bucket_name!r} path {bucket_path!r}"
+                f"the bucket {self.bucket_name!r} path {bucket_folder!r}"
             )
 
-        return to_folder
-
     def copy_object(
         self,
         from_path: Union[str, Path],
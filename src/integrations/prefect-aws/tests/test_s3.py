@@ -1,15 +1,20 @@
+import hashlib
 import io
 import os
+import threading
+import time
 from pathlib import Path, PurePosixPath, PureWindowsPath
 
 import boto3
 import pytest
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, EndpointConnectionError
 from moto import mock_s3
 from prefect_aws import AwsCredentials, MinIOCredentials
 from prefect_aws.client_parameters import AwsClientParameters
 from prefect_aws.s3 import (
     S3Bucket,
+    _file_etag,
     acopy_objects,
     adownload_from_bucket,
     alist_objects,
@@ -739,6 +744,112 @@ async def test_put_directory_respects_local_path(
     assert (tmp_path / "downloaded_files" / "folder2" / "file5.txt").exists()
 
 
+async def test_get_directory_skips_unchanged_files(
+    nested_s3_bucket_structure, s3_bucket: S3Bucket, tmp_path: Path
+):
+    await s3_bucket.get_directory(local_path=str(tmp_path))
+
+    unchanged = tmp_path / "object.txt"
+    os.utime(unchanged, ns=(0, 0))
+    changed = tmp_path / "level1" / "object_level1.txt"
+    changed.write_text("CHANGED LOCALLY")
+
+    await s3_bucket.get_directory(local_path=str(tmp_path), skip_unchanged=True)
+
+    assert unchanged.stat().st_mtime_ns == 0
+    assert changed.read_text() == "TEST"
+
+
+async def test_put_directory_skips_unchanged_files(s3_bucket: S3Bucket, tmp_path: Path):
+    (tmp_path / "file1.txt").write_text("FILE 1")
+    (tmp_path / "folder1").mkdir()
+    (tmp_path / "folder1" / "file2.txt").write_text("FILE 2")
+
+    assert await s3_bucket.put_directory(local_path=str(tmp_path)) == 2
+    assert (
+        await s3_bucket.put_directory(local_path=str(tmp_path), skip_unchanged=True)
+        == 0
+    )
+
+    (tmp_path / "file1.txt").write_text("FILE 1, CHANGED")
+
+    assert (
+        await s3_bucket.put_directory(local_path=str(tmp_path), skip_unchanged=True)
+        == 1
+    )
+    assert await s3_bucket.read_path("file1.txt") == b"FILE 1, CHANGED"
+
+
+async def test_put_directory_skips_unchanged_multipart_files(
+    s3_bucket: S3Bucket, tmp_path: Path
+):
+    # larger than boto3's default multipart threshold
+    (tmp_path / "large.bin").write_bytes(os.urandom(9 * 1024 * 1024))
+
+    assert await s3_bucket.put_directory(local_path=str(tmp_path)) == 1
+    assert (
+        await s3_bucket.put_directory(local_path=str(tmp_path), skip_unchanged=True)
+        == 0
+    )
+
+
+@pytest.mark.parametrize("multipart", [False, True])
+def test_file_etag_reads_files_one_part_at_a_time(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, multipart: bool
+):
+    data = os.urandom(10)
+    path = tmp_path / "file.bin"
+    path.write_bytes(data)
+    monkeypatch.setattr(
+        "prefect_aws.s3.TransferConfig", lambda: TransferConfig(multipart_chunksize=4)
+    )
+
+    if multipart:
+        digests = b"".join(
+            hashlib.md5(data[i : i + 4]).digest() for i in range(0, 10, 4)
+        )
+        expected = f"{hashlib.md5(digests).hexdigest()}-3"
+    else:
+        expected = hashlib.md5(data).hexdigest()
+
+    assert _file_etag(path, "etag-3" if multipart else "etag") == expected
+
+
+async def test_put_directory_limits_concurrent_uploads(
+    s3_bucket: S3Bucket, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    for i in range(20):
+        (tmp_path / f"file{i}.txt").write_text(f"FILE {i}")
+
+    client = s3_bucket._get_s3_client()
+    upload_file = client.upload_file
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def tracking_upload_file(**kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            time.sleep(0.05)
+            return upload_file(**kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    client.upload_file = tracking_upload_file
+    monkeypatch.setattr(S3Bucket, "_get_s3_client", lambda self: client)
+
+    uploaded_file_count = await s3_bucket.put_directory(
+        local_path=str(tmp_path), max_concurrency=4
+    )
+
+    assert uploaded_file_count == 20
+    assert 1 < max_in_flight <= 4
+
+
 def test_read_path_in_sync_context(s3_bucket_with_file):
     """Test that read path works in a sync context."""
     s3_bucket, key = s3_bucket_with_file
@@ -885,6 +996,25 @@ class TestS3Bucket:
         to_path = Path(to_path)
         assert (to_path / "object").read_text() == "TEST OBJECT IN FOLDER"
 
+    @pytest.mark.parametrize("client_parameters", aws_clients[-1:], indirect=True)
+    def test_download_folder_to_path_skips_unchanged_files(
+        self, s3_bucket_with_objects: S3Bucket, client_parameters, tmp_path
+    ):
+        s3_bucket_with_objects.download_folder_to_path("folder", tmp_path)
+        downloaded = tmp_path / "object"
+        os.utime(downloaded, ns=(0, 0))
+
+        s3_bucket_with_objects.download_folder_to_path(
+            "folder", tmp_path, skip_unchanged=True
+        )
+        assert downloaded.stat().st_mtime_ns == 0
+
+        downloaded.write_text("CHANGED LOCALLY")
+        s3_bucket_with_objects.download_folder_to_path(
+            "folder", tmp_path, skip_unchanged=True
+        )
+        assert downloaded.read_text() == "TEST OBJECT IN FOLDER"
+
     @pytest.mark.parametrize("client_parameters", aws_clients[-1:], indirect=True)
     def test_download_object_with_bucket_folder(
         self, s3_bucket_empty: S3Bucket, client_parameters, tmp_path
@@ -993,6 +1123,24 @@ class TestS3Bucket:
         else:
             raise AssertionError("Files did upload")
 
+    @pytest.mark.parametrize("client_parameters", aws_clients[-1:], indirect=True)
+    def test_upload_from_folder_skips_unchanged_files(
+        self, s3_bucket_empty: S3Bucket, client_parameters, tmp_path
+    ):
+        (tmp_path / "object").write_text("OBJECT")
+        (tmp_path / "other_object").write_text("OTHER OBJECT")
+        s3_bucket_empty.upload_from_folder(tmp_path)
+
+        (tmp_path / "other_object").write_text("CHANGED OBJECT")
+        client = s3_bucket_empty.credentials.get_s3_client()
+        transfers = s3_bucket_empty._plan_folder_upload(
+            client, tmp_path, "", skip_unchanged=True
+        )
+        assert [transfer.keywords["Key"] for transfer in transfers] == ["other_object"]
+
+        s3_bucket_empty.upload_from_folder(tmp_path, skip_unchanged=True)
+        assert s3_bucket_empty.read_path("other_object") == b"CHANGED OBJECT"
+
     @pytest.mark.parametrize("client_parameters", aws_clients[-1:], indirect=True)
     def test_copy_object(
         self,
@@ -7,6 +7,7 @@ import kubernetes_asyncio.watch
 from kubernetes_asyncio.client import ApiClient, V1Pod
 
 from prefect.events import Event, RelatedResource, emit_event
+from prefect_kubernetes.informer import KubernetesJobInformer
 
 EVICTED_REASONS = {
     "OOMKilled",
@@ -33,8 +34,10 @@ class KubernetesEventsReplicator:
         worker_resource: Dict[str, str],
         related_resources: List[RelatedResource],
         timeout_seconds: int,
+        informer: Optional[KubernetesJobInformer] = None,
     ):
         self._client = client
+        self._informer = informer
         self._job_name = job_name
         self._namespace = namespace
         self._timeout_seconds = timeout_seconds
@@ -75,7 +78,11 @@ class KubernetesEventsReplicator:
         last_event = None
 
         core_client = kubernetes_asyncio.client.CoreV1Api(api_client=self._client)
-        watch = kubernetes_asyncio.watch.Watch()
+        watch = (
+            self._informer.watch_pods(self._job_name)
+            if self._informer
+            else kubernetes_asyncio.watch.Watch()
+        )
         async with watch:
             async for event in watch.stream(
                 func=core_client.list_namespaced_pod,
@@ -0,0 +1,325 @@
+"""
+A shared watch of the jobs and pods created by a Kubernetes worker.
+
+Rather than opening a job watch and pod watches for every flow run it supervises, a
+worker can start one `KubernetesJobInformer` per cluster and namespace. The informer
+watches the worker's flow run jobs and their pods once and fans each event out to the
+runs waiting on that job.
+"""
+
+import asyncio
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import aiohttp
+import kubernetes_asyncio
+import kubernetes_asyncio.watch
+from kubernetes_asyncio.client import ApiClient, BatchV1Api, CoreV1Api
+from kubernetes_asyncio.client.exceptions import ApiException
+
+from prefect.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Every job created by a worker is labeled with the ID of its flow run
+JOB_LABEL_SELECTOR = "prefect.io/flow-run-id"
+# Kubernetes labels the pods of every job with the name of the job
+JOB_NAME_LABEL = "job-name"
+POD_LABEL_SELECTOR = JOB_NAME_LABEL
+# Jobs watched by a worker's informer are labeled with the name of the worker
+WORKER_NAME_LABEL = "prefect.io/worker-name"
+
+WATCH_RETRY_DELAY_SECONDS = 5
+
+
+class KubernetesJobInformer:
+    """
+    Watches the flow run jobs in a namespace, and their pods, with a single job watch
+    and a single pod watch.
+
+    The latest version of each job and pod is kept, so that runs that start listening
+    after their job was created still see its current state. Jobs and pods are
+    forgotten when they are deleted, or once the job has finished and is neither
+    tracked nor watched anymore.
+
+    Args:
+        client: The client to watch jobs and pods with.
+        namespace: The namespace to watch.
+        label_selector: An additional label selector for the jobs and pods to watch,
+            such as the label of the worker that created them.
+
+    Example:
+        ```python
+        async with KubernetesJobInformer(
+            client, namespace="default", label_selector="prefect.io/worker-name=my-worker"
+        ) as informer:
+            with informer.track("my-job"):
+                async with informer.watch_jobs("my-job") as watch:
+                    async for event in watch.stream():
+                        print(event["type"], event["object"].status)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "ApiClient",
+        namespace: str,
+        label_selector: Optional[str] = None,
+    ):
+        self._client = client
+        self._namespace = namespace
+        self._label_selector = label_selector
+
+        # The latest event for each job, and for each pod by job name and pod name
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._pods: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+
+        self._job_listeners: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._pod_listeners: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        # The number of runs supervising each job
+        self._tracked: Counter = Counter()
+
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        """Start watching jobs and pods when entering the context."""
+        batch_client = BatchV1Api(api_client=self._client)
+        core_client = CoreV1Api(api_client=self._client)
+        self._tasks = {
+            asyncio.create_task(
+                self._watch(
+                    batch_client.list_namespaced_job,
+                    self._with_label_selector(JOB_LABEL_SELECTOR),
+                    self._handle_job_event,
+                )
+            ),
+            asyncio.create_task(
+                self._watch(
+                    core_client.list_namespaced_pod,
+                    self._with_label_selector(POD_LABEL_SELECTOR),
+                    self._handle_pod_event,
+                )
+            ),
+        }
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Stop watching jobs and pods when exiting the context."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = set()
+
+    @contextmanager
+    def track(self, job_name: str):
+        """
+        Keeps the latest state of the job with the given name, and of its pods, while
+        the context is open, even when no watch is listening for them.
+        """
+        self._tracked[job_name] += 1
+        try:
+            yield
+        finally:
+            self._tracked[job_name] -= 1
+            if not self._tracked[job_name]:
+                del self._tracked[job_name]
+            self._evict_if_finished(job_name)
+
+    def watch_jobs(self, job_name: str) -> "InformerWatch":
+        """
+        Returns a stand-in for `kubernetes_asyncio.watch.Watch` that streams the
+        events for the job with the given name.
+        """
+        return InformerWatch(
+            self._job_listeners,
+            job_name,
+            current=[self._jobs[job_name]] if job_name in self._jobs else [],
+            on_close=self._evict_if_finished,
+        )
+
+    def watch_pods(self, job_name: str) -> "InformerWatch":
+        """
+        Returns a stand-in for `kubernetes_asyncio.watch.Watch` that streams the
+        events for the pods of the job with the given name.
+        """
+        return InformerWatch(
+            self._pod_listeners,
+            job_name,
+            current=list(self._pods.get(job_name, {}).values()),
+            on_close=self._evict_if_finished,
+        )
+
+    def _with_label_selector(self, label_selector: str) -> str:
+        if self._label_selector:
+            return f"{label_selector},{self._label_selector}"
+        return label_selector
+
+    def _is_wanted(self, job_name: str) -> bool:
+        return (
+            job_name in self._tracked
+            or job_name in self._job_listeners
+            or job_name in self._pod_listeners
+        )
+
+    def _evict_if_finished(self, job_name: str) -> None:
+        """
+        Forget a job and its pods once the job has finished and no run is tracking or
+        watching it anymore.
+        """
+        event = self._jobs.get(job_name)
+        if event is None or self._is_wanted(job_name):
+            return
+        if not _is_finished(event["object"]):
+            return
+
+        self._jobs.pop(job_name, None)
+        self._pods.pop(job_name, None)
+
+    async def _watch(
+        self,
+        func: Callable,
+        label_selector: str,
+        handle_event: Callable[[Dict[str, Any]], None],
+    ) -> None:
+        """
+        Watch the objects returned by `func`, restarting the watch whenever it ends.
+
+        Pick up from the last resource version seen, or relist everything in the case
+        of a 410.
+
+        See https://kubernetes.io/docs/reference/using-api/api-concepts/#efficient-detection-of-changes  # noqa
+        """
+        watch = kubernetes_asyncio.watch.Watch()
+        resource_version = None
+        async with watch:
+            while True:
+                watch_kwargs = (
+                    {"resource_version": resource_version} if resource_version else {}
+                )
+                try:
+                    async for event in watch.stream(
+                        func=func,
+                        namespace=self._namespace,
+                        label_selector=label_selector,
+                        _request_timeout=aiohttp.ClientTimeout(),
+                        **watch_kwargs,
+                    ):
+                        resource_version = event["object"].metadata.resource_version
+                        handle_event(event)
+                except Exception as exc:
+                    if isinstance(exc, ApiException) and exc.status == 410:
+                        resource_version = None
+                        continue
+
+                    logger.warning(
+                        "Error watching %r in namespace %r. Retrying in %s seconds.",
+                        func.__name__,
+                        self._namespace,
+                        WATCH_RETRY_DELAY_SECONDS,
+                        exc_info=True,
+                    )
+                    await asyncio.sleep(WATCH_RETRY_DELAY_SECONDS)
+
+    def _handle_job_event(self, event: Dict[str, Any]) -> None:
+        job_name = event["object"].metadata.name
+
+        if event["type"] == "DELETED":
+            self._jobs.pop(job_name, None)
+            self._pods.pop(job_name, None)
+        else:
+            self._jobs[job_name] = event
+
+        for queue in self._job_listeners.get(job_name, ()):
+            queue.put_nowait(event)
+
+        self._evict_if_finished(job_name)
+
+    def _handle_pod_event(self, event: Dict[str, Any]) -> None:
+        pod = event["object"]
+        job_name = (pod.metadata.labels or {}).get(JOB_NAME_LABEL)
+        if not job_name:
+            return
+
+        if event["type"] == "DELETED":
+            pods = self._pods.get(job_name, {})
+            pods.pop(pod.metadata.name, None)
+            if not pods:
+                self._pods.pop(job_name, None)
+        elif job_name in self._jobs or self._is_wanted(job_name):
+            # Pods of jobs that have been forgotten are not kept
+            self._pods[job_name][pod.metadata.name] = event
+
+        for queue in self._pod_listeners.get(job_name, ()):
+            queue.put_nowait(event)
+
+
+def _is_finished(job: Any) -> bool:
+    """Whether a job has completed or failed."""
+    if job.status.completion_time:
+        return True
+    return any(
+        condition.type in ("Complete", "Failed") and condition.status == "True"
+        for condition in job.status.conditions or ()
+    )
+
+
+class InformerWatch:
+    """
+    Streams the events for one job from a `KubernetesJobInformer`.
+
+    This has the same interface as `kubernetes_asyncio.watch.Watch`, so it can be used
+    in its place. The watch starts listening when entering its context, and the
+    current state of the job is streamed first.
+    """
+
+    def __init__(
+        self,
+        listeners: Dict[str, Set[asyncio.Queue]],
+        job_name: str,
+        current: List[Dict[str, Any]],
+        on_close: Optional[Callable[[str], None]] = None,
+    ):
+        self._listeners = listeners
+        self._job_name = job_name
+        self._on_close = on_close
+        self._queue: asyncio.Queue = asyncio.Queue()
+        for event in current:
+            self._queue.put_nowait(event)
+
+    async def __aenter__(self):
+        self._listeners[self._job_name].add(self._queue)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        queues = self._listeners.get(self._job_name, set())
+        queues.discard(self._queue)
+        if not queues:
+            self._listeners.pop(self._job_name, None)
+        if self._on_close:
+            self._on_close(self._job_name)
+
+    async def stream(
+        self, *args: Any, timeout_seconds: Optional[float] = None, **kwargs: Any
+    ):
+        """
+        Stream events until `timeout_seconds` pass, if set.
+
+        Other arguments are accepted for compatibility with
+        `kubernetes_asyncio.watch.Watch.stream` and ignored, since the informer
+        already selects the objects to watch.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds if timeout_seconds else None
+        while True:
+            if deadline is None:
+                yield await self._queue.get()
+                continue
+
+            try:
+                event = await asyncio.wait_for(
+                    self._queue.get(), timeout=deadline - loop.time()
+                )
+            except asyncio.TimeoutError:
+                return
+            yield event
@@ -23,6 +23,11 @@ class KubernetesWorkerSettings(PrefectBaseSettings):
         ),
     )
 
+    shared_watch: bool = Field(
+        default=False,
+        description="If `True`, the worker watches the jobs and pods it creates with one watch per namespace that is shared by all flow runs, instead of separate watches for each flow run. The jobs and pods are labeled with `prefect.io/worker-name` so that each worker only watches its own.",
+    )
+
     add_tcp_keepalive: bool = Field(
         default=True,
         description="If `True`, the worker will add TCP keepalive to the Kubernetes client.",
@@ -106,7 +106,7 @@ import enum
 import json
 import logging
 import shlex
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
 from datetime import datetime
 from typing import (
     Any,
@@ -119,6 +119,7 @@ from typing import (
 )
 
 import aiohttp
+import anyio
 import anyio.abc
 import kubernetes_asyncio
 from jsonpatch import JsonPatch
@@ -159,6 +160,7 @@ from prefect.workers.base import (
 )
 from prefect_kubernetes.credentials import KubernetesClusterConfig
 from prefect_kubernetes.events import KubernetesEventsReplicator
+from prefect_kubernetes.informer import WORKER_NAME_LABEL, KubernetesJobInformer
 from prefect_kubernetes.settings import KubernetesSettings
 from prefect_kubernetes.utilities import (
     KeepAliveClientRequest,
@@ -572,6 +574,9 @@ class KubernetesWorker(BaseWorker):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._created_secrets = {}
+        self._job_informers: Dict[Tuple, KubernetesJobInformer] = {}
+        self._job_informers_lock = anyio.Lock()
+        self._job_informers_exit_stack = AsyncExitStack()
 
     async def run(
         self,
@@ -594,31 +599,40 @@ class KubernetesWorker(BaseWorker):
                 final state of the flow run
         """
         logger = self.get_flow_run_logger(flow_run)
+        informer = (
+            await self._get_job_informer(configuration)
+            if KubernetesSettings().worker.shared_watch
+            else None
+        )
+        if informer:
+            self._add_worker_label(configuration)
         async with self._get_configured_kubernetes_client(configuration) as client:
             logger.info("Creating Kubernetes job...")
 
             job = await self._create_job(configuration, client)
 
-            pid = await self._get_infrastructure_pid(job, client)
-            # Indicate that the job has started
-            if task_status is not None:
-                task_status.started(pid)
-
-            # Monitor the job until completion
-            events_replicator = KubernetesEventsReplicator(
-                client=client,
-                job_name=job.metadata.name,
-                namespace=configuration.namespace,
-                worker_resource=self._event_resource(),
-                related_resources=self._event_related_resources(
-                    configuration=configuration
-                ),
-                timeout_seconds=configuration.pod_watch_timeout_seconds,
-            )
-            async with events_replicator:
-                status_code = await self._watch_job(
-                    logger, job.metadata.name, configuration, client
+            with informer.track(job.metadata.name) if informer else nullcontext():
+                pid = await self._get_infrastructure_pid(job, client)
+                # Indicate that the job has started
+                if task_status is not None:
+                    task_status.started(pid)
+
+                # Monitor the job until completion
+                events_replicator = KubernetesEventsReplicator(
+                    client=client,
+                    job_name=job.metadata.name,
+                    namespace=configuration.namespace,
+                    worker_resource=self._event_resource(),
+                    related_resources=self._event_related_resources(
+                        configuration=configuration
+                    ),
+                    timeout_seconds=configuration.pod_watch_timeout_seconds,
+                    informer=informer,
                 )
+                async with events_replicator:
+                    status_code = await self._watch_job(
+                        logger, job.metadata.name, configuration, client, informer
+                    )
 
             return KubernetesWorkerResult(identifier=pid, status_code=status_code)
 
@@ -626,6 +640,56 @@ class KubernetesWorker(BaseWorker):
         await super().teardown(*exc_info)
 
         await self._clean_up_created_secrets()
+        await self._job_informers_exit_stack.aclose()
+        self._job_informers.clear()
+
+    async def _get_job_informer(
+        self, configuration: KubernetesWorkerJobConfiguration
+    ) -> KubernetesJobInformer:
+        """
+        Returns the informer shared by all flow runs in the cluster and namespace of
+        the given configuration, starting it if necessary.
+        """
+        key: Tuple = (configuration.namespace,)
+        if configuration.cluster_config:
+            key += (
+                json.dumps(configuration.cluster_config.config, sort_keys=True),
+                configuration.cluster_config.context_name,
+            )
+
+        async with self._job_informers_lock:
+            if key not in self._job_informers:
+                client = await self._job_informers_exit_stack.enter_async_context(
+                    self._get_configured_kubernetes_client(configuration)
+                )
+                self._job_informers[
+                    key
+                ] = await self._job_informers_exit_stack.enter_async_context(
+                    KubernetesJobInformer(
+                        client,
+                        configuration.namespace,
+                        label_selector=(
+                            f"{WORKER_NAME_LABEL}={self._worker_label_value()}"
+                        ),
+                    )
+                )
+            return self._job_informers[key]
+
+    def _worker_label_value(self) -> str:
+        return _slugify_label_value(self.name)
+
+    def _add_worker_label(self, configuration: KubernetesWorkerJobConfiguration):
+        """
+        Labels the job and its pods with the name of the worker, so that the worker's
+        informers only watch the jobs it created.
+        """
+        labels = {WORKER_NAME_LABEL: self._worker_label_value()}
+        job_metadata = configuration.job_manifest["metadata"]
+        pod_metadata = configuration.job_manifest["spec"]["template"].setdefault(
+            "metadata", {}
+        )
+        for metadata in (job_metadata, pod_metadata):
+            metadata["labels"] = {**(metadata.get("labels") or {}), **labels}
 
     async def _clean_up_created_secrets(self):
         """Deletes any secrets created during the worker's operation."""
@@ -898,16 +962,21 @@ class KubernetesWorker(BaseWorker):
         job_name: str,
         namespace: str,
         watch_kwargs: dict,
+        informer: Optional[KubernetesJobInformer] = None,
     ):
         """
-        Stream job events.
+        Stream job events, from the worker's shared informer if one is given.
 
         Pick up from the current resource version returned by the API
         in the case of a 410.
 
         See https://kubernetes.io/docs/reference/using-api/api-concepts/#efficient-detection-of-changes  # noqa
         """
-        watch = kubernetes_asyncio.watch.Watch()
+        watch = (
+            informer.watch_jobs(job_name)
+            if informer
+            else kubernetes_asyncio.watch.Watch()
+        )
         resource_version = None
         async with watch:
             while True:
@@ -933,7 +1002,9 @@ class KubernetesWorker(BaseWorker):
                     else:
                         raise
 
-    async def _monitor_job_events(self, batch_client, job_name, logger, configuration):
+    async def _monitor_job_events(
+        self, batch_client, job_name, logger, configuration, informer=None
+    ):
         job = await batch_client.read_namespaced_job(
             name=job_name, namespace=configuration.namespace
         )
@@ -950,6 +1021,7 @@ class KubernetesWorker(BaseWorker):
                 job_name,
                 configuration.namespace,
                 watch_kwargs,
+                informer,
             ):
                 if event["type"] == "DELETED":
                     logger.error(f"Job {job_name!r}: Job has been deleted.")
@@ -985,6 +1057,7 @@ class KubernetesWorker(BaseWorker):
         job_name: str,
         configuration: KubernetesWorkerJobConfiguration,
         client: "ApiClient",
+        informer: Optional[KubernetesJobInformer] = None,
     ) -> int:
         """
         Watch a job.
@@ -998,7 +1071,7 @@ class KubernetesWorker(BaseWorker):
         if not job:
             return -1
 
-        pod = await self._get_job_pod(logger, job_name, configuration, client)
+        pod = await self._get_job_pod(logger, job_name, configuration, client, informer)
         if not pod:
             return -1
 
@@ -1010,6 +1083,7 @@ class KubernetesWorker(BaseWorker):
                     job_name,
                     logger,
                     configuration,
+                    informer,
                 )
             ]
             try:
@@ -1115,10 +1189,15 @@ class KubernetesWorker(BaseWorker):
         job_name: str,
         configuration: KubernetesWorkerJobConfiguration,
         client: "ApiClient",
+        informer: Optional[KubernetesJobInformer] = None,
     ) -> Optional["V1Pod"]:
         """Get the first running pod for a job."""
 
-        watch = kubernetes_asyncio.watch.Watch()
+        watch = (
+            informer.watch_pods(job_name)
+            if informer
+            else kubernetes_asyncio.watch.Watch()
+        )
         logger.info(f"Job {job_name!r}: Starting watch for pod start...")
         last_phase = None
         last_pod_name: Optional[str] = None
@@ -0,0 +1,349 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from kubernetes_asyncio.client import (
+    V1Job,
+    V1JobCondition,
+    V1JobSpec,
+    V1JobStatus,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodStatus,
+)
+from kubernetes_asyncio.client.exceptions import ApiException
+from prefect_kubernetes.informer import KubernetesJobInformer
+from prefect_kubernetes.worker import KubernetesWorker
+
+
+class FakeKubernetes:
+    """
+    A fake Kubernetes API that records every watch that is opened and streams the
+    events it is sent to the open watches for that kind of object.
+    """
+
+    def __init__(self):
+        self.connections: List[Dict[str, Any]] = []
+        self.watches: Dict[str, List[asyncio.Queue]] = defaultdict(list)
+        self.resource_version = 0
+
+    def Watch(self) -> "FakeWatch":
+        return FakeWatch(self)
+
+    async def connected(self, count: int):
+        while len(self.connections) < count:
+            await asyncio.sleep(0)
+
+    def send(self, kind: str, event: Any):
+        for queue in self.watches[kind]:
+            queue.put_nowait(event)
+
+    def job(
+        self,
+        event_type: str,
+        name: str,
+        completion_time: Optional[str] = None,
+        succeeded: Optional[int] = None,
+        conditions: Optional[List[V1JobCondition]] = None,
+    ):
+        self.resource_version += 1
+        job = V1Job(
+            metadata=V1ObjectMeta(
+                name=name, resource_version=str(self.resource_version)
+            ),
+            spec=V1JobSpec(template=MagicMock(), backoff_limit=6),
+            status=V1JobStatus(
+                completion_time=completion_time,
+                succeeded=succeeded,
+                conditions=conditions,
+            ),
+        )
+        self.send("list_namespaced_job", {"type": event_type, "object": job})
+
+    def pod(self, event_type: str, job_name: str, name: str, phase: str):
+        self.resource_version += 1
+        pod = V1Pod(
+            metadata=V1ObjectMeta(
+                name=name,
+                labels={"job-name": job_name},
+                resource_version=str(self.resource_version),
+            ),
+            status=V1PodStatus(phase=phase),
+        )
+        self.send("list_namespaced_pod", {"type": event_type, "object": pod})
+
+
+class FakeWatch:
+    def __init__(self, kubernetes: FakeKubernetes):
+        self._kubernetes = kubernetes
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def stream(self, func, **kwargs):
+        queue = asyncio.Queue()
+        self._kubernetes.watches[func.__name__].append(queue)
+        self._kubernetes.connections.append({"func": func.__name__, **kwargs})
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            self._kubernetes.watches[func.__name__].remove(queue)
+
+
+@pytest.fixture
+def kubernetes(monkeypatch) -> FakeKubernetes:
+    kubernetes = FakeKubernetes()
+    monkeypatch.setattr("kubernetes_asyncio.watch.Watch", kubernetes.Watch)
+    return kubernetes
+
+
+@pytest.fixture
+async def informer(kubernetes: FakeKubernetes):
+    async with KubernetesJobInformer(
+        MagicMock(),
+        "test-namespace",
+        label_selector="prefect.io/worker-name=test-worker",
+    ) as informer:
+        await kubernetes.connected(2)
+        yield informer
+
+
+async def next_event(watch, timeout_seconds: float = 1) -> Dict[str, Any]:
+    async for event in watch.stream(timeout_seconds=timeout_seconds):
+        return event
+    raise AssertionError("No event received")
+
+
+async def test_watches_jobs_and_pods_by_label(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    assert sorted(
+        (c["func"], c["namespace"], c["label_selector"]) for c in kubernetes.connections
+    ) == [
+        (
+            "list_namespaced_job",
+            "test-namespace",
+            "prefect.io/flow-run-id,prefect.io/worker-name=test-worker",
+        ),
+        (
+            "list_namespaced_pod",
+            "test-namespace",
+            "job-name,prefect.io/worker-name=test-worker",
+        ),
+    ]
+
+
+async def test_streams_events_for_the_watched_job_only(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    async with informer.watch_jobs("job-a") as jobs, informer.watch_pods(
+        "job-a"
+    ) as pods:
+        kubernetes.job("ADDED", "job-b")
+        kubernetes.pod("ADDED", "job-b", "pod-b", "Pending")
+        kubernetes.job("ADDED", "job-a")
+        kubernetes.pod("ADDED", "job-a", "pod-a", "Pending")
+
+        job_event = await next_event(jobs)
+        pod_event = await next_event(pods)
+
+    assert job_event["object"].metadata.name == "job-a"
+    assert pod_event["object"].metadata.name == "pod-a"
+
+
+async def test_streams_current_state_to_late_watchers(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    kubernetes.job("ADDED", "job-a")
+    kubernetes.pod("ADDED", "job-a", "pod-a", "Pending")
+    kubernetes.pod("MODIFIED", "job-a", "pod-a", "Running")
+    await asyncio.sleep(0.01)
+
+    async with informer.watch_pods("job-a") as pods:
+        event = await next_event(pods)
+
+    assert event["type"] == "MODIFIED"
+    assert event["object"].status.phase == "Running"
+
+
+async def test_forgets_deleted_jobs_and_pods(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    kubernetes.job("ADDED", "job-a")
+    kubernetes.pod("ADDED", "job-a", "pod-a", "Pending")
+    kubernetes.job("DELETED", "job-a")
+    await asyncio.sleep(0.01)
+
+    assert informer._jobs == {}
+    assert informer._pods == {}
+
+
+async def test_forgets_finished_jobs_that_are_not_watched(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    kubernetes.job("ADDED", "job-a")
+    kubernetes.job("ADDED", "job-b")
+    kubernetes.pod("ADDED", "job-a", "pod-a", "Running")
+    kubernetes.pod("ADDED", "job-b", "pod-b", "Running")
+    kubernetes.job("MODIFIED", "job-a", completion_time="2024-01-01T00:00:00Z")
+    kubernetes.job(
+        "MODIFIED",
+        "job-b",
+        conditions=[V1JobCondition(type="Failed", status="True")],
+    )
+    kubernetes.pod("MODIFIED", "job-a", "pod-a", "Succeeded")
+    await asyncio.sleep(0.01)
+
+    assert informer._jobs == {}
+    assert informer._pods == {}
+
+
+async def test_keeps_finished_jobs_while_they_are_tracked(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    with informer.track("job-a"):
+        kubernetes.job("ADDED", "job-a")
+        kubernetes.pod("ADDED", "job-a", "pod-a", "Succeeded")
+        kubernetes.job("MODIFIED", "job-a", completion_time="2024-01-01T00:00:00Z")
+        await asyncio.sleep(0.01)
+
+        async with informer.watch_pods("job-a") as pods:
+            event = await next_event(pods)
+        assert event["object"].status.phase == "Succeeded"
+        assert "job-a" in informer._jobs
+
+    assert informer._jobs == {}
+    assert informer._pods == {}
+
+
+async def test_forgets_finished_jobs_when_the_last_watch_exits(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    async with informer.watch_jobs("job-a") as jobs:
+        kubernetes.job("ADDED", "job-a", completion_time="2024-01-01T00:00:00Z")
+        await next_event(jobs)
+        assert "job-a" in informer._jobs
+
+    assert informer._jobs == {}
+
+
+async def test_stream_ends_after_timeout(informer: KubernetesJobInformer):
+    async with informer.watch_pods("job-a") as pods:
+        events = [event async for event in pods.stream(timeout_seconds=0.1)]
+
+    assert events == []
+
+
+async def test_stops_listening_when_the_watch_exits(informer: KubernetesJobInformer):
+    async with informer.watch_jobs("job-a"):
+        assert len(informer._job_listeners["job-a"]) == 1
+
+    assert "job-a" not in informer._job_listeners
+
+
+async def test_resumes_from_last_resource_version_when_the_watch_ends(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    kubernetes.job("ADDED", "job-a")
+    kubernetes.send("list_namespaced_job", None)
+    await kubernetes.connected(3)
+
+    assert kubernetes.connections[-1]["func"] == "list_namespaced_job"
+    assert kubernetes.connections[-1]["resource_version"] == "1"
+
+
+async def test_relists_when_the_resource_version_is_gone(
+    kubernetes: FakeKubernetes, informer: KubernetesJobInformer
+):
+    kubernetes.job("ADDED", "job-a")
+    kubernetes.send("list_namespaced_job", ApiException(status=410))
+    await kubernetes.connected(3)
+
+    assert kubernetes.connections[-1]["func"] == "list_namespaced_job"
+    assert "resource_version" not in kubernetes.connections[-1]
+
+
+class TestConcurrentJobs:
+    """
+    Supervises many concurrent jobs through the worker's job and pod watches to
+    measure how many watches the worker opens and how much CPU it uses doing so.
+    """
+
+    NUM_JOBS = 500
+
+    async def supervise(
+        self,
+        worker: KubernetesWorker,
+        informer: KubernetesJobInformer,
+        job_name: str,
+    ):
+        configuration = MagicMock(
+            namespace="test-namespace",
+            pod_watch_timeout_seconds=60,
+            job_watch_timeout_seconds=None,
+        )
+        batch_client = AsyncMock()
+        batch_client.read_namespaced_job.return_value.status.completion_time = None
+        logger = logging.getLogger("test")
+
+        # The worker tracks each job it creates until it is done supervising it
+        with informer.track(job_name):
+            pod = await worker._get_job_pod(
+                logger, job_name, configuration, MagicMock(), informer
+            )
+            assert pod.metadata.labels["job-name"] == job_name
+
+            await worker._monitor_job_events(
+                batch_client, job_name, logger, configuration, informer
+            )
+
+    async def test_jobs_share_one_job_watch_and_one_pod_watch(
+        self,
+        kubernetes: FakeKubernetes,
+        informer: KubernetesJobInformer,
+        monkeypatch: pytest.MonkeyPatch,
+        record_property,
+    ):
+        monkeypatch.setattr("prefect_kubernetes.worker.CoreV1Api", MagicMock())
+        worker = KubernetesWorker(work_pool_name="test")
+        job_names = [f"job-{i}" for i in range(self.NUM_JOBS)]
+
+        start = time.process_time()
+        supervisors = [
+            asyncio.create_task(self.supervise(worker, informer, job_name))
+            for job_name in job_names
+        ]
+        for job_name in job_names:
+            kubernetes.job("ADDED", job_name)
+            kubernetes.pod("ADDED", job_name, f"{job_name}-pod", "Pending")
+        for job_name in job_names:
+            kubernetes.pod("MODIFIED", job_name, f"{job_name}-pod", "Running")
+        for job_name in job_names:
+            kubernetes.job(
+                "MODIFIED",
+                job_name,
+                completion_time="2024-01-01T00:00:00Z",
+                succeeded=1,
+            )
+
+        await asyncio.wait_for(asyncio.gather(*supervisors), timeout=30)
+        record_property("cpu_seconds", time.process_time() - start)
+
+        assert len(kubernetes.connections) == 2
+        assert not informer._job_listeners
+        assert not informer._pod_listeners
+        assert not informer._jobs
+        assert not informer._pods
@@ -2,7 +2,7 @@ import base64
 import json
 import re
 import uuid
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 from time import monotonic, sleep
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
@@ -3097,3 +3097,146 @@ class TestKubernetesWorker:
             # The event for another job or pod shouldn't be included
             assert "NahChief" not in caplog.text
             assert "NotMeDude" not in caplog.text
+
+
+class TestSharedWatch:
+    @pytest.fixture
+    async def default_configuration(self):
+        return await KubernetesWorkerJobConfiguration.from_template_and_values(
+            KubernetesWorker.get_default_base_job_template(), {}
+        )
+
+    @pytest.fixture
+    def flow_run(self):
+        return FlowRun(flow_id=uuid.uuid4(), name="my-flow-run-name")
+
+    @pytest.fixture
+    def mock_informer(self, monkeypatch):
+        class MockInformer:
+            def __init__(self, client, namespace, label_selector=None):
+                self.namespace = namespace
+                self.label_selector = label_selector
+                self.stopped = False
+                self.watch_jobs = MagicMock(return_value=AsyncMock())
+                self.watch_pods = MagicMock(return_value=AsyncMock())
+                self.tracked = []
+
+            @contextmanager
+            def track(self, job_name):
+                self.tracked.append(job_name)
+                yield
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                self.stopped = True
+
+        @asynccontextmanager
+        async def get_configured_kubernetes_client(*args, **kwargs):
+            yield MagicMock(spec=ApiClient)
+
+        monkeypatch.setattr(
+            "prefect_kubernetes.worker.KubernetesJobInformer", MockInformer
+        )
+        monkeypatch.setattr(
+            "prefect_kubernetes.worker.KubernetesWorker._get_configured_kubernetes_client",
+            get_configured_kubernetes_client,
+        )
+        return MockInformer
+
+    @pytest.fixture
+    def enable_shared_watch(self, monkeypatch):
+        monkeypatch.setenv(
+            "PREFECT_INTEGRATIONS_KUBERNETES_WORKER_SHARED_WATCH", "true"
+        )
+
+    @pytest.fixture
+    def mock_job_stream_that_completes_the_job(self, mock_batch_client, mock_job):
+        read_job = mock_batch_client.return_value.read_namespaced_job
+        read_job.return_value.status.completion_time = None
+
+        async def mock_stream(*args, **kwargs):
+            mock_job.status.completion_time = pendulum.now("utc").timestamp()
+            yield {"object": mock_job, "type": "MODIFIED"}
+
+        return mock_stream
+
+    async def test_flow_runs_in_a_namespace_share_an_informer(
+        self, default_configuration: KubernetesWorkerJobConfiguration, mock_informer
+    ):
+        other_configuration = default_configuration.model_copy(
+            update={"namespace": "other-namespace"}
+        )
+
+        async with KubernetesWorker(work_pool_name="test") as k8s_worker:
+            informer = await k8s_worker._get_job_informer(default_configuration)
+            assert await k8s_worker._get_job_informer(default_configuration) is informer
+
+            other_informer = await k8s_worker._get_job_informer(other_configuration)
+            assert other_informer is not informer
+            assert other_informer.namespace == "other-namespace"
+
+        assert informer.stopped
+        assert other_informer.stopped
+
+    async def test_run_watches_the_job_through_the_shared_informer(
+        self,
+        flow_run,
+        default_configuration: KubernetesWorkerJobConfiguration,
+        mock_informer,
+        enable_shared_watch,
+        mock_core_client,
+        mock_watch,
+        mock_batch_client,
+        mock_pods_stream_that_returns_running_pod,
+        mock_job_stream_that_completes_the_job,
+    ):
+        async with KubernetesWorker(work_pool_name="test") as k8s_worker:
+            informer = await k8s_worker._get_job_informer(default_configuration)
+            informer.watch_jobs.return_value.stream = (
+                mock_job_stream_that_completes_the_job
+            )
+            informer.watch_pods.return_value.stream = (
+                mock_pods_stream_that_returns_running_pod
+            )
+
+            await k8s_worker.run(flow_run, default_configuration)
+
+        informer.watch_jobs.assert_called_with("mock-job")
+        informer.watch_pods.assert_called_with("mock-job")
+        assert informer.tracked == ["mock-job"]
+        mock_watch.assert_not_called()
+
+    async def test_run_labels_the_job_and_pods_with_the_worker_name(
+        self,
+        flow_run,
+        default_configuration: KubernetesWorkerJobConfiguration,
+        mock_informer,
+        enable_shared_watch,
+        mock_core_client,
+        mock_watch,
+        mock_batch_client,
+        mock_pods_stream_that_returns_running_pod,
+        mock_job_stream_that_completes_the_job,
+    ):
+        async with KubernetesWorker(
+            work_pool_name="test", name="My Worker"
+        ) as k8s_worker:
+            informer = await k8s_worker._get_job_informer(default_configuration)
+            informer.watch_jobs.return_value.stream = (
+                mock_job_stream_that_completes_the_job
+            )
+            informer.watch_pods.return_value.stream = (
+                mock_pods_stream_that_returns_running_pod
+            )
+
+            await k8s_worker.run(flow_run, default_configuration)
+
+        assert informer.label_selector == "prefect.io/worker-name=my-worker"
+        manifest = mock_batch_client.return_value.create_namespaced_job.call_args[0][1]
+        assert manifest["metadata"]["labels"]["prefect.io/worker-name"] == "my-worker"
+        assert (
+            manifest["spec"]["template"]["metadata"]["labels"]["prefect.io/worker-name"]
+            == "my-worker"
+        )
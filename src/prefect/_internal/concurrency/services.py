@@ -369,7 +369,8 @@ class BatchedQueueService(QueueService[T]):
     A queue service that handles a batch of items instead of a single item at a time.
 
     Items will be processed when the batch reaches the configured `_max_batch_size`
-    or after an interval of `_min_interval` seconds (if set).
+    or after an interval of `_min_interval` seconds (if set). With a `_min_interval`
+    of zero, the items that are already queued are processed as soon as one arrives.
     """
 
     _max_batch_size: int
@@ -381,33 +382,45 @@ class BatchedQueueService(QueueService[T]):
         while not done:
             batch: list[T] = []
             batch_size = 0
+            max_batch_size = self._max_batch_size
 
             # Pull items from the queue until we reach the batch size
-            deadline = get_deadline(self._min_interval)
-            while batch_size < self._max_batch_size:
+            deadline = get_deadline(self._min_interval or None)
+            while batch_size < max_batch_size:
+                if batch and self._min_interval == 0:
+                    break
+
                 try:
-                    item = await self._queue_get_thread.submit(
-                        create_call(self._queue.get, timeout=get_timeout(deadline))
+                    # Items that are already queued are collected in the same hop to
+                    # the queue thread as the first one
+                    items, size, done = await self._queue_get_thread.submit(
+                        create_call(
+                            self._get_items,
+                            max_batch_size - batch_size,
+                            timeout=get_timeout(deadline),
+                        )
                     ).aresult()
-
-                    if item is None:
-                        done = True
-                        break
-
-                    batch.append(item)
-                    batch_size += self._get_size(item)
-                    logger.debug(
-                        "Service %r added item %r to batch (size %s/%s)",
-                        self,
-                        item,
-                        batch_size,
-                        self._max_batch_size,
-                    )
                 except queue.Empty:
                     # Process the batch after `min_interval` even if it is smaller than
                     # the batch size
                     break
 
+                batch.extend(items)
+                batch_size += size
+                logger.debug(
+                    "Service %r added %s items to batch (size %s/%s)",
+                    self,
+                    len(items),
+                    batch_size,
+                    max_batch_size,
+                )
+                if done:
+                    break
+
+            if done:
+                # Account for the stop signal so `wait_until_empty` can return
+                self._queue.task_done()
+
             if not batch:
                 continue
 
@@ -426,6 +439,36 @@ class BatchedQueueService(QueueService[T]):
                     batch_size,
                     exc_info=log_traceback,
                 )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _get_items(
+        self, max_size: int, timeout: Optional[float]
+    ) -> tuple[list[T], int, bool]:
+        """
+        Wait up to `timeout` seconds for an item, then take any further items that are
+        already queued until `max_size` is reached.
+
+        Returns the items, their total size, and whether the service was stopped.
+        Raises `queue.Empty` if no item arrived in time.
+        """
+        items: list[T] = []
+        size = 0
+        item = self._queue.get(timeout=timeout)
+        while True:
+            if item is None:
+                return items, size, True
+
+            items.append(item)
+            size += self._get_size(item)
+            if size >= max_size:
+                return items, size, False
+
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items, size, False
 
     @abc.abstractmethod
     async def _handle_batch(self, items: list[T]) -> None:
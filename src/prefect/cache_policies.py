@@ -2,13 +2,25 @@ import inspect
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Union
+from types import CodeType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from typing_extensions import Self
 
 from prefect.context import TaskRunContext
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import hash_objects
+from prefect.settings import get_current_settings
+from prefect.utilities.hashing import get_hash_algorithm, hash_inputs, hash_objects
 
 if TYPE_CHECKING:
     from prefect.filesystems import WritableFileSystem
@@ -248,6 +260,15 @@ class _None(CachePolicy):
         return other
 
 
+def _inputs_hash_algorithm() -> Callable[..., Any]:
+    return get_hash_algorithm(get_current_settings().tasks.cache_key_hash_algorithm)
+
+
+_source_keys: "WeakKeyDictionary[Callable[..., Any], Tuple[CodeType, str]]" = (
+    WeakKeyDictionary()
+)
+
+
 @dataclass
 class TaskSource(CachePolicy):
     """
@@ -263,6 +284,16 @@ class TaskSource(CachePolicy):
     ) -> Optional[str]:
         if not task_ctx:
             return None
+
+        # Reading and hashing the source is costly relative to a task run, so the
+        # key is remembered per function for as long as its code object is unchanged
+        fn = getattr(task_ctx.task, "fn", task_ctx.task)
+        code = getattr(fn, "__code__", None)
+        if code is not None:
+            cached = _source_keys.get(fn)
+            if cached is not None and cached[0] is code:
+                return cached[1]
+
         try:
             lines = inspect.getsource(task_ctx.task)
         except TypeError:
@@ -272,7 +303,15 @@ class TaskSource(CachePolicy):
                 lines = task_ctx.task.fn.__code__.co_code
             else:
                 raise
-        return hash_objects(lines, raise_on_failure=True)
+        key = hash_objects(lines, raise_on_failure=True)
+
+        if code is not None:
+            try:
+                _source_keys[fn] = (code, key)
+            except TypeError:
+                # not every callable can be weakly referenced
+                pass
+        return key
 
 
 @dataclass
@@ -290,7 +329,11 @@ class FlowParameters(CachePolicy):
     ) -> Optional[str]:
         if not flow_parameters:
             return None
-        return hash_objects(flow_parameters, raise_on_failure=True)
+        return hash_inputs(
+            flow_parameters,
+            hash_algo=_inputs_hash_algorithm(),
+            raise_on_failure=True,
+        )
 
 
 @dataclass
@@ -342,7 +385,11 @@ class Inputs(CachePolicy):
                 hashed_inputs[key] = val
 
         try:
-            return hash_objects(hashed_inputs, raise_on_failure=True)
+            return hash_inputs(
+                hashed_inputs,
+                hash_algo=_inputs_hash_algorithm(),
+                raise_on_failure=True,
+            )
         except HashError as exc:
             msg = (
                 f"{exc}\n\n"
@@ -1,31 +1,66 @@
+import importlib
+from types import ModuleType
+
+# Configure logging and resolve the forward references of Prefect's models before
+# any command runs, which importing every command module used to do
+import prefect.main  # noqa: F401
 import prefect.settings
 from prefect.cli.root import app
 
-# Import CLI submodules to register them to the app
+# Declare the modules that register each command with the app. A module is only
+# imported when one of its commands is used, so that running one command does not
+# pay for importing every other command.
 # isort: split
 
-import prefect.cli.artifact
-import prefect.cli.block
-import prefect.cli.cloud
-import prefect.cli.cloud.ip_allowlist
-import prefect.cli.cloud.webhook
-import prefect.cli.shell
-import prefect.cli.concurrency_limit
-import prefect.cli.config
-import prefect.cli.dashboard
-import prefect.cli.deploy
-import prefect.cli.deployment
-import prefect.cli.dev
-import prefect.cli.events
-import prefect.cli.flow
-import prefect.cli.flow_run
-import prefect.cli.global_concurrency_limit
-import prefect.cli.profile
-import prefect.cli.server
-import prefect.cli.task
-import prefect.cli.variable
-import prefect.cli.work_pool
-import prefect.cli.work_queue
-import prefect.cli.worker
-import prefect.cli.task_run
-import prefect.events.cli.automations
+app.add_lazy_commands("artifact", modules=["prefect.cli.artifact"])
+app.add_lazy_commands("block", "blocks", modules=["prefect.cli.block"])
+app.add_lazy_commands(
+    "cloud",
+    modules=[
+        "prefect.cli.cloud",
+        "prefect.cli.cloud.ip_allowlist",
+        "prefect.cli.cloud.webhook",
+    ],
+)
+app.add_lazy_commands("shell", modules=["prefect.cli.shell"])
+app.add_lazy_commands(
+    "concurrency-limit",
+    "concurrency-limits",
+    modules=["prefect.cli.concurrency_limit"],
+)
+app.add_lazy_commands("config", modules=["prefect.cli.config"])
+app.add_lazy_commands("dashboard", modules=["prefect.cli.dashboard"])
+app.add_lazy_commands("deploy", "init", modules=["prefect.cli.deploy"])
+app.add_lazy_commands("deployment", "deployments", modules=["prefect.cli.deployment"])
+app.add_lazy_commands("dev", modules=["prefect.cli.dev"])
+app.add_lazy_commands("event", "events", modules=["prefect.cli.events"])
+app.add_lazy_commands("flow", "flows", modules=["prefect.cli.flow"])
+app.add_lazy_commands("flow-run", "flow-runs", modules=["prefect.cli.flow_run"])
+app.add_lazy_commands(
+    "global-concurrency-limit",
+    "gcl",
+    modules=["prefect.cli.global_concurrency_limit"],
+)
+app.add_lazy_commands("profile", "profiles", modules=["prefect.cli.profile"])
+app.add_lazy_commands("server", modules=["prefect.cli.server"])
+app.add_lazy_commands("task", modules=["prefect.cli.task"])
+app.add_lazy_commands("variable", modules=["prefect.cli.variable"])
+app.add_lazy_commands("work-pool", modules=["prefect.cli.work_pool"])
+app.add_lazy_commands("work-queue", "work-queues", modules=["prefect.cli.work_queue"])
+app.add_lazy_commands("worker", modules=["prefect.cli.worker"])
+app.add_lazy_commands("task-run", "task-runs", modules=["prefect.cli.task_run"])
+app.add_lazy_commands(
+    "automation", "automations", modules=["prefect.events.cli.automations"]
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Command modules are not imported until their commands are used, so import
+    # them on attribute access as importing them eagerly would
+    module_name = f"{__name__}.{name}"
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != module_name:
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
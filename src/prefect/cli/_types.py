@@ -4,12 +4,16 @@ Custom Prefect CLI types
 
 import asyncio
 import functools
+import importlib
 import sys
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Set
 
+import click
 import typer
+import typer.main
 from rich.console import Console
 from rich.theme import Theme
+from typer.core import TyperGroup
 
 from prefect._internal.compatibility.deprecated import generate_deprecation_message
 from prefect.cli._utilities import with_cli_exception_handling
@@ -59,6 +63,44 @@ def with_deprecated_message(
     return decorator
 
 
+class LazyTyperGroup(TyperGroup):
+    """
+    A command group that imports the modules registering a subcommand only when
+    that subcommand is used, so that running one command does not pay for importing
+    every other command.
+
+    Subclasses are created by `PrefectTyper` for apps with lazy commands.
+    """
+
+    typer_app: ClassVar["PrefectTyper"]
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.typer_app.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        modules = self.typer_app.lazy_commands.get(cmd_name, ())
+        # Modules are tracked rather than looked up in `sys.modules` so that they
+        # are never imported twice, which would register their commands twice
+        unimported = [
+            module
+            for module in modules
+            if module not in self.typer_app.imported_lazy_modules
+        ]
+        if not unimported:
+            return super().get_command(ctx, cmd_name)
+
+        for module in unimported:
+            importlib.import_module(module)
+            self.typer_app.imported_lazy_modules.add(module)
+
+        # Importing the modules registered the command with the typer app, so the
+        # group is rebuilt from the app to convert it to a click command
+        command = typer.main.get_group(self.typer_app).commands.get(cmd_name)
+        if command is not None:
+            self.commands[cmd_name] = command
+        return command
+
+
 class PrefectTyper(typer.Typer):
     """
     Wraps commands created by `Typer` to support async functions and handle errors.
@@ -73,8 +115,17 @@ class PrefectTyper(typer.Typer):
         deprecated_start_date: Optional[str] = None,
         deprecated_help: str = "",
         deprecated_name: str = "",
+        lazy: bool = False,
         **kwargs: Any,
     ):
+        # Commands that are registered by importing modules, by command name
+        self.lazy_commands: Dict[str, Sequence[str]] = {}
+        self.imported_lazy_modules: Set[str] = set()
+        if lazy:
+            kwargs["cls"] = type(
+                "LazyPrefectTyperGroup", (LazyTyperGroup,), {"typer_app": self}
+            )
+
         super().__init__(*args, **kwargs)
 
         self.deprecated = deprecated
@@ -93,6 +144,16 @@ class PrefectTyper(typer.Typer):
             color_system="auto" if PREFECT_CLI_COLORS else None,
         )
 
+    def add_lazy_commands(self, *names: str, modules: Sequence[str]) -> None:
+        """
+        Declare commands that are registered with this app by importing the given
+        modules, which are only imported once one of the commands is used.
+
+        The app must have been created with `lazy=True`.
+        """
+        for name in names:
+            self.lazy_commands[name] = modules
+
     def add_typer(
         self,
         typer_instance: "PrefectTyper",
@@ -20,7 +20,7 @@ from prefect.cli._utilities import exit_with_error, exit_with_success
 from prefect.cli.root import app, is_interactive
 from prefect.client.orchestration import get_client
 from prefect.client.schemas.filters import FlowFilter, FlowRunFilter, LogFilter
-from prefect.client.schemas.objects import StateType
+from prefect.client.schemas.objects import Log, StateType
 from prefect.client.schemas.responses import SetStateStatus
 from prefect.client.schemas.sorting import FlowRunSort, LogSort
 from prefect.exceptions import ObjectNotFound
@@ -259,11 +259,6 @@ async def logs(
     """
     View logs for a flow run.
     """
-    # Pagination - API returns max 200 (LOGS_DEFAULT_PAGE_SIZE) logs at a time
-    offset = 0
-    more_logs = True
-    num_logs_returned = 0
-
     # if head and tail flags are being used together
     if head and tail:
         exit_with_error("Please provide either a `head` or `tail` option but not both.")
@@ -274,10 +269,6 @@ async def logs(
         else None
     )
 
-    # if using tail update offset according to LOGS_DEFAULT_PAGE_SIZE
-    if tail:
-        offset = max(0, user_specified_num_logs - LOGS_DEFAULT_PAGE_SIZE)
-
     log_filter = LogFilter(flow_run_id={"any_": [id]})
 
     async with get_client() as client:
@@ -287,57 +278,34 @@ async def logs(
         except ObjectNotFound:
             exit_with_error(f"Flow run {str(id)!r} not found!")
 
-        while more_logs:
-            num_logs_to_return_from_page = (
-                LOGS_DEFAULT_PAGE_SIZE
-                if user_specified_num_logs is None
-                else min(
-                    LOGS_DEFAULT_PAGE_SIZE, user_specified_num_logs - num_logs_returned
-                )
-            )
+        def print_log(log: Log) -> None:
+            # Print following the flow run format (declared in logging.yml)
+            timestamp = f"{log.timestamp:%Y-%m-%d %H:%M:%S.%f}"[:-3]
+            log_level = f"{logging.getLevelName(log.level):7s}"
+            flow_run_info = f"Flow run {flow_run.name!r} - {escape(log.message)}"
 
-            # Get the next page of logs
-            page_logs = await client.read_logs(
-                log_filter=log_filter,
-                limit=num_logs_to_return_from_page,
-                offset=offset,
-                sort=(
-                    LogSort.TIMESTAMP_DESC if reverse or tail else LogSort.TIMESTAMP_ASC
-                ),
+            log_message = f"{timestamp} | {log_level} | {flow_run_info}"
+            app.console.print(
+                log_message,
+                soft_wrap=True,
             )
 
-            for log in reversed(page_logs) if tail and not reverse else page_logs:
-                # Print following the flow run format (declared in logging.yml)
-                timestamp = f"{log.timestamp:%Y-%m-%d %H:%M:%S.%f}"[:-3]
-                log_level = f"{logging.getLevelName(log.level):7s}"
-                flow_run_info = f"Flow run {flow_run.name!r} - {escape(log.message)}"
-
-                log_message = f"{timestamp} | {log_level} | {flow_run_info}"
-                app.console.print(
-                    log_message,
-                    soft_wrap=True,
-                )
-
-            # Update the number of logs retrieved
-            num_logs_returned += num_logs_to_return_from_page
-
-            if tail:
-                #  If the current offset is not 0, update the offset for the next page
-                if offset != 0:
-                    offset = (
-                        0
-                        # Reset the offset to 0 if there are less logs than the LOGS_DEFAULT_PAGE_SIZE to get the remaining log
-                        if offset < LOGS_DEFAULT_PAGE_SIZE
-                        else offset - LOGS_DEFAULT_PAGE_SIZE
-                    )
-                else:
-                    more_logs = False
-            else:
-                if len(page_logs) == LOGS_DEFAULT_PAGE_SIZE:
-                    offset += LOGS_DEFAULT_PAGE_SIZE
-                else:
-                    # No more logs to show, exit
-                    more_logs = False
+        # Logs are read a page at a time, so only one page is held in memory
+        # however many logs there are
+        logs = client.stream_logs(
+            log_filter=log_filter,
+            limit=user_specified_num_logs,
+            sort=LogSort.TIMESTAMP_DESC if reverse or tail else LogSort.TIMESTAMP_ASC,
+            page_size=LOGS_DEFAULT_PAGE_SIZE,
+        )
+        if tail and not reverse:
+            # The last logs are read from newest to oldest, so they are collected
+            # to be printed from oldest to newest
+            for log in reversed([log async for log in logs]):
+                print_log(log)
+        else:
+            async for log in logs:
+                print_log(log)
 
 
 @flow_run_app.command()
@@ -26,7 +26,7 @@ from prefect.settings import (
     PREFECT_TEST_MODE,
 )
 
-app: PrefectTyper = PrefectTyper(add_completion=True, no_args_is_help=True)
+app: PrefectTyper = PrefectTyper(add_completion=True, no_args_is_help=True, lazy=True)
 
 
 def version_callback(value: bool) -> None:
@@ -249,6 +249,51 @@ def get_client(
         )
 
 
+def _task_run_create(
+    task: "TaskObject[Any, Any]",
+    flow_run_id: Optional[UUID],
+    dynamic_key: str,
+    id: Optional[UUID] = None,
+    name: Optional[str] = None,
+    extra_tags: Optional[Iterable[str]] = None,
+    state: Optional[prefect.states.State[Any]] = None,
+    task_inputs: Optional[
+        dict[str, list[Union[TaskRunResult, Parameter, Constant]]]
+    ] = None,
+) -> TaskRunCreate:
+    """
+    Build the request body to create a task run of the given task. Shared by the
+    clients' `create_task_run` and by callers of `create_task_runs`.
+    """
+    tags = set(task.tags).union(extra_tags or [])
+
+    if state is None:
+        state = prefect.states.Pending()
+
+    retry_delay = task.retry_delay_seconds
+    if isinstance(retry_delay, list):
+        retry_delay = [int(rd) for rd in retry_delay]
+    elif isinstance(retry_delay, float):
+        retry_delay = int(retry_delay)
+
+    return TaskRunCreate(
+        id=id,
+        name=name,
+        flow_run_id=flow_run_id,
+        task_key=task.task_key,
+        dynamic_key=str(dynamic_key),
+        tags=list(tags),
+        task_version=task.version,
+        empirical_policy=TaskRunPolicy(
+            retries=task.retries,
+            retry_delay=retry_delay,
+            retry_jitter_factor=task.retry_jitter_factor,
+        ),
+        state=state.to_state_create(),
+        task_inputs=task_inputs or {},
+    )
+
+
 class PrefectClient(
     ArtifactAsyncClient,
     ArtifactCollectionAsyncClient,
@@ -790,38 +835,43 @@ class PrefectClient(
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
-
-        if state is None:
-            state = prefect.states.Pending()
-
-        retry_delay = task.retry_delay_seconds
-        if isinstance(retry_delay, list):
-            retry_delay = [int(rd) for rd in retry_delay]
-        elif isinstance(retry_delay, float):
-            retry_delay = int(retry_delay)
-
-        task_run_data = TaskRunCreate(
+        task_run_data = _task_run_create(
+            task,
+            flow_run_id=flow_run_id,
+            dynamic_key=dynamic_key,
             id=id,
             name=name,
-            flow_run_id=flow_run_id,
-            task_key=task.task_key,
-            dynamic_key=str(dynamic_key),
-            tags=list(tags),
-            task_version=task.version,
-            empirical_policy=TaskRunPolicy(
-                retries=task.retries,
-                retry_delay=retry_delay,
-                retry_jitter_factor=task.retry_jitter_factor,
-            ),
-            state=state.to_state_create(),
-            task_inputs=task_inputs or {},
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
         )
         content = task_run_data.model_dump_json(exclude={"id"} if id is None else None)
 
         response = await self._client.post("/task_runs/", content=content)
         return TaskRun.model_validate(response.json())
 
+    async def create_task_runs(self, task_runs: list[TaskRunCreate]) -> list[TaskRun]:
+        """
+        Create many task runs in a single request.
+
+        Args:
+            task_runs: The task runs to create. Task runs without an `id` have one
+                generated server-side.
+
+        Returns:
+            The created task runs, in the order they were given.
+        """
+        response = await self._client.post(
+            "/task_runs/bulk",
+            json=[
+                task_run.model_dump(
+                    mode="json", exclude={"id"} if task_run.id is None else None
+                )
+                for task_run in task_runs
+            ],
+        )
+        return pydantic.TypeAdapter(list[TaskRun]).validate_python(response.json())
+
     async def read_task_run(self, task_run_id: UUID) -> TaskRun:
         """
         Query the Prefect API for a task run by id.
@@ -1388,6 +1438,50 @@ class PrefectClient(
             response.json()
         )
 
+    async def claim_flow_runs_for_work_pool(
+        self,
+        work_pool_name: str,
+        work_queue_names: Optional[list[str]] = None,
+        scheduled_before: Optional[datetime.datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[WorkerFlowRunResponse]:
+        """
+        Claims scheduled flow runs from the provided set of work pool queues by
+        moving them to a `Pending` state.
+
+        Each flow run is claimed by only one caller, so unlike
+        `get_scheduled_flow_runs_for_work_pool`, the returned flow runs can be
+        submitted without proposing a `Pending` state first.
+
+        Args:
+            work_pool_name: The name of the work pool that the work pool
+                queues are associated with.
+            work_queue_names: The names of the work pool queues from which
+                to claim scheduled flow runs.
+            scheduled_before: Datetime used to filter claimed flow runs. Flow runs
+                scheduled for after the given datetime string will not be claimed.
+            limit: The maximum number of flow runs to claim.
+
+        Returns:
+            A list of worker flow run responses containing information about the
+            claimed flow runs, in their `Pending` states.
+        """
+        body: dict[str, Any] = {}
+        if work_queue_names is not None:
+            body["work_queue_names"] = list(work_queue_names)
+        if scheduled_before:
+            body["scheduled_before"] = str(scheduled_before)
+        if limit is not None:
+            body["limit"] = limit
+
+        response = await self._client.post(
+            f"/work_pools/{work_pool_name}/claim_flow_runs",
+            json=body,
+        )
+        return pydantic.TypeAdapter(list[WorkerFlowRunResponse]).validate_python(
+            response.json()
+        )
+
     async def read_worker_metadata(self) -> dict[str, Any]:
         """Reads worker metadata stored in Prefect collection registry."""
         response = await self._client.get("collections/views/aggregate-worker-metadata")
@@ -1810,32 +1904,15 @@ class SyncPrefectClient(
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
-
-        if state is None:
-            state = prefect.states.Pending()
-
-        retry_delay = task.retry_delay_seconds
-        if isinstance(retry_delay, list):
-            retry_delay = [int(rd) for rd in retry_delay]
-        elif isinstance(retry_delay, float):
-            retry_delay = int(retry_delay)
-
-        task_run_data = TaskRunCreate(
-            id=id,
-            name=name,
+        task_run_data = _task_run_create(
+            task,
             flow_run_id=flow_run_id,
-            task_key=task.task_key,
             dynamic_key=dynamic_key,
-            tags=list(tags),
-            task_version=task.version,
-            empirical_policy=TaskRunPolicy(
-                retries=task.retries,
-                retry_delay=retry_delay,
-                retry_jitter_factor=task.retry_jitter_factor,
-            ),
-            state=state.to_state_create(),
-            task_inputs=task_inputs or {},
+            id=id,
+            name=name,
+            extra_tags=extra_tags,
+            state=state,
+            task_inputs=task_inputs,
         )
 
         content = task_run_data.model_dump_json(exclude={"id"} if id is None else None)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Iterable, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Iterable, Union
 
 from prefect.client.orchestration.base import BaseAsyncClient, BaseClient
 
@@ -16,6 +16,29 @@ if TYPE_CHECKING:
     )
     from prefect.client.schemas.sorting import LogSort
 
+# The maximum number of logs the API returns at a time by default
+LOGS_PAGE_SIZE = 200
+
+
+def _read_logs_body(
+    log_filter: "LogFilter | None",
+    limit: int | None,
+    offset: int | None,
+    sort: "LogSort | None",
+    after: "Log | None",
+) -> dict[str, Any]:
+    from prefect.client.schemas.sorting import LogSort
+
+    body: dict[str, Any] = {
+        "logs": log_filter.model_dump(mode="json") if log_filter else None,
+        "limit": limit,
+        "offset": offset,
+        "sort": sort or LogSort.TIMESTAMP_ASC,
+    }
+    if after is not None:
+        body["after"] = after.model_dump(mode="json", include={"timestamp", "id"})
+    return body
+
 
 class LogClient(BaseClient):
     def create_logs(self, logs: Iterable[Union["LogCreate", dict[str, Any]]]) -> None:
@@ -36,23 +59,56 @@ class LogClient(BaseClient):
         limit: int | None = None,
         offset: int | None = None,
         sort: "LogSort | None" = None,
+        after: "Log | None" = None,
     ) -> list["Log"]:
         """
         Read flow and task run logs.
+
+        Args:
+            log_filter: only read logs that match this filter
+            limit: the maximum number of logs to read
+            offset: the number of logs to skip
+            sort: the order to read logs in
+            after: only read logs that come after this log in the sort order
         """
-        from prefect.client.schemas.sorting import LogSort
-
-        body: dict[str, Any] = {
-            "logs": log_filter.model_dump(mode="json") if log_filter else None,
-            "limit": limit,
-            "offset": offset,
-            "sort": sort or LogSort.TIMESTAMP_ASC,
-        }
+        body = _read_logs_body(log_filter, limit, offset, sort, after)
         response = self.request("POST", "/logs/filter", json=body)
         from prefect.client.schemas.objects import Log
 
         return Log.model_validate_list(response.json())
 
+    def stream_logs(
+        self,
+        log_filter: "LogFilter | None" = None,
+        limit: int | None = None,
+        sort: "LogSort | None" = None,
+        page_size: int = LOGS_PAGE_SIZE,
+    ) -> Generator["Log", None, None]:
+        """
+        Read flow and task run logs one page at a time, continuing each page after
+        the last log of the previous one, so that any number of logs can be read
+        with only one page held in memory.
+
+        Args:
+            log_filter: only read logs that match this filter
+            limit: the maximum number of logs to read, or `None` to read all logs
+            sort: the order to read logs in
+            page_size: the number of logs to request at a time
+        """
+        after: "Log | None" = None
+        while limit is None or limit > 0:
+            page_limit = page_size if limit is None else min(page_size, limit)
+            logs = self.read_logs(
+                log_filter=log_filter, limit=page_limit, sort=sort, after=after
+            )
+            yield from logs
+
+            if len(logs) < page_limit:
+                return
+            if limit is not None:
+                limit -= len(logs)
+            after = logs[-1]
+
 
 class LogAsyncClient(BaseAsyncClient):
     async def create_logs(
@@ -78,20 +134,53 @@ class LogAsyncClient(BaseAsyncClient):
         limit: int | None = None,
         offset: int | None = None,
         sort: "LogSort | None" = None,
+        after: "Log | None" = None,
     ) -> list[Log]:
         """
         Read flow and task run logs.
-        """
-        from prefect.client.schemas.sorting import LogSort
-
-        body: dict[str, Any] = {
-            "logs": log_filter.model_dump(mode="json") if log_filter else None,
-            "limit": limit,
-            "offset": offset,
-            "sort": sort or LogSort.TIMESTAMP_ASC,
-        }
 
+        Args:
+            log_filter: only read logs that match this filter
+            limit: the maximum number of logs to read
+            offset: the number of logs to skip
+            sort: the order to read logs in
+            after: only read logs that come after this log in the sort order
+        """
+        body = _read_logs_body(log_filter, limit, offset, sort, after)
         response = await self.request("POST", "/logs/filter", json=body)
         from prefect.client.schemas.objects import Log
 
         return Log.model_validate_list(response.json())
+
+    async def stream_logs(
+        self,
+        log_filter: "LogFilter | None" = None,
+        limit: int | None = None,
+        sort: "LogSort | None" = None,
+        page_size: int = LOGS_PAGE_SIZE,
+    ) -> AsyncGenerator["Log", None]:
+        """
+        Read flow and task run logs one page at a time, continuing each page after
+        the last log of the previous one, so that any number of logs can be read
+        with only one page held in memory.
+
+        Args:
+            log_filter: only read logs that match this filter
+            limit: the maximum number of logs to read, or `None` to read all logs
+            sort: the order to read logs in
+            page_size: the number of logs to request at a time
+        """
+        after: "Log | None" = None
+        while limit is None or limit > 0:
+            page_limit = page_size if limit is None else min(page_size, limit)
+            logs = await self.read_logs(
+                log_filter=log_filter, limit=page_limit, sort=sort, after=after
+            )
+            for log in logs:
+                yield log
+
+            if len(logs) < page_limit:
+                return
+            if limit is not None:
+                limit -= len(logs)
+            after = logs[-1]
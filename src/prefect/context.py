@@ -34,6 +34,7 @@ from prefect.settings import Profile, Settings
 from prefect.settings.legacy import (
     _get_settings_fields,  # type: ignore[reportPrivateUsage]
 )
+from prefect.settings.snapshot import load_settings_snapshot
 from prefect.states import State
 from prefect.task_runners import TaskRunner
 from prefect.types import DateTime
@@ -675,7 +676,10 @@ def root_settings_context() -> SettingsContext:
         )
         active_name = "ephemeral"
 
-    if not (settings := Settings()).home.exists():
+    # Processes started with a snapshot of their parent's settings can skip
+    # resolving them again
+    settings = load_settings_snapshot() or Settings()
+    if not settings.home.exists():
         try:
             settings.home.mkdir(mode=0o0700, exist_ok=True)
         except OSError:
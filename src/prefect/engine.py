@@ -25,17 +25,14 @@ if TYPE_CHECKING:
 engine_logger: "logging.Logger" = get_logger("engine")
 
 
-if __name__ == "__main__":
-    try:
-        flow_run_id: UUID = UUID(
-            sys.argv[1] if len(sys.argv) > 1 else os.environ.get("PREFECT__FLOW_RUN_ID")
-        )
-    except Exception:
-        engine_logger.error(
-            f"Invalid flow run id. Received arguments: {sys.argv}", exc_info=True
-        )
-        exit(1)
+def execute_flow_run(flow_run_id: UUID) -> int:
+    """
+    Loads and runs the flow run with the given ID, returning the exit code for the
+    process running it.
 
+    Base exceptions, such as termination signals, are raised so that they determine
+    the exit code of the process.
+    """
     try:
         from prefect.flow_engine import (
             flow_run_logger,
@@ -68,13 +65,13 @@ if __name__ == "__main__":
             f"Engine execution of flow run '{flow_run_id}' aborted by orchestrator:"
             f" {abort_signal}"
         )
-        exit(0)
+        return 0
     except Pause as pause_signal:
         pause_signal: Pause
         engine_logger.info(
             f"Engine execution of flow run '{flow_run_id}' is paused: {pause_signal}"
         )
-        exit(0)
+        return 0
     except Exception:
         engine_logger.error(
             (
@@ -83,7 +80,7 @@ if __name__ == "__main__":
             ),
             exc_info=True,
         )
-        exit(1)
+        return 1
     except BaseException:
         engine_logger.error(
             (
@@ -95,4 +92,20 @@ if __name__ == "__main__":
         # Let the exit code be determined by the base exception type
         raise
 
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        flow_run_id: UUID = UUID(
+            sys.argv[1] if len(sys.argv) > 1 else os.environ.get("PREFECT__FLOW_RUN_ID")
+        )
+    except Exception:
+        engine_logger.error(
+            f"Invalid flow run id. Received arguments: {sys.argv}", exc_info=True
+        )
+        exit(1)
+
+    exit(execute_flow_run(flow_run_id))
+
 __getattr__: Callable[[str], Any] = getattr_migration(__name__)
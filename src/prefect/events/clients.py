@@ -221,10 +221,27 @@ class EventsClient(abc.ABC):
         finally:
             EVENTS_EMITTED.labels(self.client_name).inc()
 
+    async def emit_many(self, events: List[Event]) -> None:
+        """Emit several events, which clients may send together"""
+        if not hasattr(self, "_in_context"):
+            raise TypeError(
+                "Events may only be emitted while this client is being used as a "
+                "context manager"
+            )
+
+        try:
+            return await self._emit_many(events)
+        finally:
+            EVENTS_EMITTED.labels(self.client_name).inc(len(events))
+
     @abc.abstractmethod
     async def _emit(self, event: Event) -> None:  # pragma: no cover
         ...
 
+    async def _emit_many(self, events: List[Event]) -> None:
+        for event in events:
+            await self._emit(event)
+
     async def __aenter__(self) -> Self:
         self._in_context = True
         return self
@@ -298,11 +315,20 @@ def _get_api_url_and_key(
     return api_url, api_key
 
 
+# Offered when connecting to a Prefect server's events socket; servers that accept it
+# receive frames containing a JSON array of events in addition to single events
+BATCHED_EVENTS_SUBPROTOCOL = Subprotocol("prefect-events-batch")
+
+# Batched frames stay well under the server's maximum websocket message size
+MAX_BATCH_FRAME_BYTES = 1024 * 1024
+
+
 class PrefectEventsClient(EventsClient):
     """A Prefect Events client that streams events to a Prefect server"""
 
     _websocket: Optional[WebSocketClientProtocol]
     _unconfirmed_events: List[Event]
+    _pending_checkpoint: Optional[Tuple["asyncio.Future[float]", int]]
 
     def __init__(
         self,
@@ -325,10 +351,13 @@ class PrefectEventsClient(EventsClient):
             )
 
         self._events_socket_url = events_in_socket_from_api_url(api_url)
-        self._connect = websocket_connect(self._events_socket_url)
+        self._connect = websocket_connect(
+            self._events_socket_url, subprotocols=[BATCHED_EVENTS_SUBPROTOCOL]
+        )
         self._websocket = None
         self._reconnection_attempts = reconnection_attempts
         self._unconfirmed_events = []
+        self._pending_checkpoint = None
         self._checkpoint_every = checkpoint_every
 
     async def __aenter__(self) -> Self:
@@ -360,6 +389,9 @@ class PrefectEventsClient(EventsClient):
             await self._connect.__aexit__(None, None, None)
             logger.debug("Cleared existing websocket connection.")
 
+        # A checkpoint in flight on the old connection can no longer confirm anything
+        self._pending_checkpoint = None
+
         try:
             logger.debug("Opening websocket connection.")
             self._websocket = await self._connect.__aenter__()
@@ -393,36 +425,79 @@ class PrefectEventsClient(EventsClient):
             await self.emit(event)
         logger.debug("Finished resending unconfirmed events.")
 
-    async def _checkpoint(self, event: Event) -> None:
+    async def _checkpoint(self, events: List[Event], wait: bool = True) -> None:
+        """
+        Track sent events until a ping confirms the server received them.
+
+        Every `checkpoint_every` events, the client pings the server. When `wait` is
+        False, the ping is not awaited and its pong is checked by later checkpoints, so
+        that sending is not held up by round trips. The client only waits for that pong
+        if another `checkpoint_every` events are sent before it arrives.
+        """
         assert self._websocket
 
-        self._unconfirmed_events.append(event)
+        self._unconfirmed_events.extend(events)
+        self._confirm_checkpoint()
 
         unconfirmed_count = len(self._unconfirmed_events)
 
         logger.debug(
-            "Added event id=%s to unconfirmed events list. "
+            "Added %s events to unconfirmed events list. "
             "There are now %s unconfirmed events.",
-            event.id,
+            len(events),
             unconfirmed_count,
         )
         if unconfirmed_count < self._checkpoint_every:
             return
 
+        if self._pending_checkpoint:
+            if not wait and unconfirmed_count < 2 * self._checkpoint_every:
+                return
+
+            await self._pending_checkpoint[0]
+            self._confirm_checkpoint()
+            unconfirmed_count = len(self._unconfirmed_events)
+            if unconfirmed_count < self._checkpoint_every:
+                return
+
         logger.debug("Pinging to checkpoint unconfirmed events.")
         pong = await self._websocket.ping()
-        await pong
+        # A pong that fails because the connection closed is superseded by the
+        # reconnection, so its error doesn't need to be retrieved
+        pong.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending_checkpoint = (pong, unconfirmed_count)
+
+        if wait:
+            await pong
+            self._confirm_checkpoint()
+
+    def _confirm_checkpoint(self) -> None:
+        if not self._pending_checkpoint or not self._pending_checkpoint[0].done():
+            return
+
+        pong, confirmed_count = self._pending_checkpoint
+        self._pending_checkpoint = None
+        if pong.cancelled() or pong.exception():
+            return
+
         self._log_debug("Pong received. Events checkpointed.")
 
         # once the pong returns, we know for sure that we've sent all the messages
         # we had enqueued prior to that.  There could be more that came in after, so
         # don't clear the list, just the ones that we are sure of.
-        self._unconfirmed_events = self._unconfirmed_events[unconfirmed_count:]
+        self._unconfirmed_events = self._unconfirmed_events[confirmed_count:]
 
         EVENT_WEBSOCKET_CHECKPOINTS.labels(self.client_name).inc()
 
     async def _emit(self, event: Event) -> None:
         self._log_debug("Emitting event id=%s.", event.id)
+        await self._send_with_reconnection([event], wait=True)
+
+    async def _emit_many(self, events: List[Event]) -> None:
+        self._log_debug("Emitting %s events.", len(events))
+        await self._send_with_reconnection(events, wait=False)
+
+    async def _send_with_reconnection(self, events: List[Event], wait: bool) -> None:
         for i in range(self._reconnection_attempts + 1):
             self._log_debug("Emit reconnection attempt %s.", i)
             try:
@@ -431,16 +506,15 @@ class PrefectEventsClient(EventsClient):
                 #
                 # Otherwise, after the first time through this loop, we're recovering
                 # from a ConnectionClosed, so reconnect now, resending any unconfirmed
-                # events before we send this one.
+                # events before we send these.
                 if not self._websocket or i > 0:
                     self._log_debug("Attempting websocket reconnection.")
                     await self._reconnect()
                     assert self._websocket
 
-                self._log_debug("Sending event id=%s.", event.id)
-                await self._websocket.send(event.model_dump_json())
-                self._log_debug("Checkpointing event id=%s.", event.id)
-                await self._checkpoint(event)
+                await self._send(events)
+                self._log_debug("Checkpointing %s events.", len(events))
+                await self._checkpoint(events, wait=wait)
 
                 return
             except ConnectionClosed:
@@ -458,6 +532,32 @@ class PrefectEventsClient(EventsClient):
                     )
                     await asyncio.sleep(1)
 
+    async def _send(self, events: List[Event]) -> None:
+        assert self._websocket
+
+        if (
+            len(events) == 1
+            or self._websocket.subprotocol != BATCHED_EVENTS_SUBPROTOCOL
+        ):
+            for event in events:
+                self._log_debug("Sending event id=%s.", event.id)
+                await self._websocket.send(event.model_dump_json())
+            return
+
+        # Send as few frames as possible, each a JSON array of events
+        frame: List[str] = []
+        frame_size = 0
+        for event in events:
+            event_json = event.model_dump_json()
+            if frame and frame_size + len(event_json) > MAX_BATCH_FRAME_BYTES:
+                await self._websocket.send(f"[{','.join(frame)}]")
+                frame, frame_size = [], 0
+            frame.append(event_json)
+            frame_size += len(event_json) + 1
+
+        self._log_debug("Sending batch of %s events.", len(frame))
+        await self._websocket.send(f"[{','.join(frame)}]")
+
 
 class AssertingPassthroughEventsClient(PrefectEventsClient):
     """A Prefect Events client that BOTH records all events sent to it for inspection
@@ -494,6 +594,10 @@ class AssertingPassthroughEventsClient(PrefectEventsClient):
         # record the event for inspection
         self.events.append(event)
 
+    async def _emit_many(self, events: List[Event]) -> None:
+        await super()._emit_many(events)
+        self.events.extend(events)
+
     async def __aenter__(self) -> Self:
         await super().__aenter__()
         self.events = []
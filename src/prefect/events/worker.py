@@ -1,11 +1,12 @@
 from contextlib import asynccontextmanager
 from contextvars import Context, copy_context
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from typing_extensions import Self
 
-from prefect._internal.concurrency.services import QueueService
+from prefect._internal.concurrency.services import BatchedQueueService
+from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_KEY,
     PREFECT_API_URL,
@@ -50,7 +51,14 @@ def should_emit_events_to_ephemeral_server() -> bool:
     return PREFECT_API_KEY.value() is None
 
 
-class EventsWorker(QueueService[Event]):
+logger = get_logger(__name__)
+
+
+class EventsWorker(BatchedQueueService[Event]):
+    # Events that are already queued are emitted together, without waiting for more
+    _max_batch_size = 500
+    _min_interval = 0
+
     def __init__(
         self, client_type: Type[EventsClient], client_options: Tuple[Tuple[str, Any]]
     ):
@@ -75,12 +83,18 @@ class EventsWorker(QueueService[Event]):
         self._context_cache[event.id] = copy_context()
         return event
 
-    async def _handle(self, event: Event):
-        context = self._context_cache.pop(event.id)
-        with temporary_context(context=context):
-            await self.attach_related_resources_from_context(event)
-
-        await self._client.emit(event)
+    async def _handle_batch(self, events: List[Event]):
+        for event in events:
+            context = self._context_cache.pop(event.id)
+            try:
+                with temporary_context(context=context):
+                    await self.attach_related_resources_from_context(event)
+            except Exception:
+                logger.exception(
+                    "Failed to attach related resources to event %s", event.id
+                )
+
+        await self._client.emit_many(events)
 
     async def attach_related_resources_from_context(self, event: Event) -> None:
         if "prefect.resource.lineage-group" in event.resource:
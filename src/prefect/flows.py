@@ -17,6 +17,7 @@ import sys
 import tempfile
 import warnings
 from copy import copy
+from dataclasses import is_dataclass
 from functools import partial, update_wrapper
 from pathlib import Path
 from typing import (
@@ -80,7 +81,7 @@ from prefect.states import State
 from prefect.task_runners import TaskRunner, ThreadPoolTaskRunner
 from prefect.types import BANNED_CHARACTERS, WITHOUT_BANNED_CHARACTERS
 from prefect.types.entrypoint import EntrypointType
-from prefect.utilities.annotations import NotSet
+from prefect.utilities.annotations import BaseAnnotation, NotSet
 from prefect.utilities.asyncutils import (
     run_sync_in_worker_thread,
     sync_compatible,
@@ -392,6 +393,18 @@ class Flow(Generic[P, R]):
 
         self._entrypoint = f"{module}:{fn.__name__}"
 
+        # Validators built from the function's signature, keyed by whether they
+        # validate Pydantic v1 models
+        self._parameter_validators: dict[
+            bool, Union[V1ValidatedFunction, V2ValidatedFunction]
+        ] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Validators are rebuilt as needed rather than pickled with the flow
+        state = self.__dict__.copy()
+        state["_parameter_validators"] = {}
+        return state
+
     @property
     def ismethod(self) -> bool:
         return hasattr(self.fn, "__prefect_self__")
@@ -412,6 +425,8 @@ class Flow(Generic[P, R]):
         else:
             bound_flow = copy(self)
             setattr(bound_flow.fn, "__prefect_self__", instance)
+            # the bound flow has the same function, so it can share validators
+            bound_flow._parameter_validators = self._parameter_validators
             return bound_flow
 
     def with_options(
@@ -563,14 +578,15 @@ class Flow(Generic[P, R]):
                 return Block.load_from_ref(data["$ref"], _sync=True)
             return data
 
-        try:
-            parameters = visit_collection(
-                parameters, resolve_block_reference, return_data=True
-            )
-        except (ValueError, RuntimeError) as exc:
-            raise ParameterTypeError(
-                "Failed to resolve block references in parameters."
-            ) from exc
+        if _may_have_block_references(parameters):
+            try:
+                parameters = visit_collection(
+                    parameters, resolve_block_reference, return_data=True
+                )
+            except (ValueError, RuntimeError) as exc:
+                raise ParameterTypeError(
+                    "Failed to resolve block references in parameters."
+                ) from exc
 
         args, kwargs = parameters_to_args_kwargs(self.fn, parameters)
 
@@ -591,12 +607,18 @@ class Flow(Generic[P, R]):
                 "Cannot mix Pydantic v1 and v2 types as arguments to a flow."
             )
 
-        validated_fn_kwargs = dict(arbitrary_types_allowed=True)
+        # Building a validator creates a model from the function's signature, which
+        # dominates the cost of validation, so each kind is built once per flow
+        validated_fn = self._parameter_validators.get(has_v1_models)
+        if validated_fn is None:
+            validated_fn_kwargs = dict(arbitrary_types_allowed=True)
 
-        if has_v1_models:
-            validated_fn = V1ValidatedFunction(self.fn, config=validated_fn_kwargs)
-        else:
-            validated_fn = V2ValidatedFunction(self.fn, config=validated_fn_kwargs)
+            if has_v1_models:
+                validated_fn = V1ValidatedFunction(self.fn, config=validated_fn_kwargs)
+            else:
+                validated_fn = V2ValidatedFunction(self.fn, config=validated_fn_kwargs)
+
+            self._parameter_validators[has_v1_models] = validated_fn
 
         try:
             with warnings.catch_warnings():
@@ -1714,6 +1736,29 @@ class FlowDecorator:
 flow: FlowDecorator = FlowDecorator()
 
 
+def _may_have_block_references(obj: Any, _seen: Optional[set[int]] = None) -> bool:
+    """
+    Returns `False` if `obj` can't contain a block reference that
+    `Flow.validate_parameters` would resolve. Dataclasses, Pydantic models and
+    annotations are assumed to contain one rather than inspected.
+    """
+    if isinstance(obj, (dict, list, tuple, set)):
+        _seen = _seen if _seen is not None else set()
+        if id(obj) in _seen:
+            return False
+        _seen.add(id(obj))
+
+        if isinstance(obj, dict):
+            return "$ref" in obj or any(
+                _may_have_block_references(value, _seen) for value in obj.values()
+            )
+        return any(_may_have_block_references(item, _seen) for item in obj)
+
+    return isinstance(obj, (BaseAnnotation, pydantic.BaseModel)) or (
+        is_dataclass(obj) and not isinstance(obj, type)
+    )
+
+
 def _raise_on_name_with_banned_characters(name: Optional[str]) -> Optional[str]:
     """
     Raise an InvalidNameError if the given name contains any invalid
@@ -8,9 +8,9 @@ import traceback
 import uuid
 import warnings
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, TextIO, Type
 
-import pendulum
 from rich.console import Console
 from rich.highlighter import Highlighter, NullHighlighter
 from rich.theme import Theme
@@ -22,7 +22,6 @@ from prefect._internal.concurrency.event_loop import get_running_loop
 from prefect._internal.concurrency.services import BatchedQueueService
 from prefect._internal.concurrency.threads import in_global_loop
 from prefect.client.orchestration import get_client
-from prefect.client.schemas.actions import LogCreate
 from prefect.exceptions import MissingContextError
 from prefect.logging.highlighters import PrefectConsoleHighlighter
 from prefect.settings import (
@@ -59,8 +58,25 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         return PREFECT_LOGGING_TO_API_BATCH_INTERVAL.value()
 
     async def _handle_batch(self, items: List):
+        max_log_size = PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()
+        logs: List[Dict[str, Any]] = []
+        for item in items:
+            log_size = item.pop("__payload_size__", 0)
+            if log_size > max_log_size:
+                if logging.raiseExceptions and sys.stderr:
+                    sys.stderr.write("--- Error logging to API ---\n")
+                    sys.stderr.write(
+                        f"Log of size {log_size} is greater than the max size of "
+                        f"{max_log_size}\n"
+                    )
+                continue
+            logs.append(item)
+
+        if not logs:
+            return
+
         try:
-            await self._client.create_logs(items)
+            await self._client.create_logs(logs)
         except Exception as e:
             # Roughly replicate the behavior of the stdlib logger error handling
             if logging.raiseExceptions and sys.stderr:
@@ -88,7 +104,37 @@ class APILogWorker(BatchedQueueService[Dict[str, Any]]):
         return super().instance(*settings)
 
     def _get_size(self, item: Dict[str, Any]) -> int:
-        return item.pop("__payload_size__", None) or len(json.dumps(item).encode())
+        # Logs are serialized and measured here, on the worker's queue thread, rather
+        # than on the thread that emitted them
+        size = item.get("__payload_size__")
+        if size is None:
+            _serialize_log(item)
+            size = item["__payload_size__"] = len(json.dumps(item).encode())
+        return size
+
+
+def _serialize_log(log: Dict[str, Any]) -> None:
+    """
+    Convert the fields of a log prepared by `APILogHandler.prepare` to their JSON
+    representation, in place.
+    """
+    timestamp = log.get("timestamp")
+    if isinstance(timestamp, (int, float)):
+        log["timestamp"] = (
+            datetime.fromtimestamp(timestamp, timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+    for key in ("flow_run_id", "task_run_id", "worker_id"):
+        value = log.get(key)
+        if isinstance(value, uuid.UUID):
+            log[key] = str(value)
+
+
+def _as_uuid(value: Any) -> uuid.UUID | None:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
 
 
 class APILogHandler(logging.Handler):
@@ -179,14 +225,16 @@ class APILogHandler(logging.Handler):
 
     def prepare(self, record: logging.LogRecord) -> Dict[str, Any]:
         """
-        Convert a `logging.LogRecord` to the API `LogCreate` schema and serialize.
+        Convert a `logging.LogRecord` to a log for the `APILogWorker`.
 
         This infers the linked flow or task run from the log record or the current
         run context.
 
         If a flow run id cannot be found, the log will be dropped.
 
-        Logs exceeding the maximum size will be dropped.
+        Only the fields of the `LogCreate` schema are captured here, since this runs on
+        the thread that emitted the record. Serialization and size accounting are left
+        to the `APILogWorker`, which drops logs exceeding the maximum size.
         """
         flow_run_id = getattr(record, "flow_run_id", None)
         task_run_id = getattr(record, "task_run_id", None)
@@ -213,9 +261,6 @@ class APILogHandler(logging.Handler):
                     "run information."
                 )
 
-        # Parsing to a `LogCreate` object here gives us nice parsing error messages
-        # from the standard lib `handleError` method if something goes wrong and
-        # prevents malformed logs from entering the queue
         try:
             is_uuid_like = isinstance(flow_run_id, uuid.UUID) or (
                 isinstance(flow_run_id, str) and uuid.UUID(flow_run_id)
@@ -223,30 +268,20 @@ class APILogHandler(logging.Handler):
         except ValueError:
             is_uuid_like = False
 
-        log = LogCreate(
-            flow_run_id=flow_run_id if is_uuid_like else None,
-            task_run_id=task_run_id,
-            worker_id=worker_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=pendulum.from_timestamp(
-                getattr(record, "created", None) or time.time()
-            ),
-            message=self.format(record),
-        ).model_dump(mode="json")
-
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
-            raise ValueError(
-                f"Log of size {log_size} is greater than the max size of "
-                f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
-            )
-
+        # Malformed ids raise here so that `handleError` reports them and they never
+        # enter the queue
+        log: Dict[str, Any] = {
+            "name": record.name,
+            "level": record.levelno,
+            "message": self.format(record),
+            "timestamp": getattr(record, "created", None) or time.time(),
+            "flow_run_id": flow_run_id if is_uuid_like else None,
+            "task_run_id": _as_uuid(task_run_id),
+        }
+        if worker_id is not None:
+            log["worker_id"] = _as_uuid(worker_id)
         return log
 
-    def _get_payload_size(self, log: Dict[str, Any]) -> int:
-        return len(json.dumps(log).encode())
-
 
 class WorkerAPILogHandler(APILogHandler):
     def emit(self, record: logging.LogRecord) -> None:
@@ -259,33 +294,21 @@ class WorkerAPILogHandler(APILogHandler):
 
     def prepare(self, record: logging.LogRecord) -> Dict[str, Any]:
         """
-        Convert a `logging.LogRecord` to the API `LogCreate` schema and serialize.
+        Convert a `logging.LogRecord` to a log for the `APILogWorker`.
 
         This will add in the worker id to the log.
 
-        Logs exceeding the maximum size will be dropped.
+        Logs exceeding the maximum size will be dropped by the `APILogWorker`.
         """
-
-        worker_id = getattr(record, "worker_id", None)
-
-        log = LogCreate(
-            worker_id=worker_id,
-            name=record.name,
-            level=record.levelno,
-            timestamp=pendulum.from_timestamp(
-                getattr(record, "created", None) or time.time()
-            ),
-            message=self.format(record),
-        ).model_dump(mode="json")
-
-        log_size = log["__payload_size__"] = self._get_payload_size(log)
-        if log_size > PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value():
-            raise ValueError(
-                f"Log of size {log_size} is greater than the max size of "
-                f"{PREFECT_LOGGING_TO_API_MAX_LOG_SIZE.value()}"
-            )
-
-        return log
+        return {
+            "name": record.name,
+            "level": record.levelno,
+            "message": self.format(record),
+            "timestamp": getattr(record, "created", None) or time.time(),
+            "flow_run_id": None,
+            "task_run_id": None,
+            "worker_id": _as_uuid(getattr(record, "worker_id", None)),
+        }
 
 
 class PrefectConsoleHandler(StreamHandler):
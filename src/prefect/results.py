@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import os
 import socket
+import struct
 import threading
 import uuid
 from functools import partial
@@ -15,6 +16,7 @@ from typing import (
     Callable,
     ClassVar,
     Generic,
+    Literal,
     Optional,
     TypeVar,
     Union,
@@ -245,6 +247,14 @@ def get_default_result_serializer() -> Serializer:
     return resolve_serializer(settings.results.default_serializer)
 
 
+def get_default_record_format() -> Literal["json", "binary"]:
+    """
+    Return the default format for serialized result records.
+    """
+    settings = get_current_settings()
+    return settings.results.record_format
+
+
 def get_default_persist_setting() -> bool:
     """
     Return the default option for result persistence.
@@ -348,6 +358,8 @@ class ResultStore(BaseModel):
         cache_result_in_memory: Whether to cache results in memory.
         serializer: The serializer to use for results.
         storage_key_fn: The function to generate storage keys.
+        record_format: The format to write result records in. Records in either
+            format can always be read.
     """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
@@ -366,6 +378,9 @@ class ResultStore(BaseModel):
     serializer: Serializer = Field(default_factory=get_default_result_serializer)
     storage_key_fn: Callable[[], str] = Field(default=DEFAULT_STORAGE_KEY_FN)
     cache: LRUCache[str, "ResultRecord[Any]"] = Field(default_factory=default_cache)
+    record_format: Literal["json", "binary"] = Field(
+        default_factory=get_default_record_format
+    )
 
     @property
     def result_storage_block_id(self) -> UUID | None:
@@ -789,12 +804,17 @@ class ResultStore(BaseModel):
                 self.result_storage,
                 "write_path",
                 (result_record.metadata.storage_key,),
-                {"content": result_record.serialize()},
+                {"content": self._serialize_record(result_record)},
             )
             await emit_result_write_event(self, result_record.metadata.storage_key)
         if self.cache_result_in_memory:
             self.cache[key] = result_record
 
+    def _serialize_record(self, result_record: "ResultRecord[Any]") -> bytes:
+        if self.record_format == "binary":
+            return result_record.serialize_binary()
+        return result_record.serialize()
+
     def persist_result_record(
         self, result_record: "ResultRecord[Any]", holder: str | None = None
     ) -> None:
@@ -975,7 +995,7 @@ class ResultStore(BaseModel):
             self.result_storage,
             "write_path",
             (f"parameters/{identifier}",),
-            {"content": record.serialize()},
+            {"content": self._serialize_record(record)},
         )
 
     @sync_compatible
@@ -1057,6 +1077,23 @@ class ResultRecordMetadata(BaseModel):
         )
 
 
+# Result records serialized in the binary format begin with this marker, which can
+# never begin a JSON document, so that they can be told apart from JSON records
+BINARY_RECORD_MARKER = b"\x00PFRR"
+BINARY_RECORD_VERSION = 1
+
+# marker, version, metadata length, and number of result frames
+_BINARY_RECORD_HEADER = struct.Struct(">5sBII")
+_BINARY_RECORD_FRAME_LENGTH = struct.Struct(">Q")
+
+
+def is_binary_record(data: bytes) -> bool:
+    """
+    Returns whether the given bytes are a result record in the binary format.
+    """
+    return data[: len(BINARY_RECORD_MARKER)] == BINARY_RECORD_MARKER
+
+
 class ResultRecord(BaseModel, Generic[R]):
     """
     A record of a result.
@@ -1074,8 +1111,11 @@ class ResultRecord(BaseModel, Generic[R]):
         return self.metadata.serializer
 
     def serialize_result(self) -> bytes:
+        return self._dump_result(self.serializer.dumps)
+
+    def _dump_result(self, dumps: Callable[[Any], T]) -> T:
         try:
-            data = self.serializer.dumps(self.result)
+            data = dumps(self.result)
         except Exception as exc:
             extra_info = (
                 'You can try a different serializer (e.g. result_serializer="json") '
@@ -1179,6 +1219,38 @@ class ResultRecord(BaseModel, Generic[R]):
             .encode()
         )
 
+    def serialize_binary(self) -> bytes:
+        """
+        Serialize the record to bytes in the binary format.
+
+        The binary format is a small header, followed by the record's metadata as JSON
+        and the frames of the serialized result. Unlike `serialize`, the result is
+        written as-is rather than embedded in JSON, so pickled results are not base64
+        encoded. Large buffers (like arrays) are kept out of the pickle, so they are
+        only copied once, when the frames are joined into the returned bytes.
+
+        Returns:
+            bytes: the serialized record
+        """
+        frames = self._dump_result(self.serializer.dumps_frames)
+        metadata = self.serialize_metadata()
+        return b"".join(
+            [
+                _BINARY_RECORD_HEADER.pack(
+                    BINARY_RECORD_MARKER,
+                    BINARY_RECORD_VERSION,
+                    len(metadata),
+                    len(frames),
+                ),
+                metadata,
+                *(
+                    _BINARY_RECORD_FRAME_LENGTH.pack(memoryview(frame).nbytes)
+                    for frame in frames
+                ),
+                *frames,
+            ]
+        )
+
     @classmethod
     def deserialize(
         cls, data: bytes, backup_serializer: Serializer | None = None
@@ -1194,6 +1266,9 @@ class ResultRecord(BaseModel, Generic[R]):
         Returns:
             ResultRecord: the deserialized record
         """
+        if is_binary_record(data):
+            return cls._deserialize_binary(data)
+
         try:
             instance = cls.model_validate_json(data)
         except ValidationError:
@@ -1211,6 +1286,43 @@ class ResultRecord(BaseModel, Generic[R]):
             instance.result = instance.serializer.loads(instance.result.encode())
         return instance
 
+    @classmethod
+    def _deserialize_binary(cls, data: bytes) -> "ResultRecord[R]":
+        view = memoryview(data)
+        _, version, metadata_length, frame_count = _BINARY_RECORD_HEADER.unpack_from(
+            view
+        )
+        if version != BINARY_RECORD_VERSION:
+            raise ValueError(
+                f"Unsupported binary result record version {version!r}; this version"
+                f" of Prefect supports version {BINARY_RECORD_VERSION}."
+            )
+        offset = _BINARY_RECORD_HEADER.size
+
+        metadata = ResultRecordMetadata.load_bytes(
+            bytes(view[offset : offset + metadata_length])
+        )
+        offset += metadata_length
+
+        lengths: list[int] = []
+        for _ in range(frame_count):
+            (length,) = _BINARY_RECORD_FRAME_LENGTH.unpack_from(view, offset)
+            lengths.append(length)
+            offset += _BINARY_RECORD_FRAME_LENGTH.size
+
+        if frame_count > 1 and view.readonly:
+            # Out-of-band frames back the deserialized objects directly (for example,
+            # the memory of an array), which would be read-only if they referred to
+            # immutable bytes, so copy the record once into writable memory
+            view = memoryview(bytearray(view))
+
+        frames: list[memoryview] = []
+        for length in lengths:
+            frames.append(view[offset : offset + length])
+            offset += length
+
+        return cls(metadata=metadata, result=metadata.serializer.loads_frames(frames))
+
     @classmethod
     def deserialize_from_result_and_metadata(
         cls, result: bytes, metadata: bytes
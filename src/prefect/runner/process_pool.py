@@ -0,0 +1,327 @@
+"""
+A pool of warm processes for executing flow runs.
+
+Starting a new process for every flow run pays for interpreter startup, importing
+Prefect, loading settings and importing the flow's code before the flow can start.
+For short flows that run often, this can take longer than the flow itself.
+
+Instead, a runner can keep processes that have already done this work waiting. Each
+waiting process is sent the ID of one flow run at a time over a socket, executes it,
+and reports the exit code the flow run would have had in its own process. Processes
+are replaced after a number of flow runs, and killing a process while it executes a
+flow run cancels that flow run just like killing a dedicated process would.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+from collections import defaultdict
+from types import TracebackType
+from typing import Dict, List, Optional, Set, Tuple, Type
+from uuid import UUID
+
+import anyio
+import anyio.abc
+from typing_extensions import Self
+
+from prefect.logging.loggers import get_logger
+from prefect.utilities.processutils import (
+    consume_process_output,
+    get_sys_executable,
+    open_process,
+)
+
+logger = get_logger("runner.process_pool")
+
+# Processes are pooled by their working directory, environment and the entrypoint of
+# the flow they have imported
+ProcessKey = Tuple[Optional[str], Tuple[Tuple[str, str], ...], Optional[str]]
+
+CLOSE_TIMEOUT_SECONDS = 10
+
+
+class FlowRunProcess:
+    """
+    A process that executes the flow runs sent to it, one at a time.
+    """
+
+    def __init__(
+        self, process: anyio.abc.Process, channel: socket.socket, key: ProcessKey
+    ):
+        self.process = process
+        self.key = key
+        self.runs = 0
+        self._channel = channel
+        self._buffer = b""
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.returncode is None and self._channel.fileno() != -1
+
+    async def run(self, flow_run_id: UUID) -> int:
+        """
+        Executes the given flow run, returning its exit code.
+
+        If the process exits while executing the flow run, its exit code is
+        returned instead.
+        """
+        self.runs += 1
+        try:
+            self._channel.sendall(f"{flow_run_id}\n".encode())
+            line = await self._readline()
+        except OSError:
+            line = None
+
+        if line is None:
+            self._channel.close()
+            return await self.process.wait()
+        return int(line)
+
+    async def close(self) -> None:
+        """
+        Asks the process to exit and waits for it, killing it if it doesn't exit
+        within `CLOSE_TIMEOUT_SECONDS`.
+        """
+        self._channel.close()
+        with anyio.move_on_after(CLOSE_TIMEOUT_SECONDS, shield=True):
+            await self.process.wait()
+            return
+
+        self.process.kill()
+        with anyio.CancelScope(shield=True):
+            await self.process.wait()
+
+    async def _readline(self) -> Optional[bytes]:
+        while b"\n" not in self._buffer:
+            await anyio.wait_socket_readable(self._channel)
+            data = self._channel.recv(4096)
+            if not data:
+                return None
+            self._buffer += data
+
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line
+
+
+class FlowRunProcessPool:
+    """
+    Keeps warm processes ready to execute flow runs.
+
+    Up to `size` idle processes are kept for each combination of working directory,
+    environment and flow entrypoint. A process is taken from the pool for each flow
+    run, or started if none are idle, and returned to the pool afterwards. Once a
+    process has executed `max_runs` flow runs, or has exited, a replacement is
+    started in the background so the next flow run finds a warm process.
+
+    Modules imported by a flow stay imported in its process until the process is
+    replaced, so changes to them are picked up after at most `max_runs` flow runs.
+
+    The output of every process is streamed to the output of this process. Process
+    pools are not supported on Windows.
+    """
+
+    def __init__(self, size: int, max_runs: int):
+        self.size = size
+        self.max_runs = max_runs
+        self._idle: Dict[ProcessKey, List[FlowRunProcess]] = defaultdict(list)
+        self._starting: Dict[ProcessKey, int] = defaultdict(int)
+        self._processes: Set[FlowRunProcess] = set()
+        self._task_group: Optional[anyio.abc.TaskGroup] = None
+        self._closing = False
+
+    async def __aenter__(self) -> Self:
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        assert self._task_group is not None
+        self._closing = True
+        for process in list(self._processes):
+            await self._close(process)
+        self._idle.clear()
+        await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
+        self._task_group = None
+
+    async def run(
+        self,
+        flow_run_id: UUID,
+        env: Dict[str, str],
+        cwd: Optional[str] = None,
+        entrypoint: Optional[str] = None,
+        task_status: Optional[anyio.abc.TaskStatus[int]] = None,
+    ) -> int:
+        """
+        Executes the given flow run in a warm process, returning its exit code.
+
+        Args:
+            flow_run_id: The ID of the flow run to execute
+            env: The environment for the process, which must not include anything
+                specific to the flow run
+            cwd: The working directory for the process
+            entrypoint: The entrypoint of the flow to import before the flow run is
+                received, if known
+            task_status: anyio task status which is sent the ID of the process once
+                the flow run has been sent to it
+        """
+        assert self._task_group is not None
+        key: ProcessKey = (cwd, tuple(sorted(env.items())), entrypoint)
+
+        process = self._take_idle(key)
+        if process is None:
+            process = await self._start(key)
+
+        if task_status is not None:
+            task_status.started(process.pid)
+
+        returncode = await process.run(flow_run_id)
+
+        if (
+            process.is_alive
+            and process.runs < self.max_runs
+            and len(self._idle[key]) < self.size
+        ):
+            self._idle[key].append(process)
+        else:
+            self._task_group.start_soon(self._close, process)
+            self._replenish(key)
+
+        return returncode
+
+    def _take_idle(self, key: ProcessKey) -> Optional[FlowRunProcess]:
+        idle = self._idle[key]
+        while idle:
+            process = idle.pop()
+            if process.is_alive:
+                return process
+            self._processes.discard(process)
+        return None
+
+    def _replenish(self, key: ProcessKey) -> None:
+        assert self._task_group is not None
+        missing = self.size - len(self._idle[key]) - self._starting[key]
+        for _ in range(max(missing, 0)):
+            self._starting[key] += 1
+            self._task_group.start_soon(self._start_idle, key)
+
+    async def _start_idle(self, key: ProcessKey) -> None:
+        try:
+            process = await self._start(key)
+        except Exception:
+            logger.exception("Failed to start a flow run process.")
+            return
+        finally:
+            self._starting[key] -= 1
+
+        if self._closing:
+            await self._close(process)
+        else:
+            self._idle[key].append(process)
+
+    async def _start(self, key: ProcessKey) -> FlowRunProcess:
+        assert self._task_group is not None
+        parent_channel, child_channel = socket.socketpair()
+        try:
+            process = await self._task_group.start(
+                self._run_process, key, child_channel
+            )
+        except BaseException:
+            parent_channel.close()
+            raise
+        finally:
+            child_channel.close()
+
+        parent_channel.setblocking(False)
+        flow_run_process = FlowRunProcess(process, parent_channel, key)
+        self._processes.add(flow_run_process)
+        logger.debug("Started flow run process %s", process.pid)
+        return flow_run_process
+
+    async def _run_process(
+        self,
+        key: ProcessKey,
+        channel: socket.socket,
+        task_status: anyio.abc.TaskStatus[anyio.abc.Process],
+    ) -> None:
+        cwd, env, entrypoint = key
+        command = [
+            get_sys_executable(),
+            "-m",
+            "prefect.runner.process_pool",
+            str(channel.fileno()),
+        ]
+        if entrypoint:
+            command.append(entrypoint)
+
+        async with open_process(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=dict(env),
+            cwd=cwd,
+            pass_fds=(channel.fileno(),),
+        ) as process:
+            task_status.started(process)
+            await consume_process_output(
+                process, stdout_sink=sys.stdout, stderr_sink=sys.stderr
+            )
+            await process.wait()
+
+    async def _close(self, process: FlowRunProcess) -> None:
+        self._processes.discard(process)
+        await process.close()
+        logger.debug("Closed flow run process %s", process.pid)
+
+
+def _serve(channel: socket.socket, entrypoint: Optional[str]) -> None:
+    """
+    Executes each flow run ID received on the channel, replying with its exit code,
+    until the channel is closed.
+    """
+    from prefect.engine import engine_logger, execute_flow_run
+    from prefect.flows import load_flow_from_entrypoint
+
+    if entrypoint:
+        # Importing the flow now means its modules are already imported when a
+        # flow run is received. The flow is loaded again for each flow run, so
+        # failures are reported there.
+        try:
+            load_flow_from_entrypoint(entrypoint, use_placeholder_flow=False)
+        except Exception:
+            engine_logger.debug(
+                "Failed to import flow from %r ahead of its flow runs",
+                entrypoint,
+                exc_info=True,
+            )
+
+    with channel, channel.makefile("rb") as lines:
+        for line in lines:
+            flow_run_id = UUID(line.decode().strip())
+            os.environ["PREFECT__FLOW_RUN_ID"] = str(flow_run_id)
+            # Loading a flow can change the working directory and the import path,
+            # e.g. after pull steps, which must not leak into the next flow run
+            cwd, path = os.getcwd(), list(sys.path)
+            try:
+                returncode = execute_flow_run(flow_run_id)
+            finally:
+                os.chdir(cwd)
+                sys.path[:] = path
+            channel.sendall(f"{returncode}\n".encode())
+
+
+if __name__ == "__main__":
+    _serve(
+        socket.socket(fileno=int(sys.argv[1])),
+        sys.argv[2] if len(sys.argv) > 2 else None,
+    )
@@ -100,6 +100,10 @@ from prefect.settings import (
     PREFECT_RUNNER_SERVER_ENABLE,
     get_current_settings,
 )
+from prefect.settings.snapshot import (
+    SETTINGS_SNAPSHOT_ENV_VAR,
+    create_settings_snapshot,
+)
 from prefect.states import (
     Crashed,
     Pending,
@@ -129,6 +133,7 @@ if TYPE_CHECKING:
     from prefect.client.schemas.responses import DeploymentResponse
     from prefect.client.types.flexible_schedule_list import FlexibleScheduleList
     from prefect.deployments.runner import RunnerDeployment
+    from prefect.runner.process_pool import FlowRunProcessPool
 
 __all__ = ["Runner"]
 
@@ -148,6 +153,7 @@ class Runner:
         limit: Optional[int] = None,
         pause_on_shutdown: bool = True,
         webserver: bool = False,
+        process_pool_size: Optional[int] = None,
     ):
         """
         Responsible for managing the execution of remotely initiated flow runs.
@@ -165,6 +171,10 @@ class Runner:
             pause_on_shutdown: A boolean for whether or not to automatically pause
                 deployment schedules on shutdown; defaults to `True`
             webserver: a boolean flag for whether to start a webserver for this runner
+            process_pool_size: The number of warm processes to keep ready for each
+                flow this runner executes, which have already imported Prefect and
+                the flow's code; defaults to `PREFECT_RUNNER_PROCESS_POOL_SIZE`. If 0,
+                a new process is started for every flow run. Not supported on Windows.
 
         Examples:
             Set up a Runner to manage the execute of scheduled flow runs for two flows:
@@ -213,6 +223,16 @@ class Runner:
         if self.heartbeat_seconds is not None and self.heartbeat_seconds < 30:
             raise ValueError("Heartbeat must be 30 seconds or greater.")
 
+        self.process_pool_size: int = (
+            settings.runner.process_pool_size
+            if process_pool_size is None
+            else process_pool_size
+        )
+        self._process_pool_max_runs: int = settings.runner.process_pool_max_runs
+        if self.process_pool_size and sys.platform == "win32":
+            raise ValueError("Process pools are not supported on Windows.")
+        self._process_pool: "FlowRunProcessPool | None" = None
+
         self._limiter: anyio.CapacityLimiter | None = None
         self._client: PrefectClient = get_client()
         self._submitting_flow_run_ids: set[UUID] = set()
@@ -612,7 +632,8 @@ class Runner:
         entrypoint: Optional[str] = None,
     ) -> int:
         """
-        Runs the given flow run in a subprocess.
+        Runs the given flow run in a subprocess, or in a warm process from the
+        runner's process pool if it has one.
 
         Args:
             flow_run: Flow run to execute via process. The ID of this flow run
@@ -635,7 +656,8 @@ class Runner:
 
         flow_run_logger.info("Opening process...")
 
-        env = get_current_settings().to_environment_variables(exclude_unset=True)
+        settings = get_current_settings()
+        env = settings.to_environment_variables(exclude_unset=True)
         env.update(
             {
                 **{
@@ -672,23 +694,50 @@ class Runner:
                 await storage.pull_code()
                 setattr(storage, "last_adhoc_pull", datetime.datetime.now())
 
-        process = await run_process(
-            command=command,
-            stream_output=True,
-            task_status=task_status,
-            task_status_handler=None,
-            env=env,
-            cwd=storage.destination if storage else None,
-            **kwargs,
-        )
+        cwd = str(storage.destination) if storage else None
+
+        # Pass the settings resolved here to the flow run process, so that it
+        # doesn't need to resolve them again
+        snapshot = create_settings_snapshot(settings, env, cwd=cwd)
+        if snapshot:
+            env[SETTINGS_SNAPSHOT_ENV_VAR] = snapshot
+        else:
+            env.pop(SETTINGS_SNAPSHOT_ENV_VAR, None)
+
+        if self._process_pool is not None:
+            # Warm processes are shared between flow runs, so they're sent the ID
+            # of each flow run instead of finding it in their environment
+            env.pop("PREFECT__FLOW_RUN_ID", None)
+            if not entrypoint:
+                _, deployment = await self._get_flow_and_deployment(flow_run)
+                entrypoint = deployment.entrypoint if deployment else None
+
+            returncode = await self._process_pool.run(
+                flow_run.id,
+                env=env,
+                cwd=cwd,
+                entrypoint=entrypoint,
+                task_status=task_status,
+            )
+        else:
+            process = await run_process(
+                command=command,
+                stream_output=True,
+                task_status=task_status,
+                task_status_handler=None,
+                env=env,
+                cwd=cwd,
+                **kwargs,
+            )
+            returncode = process.returncode
 
-        if process.returncode is None:
+        if returncode is None:
             raise RuntimeError("Process exited with None return code")
 
-        if process.returncode:
+        if returncode:
             help_message = None
             level = logging.ERROR
-            if process.returncode == -9:
+            if returncode == -9:
                 level = logging.INFO
                 help_message = (
                     "This indicates that the process exited due to a SIGKILL signal. "
@@ -696,20 +745,18 @@ class Runner:
                     "high memory usage causing the operating system to "
                     "terminate the process."
                 )
-            if process.returncode == -15:
+            if returncode == -15:
                 level = logging.INFO
                 help_message = (
                     "This indicates that the process exited due to a SIGTERM signal. "
                     "Typically, this is caused by manual cancellation."
                 )
-            elif process.returncode == 247:
+            elif returncode == 247:
                 help_message = (
                     "This indicates that the process was terminated due to high "
                     "memory usage."
                 )
-            elif (
-                sys.platform == "win32" and process.returncode == STATUS_CONTROL_C_EXIT
-            ):
+            elif sys.platform == "win32" and returncode == STATUS_CONTROL_C_EXIT:
                 level = logging.INFO
                 help_message = (
                     "Process was terminated due to a Ctrl+C or Ctrl+Break signal. "
@@ -719,15 +766,14 @@ class Runner:
             flow_run_logger.log(
                 level,
                 f"Process for flow run {flow_run.name!r} exited with status code:"
-                f" {process.returncode}"
-                + (f"; {help_message}" if help_message else ""),
+                f" {returncode}" + (f"; {help_message}" if help_message else ""),
             )
         else:
             flow_run_logger.info(
                 f"Process for flow run {flow_run.name!r} exited cleanly."
             )
 
-        return process.returncode
+        return returncode
 
     async def _kill_process(
         self,
@@ -1426,6 +1472,16 @@ class Runner:
 
         await self._client.__aenter__()
 
+        # The process pool is entered before the runs task group so that it's
+        # closed after every flow run has finished
+        if self.process_pool_size:
+            from prefect.runner.process_pool import FlowRunProcessPool
+
+            self._process_pool = FlowRunProcessPool(
+                size=self.process_pool_size, max_runs=self._process_pool_max_runs
+            )
+            await self._process_pool.__aenter__()
+
         if not hasattr(self, "_runs_task_group") or not self._runs_task_group:
             self._runs_task_group: anyio.abc.TaskGroup = anyio.create_task_group()
         await self._runs_task_group.__aenter__()
@@ -1448,6 +1504,10 @@ class Runner:
         if self._runs_task_group:
             await self._runs_task_group.__aexit__(*exc_info)
 
+        if self._process_pool:
+            await self._process_pool.__aexit__(*exc_info)
+            self._process_pool = None
+
         if self._client:
             await self._client.__aexit__(*exc_info)
 
@@ -1,3 +1,4 @@
+import json
 import shutil
 import subprocess
 from copy import deepcopy
@@ -25,6 +26,21 @@ from prefect.filesystems import ReadableDeploymentStorage, WritableDeploymentSto
 from prefect.logging.loggers import get_logger
 from prefect.utilities.collections import visit_collection
 
+REMOTE_STORAGE_MANIFEST_FILENAME = ".prefect-remote-storage-manifest.json"
+
+# The details reported by `fsspec` filesystems that change whenever a file's
+# contents do, in order of preference
+REMOTE_FILE_VERSION_KEYS = (
+    "ETag",  # s3fs
+    "etag",  # gcsfs, adlfs
+    "md5Hash",  # gcsfs
+    "LastModified",  # s3fs
+    "last_modified",  # adlfs
+    "updated",  # gcsfs
+    "mtime",  # local
+    "created",  # memory
+)
+
 
 @runtime_checkable
 class RunnerStorage(Protocol):
@@ -221,9 +237,49 @@ class GitRepository:
         except Exception:
             return False
 
+    async def _is_up_to_date(self) -> bool:
+        """
+        Check if the local checkout is already at the commit the remote branch
+        points to, without fetching any objects.
+        """
+        ref = self._branch or "HEAD"
+        try:
+            remote = await run_process(
+                ["git", "ls-remote", "origin", ref], cwd=self.destination
+            )
+            local = await run_process(
+                ["git", "rev-parse", "HEAD"], cwd=self.destination
+            )
+        except subprocess.CalledProcessError:
+            return False
+
+        remote_refs = {}
+        for line in (remote.stdout or b"").decode().splitlines():
+            sha, _, name = line.partition("\t")
+            remote_refs[name.strip()] = sha.strip()
+
+        # Prefer a branch over a tag of the same name, and a peeled tag over the
+        # tag object itself
+        for name in (
+            ref,
+            f"refs/heads/{ref}",
+            f"refs/tags/{ref}^{{}}",
+            f"refs/tags/{ref}",
+        ):
+            if name in remote_refs:
+                remote_head = remote_refs[name]
+                break
+        else:
+            return False
+
+        return remote_head == (local.stdout or b"").decode().strip()
+
     async def pull_code(self) -> None:
         """
         Pulls the contents of the configured repository to the local filesystem.
+
+        If the repository has already been cloned, the pull is skipped when the
+        remote branch has not moved since the last pull.
         """
         self._logger.debug(
             "Pulling contents from repository '%s' to '%s'...",
@@ -256,8 +312,16 @@ class GitRepository:
                     cwd=self.destination,
                 )
 
+            if await self._is_up_to_date():
+                self._logger.debug(
+                    "Remote origin/%s is unchanged, skipping pull", self._branch
+                )
+                return
+
             self._logger.debug("Pulling latest changes from origin/%s", self._branch)
-            # Update the existing repository
+            # Update the existing repository. The clone is shallow, so fetching
+            # without `--depth` only transfers the commits made since the last pull
+            # and lets them be fast-forwarded onto the local branch.
             cmd = ["git"]
             # Add the git configuration, must be given after `git` and before the command
             cmd += self._git_config
@@ -267,7 +331,7 @@ class GitRepository:
                 cmd += [self._branch]
             if self._include_submodules:
                 cmd += ["--recurse-submodules"]
-            cmd += ["--depth", "1"]
+            cmd += ["--ff-only"]
             try:
                 await run_process(cmd, cwd=self.destination)
                 self._logger.debug("Successfully pulled latest changes")
@@ -505,16 +569,9 @@ class RemoteStorage:
         if not self.destination.exists():
             self.destination.mkdir(parents=True, exist_ok=True)
 
-        remote_path = str(self._remote_path) + "/"
-
         try:
             await from_async.wait_for_call_in_new_thread(
-                create_call(
-                    self._filesystem.get,
-                    remote_path,
-                    str(self.destination),
-                    recursive=True,
-                )
+                create_call(self._pull_changed_files)
             )
         except Exception as exc:
             raise RuntimeError(
@@ -522,6 +579,61 @@ class RemoteStorage:
                 f" {self.destination!r}"
             ) from exc
 
+    @property
+    def _manifest_path(self) -> Path:
+        """
+        The local file recording the version of each file pulled from remote
+        storage.
+        """
+        return self.destination / REMOTE_STORAGE_MANIFEST_FILENAME
+
+    def _read_manifest(self) -> Dict[str, str]:
+        try:
+            return json.loads(self._manifest_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _pull_changed_files(self) -> None:
+        """
+        Copies the files that have changed in remote storage since the last pull
+        to the local filesystem.
+
+        Files are compared using the version information their filesystem reports,
+        such as an ETag or modification time, and recorded in a manifest in the
+        destination directory. Files without any version information are always
+        copied.
+        """
+        filesystem = self._filesystem
+        remote_path = str(self._remote_path) + "/"
+        remote_root = filesystem._strip_protocol(remote_path).rstrip("/")
+
+        previous = self._read_manifest()
+        manifest: Dict[str, str] = {}
+        remote_files, local_files = [], []
+        for path, info in filesystem.find(remote_path, detail=True).items():
+            relative_path = path[len(remote_root) :].lstrip("/")
+            local_path = self.destination / relative_path
+            version = _file_version(info)
+            if version is not None:
+                manifest[relative_path] = version
+            if (
+                version is None
+                or previous.get(relative_path) != version
+                or not local_path.exists()
+            ):
+                remote_files.append(path)
+                local_files.append(str(local_path))
+
+        self._logger.debug(
+            "Pulling %d changed file(s) from remote storage '%s'",
+            len(remote_files),
+            self._url,
+        )
+        if remote_files:
+            filesystem.get(remote_files, local_files)
+
+        self._manifest_path.write_text(json.dumps(manifest))
+
     def to_pull_step(self) -> dict[str, Any]:
         """
         Returns a dictionary representation of the storage object that can be
@@ -720,6 +832,17 @@ def create_storage_from_source(
         return LocalStorage(path=source, pull_interval=pull_interval)
 
 
+def _file_version(info: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns a string identifying the version of a file from the details reported by
+    its `fsspec` filesystem, or `None` if the filesystem reports no version details.
+    """
+    for key in REMOTE_FILE_VERSION_KEYS:
+        if info.get(key) is not None:
+            return f"{key}={info[key]};size={info.get('size')}"
+    return None
+
+
 def _format_token_from_credentials(netloc: str, credentials: dict) -> str:
     """
     Formats the credentials block for the git provider.
@@ -12,6 +12,7 @@ bytes to an object respectively.
 """
 
 import base64
+import pickle
 from typing import Any, ClassVar, Generic, Optional, Union, overload
 
 from pydantic import (
@@ -112,6 +113,21 @@ class Serializer(BaseModel, Generic[D]):
         """Decode the blob of bytes into an object."""
         raise NotImplementedError
 
+    def dumps_frames(self, obj: D) -> list[Union[bytes, memoryview]]:
+        """
+        Encode the object into one or more frames of bytes.
+
+        Used by binary result records, which store each frame as-is rather than
+        embedding the encoded object in JSON. Serializers that can expose large
+        buffers without copying them into the encoded object may return them as
+        additional frames.
+        """
+        return [self.dumps(obj)]
+
+    def loads_frames(self, frames: list[memoryview]) -> D:
+        """Decode an object from the frames produced by `dumps_frames`."""
+        return self.loads(bytes(frames[0]))
+
     model_config: ClassVar[ConfigDict] = ConfigDict(extra="forbid")
 
     @classmethod
@@ -128,6 +144,9 @@ class PickleSerializer(Serializer[D]):
     - Stores the version of the pickle library to check for compatibility during
         deserialization.
     - Wraps pickles in base64 for safe transmission.
+    - Writes raw pickles with protocol 5 out-of-band buffers when framed (see
+        `dumps_frames`), so large buffers like arrays are returned as separate
+        frames instead of being copied into the pickle.
     """
 
     type: str = Field(default="pickle", frozen=True)
@@ -148,6 +167,22 @@ class PickleSerializer(Serializer[D]):
         pickler = from_qualified_name(self.picklelib)
         return pickler.loads(base64.decodebytes(blob))
 
+    def dumps_frames(self, obj: D) -> list[Union[bytes, memoryview]]:
+        pickler = from_qualified_name(self.picklelib)
+        buffers: list[pickle.PickleBuffer] = []
+        try:
+            blob = pickler.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        except TypeError:
+            # the pickle library does not support out-of-band buffers
+            return [pickler.dumps(obj)]
+        return [blob, *(buffer.raw() for buffer in buffers)]
+
+    def loads_frames(self, frames: list[memoryview]) -> D:
+        pickler = from_qualified_name(self.picklelib)
+        if len(frames) == 1:
+            return pickler.loads(frames[0])
+        return pickler.loads(frames[0], buffers=frames[1:])
+
 
 class JSONSerializer(Serializer[D]):
     """
@@ -5,6 +5,7 @@ from fastapi import Response, WebSocket, status
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends, Path
 from fastapi.params import Body, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.status import WS_1002_PROTOCOL_ERROR
@@ -56,17 +57,31 @@ async def create_events(
         await messaging.publish(received_events)
 
 
+# Clients that offer this subprotocol may send frames containing a JSON array of
+# events in addition to single events
+BATCHED_EVENTS_SUBPROTOCOL = "prefect-events-batch"
+
+_event_batch_adapter: TypeAdapter[List[Event]] = TypeAdapter(List[Event])
+
+
 @router.websocket("/in")
 async def stream_events_in(websocket: WebSocket) -> None:
     """Open a WebSocket to stream incoming Events"""
 
-    await websocket.accept()
+    if BATCHED_EVENTS_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+        await websocket.accept(subprotocol=BATCHED_EVENTS_SUBPROTOCOL)
+    else:
+        await websocket.accept()
 
     try:
         async with messaging.create_event_publisher() as publisher:
             async for event_json in websocket.iter_text():
-                event = Event.model_validate_json(event_json)
-                await publisher.publish_event(event.receive())
+                if event_json.startswith("["):
+                    events = _event_batch_adapter.validate_json(event_json)
+                else:
+                    events = [Event.model_validate_json(event_json)]
+                for event in events:
+                    await publisher.publish_event(event.receive())
     except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:  # pragma: no cover
         pass  # it's fine if a client disconnects either normally or abnormally
 
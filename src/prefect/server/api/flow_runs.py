@@ -781,6 +781,15 @@ async def paginate_flow_runs(
 
 
 FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT = 1000
+# The size in characters of the chunks of CSV sent to the client
+FLOW_RUN_LOGS_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _flush(data: io.StringIO) -> str:
+    chunk = data.getvalue()
+    data.seek(0)
+    data.truncate(0)
+    return chunk
 
 
 @router.get("/{id}/logs/download")
@@ -806,39 +815,27 @@ async def download_logs(
                 ["timestamp", "level", "flow_run_id", "task_run_id", "message"]
             )
 
-            offset = 0
-            limit = FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT
-
-            while True:
-                results = await models.logs.read_logs(
-                    session=session,
-                    log_filter=schemas.filters.LogFilter(
-                        flow_run_id={"any_": [flow_run_id]}
-                    ),
-                    offset=offset,
-                    limit=limit,
-                    sort=schemas.sorting.LogSort.TIMESTAMP_ASC,
+            async for log in models.logs.stream_logs(
+                session=session,
+                log_filter=schemas.filters.LogFilter(
+                    flow_run_id={"any_": [flow_run_id]}
+                ),
+                sort=schemas.sorting.LogSort.TIMESTAMP_ASC,
+                batch_size=FLOW_RUN_LOGS_DOWNLOAD_PAGE_LIMIT,
+            ):
+                csv_writer.writerow(
+                    [
+                        log.timestamp,
+                        log.level,
+                        log.flow_run_id,
+                        log.task_run_id,
+                        log.message,
+                    ]
                 )
+                if data.tell() >= FLOW_RUN_LOGS_DOWNLOAD_CHUNK_SIZE:
+                    yield _flush(data)
 
-                if not results:
-                    break
-
-                offset += limit
-
-                for log in results:
-                    csv_writer.writerow(
-                        [
-                            log.timestamp,
-                            log.level,
-                            log.flow_run_id,
-                            log.task_run_id,
-                            log.message,
-                        ]
-                    )
-                    data.seek(0)
-                    yield data.read()
-                    data.seek(0)
-                    data.truncate(0)
+            yield _flush(data)
 
         return StreamingResponse(
             generate(),
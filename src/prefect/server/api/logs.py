@@ -2,7 +2,7 @@
 Routes for interacting with log objects.
 """
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import Body, Depends, status
 
@@ -32,6 +32,14 @@ async def read_logs(
     offset: int = Body(0, ge=0),
     logs: schemas.filters.LogFilter = None,
     sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    after: Optional[schemas.core.LogCursor] = Body(
+        None,
+        description=(
+            "Only return logs that come after this log in the sort order. Pass the"
+            " timestamp and ID of the last log of the previous page to read the next"
+            " page without the cost of skipping over earlier logs."
+        ),
+    ),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.core.Log]:
     """
@@ -39,5 +47,10 @@ async def read_logs(
     """
     async with db.session_context() as session:
         return await models.logs.read_logs(
-            session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
+            session=session,
+            log_filter=logs,
+            offset=offset,
+            limit=limit,
+            sort=sort,
+            after=after,
         )
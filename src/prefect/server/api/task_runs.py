@@ -32,6 +32,7 @@ from prefect.server.schemas.responses import OrchestrationResult
 from prefect.server.task_queue import MultiQueue, TaskQueue
 from prefect.server.utilities import subscriptions
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import PREFECT_API_DEFAULT_LIMIT
 from prefect.types import DateTime
 
 if TYPE_CHECKING:
@@ -84,6 +85,70 @@ async def create_task_run(
     return new_task_run
 
 
+@router.post("/bulk")
+async def create_task_runs(
+    task_runs: List[schemas.actions.TaskRunCreate],
+    response: Response,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[schemas.core.TaskRun]:
+    """
+    Create many task runs in one transaction, such as background task runs
+    submitted together. As with creating a single task run, if a task run with the
+    same flow_run_id, task_key, and dynamic_key already exists, the existing task
+    run will be returned in its place.
+
+    Responds with 201 if any task run was created, and 200 if all of them already
+    existed. At most `PREFECT_API_DEFAULT_LIMIT` task runs can be created at once.
+    """
+    limit = PREFECT_API_DEFAULT_LIMIT.value()
+    if len(task_runs) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid request: at most {limit} task runs can be created at once.",
+        )
+
+    # deferred task runs are enqueued for task workers only after the transaction
+    # commits, so a failure partway through the batch doesn't leave rolled back
+    # task runs in the queue
+    enqueue_after_commit: List[schemas.core.TaskRun] = []
+    orchestration_parameters = {
+        **orchestration_parameters,
+        "enqueue_after_commit": enqueue_after_commit,
+    }
+
+    now = pendulum.now("UTC")
+
+    task_run_models: List[Any] = []
+    async with db.session_context(begin_transaction=True) as session:
+        for task_run_create in task_runs:
+            task_run_dict = task_run_create.model_dump()
+            if not task_run_dict.get("id"):
+                task_run_dict.pop("id", None)
+            task_run = schemas.core.TaskRun(**task_run_dict)
+
+            if not task_run.state:
+                task_run.state = schemas.states.Pending()
+
+            task_run_models.append(
+                await models.task_runs.create_task_run(
+                    session=session,
+                    task_run=task_run,
+                    orchestration_parameters=orchestration_parameters,
+                )
+            )
+
+    for task_run in enqueue_after_commit:
+        await TaskQueue.for_key(task_run.task_key).enqueue(task_run)
+
+    if any(model.created >= now for model in task_run_models):
+        response.status_code = status.HTTP_201_CREATED
+
+    return [schemas.core.TaskRun.model_validate(model) for model in task_run_models]
+
+
 @router.patch("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_task_run(
     task_run: schemas.actions.TaskRunUpdate,
@@ -2,7 +2,7 @@
 Routes for interacting with work queue objects.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 import pendulum
@@ -13,22 +13,35 @@ from fastapi import (
     Depends,
     HTTPException,
     Path,
+    Response,
+    WebSocket,
     status,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.websockets import WebSocketDisconnect
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.api.validation import validate_job_variable_defaults_for_work_pool
 from prefect.server.database import PrefectDBInterface, provide_database_interface
+from prefect.server.events import stream
+from prefect.server.events.filters import (
+    EventFilter,
+    EventOccurredFilter,
+    EventResourceFilter,
+)
+from prefect.server.events.schemas.events import ResourceSpecification
 from prefect.server.models.deployments import mark_deployments_ready
 from prefect.server.models.work_queues import (
     emit_work_queue_status_event,
     mark_work_queues_ready,
 )
 from prefect.server.models.workers import emit_work_pool_status_event
+from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.orchestration.policies import FlowRunOrchestrationPolicy
 from prefect.server.schemas.statuses import WorkQueueStatus
+from prefect.server.utilities import subscriptions
 from prefect.server.utilities.server import PrefectRouter
 from prefect.types import DateTime
 
@@ -316,6 +329,61 @@ async def delete_work_pool(
         )
 
 
+async def _read_polled_work_queues(
+    session: AsyncSession,
+    work_pool_name: str,
+    work_queue_names: Optional[List[str]],
+    worker_lookups: WorkerLookups,
+) -> tuple[UUID, List["ORMWorkQueue"], Optional[List[UUID]]]:
+    """
+    Reads the work pool and the work queues that a worker polls, returning the ID
+    of the work pool, the work queues, and the IDs of the work queues to get runs
+    from, or `None` to get runs from all of the work pool's queues.
+    """
+    work_pool_id = await worker_lookups._get_work_pool_id_from_name(
+        session=session, work_pool_name=work_pool_name
+    )
+
+    if not work_queue_names:
+        work_queues = list(
+            await models.workers.read_work_queues(
+                session=session, work_pool_id=work_pool_id
+            )
+        )
+        # None here instructs get_scheduled_flow_runs to use the default behavior
+        # of just operating on all work queues of the pool
+        return work_pool_id, work_queues, None
+
+    work_queues = [
+        await worker_lookups._get_work_queue_from_name(
+            session=session,
+            work_pool_name=work_pool_name,
+            work_queue_name=name,
+        )
+        for name in work_queue_names
+    ]
+    return work_pool_id, work_queues, [wq.id for wq in work_queues]
+
+
+def _mark_polled_work_queues_ready(
+    background_tasks: BackgroundTasks, work_queues: List["ORMWorkQueue"]
+) -> None:
+    background_tasks.add_task(
+        mark_work_queues_ready,
+        polled_work_queue_ids=[
+            wq.id for wq in work_queues if wq.status != WorkQueueStatus.NOT_READY
+        ],
+        ready_work_queue_ids=[
+            wq.id for wq in work_queues if wq.status == WorkQueueStatus.NOT_READY
+        ],
+    )
+
+    background_tasks.add_task(
+        mark_deployments_ready,
+        work_queue_ids=[wq.id for wq in work_queues],
+    )
+
+
 @router.post("/{name}/get_scheduled_flow_runs")
 async def get_scheduled_flow_runs(
     background_tasks: BackgroundTasks,
@@ -337,30 +405,13 @@ async def get_scheduled_flow_runs(
     Load scheduled runs for a worker
     """
     async with db.session_context() as session:
-        work_pool_id = await worker_lookups._get_work_pool_id_from_name(
-            session=session, work_pool_name=work_pool_name
+        work_pool_id, work_queues, work_queue_ids = await _read_polled_work_queues(
+            session=session,
+            work_pool_name=work_pool_name,
+            work_queue_names=work_queue_names,
+            worker_lookups=worker_lookups,
         )
 
-        if not work_queue_names:
-            work_queues = list(
-                await models.workers.read_work_queues(
-                    session=session, work_pool_id=work_pool_id
-                )
-            )
-            # None here instructs get_scheduled_flow_runs to use the default behavior
-            # of just operating on all work queues of the pool
-            work_queue_ids = None
-        else:
-            work_queues = [
-                await worker_lookups._get_work_queue_from_name(
-                    session=session,
-                    work_pool_name=work_pool_name,
-                    work_queue_name=name,
-                )
-                for name in work_queue_names
-            ]
-            work_queue_ids = [wq.id for wq in work_queues]
-
     async with db.session_context(begin_transaction=True) as session:
         queue_response = await models.workers.get_scheduled_flow_runs(
             session=session,
@@ -371,22 +422,175 @@ async def get_scheduled_flow_runs(
             limit=limit,
         )
 
-    background_tasks.add_task(
-        mark_work_queues_ready,
-        polled_work_queue_ids=[
-            wq.id for wq in work_queues if wq.status != WorkQueueStatus.NOT_READY
-        ],
-        ready_work_queue_ids=[
-            wq.id for wq in work_queues if wq.status == WorkQueueStatus.NOT_READY
-        ],
-    )
+    _mark_polled_work_queues_ready(background_tasks, work_queues)
 
-    background_tasks.add_task(
-        mark_deployments_ready,
-        work_queue_ids=[wq.id for wq in work_queues],
+    return queue_response
+
+
+# The number of runs a claim proposed a `Pending` state for that were rejected
+REJECTED_CLAIMS_HEADER = "X-Prefect-Rejected-Claims"
+
+
+@router.post("/{name}/claim_flow_runs")
+async def claim_flow_runs(
+    background_tasks: BackgroundTasks,
+    response: Response,
+    work_pool_name: str = Path(..., description="The work pool name", alias="name"),
+    work_queue_names: List[str] = Body(
+        None, description="The names of work pool queues"
+    ),
+    scheduled_before: DateTime = Body(
+        None, description="The maximum time to look for scheduled flow runs"
+    ),
+    scheduled_after: DateTime = Body(
+        None, description="The minimum time to look for scheduled flow runs"
+    ),
+    limit: int = dependencies.LimitBody(),
+    worker_lookups: WorkerLookups = Depends(WorkerLookups),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    flow_policy: type[FlowRunOrchestrationPolicy] = Depends(
+        orchestration_dependencies.provide_flow_policy
+    ),
+    orchestration_parameters: Dict[str, Any] = Depends(
+        orchestration_dependencies.provide_flow_orchestration_parameters
+    ),
+    api_version: str = Depends(dependencies.provide_request_api_version),
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Claim scheduled runs for a worker by moving them to a `Pending` state.
+
+    Unlike `get_scheduled_flow_runs`, each run is returned to only one worker, even
+    when many workers poll the same work pool at once, so workers don't need to
+    propose `Pending` states for runs that other workers may have already
+    submitted. Runs whose `Pending` transitions are rejected aren't returned, and
+    are counted in the `X-Prefect-Rejected-Claims` response header.
+    """
+    # pass the request version to the orchestration engine to support compatibility code
+    orchestration_parameters.update({"api-version": api_version})
+
+    async with db.session_context() as session:
+        work_pool_id, work_queues, work_queue_ids = await _read_polled_work_queues(
+            session=session,
+            work_pool_name=work_pool_name,
+            work_queue_names=work_queue_names,
+            worker_lookups=worker_lookups,
+        )
+
+    rejected_flow_run_ids: List[UUID] = []
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        claimed = await models.workers.claim_scheduled_flow_runs(
+            session=session,
+            work_pool_ids=[work_pool_id],
+            work_queue_ids=work_queue_ids,
+            scheduled_before=scheduled_before,
+            scheduled_after=scheduled_after,
+            limit=limit,
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+            rejected_flow_run_ids=rejected_flow_run_ids,
+        )
+
+    _mark_polled_work_queues_ready(background_tasks, work_queues)
+
+    response.headers[REJECTED_CLAIMS_HEADER] = str(len(rejected_flow_run_ids))
+    return claimed
+
+
+@router.websocket("/{name}/subscriptions/scheduled")
+async def scheduled_flow_run_subscription(
+    websocket: WebSocket,
+    work_pool_name: str = Path(..., description="The work pool name", alias="name"),
+) -> None:
+    """
+    Notify a worker of flow runs moving to a `Scheduled` state in the work pool
+    queues it polls, along with when they are scheduled to start, so that it can
+    poll for them without waiting for its next query interval.
+
+    Flow runs that the scheduler service creates for deployment schedules are
+    inserted without state change events, so they aren't notified. They are created
+    well ahead of their scheduled start time, and are picked up by polling.
+    """
+    websocket = await subscriptions.accept_prefect_socket(websocket)
+    if not websocket:
+        return
+
+    try:
+        subscription = await websocket.receive_json()
+    except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:
+        return
+
+    if subscription.get("type") != "subscribe":
+        return await websocket.close(
+            code=4001, reason="Protocol violation: expected 'subscribe' message"
+        )
+
+    db = provide_database_interface()
+    try:
+        async with db.session_context() as session:
+            work_pool_id, _, work_queue_ids = await _read_polled_work_queues(
+                session=session,
+                work_pool_name=work_pool_name,
+                work_queue_names=subscription.get("keys"),
+                worker_lookups=WorkerLookups(),
+            )
+    except HTTPException as exc:
+        return await websocket.close(code=4404, reason=exc.detail)
+
+    # Runs are matched on the work pool or queues related to their state change
+    # events, which the flow run orchestration policies emit for every transition
+    related_ids = (
+        {f"prefect.work-queue.{id}" for id in work_queue_ids}
+        if work_queue_ids
+        else {f"prefect.work-pool.{work_pool_id}"}
+    )
+    filter = EventFilter(
+        occurred=EventOccurredFilter(
+            since=pendulum.now("UTC"),
+            until=pendulum.now("UTC").add(years=1),
+        ),
+        resource=EventResourceFilter(
+            id_prefix=["prefect.flow-run."],
+            labels=ResourceSpecification({"prefect.state-type": "SCHEDULED"}),
+        ),
     )
 
-    return queue_response
+    try:
+        async with stream.events(filter) as event_stream:
+            async for event in event_stream:
+                if not event:
+                    if await subscriptions.still_connected(websocket):
+                        continue
+                    break
+
+                if not any(related.id in related_ids for related in event.related):
+                    continue
+
+                # Workers only poll for runs scheduled within their prefetch window,
+                # so they are told when the run is due to start
+                validated_state = event.payload.get("validated_state") or {}
+                await websocket.send_json(
+                    {
+                        "id": event.resource.id.removeprefix("prefect.flow-run."),
+                        "next_scheduled_start_time": validated_state.get(
+                            "scheduled_time"
+                        ),
+                    }
+                )
+
+                acknowledgement = await websocket.receive_json()
+                ack_type = acknowledgement.get("type")
+                if ack_type != "ack":
+                    if ack_type == "quit":
+                        return await websocket.close()
+
+                    raise WebSocketDisconnect(
+                        code=4001, reason="Protocol violation: expected 'ack' message"
+                    )
+
+    except subscriptions.NORMAL_DISCONNECT_EXCEPTIONS:
+        pass  # it's fine if a client disconnects either normally or abnormally
 
 
 # -----------------------------------------------------
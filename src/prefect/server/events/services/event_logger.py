@@ -8,7 +8,12 @@ import rich
 
 from prefect.logging import get_logger
 from prefect.server.events.schemas.events import ReceivedEvent
-from prefect.server.utilities.messaging import Consumer, Message, create_consumer
+from prefect.server.utilities.messaging import (
+    Consumer,
+    Message,
+    create_consumer,
+    decode_message,
+)
 
 if TYPE_CHECKING:
     import logging
@@ -31,7 +36,7 @@ class EventLogger:
 
         async def handler(message: Message):
             now = pendulum.now("UTC")
-            event: ReceivedEvent = ReceivedEvent.model_validate_json(message.data)
+            event: ReceivedEvent = decode_message(message, ReceivedEvent)
 
             console.print(
                 "Event:",
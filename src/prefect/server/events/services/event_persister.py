@@ -22,6 +22,7 @@ from prefect.server.utilities.messaging import (
     Message,
     MessageHandler,
     create_consumer,
+    decode_message,
 )
 from prefect.settings import (
     PREFECT_API_SERVICES_EVENT_PERSISTER_BATCH_SIZE,
@@ -158,7 +159,7 @@ async def create_handler(
         if not message.data:
             return
 
-        event = ReceivedEvent.model_validate_json(message.data)
+        event = decode_message(message, ReceivedEvent)
 
         logger.debug(
             "Received event: %s with id: %s for resource: %s",
@@ -4,6 +4,7 @@ to act on them based on the automations that users have set up.
 """
 
 import asyncio
+from collections import defaultdict
 from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import timedelta
 from typing import (
@@ -11,8 +12,10 @@ from typing import (
     AsyncGenerator,
     Collection,
     Dict,
+    Iterable,
     List,
     Optional,
+    Set,
     Tuple,
 )
 from uuid import UUID
@@ -53,7 +56,11 @@ from prefect.server.events.schemas.automations import (
     TriggerState,
 )
 from prefect.server.events.schemas.events import ReceivedEvent
-from prefect.server.utilities.messaging import Message, MessageHandler
+from prefect.server.utilities.messaging import (
+    Message,
+    MessageHandler,
+    decode_message,
+)
 from prefect.settings import PREFECT_EVENTS_EXPIRED_BUCKET_BUFFER
 
 if TYPE_CHECKING:
@@ -645,8 +652,178 @@ def _automations_lock() -> asyncio.Lock:
     return __automations_lock
 
 
+class TriggerIndex:
+    """
+    An in-memory index of the loaded event triggers, used to narrow down the set of
+    triggers that could possibly be interested in an event before evaluating the
+    (comparatively expensive) `EventTrigger.covers` on each of them.
+
+    Triggers are indexed along two dimensions:
+
+    - the literal prefix of each of their `expect`/`after` event patterns (the part
+      before the first wildcard, or the whole name when there is no wildcard), and
+    - the `prefect.resource.id` values of their `match` specification, either
+      exactly or by prefix for values with a trailing wildcard.
+
+    Triggers that can't be narrowed along a dimension (for example, those with no
+    `expect` or with a negated resource ID) are indexed under the empty prefix or as
+    matching any resource.  The index only ever produces a superset of the triggers
+    that cover an event; callers must still check `covers`.
+    """
+
+    def __init__(self) -> None:
+        self._sequence = 0
+        self._order: Dict[TriggerID, int] = {}
+        self._event_prefixes: Dict[TriggerID, Set[str]] = {}
+        self._resource_keys: Dict[TriggerID, Tuple[Set[str], Set[str]]] = {}
+
+        self._by_event_prefix: Dict[str, Set[TriggerID]] = defaultdict(set)
+        self._by_resource_id: Dict[str, Set[TriggerID]] = defaultdict(set)
+        self._by_resource_id_prefix: Dict[str, Set[TriggerID]] = defaultdict(set)
+        self._any_resource: Set[TriggerID] = set()
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, trigger_id: TriggerID) -> bool:
+        return trigger_id in self._order
+
+    def add(self, trigger: EventTrigger) -> None:
+        """Adds (or re-indexes) the given trigger"""
+        if trigger.id in self._order:
+            order = self._order[trigger.id]
+            self.remove(trigger.id)
+        else:
+            order = self._sequence
+            self._sequence += 1
+
+        self._order[trigger.id] = order
+
+        event_prefixes = self._event_prefixes_for(trigger)
+        self._event_prefixes[trigger.id] = event_prefixes
+        for prefix in event_prefixes:
+            self._by_event_prefix[prefix].add(trigger.id)
+
+        resource_keys = self._resource_keys_for(trigger)
+        if resource_keys is None:
+            self._any_resource.add(trigger.id)
+            return
+
+        self._resource_keys[trigger.id] = resource_keys
+        exact, prefixes = resource_keys
+        for resource_id in exact:
+            self._by_resource_id[resource_id].add(trigger.id)
+        for prefix in prefixes:
+            self._by_resource_id_prefix[prefix].add(trigger.id)
+
+    def remove(self, trigger_id: TriggerID) -> None:
+        """Removes the given trigger from the index, if it is present"""
+        if self._order.pop(trigger_id, None) is None:
+            return
+
+        for prefix in self._event_prefixes.pop(trigger_id, ()):
+            self._discard(self._by_event_prefix, prefix, trigger_id)
+
+        self._any_resource.discard(trigger_id)
+        if resource_keys := self._resource_keys.pop(trigger_id, None):
+            exact, prefixes = resource_keys
+            for resource_id in exact:
+                self._discard(self._by_resource_id, resource_id, trigger_id)
+            for prefix in prefixes:
+                self._discard(self._by_resource_id_prefix, prefix, trigger_id)
+
+    def clear(self) -> None:
+        self._sequence = 0
+        self._order.clear()
+        self._event_prefixes.clear()
+        self._resource_keys.clear()
+        self._by_event_prefix.clear()
+        self._by_resource_id.clear()
+        self._by_resource_id_prefix.clear()
+        self._any_resource.clear()
+
+    def candidates(self, event: ReceivedEvent) -> List[TriggerID]:
+        """Returns the IDs of the triggers that may cover the given event, in the
+        order they were loaded"""
+        by_event = self._matching_prefixes(self._by_event_prefix, event.event)
+        if not by_event:
+            return []
+
+        resource_id = event.resource.id
+        by_resource = self._matching_prefixes(self._by_resource_id_prefix, resource_id)
+        if exact := self._by_resource_id.get(resource_id):
+            by_resource.append(exact)
+        if self._any_resource:
+            by_resource.append(self._any_resource)
+        if not by_resource:
+            return []
+
+        # Materialize the smaller of the two dimensions and probe the larger one, so
+        # that the work done here is proportional to the narrower of the two.
+        smaller, larger = by_event, by_resource
+        if sum(map(len, smaller)) > sum(map(len, larger)):
+            smaller, larger = larger, smaller
+
+        matched = {
+            trigger_id
+            for bucket in smaller
+            for trigger_id in bucket
+            if any(trigger_id in other for other in larger)
+        }
+        return sorted(matched, key=self._order.__getitem__)
+
+    @staticmethod
+    def _matching_prefixes(
+        index: Dict[str, Set[TriggerID]], value: str
+    ) -> List[Set[TriggerID]]:
+        return [
+            bucket
+            for length in range(len(value) + 1)
+            if (bucket := index.get(value[:length]))
+        ]
+
+    @staticmethod
+    def _discard(
+        index: Dict[str, Set[TriggerID]], key: str, trigger_id: TriggerID
+    ) -> None:
+        if bucket := index.get(key):
+            bucket.discard(trigger_id)
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _event_prefixes_for(trigger: EventTrigger) -> Set[str]:
+        # This mirrors `EventTrigger.event_pattern`, which considers both `expect` and
+        # `after` when there are any expectations, and otherwise matches any event
+        if not trigger.expect:
+            return {""}
+        return {pattern.split("*", 1)[0] for pattern in trigger.expect | trigger.after}
+
+    @staticmethod
+    def _resource_keys_for(
+        trigger: EventTrigger,
+    ) -> Optional[Tuple[Set[str], Set[str]]]:
+        values: Iterable[str] = trigger.match.get("prefect.resource.id") or []
+        if not values or any(value.startswith("!") for value in values):
+            return None
+
+        exact: Set[str] = set()
+        prefixes: Set[str] = set()
+        for value in values:
+            if value.endswith("*"):
+                prefixes.add(value[:-1])
+            else:
+                exact.add(value)
+        return exact, prefixes
+
+
+trigger_index = TriggerIndex()
+
+
 def find_interested_triggers(event: ReceivedEvent) -> Collection[EventTrigger]:
-    candidates = triggers.values()
+    candidates = [
+        triggers[trigger_id] for trigger_id in trigger_index.candidates(event)
+    ]
     return [trigger for trigger in candidates if trigger.covers(event)]
 
 
@@ -665,6 +842,7 @@ def load_automation(automation: Optional[Automation]) -> None:
 
     for trigger in event_triggers:
         triggers[trigger.id] = trigger
+        trigger_index.add(trigger)
         next_proactive_runs.pop(trigger.id, None)
 
 
@@ -673,6 +851,7 @@ def forget_automation(automation_id: UUID) -> None:
     if automation := automations_by_id.pop(automation_id, None):
         for trigger in automation.triggers():
             triggers.pop(trigger.id, None)
+            trigger_index.remove(trigger.id)
             next_proactive_runs.pop(trigger.id, None)
 
 
@@ -984,6 +1163,7 @@ async def reset() -> None:
     await reset_events_clock()
     automations_by_id.clear()
     triggers.clear()
+    trigger_index.clear()
     next_proactive_runs.clear()
 
 
@@ -1031,7 +1211,7 @@ async def consumer(
         if await ordering.event_has_been_seen(event_id):
             return
 
-        event = ReceivedEvent.model_validate_json(message.data)
+        event = decode_message(message, ReceivedEvent)
 
         try:
             await reactive_evaluation(event)
@@ -648,6 +648,8 @@ async def _generate_scheduled_flow_runs(
     min_runs: int,
     max_runs: int,
     auto_scheduled: bool = True,
+    deployment: Optional[orm_models.Deployment] = None,
+    deployment_schedules: Optional[Sequence[orm_models.DeploymentSchedule]] = None,
 ) -> list[dict[str, Any]]:
     """
     Given a `deployment_id` and schedule, generates a list of flow run objects and
@@ -655,6 +657,9 @@ async def _generate_scheduled_flow_runs(
     does NOT insert generated runs into the database, in order to facilitate
     batch operations. Call `_insert_scheduled_flow_runs()` to insert these runs.
 
+    The deployment and its active schedules are read from the database unless they
+    were already loaded, e.g. by `_read_deployments_with_active_schedules`.
+
     Runs include an idempotency key which prevents duplicate runs from being inserted
     if the output from this function is used more than once.
 
@@ -666,6 +671,8 @@ async def _generate_scheduled_flow_runs(
         min_time: runs will be scheduled until at least this far in the future
         min_runs: a minimum amount of runs to schedule
         max_runs: a maximum amount of runs to schedule
+        deployment: the deployment, if already loaded
+        deployment_schedules: the deployment's active schedules, if already loaded
 
     This function will generate the minimum number of runs that satisfy the min
     and max times, and the min and max counts. Specifically, the following order
@@ -680,22 +687,106 @@ async def _generate_scheduled_flow_runs(
     Returns:
         a list of dictionary representations of the `FlowRun` objects to schedule
     """
-    runs: list[dict[str, Any]] = []
-
-    deployment = await session.get(db.Deployment, deployment_id)
+    if deployment is None:
+        deployment = await session.get(db.Deployment, deployment_id)
 
     if not deployment:
         return []
 
-    active_deployment_schedules = await read_deployment_schedules(
-        session=session,
-        deployment_id=deployment.id,
-        deployment_schedule_filter=schemas.filters.DeploymentScheduleFilter(
-            active=schemas.filters.DeploymentScheduleFilterActive(eq_=True)
-        ),
+    if deployment_schedules is None:
+        active_deployment_schedules = await read_deployment_schedules(
+            session=session,
+            deployment_id=deployment.id,
+            deployment_schedule_filter=schemas.filters.DeploymentScheduleFilter(
+                active=schemas.filters.DeploymentScheduleFilterActive(eq_=True)
+            ),
+        )
+    else:
+        active_deployment_schedules = [
+            schemas.core.DeploymentSchedule.model_validate(
+                schedule, from_attributes=True
+            )
+            for schedule in deployment_schedules
+        ]
+
+    return _generate_flow_runs_from_schedules(
+        deployment=deployment,
+        deployment_schedules=active_deployment_schedules,
+        start_time=start_time,
+        end_time=end_time,
+        min_time=min_time,
+        min_runs=min_runs,
+        max_runs=max_runs,
+        auto_scheduled=auto_scheduled,
     )
 
-    for deployment_schedule in active_deployment_schedules:
+
+@db_injector
+async def _read_deployments_with_active_schedules(
+    db: PrefectDBInterface,
+    session: AsyncSession,
+    deployment_ids: Sequence[UUID],
+) -> list[tuple[orm_models.Deployment, list[orm_models.DeploymentSchedule]]]:
+    """
+    Reads a page of deployments along with their active schedules for scheduling.
+
+    This loads all of the deployments and their schedules in a constant number of
+    queries, rather than the per-deployment `session.get` and
+    `read_deployment_schedules` calls made by `_generate_scheduled_flow_runs`.
+    The schedules are returned as stored, and are validated per deployment when
+    they're passed to `_generate_scheduled_flow_runs`.
+
+    Args:
+        session: a database session
+        deployment_ids: the ids of the deployments to read
+
+    Returns:
+        a list of (deployment, active schedules) pairs in the order of
+        `deployment_ids`, omitting any deployments that no longer exist
+    """
+    if not deployment_ids:
+        return []
+
+    query = (
+        sa.select(db.Deployment)
+        .where(db.Deployment.id.in_(deployment_ids))
+        .options(
+            # schedules are loaded in a single batched query for the whole page,
+            # while the other eagerly-loaded relationships aren't needed to
+            # generate runs
+            sa.orm.selectinload(db.Deployment.schedules),
+            sa.orm.noload(db.Deployment.work_queue),
+            sa.orm.noload(db.Deployment.global_concurrency_limit),
+        )
+    )
+    result = await session.execute(query)
+    deployments = {deployment.id: deployment for deployment in result.scalars()}
+
+    return [
+        (deployment, [schedule for schedule in deployment.schedules if schedule.active])
+        for deployment_id in deployment_ids
+        if (deployment := deployments.get(deployment_id))
+    ]
+
+
+def _generate_flow_runs_from_schedules(
+    deployment: orm_models.Deployment,
+    deployment_schedules: Iterable[schemas.core.DeploymentSchedule],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    min_time: datetime.timedelta,
+    min_runs: int,
+    max_runs: int,
+    auto_scheduled: bool = True,
+) -> list[dict[str, Any]]:
+    """
+    Generates the flow runs for an already-loaded deployment and its active
+    schedules, following the same rules as `_generate_scheduled_flow_runs`. This
+    performs no database queries.
+    """
+    runs: list[dict[str, Any]] = []
+
+    for deployment_schedule in deployment_schedules:
         dates: list[pendulum.DateTime] = []
 
         # generate up to `n` dates satisfying the min of `max_runs` and `end_time`
@@ -717,7 +808,7 @@ async def _generate_scheduled_flow_runs(
                 {
                     "id": uuid4(),
                     "flow_id": deployment.flow_id,
-                    "deployment_id": deployment_id,
+                    "deployment_id": deployment.id,
                     "deployment_version": deployment.version,
                     "work_queue_name": deployment.work_queue_name,
                     "work_queue_id": deployment.work_queue_id,
@@ -269,6 +269,8 @@ def state_payload(state: Optional[schemas.states.State]) -> Optional[Dict[str, s
         payload["message"] = truncated_to(TRUNCATE_STATE_MESSAGES_AT, state.message)
     if state.is_paused():
         payload["pause_reschedule"] = str(state.state_details.pause_reschedule).lower()
+    if state.is_scheduled() and state.state_details.scheduled_time:
+        payload["scheduled_time"] = state.state_details.scheduled_time.isoformat()
     return payload
 
 
@@ -3,9 +3,17 @@ Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
 
-from typing import TYPE_CHECKING, Generator, List, Optional, Sequence, Tuple
-
-from sqlalchemy import select
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import prefect.server.schemas as schemas
@@ -68,10 +76,11 @@ async def create_logs(
 async def read_logs(
     db: PrefectDBInterface,
     session: AsyncSession,
-    log_filter: schemas.filters.LogFilter,
+    log_filter: Optional[schemas.filters.LogFilter],
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    after: Optional[schemas.core.LogCursor] = None,
 ) -> Sequence[orm_models.Log]:
     """
     Read logs.
@@ -83,6 +92,9 @@ async def read_logs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        after: only select logs that come after this log in the sort order. Unlike
+            an offset, the logs before it are not scanned, so reading many pages
+            of logs this way takes time proportional to the number of logs read.
 
     Returns:
         List[orm_models.Log]: the matching logs
@@ -92,5 +104,61 @@ async def read_logs(
     if log_filter:
         query = query.where(log_filter.as_sql_filter())
 
+    if after:
+        if sort == schemas.sorting.LogSort.TIMESTAMP_ASC:
+            query = query.where(
+                or_(
+                    db.Log.timestamp > after.timestamp,
+                    and_(db.Log.timestamp == after.timestamp, db.Log.id > after.id),
+                )
+            )
+        else:
+            query = query.where(
+                or_(
+                    db.Log.timestamp < after.timestamp,
+                    and_(db.Log.timestamp == after.timestamp, db.Log.id < after.id),
+                )
+            )
+
     result = await session.execute(query)
     return result.scalars().unique().all()
+
+
+async def stream_logs(
+    session: AsyncSession,
+    log_filter: Optional[schemas.filters.LogFilter],
+    sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    batch_size: int = 1000,
+) -> AsyncGenerator[orm_models.Log, None]:
+    """
+    Stream all matching logs, reading them from the database in batches.
+
+    Each batch is read after the last log of the previous batch, so only one batch
+    is held in memory at a time and no query holds a cursor open while the logs are
+    consumed.
+
+    Args:
+        session: a database session
+        log_filter: only select logs that match these filters
+        sort: Query sort
+        batch_size: the number of logs to read from the database at a time
+
+    Yields:
+        orm_models.Log: the matching logs
+    """
+    after: Optional[schemas.core.LogCursor] = None
+    while True:
+        logs = await read_logs(
+            session=session,
+            log_filter=log_filter,
+            limit=batch_size,
+            sort=sort,
+            after=after,
+        )
+        for log in logs:
+            yield log
+
+        if len(logs) < batch_size:
+            return
+
+        after = schemas.core.LogCursor(timestamp=logs[-1].timestamp, id=logs[-1].id)
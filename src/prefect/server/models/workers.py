@@ -5,12 +5,14 @@ Intended for internal use by the Prefect REST API.
 
 import datetime
 from typing import (
+    Any,
     Awaitable,
     Callable,
     Dict,
     List,
     Optional,
     Sequence,
+    Type,
     Union,
 )
 from uuid import UUID, uuid4
@@ -21,10 +23,12 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import prefect.server.schemas as schemas
+from prefect.server import models
 from prefect.server.database import PrefectDBInterface, db_injector, orm_models
 from prefect.server.events.clients import PrefectServerEventsClient
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models.events import work_pool_status_event
+from prefect.server.orchestration.policies import FlowRunOrchestrationPolicy
 from prefect.server.schemas.statuses import WorkQueueStatus
 from prefect.server.utilities.database import UUID as PrefectUUID
 
@@ -331,6 +335,92 @@ async def get_scheduled_flow_runs(
     )
 
 
+async def claim_scheduled_flow_runs(
+    session: AsyncSession,
+    work_pool_ids: Optional[List[UUID]] = None,
+    work_queue_ids: Optional[List[UUID]] = None,
+    scheduled_before: Optional[datetime.datetime] = None,
+    scheduled_after: Optional[datetime.datetime] = None,
+    limit: Optional[int] = None,
+    respect_queue_priorities: Optional[bool] = None,
+    flow_policy: Optional[Type[FlowRunOrchestrationPolicy]] = None,
+    orchestration_parameters: Optional[Dict[str, Any]] = None,
+    rejected_flow_run_ids: Optional[List[UUID]] = None,
+) -> List[schemas.responses.WorkerFlowRunResponse]:
+    """
+    Claim runs from queues in a specific work pool by moving them to a `Pending`
+    state, so that each run is claimed by only one caller.
+
+    The session must be in a transaction that locks the runs it reads until the
+    claims are committed. On PostgreSQL, runs are read with `FOR UPDATE SKIP
+    LOCKED`, so concurrent claims skip each other's runs instead of waiting. On
+    SQLite, the transaction must be begun with `with_for_update=True` so that
+    concurrent claims run one at a time.
+
+    Args:
+        session (AsyncSession): a database session in a transaction
+        work_pool_ids (List[UUID]): a list of work pool ids
+        work_queue_ids (List[UUID]): a list of work pool queue ids
+        scheduled_before (datetime.datetime): a datetime to filter runs scheduled before
+        scheduled_after (datetime.datetime): a datetime to filter runs scheduled after
+        limit (int): the maximum number of runs to claim
+        respect_queue_priorities (bool): whether or not to respect queue priorities
+        flow_policy: the orchestration policy for the `Pending` transitions
+        orchestration_parameters: parameters for the orchestration of the `Pending`
+            transitions
+        rejected_flow_run_ids: if given, the ids of the runs whose `Pending`
+            transitions were rejected are appended to it
+
+    Returns:
+        List[WorkerFlowRunResponse]: the claimed runs in their `Pending` state, as
+            well as related work pool details
+    """
+    candidates = await get_scheduled_flow_runs(
+        session=session,
+        work_pool_ids=work_pool_ids,
+        work_queue_ids=work_queue_ids,
+        scheduled_before=scheduled_before,
+        scheduled_after=scheduled_after,
+        limit=limit,
+        respect_queue_priorities=respect_queue_priorities,
+    )
+
+    # The candidates were loaded without their states, so they are removed from the
+    # session to load them again with their states for orchestration
+    session.expunge_all()
+
+    claimed: List[schemas.responses.WorkerFlowRunResponse] = []
+    for candidate in candidates:
+        result = await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=candidate.flow_run.id,
+            state=schemas.states.Pending(),
+            flow_policy=flow_policy,
+            orchestration_parameters=orchestration_parameters,
+        )
+        if result.state is None or not result.state.is_pending():
+            if rejected_flow_run_ids is not None:
+                rejected_flow_run_ids.append(candidate.flow_run.id)
+            continue
+
+        claimed.append(
+            candidate.model_copy(
+                update={
+                    "flow_run": candidate.flow_run.model_copy(
+                        update={
+                            "state": result.state,
+                            "state_id": result.state.id,
+                            "state_type": result.state.type,
+                            "state_name": result.state.name,
+                        }
+                    )
+                }
+            )
+        )
+
+    return claimed
+
+
 # -----------------------------------------------------
 # --
 # --
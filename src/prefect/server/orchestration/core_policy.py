@@ -811,6 +811,15 @@ class EnqueueScheduledTasks(TaskRunOrchestrationRule):
             return
 
         task_run: core.TaskRun = core.TaskRun.model_validate(context.run)
+
+        # Callers that create several task runs in one transaction collect them
+        # here and enqueue them once it commits, so that task workers never
+        # receive a run that was rolled back
+        pending_enqueues = context.parameters.get("enqueue_after_commit")
+        if pending_enqueues is not None and validated_state.name != "AwaitingRetry":
+            pending_enqueues.append(task_run)
+            return
+
         queue: TaskQueue = TaskQueue.for_key(task_run.task_key)
 
         if validated_state.name == "AwaitingRetry":
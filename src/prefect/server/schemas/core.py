@@ -929,6 +929,16 @@ class Log(ORMBaseModel):
     )
 
 
+class LogCursor(PrefectBaseModel):
+    """
+    The position of a log when logs are sorted by timestamp, used to read the logs
+    that come after it.
+    """
+
+    timestamp: DateTime = Field(default=..., description="The log timestamp.")
+    id: UUID = Field(default=..., description="The log ID.")
+
+
 class QueueFilter(PrefectBaseModel):
     """Filter criteria definition for a work queue."""
 
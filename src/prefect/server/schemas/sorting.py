@@ -92,9 +92,11 @@ class LogSort(AutoEnum):
     @db_injector
     def as_sql_sort(self, db: PrefectDBInterface) -> Iterable[sa.ColumnElement[Any]]:
         """Return an expression used to sort task runs"""
+        # Logs with the same timestamp are sorted by ID so that the order is stable
+        # when logs are read in pages
         sort_mapping: dict[str, Iterable[sa.ColumnElement[Any]]] = {
-            "TIMESTAMP_ASC": [db.Log.timestamp.asc()],
-            "TIMESTAMP_DESC": [db.Log.timestamp.desc()],
+            "TIMESTAMP_ASC": [db.Log.timestamp.asc(), db.Log.id.asc()],
+            "TIMESTAMP_DESC": [db.Log.timestamp.desc(), db.Log.id.desc()],
         }
         return sort_mapping[self.value]
 
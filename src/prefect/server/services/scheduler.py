@@ -6,6 +6,8 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import time
+from dataclasses import dataclass
 from typing import Any, Sequence
 from uuid import UUID
 
@@ -13,7 +15,7 @@ import pendulum
 import sqlalchemy as sa
 
 import prefect.server.models as models
-from prefect.server.database import PrefectDBInterface
+from prefect.server.database import PrefectDBInterface, orm_models
 from prefect.server.database.dependencies import db_injector
 from prefect.server.schemas.states import StateType
 from prefect.server.services.loop_service import LoopService, run_multiple_services
@@ -33,6 +35,18 @@ class TryAgain(Exception):
     """Internal control-flow exception used to retry the Scheduler's main loop"""
 
 
+@dataclass
+class SchedulerLoopStats:
+    """Timing and throughput of a single loop of the Scheduler"""
+
+    deployments: int = 0
+    inserted_runs: int = 0
+    select_seconds: float = 0.0
+    collect_seconds: float = 0.0
+    insert_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+
 class Scheduler(LoopService):
     """
     A loop service that schedules flow runs from deployments.
@@ -59,12 +73,19 @@ class Scheduler(LoopService):
         self.max_scheduled_time: datetime.timedelta = (
             PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME.value()
         )
+        # the deployments and active schedules read for the page being scheduled,
+        # which `_generate_scheduled_flow_runs` uses instead of reading them again
+        self._loaded_deployments: dict[
+            UUID,
+            tuple[orm_models.Deployment, list[orm_models.DeploymentSchedule]],
+        ] = {}
         self.min_scheduled_time: datetime.timedelta = (
             PREFECT_API_SERVICES_SCHEDULER_MIN_SCHEDULED_TIME.value()
         )
         self.insert_batch_size: int = (
             PREFECT_API_SERVICES_SCHEDULER_INSERT_BATCH_SIZE.value()
         )
+        self.last_loop_stats: SchedulerLoopStats | None = None
 
     @db_injector
     async def run_once(self, db: PrefectDBInterface) -> None:
@@ -78,7 +99,8 @@ class Scheduler(LoopService):
         All inserted flow runs are committed to the database at the termination of the
         loop.
         """
-        total_inserted_runs = 0
+        stats = SchedulerLoopStats()
+        loop_start = time.monotonic()
 
         last_id = None
         while True:
@@ -89,24 +111,33 @@ class Scheduler(LoopService):
                 if last_id:
                     query = query.where(db.Deployment.id > last_id)
 
+                started = time.monotonic()
                 result = await session.execute(query)
                 deployment_ids = result.scalars().unique().all()
+                stats.select_seconds += time.monotonic() - started
 
                 # collect runs across all deployments
+                started = time.monotonic()
                 try:
                     runs_to_insert = await self._collect_flow_runs(
                         session=session, deployment_ids=deployment_ids
                     )
                 except TryAgain:
                     continue
+                finally:
+                    stats.collect_seconds += time.monotonic() - started
+
+            stats.deployments += len(deployment_ids)
 
             # bulk insert the runs based on batch size setting
+            started = time.monotonic()
             for batch in batched_iterable(runs_to_insert, self.insert_batch_size):
                 async with db.session_context(begin_transaction=True) as session:
                     inserted_runs = await self._insert_scheduled_flow_runs(
                         session=session, runs=list(batch)
                     )
-                    total_inserted_runs += len(inserted_runs)
+                    stats.inserted_runs += len(inserted_runs)
+            stats.insert_seconds += time.monotonic() - started
 
             # if this is the last page of deployments, exit the loop
             if len(deployment_ids) < self.deployment_batch_size:
@@ -115,7 +146,16 @@ class Scheduler(LoopService):
                 # record the last deployment ID
                 last_id = deployment_ids[-1]
 
-        self.logger.info(f"Scheduled {total_inserted_runs} runs.")
+        stats.total_seconds = time.monotonic() - loop_start
+        self.last_loop_stats = stats
+
+        self.logger.info(
+            f"Scheduled {stats.inserted_runs} runs for {stats.deployments} deployments"
+            f" in {stats.total_seconds:.3f} seconds (selecting deployments:"
+            f" {stats.select_seconds:.3f}s, generating runs:"
+            f" {stats.collect_seconds:.3f}s, inserting runs:"
+            f" {stats.insert_seconds:.3f}s)."
+        )
 
     @db_injector
     def _get_select_deployments_to_schedule_query(
@@ -188,47 +228,80 @@ class Scheduler(LoopService):
         deployment_ids: Sequence[UUID],
     ) -> list[dict[str, Any]]:
         runs_to_insert: list[dict[str, Any]] = []
-        for deployment_id in deployment_ids:
-            now = pendulum.now("UTC")
-            # guard against erroneously configured schedules
-            try:
-                runs_to_insert.extend(
-                    await self._generate_scheduled_flow_runs(
-                        session=session,
-                        deployment_id=deployment_id,
-                        start_time=now,
-                        end_time=now + self.max_scheduled_time,
-                        min_time=self.min_scheduled_time,
-                        min_runs=self.min_runs,
-                        max_runs=self.max_runs,
+
+        try:
+            deployments = await self._read_deployments_with_active_schedules(
+                session=session, deployment_ids=deployment_ids
+            )
+        finally:
+            await self._rollback_if_invalidated(session)
+
+        now = pendulum.now("UTC")
+        self._loaded_deployments = {
+            deployment.id: (deployment, deployment_schedules)
+            for deployment, deployment_schedules in deployments
+        }
+        try:
+            for deployment, _ in deployments:
+                # guard against erroneously configured schedules
+                try:
+                    runs_to_insert.extend(
+                        await self._generate_scheduled_flow_runs(
+                            session=session,
+                            deployment_id=deployment.id,
+                            start_time=now,
+                            end_time=now + self.max_scheduled_time,
+                            min_time=self.min_scheduled_time,
+                            min_runs=self.min_runs,
+                            max_runs=self.max_runs,
+                        )
                     )
-                )
-            except Exception:
-                self.logger.exception(
-                    f"Error scheduling deployment {deployment_id!r}.",
-                )
-            finally:
-                connection = await session.connection()
-                if connection.invalidated:
-                    # If the error we handled above was the kind of database error that
-                    # causes underlying transaction to rollback and the connection to
-                    # become invalidated, rollback this session.  Errors that may cause
-                    # this are connection drops, database restarts, and things of the
-                    # sort.
-                    #
-                    # This rollback _does not rollback a transaction_, since that has
-                    # actually already happened due to the error above.  It brings the
-                    # Python session in sync with underlying connection so that when we
-                    # exec the outer with block, the context manager will not attempt to
-                    # commit the session.
-                    #
-                    # Then, raise TryAgain to break out of these nested loops, back to
-                    # the outer loop, where we'll begin a new transaction with
-                    # session.begin() in the next loop iteration.
-                    await session.rollback()
-                    raise TryAgain()
+                except Exception:
+                    self.logger.exception(
+                        f"Error scheduling deployment {deployment.id!r}.",
+                    )
+                finally:
+                    await self._rollback_if_invalidated(session)
+        finally:
+            self._loaded_deployments = {}
         return runs_to_insert
 
+    async def _rollback_if_invalidated(self, session: sa.orm.Session) -> None:
+        connection = await session.connection()
+        if connection.invalidated:
+            # If an error was raised by the kind of database error that causes
+            # underlying transaction to rollback and the connection to become
+            # invalidated, rollback this session.  Errors that may cause this are
+            # connection drops, database restarts, and things of the sort.
+            #
+            # This rollback _does not rollback a transaction_, since that has
+            # actually already happened due to the error.  It brings the Python
+            # session in sync with underlying connection so that when we exit the
+            # outer with block, the context manager will not attempt to commit the
+            # session.
+            #
+            # Then, raise TryAgain to break out of the loop over this page of
+            # deployments, back to the outer loop, where we'll begin a new
+            # transaction in the next loop iteration.
+            await session.rollback()
+            raise TryAgain()
+
+    async def _read_deployments_with_active_schedules(
+        self,
+        session: sa.orm.Session,
+        deployment_ids: Sequence[UUID],
+    ) -> list[tuple[orm_models.Deployment, list[orm_models.DeploymentSchedule]]]:
+        """
+        Given a page of `deployment_ids`, reads the deployments and their active
+        schedules in bulk so that runs can be generated for the whole page without
+        further queries.
+
+        Pass-through method for overrides.
+        """
+        return await models.deployments._read_deployments_with_active_schedules(
+            session=session, deployment_ids=deployment_ids
+        )
+
     @db_injector
     async def _generate_scheduled_flow_runs(
         self,
@@ -244,6 +317,8 @@ class Scheduler(LoopService):
         """
         Given a `deployment_id` and schedule params, generates a list of flow run
         objects and associated scheduled states that represent scheduled flow runs.
+        Deployments in the page being scheduled are not read again, since the
+        scheduler loads them and their active schedules for the whole page at once.
 
         Pass-through method for overrides.
 
@@ -268,6 +343,9 @@ class Scheduler(LoopService):
             - Runs will be generated until at least `start_time + min_time` is reached
 
         """
+        deployment, deployment_schedules = self._loaded_deployments.get(
+            deployment_id, (None, None)
+        )
         return await models.deployments._generate_scheduled_flow_runs(
             db,
             session=session,
@@ -277,6 +355,8 @@ class Scheduler(LoopService):
             min_time=min_time,
             min_runs=min_runs,
             max_runs=max_runs,
+            deployment=deployment,
+            deployment_schedules=deployment_schedules,
         )
 
     async def _insert_scheduled_flow_runs(
@@ -24,6 +24,7 @@ from prefect.server.utilities.messaging import (
     Message,
     MessageHandler,
     create_consumer,
+    decode_message,
 )
 
 if TYPE_CHECKING:
@@ -187,7 +188,7 @@ async def record_task_run_event(event: ReceivedEvent) -> None:
 @asynccontextmanager
 async def consumer() -> AsyncGenerator[MessageHandler, None]:
     async def message_handler(message: Message):
-        event: ReceivedEvent = ReceivedEvent.model_validate_json(message.data)
+        event: ReceivedEvent = decode_message(message, ReceivedEvent)
 
         if not event.event.startswith("prefect.task-run"):
             return
@@ -3,6 +3,7 @@ Implements an in-memory task queue for delivering background task runs to TaskWo
 """
 
 import asyncio
+import weakref
 from typing import Dict, List, Optional, Tuple
 
 from typing_extensions import Self
@@ -27,6 +28,7 @@ class TaskQueue:
     task_key: str
     _scheduled_queue: asyncio.Queue
     _retry_queue: asyncio.Queue
+    _subscribers: "weakref.WeakSet[asyncio.Event]"
 
     @classmethod
     async def enqueue(cls, task_run: schemas.core.TaskRun) -> None:
@@ -62,6 +64,7 @@ class TaskQueue:
         self.task_key = task_key
         self._scheduled_queue = asyncio.Queue(maxsize=scheduled_queue_size)
         self._retry_queue = asyncio.Queue(maxsize=retry_queue_size)
+        self._subscribers = weakref.WeakSet()
 
     async def get(self) -> schemas.core.TaskRun:
         # First, check if there's anything in the retry queue
@@ -79,25 +82,45 @@ class TaskQueue:
 
     async def put(self, task_run: schemas.core.TaskRun) -> None:
         await self._scheduled_queue.put(task_run)
+        self._notify()
 
     async def retry(self, task_run: schemas.core.TaskRun) -> None:
         await self._retry_queue.put(task_run)
+        self._notify()
+
+    def subscribe(self, ready: asyncio.Event) -> None:
+        """
+        Set `ready` whenever a task run is added to this queue. Subscriptions last
+        as long as the event does.
+        """
+        self._subscribers.add(ready)
+
+    def _notify(self) -> None:
+        for ready in self._subscribers:
+            ready.set()
 
 
 class MultiQueue:
     """A queue that can pull tasks from from any of a number of task queues"""
 
     _queues: List[TaskQueue]
+    _ready: asyncio.Event
 
     def __init__(self, task_keys: List[str]):
         self._queues = [TaskQueue.for_key(task_key) for task_key in task_keys]
+        self._ready = asyncio.Event()
+        for queue in self._queues:
+            queue.subscribe(self._ready)
 
     async def get(self) -> schemas.core.TaskRun:
         """Gets the next task_run from any of the given queues"""
         while True:
+            # Nothing can be enqueued between clearing and checking the queues, so
+            # any task run that arrives while we wait will set the event
+            self._ready.clear()
             for queue in self._queues:
                 try:
                     return queue.get_nowait()
                 except asyncio.QueueEmpty:
                     continue
-            await asyncio.sleep(0.01)
+            await self._ready.wait()
@@ -15,6 +15,7 @@ from typing import (
     runtime_checkable,
 )
 from collections.abc import AsyncGenerator, Awaitable, Iterable, Mapping
+from pydantic import BaseModel
 from typing_extensions import Self
 
 from prefect.settings import PREFECT_MESSAGING_CACHE, PREFECT_MESSAGING_BROKER
@@ -27,6 +28,7 @@ logger: "logging.Logger" = get_logger(__name__)
 
 
 M = TypeVar("M", bound="Message", covariant=True)
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class Message(Protocol):
@@ -43,6 +45,34 @@ class Message(Protocol):
         ...
 
 
+def decode_message(message: Message, model: Type[ModelT]) -> ModelT:
+    """
+    Validates the data of a message as the given model.
+
+    Brokers that fan the same message out to several subscriptions (like the
+    in-memory broker) may attach a shared `decoded` dictionary to their messages,
+    in which case the message is only validated once and the resulting model is
+    shared by every consumer of that message.  Consumers must treat the returned
+    model as read-only.
+
+    Args:
+        message: the message to decode
+        model: the pydantic model to validate the message's data as
+
+    Returns:
+        the validated model
+    """
+    decoded: Optional[dict[type, Any]] = getattr(message, "decoded", None)
+    if decoded is None:
+        return model.model_validate_json(message.data)
+
+    try:
+        return decoded[model]
+    except KeyError:
+        value = decoded[model] = model.model_validate_json(message.data)
+        return value
+
+
 class Cache(abc.ABC):
     @abc.abstractmethod
     async def clear_recently_seen_messages(self) -> None:
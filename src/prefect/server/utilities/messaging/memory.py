@@ -2,7 +2,7 @@ import asyncio
 import copy
 from collections.abc import AsyncGenerator, Iterable, Mapping, MutableMapping
 from contextlib import asynccontextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
 from types import TracebackType
@@ -33,6 +33,10 @@ class MemoryMessage:
     attributes: Mapping[str, Any]
     retry_count: int = 0
 
+    # Models decoded from `data`, shared by every subscription's copy of this message
+    # so that each message is only validated once; see `messaging.decode_message`
+    decoded: dict[type, Any] = field(default_factory=dict, repr=False, compare=False)
+
 
 class Subscription:
     """
@@ -121,7 +125,13 @@ class Subscription:
         self.dead_letter_queue_path.mkdir(parents=True, exist_ok=True)
         try:
             await anyio.Path(self.dead_letter_queue_path / uuid4().hex).write_bytes(
-                to_json(asdict(message))
+                to_json(
+                    {
+                        "data": message.data,
+                        "attributes": message.attributes,
+                        "retry_count": message.retry_count,
+                    }
+                )
             )
         except Exception as e:
             logger.warning("Failed to write message to dead letter queue", exc_info=e)
@@ -167,8 +177,11 @@ class Topic:
 
     async def publish(self, message: MemoryMessage) -> None:
         for subscription in self._subscriptions:
-            # Ensure that each subscription gets its own copy of the message
-            await subscription.deliver(copy.deepcopy(message))
+            # Ensure that each subscription gets its own copy of the message, while
+            # sharing the (read-only) models decoded from its data
+            await subscription.deliver(
+                copy.deepcopy(message, memo={id(message.decoded): message.decoded})
+            )
 
 
 @asynccontextmanager
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+from contextvars import ContextVar
 from functools import partial
 from typing import Any, Dict, Tuple, Type
 
@@ -27,6 +28,12 @@ from prefect.settings.sources import (
 from prefect.utilities.collections import visit_collection
 from prefect.utilities.pydantic import handle_secret_render
 
+# Set while settings are validated from values that were already resolved from every
+# source, such as a settings snapshot, so that the sources are not read again
+_skip_settings_sources: ContextVar[bool] = ContextVar(
+    "_skip_settings_sources", default=False
+)
+
 
 class PrefectBaseSettings(BaseSettings):
     @classmethod
@@ -45,6 +52,9 @@ class PrefectBaseSettings(BaseSettings):
 
         See https://docs.pydantic.dev/latest/concepts/pydantic_settings/#customise-settings-sources
         """
+        if _skip_settings_sources.get():
+            return (init_settings,)
+
         env_filter: set[str] = set()
         for field_name, field in settings_cls.model_fields.items():
             if field.validation_alias is not None and isinstance(
@@ -13,12 +13,13 @@ def get_current_settings() -> Settings:
     or, if no settings context is active, the environment.
     """
     from prefect.context import SettingsContext
+    from prefect.settings.snapshot import load_settings_snapshot
 
     settings_context = SettingsContext.get()
     if settings_context is not None:
         return settings_context.settings
 
-    return Settings()
+    return load_settings_snapshot() or Settings()
 
 
 @contextmanager
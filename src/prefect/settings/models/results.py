@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import ClassVar, Optional
+from typing import ClassVar, Literal, Optional
 
 from pydantic import AliasChoices, AliasPath, Field
 from pydantic_settings import SettingsConfigDict
@@ -19,6 +19,16 @@ class ResultsSettings(PrefectBaseSettings):
         description="The default serializer to use when not otherwise specified.",
     )
 
+    record_format: Literal["json", "binary"] = Field(
+        default="json",
+        description=(
+            "The format to write result records in. The `binary` format stores results"
+            " without embedding them in JSON, which avoids base64 encoding pickled"
+            " results and copying large buffers. Records in either format can always"
+            " be read."
+        ),
+    )
+
     persist_by_default: bool = Field(
         default=False,
         description="The default setting for persisting results when not otherwise specified.",
@@ -65,6 +65,18 @@ class RunnerSettings(PrefectBaseSettings):
         ge=30,
     )
 
+    process_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Number of warm flow run processes a runner keeps ready for each flow it runs. Warm processes have already imported Prefect and the flow's code. If 0, a new process is started for every flow run.",
+    )
+
+    process_pool_max_runs: int = Field(
+        default=10,
+        ge=1,
+        description="Number of flow runs a warm flow run process executes before it is replaced.",
+    )
+
     server: RunnerServerSettings = Field(
         default_factory=RunnerServerSettings,
         description="Settings for controlling runner server behavior",
@@ -1,4 +1,4 @@
-from typing import ClassVar, Optional, Union
+from typing import ClassVar, Literal, Optional, Union
 
 from pydantic import AliasChoices, AliasPath, Field
 from pydantic_settings import SettingsConfigDict
@@ -22,6 +22,12 @@ class TasksRunnerSettings(PrefectBaseSettings):
         ),
     )
 
+    process_pool_max_workers: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of worker processes for ProcessPoolTaskRunner. Defaults to the number of CPUs.",
+    )
+
 
 class TasksSchedulingSettings(PrefectBaseSettings):
     model_config: ClassVar[SettingsConfigDict] = build_settings_config(
@@ -84,6 +90,26 @@ class TasksSettings(PrefectBaseSettings):
         "Note that setting to `False` will override the behavior set by a parent flow or task.",
     )
 
+    cache_key_hash_algorithm: Literal["md5", "sha256", "blake2b", "xxhash"] = Field(
+        default="md5",
+        description=(
+            "The hash algorithm used to compute cache keys from task inputs and flow"
+            " parameters. `xxhash` is considerably faster for large inputs and requires"
+            " the `xxhash` package."
+        ),
+    )
+
+    pending_wait_mode: Literal["poll", "events"] = Field(
+        default="events",
+        description=(
+            "How a task run that was held in a `Pending` or `Paused` state waits before"
+            " proposing a `Running` state again. `poll` retries on a short backoff."
+            " `events` retries when the task run or its flow run changes state, or when"
+            " a task run sharing one of its tags finishes, and otherwise only about once"
+            " a minute. It falls back to `poll` while events can't be received."
+        ),
+    )
+
     runner: TasksRunnerSettings = Field(
         default_factory=TasksRunnerSettings,
         description="Settings for controlling task runner behavior",
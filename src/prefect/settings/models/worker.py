@@ -40,6 +40,40 @@ class WorkerSettings(PrefectBaseSettings):
         description="The number of seconds into the future a worker should query for scheduled work.",
     )
 
+    claim_flow_runs: bool = Field(
+        default=False,
+        description="""
+        Whether workers should claim scheduled flow runs from the API, which moves
+        each flow run to a `Pending` state for only one worker. If disabled, workers
+        query for scheduled flow runs and then race other workers polling the same
+        queues to propose `Pending` states. Requires a Prefect server that supports
+        claiming flow runs.
+        """,
+    )
+
+    subscribe_to_flow_runs: bool = Field(
+        default=False,
+        description="""
+        Whether workers should subscribe to notifications of flow runs being
+        scheduled in their work pool, and query for scheduled work as soon as a
+        notified run is due to start within `prefetch_seconds`. Runs that the
+        scheduler service creates ahead of time for deployment schedules are not
+        notified. Workers still query for scheduled work every `query_seconds`,
+        including while they are disconnected. Requires a Prefect server that
+        supports flow run subscriptions.
+        """,
+    )
+
+    job_configuration_cache_seconds: float = Field(
+        default=0,
+        description="""
+        Number of seconds a worker should cache the deployments, flows, block
+        documents, and variables it reads to build job configurations. Cached
+        objects are evicted sooner when the API emits an event about them. If 0,
+        these objects are read for every flow run.
+        """,
+    )
+
     webserver: WorkerWebserverSettings = Field(
         default_factory=WorkerWebserverSettings,
         description="Settings for a worker's webserver",
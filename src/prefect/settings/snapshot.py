@@ -0,0 +1,171 @@
+"""
+Snapshots of resolved settings that can be passed to child processes.
+
+Resolving settings reads every environment variable, profiles file, `.env` file and
+TOML file for each settings model, which is a noticeable part of starting a process
+that runs a flow. A process that starts children with its own settings can instead
+pass them a snapshot of the settings it already resolved in a single environment
+variable. Children load the snapshot without reading any other sources.
+
+A snapshot is only used if it was created by the same version of Prefect, in the same
+working directory and for the same Prefect environment variables as the child has.
+Otherwise, or if there is no snapshot, settings are resolved as usual. Since `.env`
+and TOML files are read from the working directory, snapshots are only created for
+children that run in the working directory the settings were resolved in.
+"""
+
+import hashlib
+import json
+import os
+from functools import cache
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import TypeAdapter
+
+import prefect
+from prefect.settings.base import PrefectBaseSettings, _skip_settings_sources
+from prefect.settings.constants import _SECRET_TYPES  # type: ignore[reportPrivateUsage]
+from prefect.settings.legacy import (
+    _get_settings_fields,  # type: ignore[reportPrivateUsage]
+)
+from prefect.settings.models.root import Settings
+
+SETTINGS_SNAPSHOT_ENV_VAR = "PREFECT__SETTINGS_SNAPSHOT"
+
+# Incremented when the format of snapshots changes
+SETTINGS_SNAPSHOT_VERSION = 1
+
+
+def create_settings_snapshot(
+    settings: Settings, env: Mapping[str, str], cwd: Optional[str] = None
+) -> Optional[str]:
+    """
+    Create a snapshot of the given settings for a child process with the given
+    environment and working directory.
+
+    Returns `None` if the environment doesn't include the given settings, or
+    includes settings that disagree with them, or if the child runs in another
+    working directory than the one the settings were resolved in, since the child
+    would resolve different settings than the snapshot.
+
+    Args:
+        settings: The settings to snapshot, resolved in the current working directory
+        env: The environment variables of the child process
+        cwd: The working directory of the child process, defaulting to the current
+            working directory
+    """
+    resolved_in = os.path.realpath(os.getcwd())
+    if cwd is not None and os.path.realpath(cwd) != resolved_in:
+        return None
+
+    if not _agrees_with_environment(settings, env):
+        return None
+
+    return json.dumps(
+        {
+            "version": SETTINGS_SNAPSHOT_VERSION,
+            "prefect_version": prefect.__version__,
+            "cwd": resolved_in,
+            "environment": _environment_digest(env),
+            "settings": _set_values(settings),
+        }
+    )
+
+
+def load_settings_snapshot(
+    env: Optional[Mapping[str, str]] = None,
+) -> Optional[Settings]:
+    """
+    Load settings from the snapshot in the environment, if there is one that was
+    created for this process.
+    """
+    env = os.environ if env is None else env
+    if SETTINGS_SNAPSHOT_ENV_VAR not in env:
+        return None
+
+    try:
+        snapshot: Dict[str, Any] = json.loads(env[SETTINGS_SNAPSHOT_ENV_VAR])
+    except ValueError:
+        return None
+
+    if (
+        snapshot.get("version") != SETTINGS_SNAPSHOT_VERSION
+        or snapshot.get("prefect_version") != prefect.__version__
+        or snapshot.get("cwd") != os.path.realpath(os.getcwd())
+        or snapshot.get("environment") != _environment_digest(env)
+    ):
+        return None
+
+    token = _skip_settings_sources.set(True)
+    try:
+        return Settings.model_validate(snapshot["settings"])
+    except (KeyError, ValueError):
+        return None
+    finally:
+        _skip_settings_sources.reset(token)
+
+
+def _agrees_with_environment(settings: Settings, env: Mapping[str, str]) -> bool:
+    """
+    Whether a child process with the given environment would resolve the same values
+    as the given settings for every setting in its environment.
+    """
+    settings_env = settings.to_environment_variables(exclude_unset=True)
+    if not settings_env.keys() <= env.keys():
+        return False
+
+    settings_fields = _get_settings_fields(Settings)
+    for key, value in _prefect_environment_variables(env).items():
+        if settings_env.get(key) == value or key not in settings_fields:
+            continue
+
+        # The variable may be formatted differently than the setting's value, e.g.
+        # `1` instead of `True`
+        setting = settings_fields[key]
+        try:
+            env_value = _type_adapter(key).validate_python(value)
+        except ValueError:
+            return False
+        if isinstance(env_value, _SECRET_TYPES):
+            env_value = env_value.get_secret_value()
+        if env_value != setting.value_from(settings):
+            return False
+
+    return True
+
+
+@cache
+def _type_adapter(key: str) -> TypeAdapter[Any]:
+    return TypeAdapter(_get_settings_fields(Settings)[key]._type)  # type: ignore[reportPrivateUsage]
+
+
+def _set_values(settings: PrefectBaseSettings) -> Dict[str, Any]:
+    """
+    The JSON values of the settings that were set, including secrets, so that unset
+    settings take their defaults when the snapshot is loaded.
+    """
+    values: Dict[str, Any] = {}
+    for key in type(settings).model_fields:
+        value = getattr(settings, key)
+        if isinstance(value, PrefectBaseSettings):
+            if child_values := _set_values(value):
+                values[key] = child_values
+        elif key in settings.model_fields_set:
+            values[key] = settings.model_dump(
+                mode="json", include={key}, context={"include_secrets": True}
+            )[key]
+    return values
+
+
+def _prefect_environment_variables(env: Mapping[str, str]) -> Dict[str, str]:
+    # Variables with a double underscore are internal, and are not settings
+    return {
+        key: value
+        for key, value in env.items()
+        if key.startswith("PREFECT_") and not key.startswith("PREFECT__")
+    }
+
+
+def _environment_digest(env: Mapping[str, str]) -> str:
+    variables = sorted(_prefect_environment_variables(env).items())
+    return hashlib.sha256(json.dumps(variables).encode()).hexdigest()
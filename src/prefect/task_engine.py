@@ -78,6 +78,7 @@ from prefect.states import (
     exception_to_failed_state,
     return_value_to_state,
 )
+from prefect.task_runs import TaskRunStateChangeWaiter
 from prefect.telemetry.run_telemetry import RunTelemetry
 from prefect.transactions import IsolationLevel, Transaction, transaction
 from prefect.utilities._engine import get_hook_name
@@ -100,6 +101,9 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 BACKOFF_MAX = 10
+# How often a task run waiting for state change events proposes again anyway, in
+# case an event that would have unblocked it was missed
+STATE_CHANGE_FALLBACK_INTERVAL = 60
 
 
 class TaskRunTimeoutError(TimeoutError):
@@ -403,6 +407,7 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             flow_run = flow_run_context.flow_run
             self.task_run.flow_run_run_count = flow_run.run_count
 
+        proposed_at = time.monotonic()
         state = self.set_state(new_state)
 
         # TODO: this is temporary until the API stops rejecting state transitions
@@ -415,17 +420,49 @@ class SyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             except Exception:
                 state = self.set_state(new_state, force=True)
 
+        if not (state.is_pending() or state.is_paused()):
+            return
+
         backoff_count = 0
 
-        # TODO: Could this listen for state change events instead of polling?
-        while state.is_pending() or state.is_paused():
-            if backoff_count < BACKOFF_MAX:
-                backoff_count += 1
-            interval = clamped_poisson_interval(
-                average_interval=backoff_count, clamping_factor=0.3
-            )
-            time.sleep(interval)
-            state = self.set_state(new_state)
+        with self._watch_for_state_changes(since=proposed_at) as changed:
+            while state.is_pending() or state.is_paused():
+                if backoff_count < BACKOFF_MAX:
+                    backoff_count += 1
+                average_interval = backoff_count
+                if (
+                    changed is not None
+                    and TaskRunStateChangeWaiter.instance().subscribed
+                ):
+                    # Only propose again when something that may unblock the task
+                    # run happened, or rarely in case an event was missed
+                    average_interval = STATE_CHANGE_FALLBACK_INTERVAL
+                interval = clamped_poisson_interval(
+                    average_interval=average_interval, clamping_factor=0.3
+                )
+                if changed is None:
+                    time.sleep(interval)
+                else:
+                    changed.wait(interval)
+                    changed.clear()
+                state = self.set_state(new_state)
+
+    @contextmanager
+    def _watch_for_state_changes(
+        self, since: float
+    ) -> Generator[Optional[threading.Event], None, None]:
+        if get_current_settings().tasks.pending_wait_mode != "events":
+            yield None
+            return
+
+        assert self.task_run is not None
+        with TaskRunStateChangeWaiter.watch(
+            task_run_id=self.task_run.id,
+            flow_run_id=self.task_run.flow_run_id,
+            tags=self.task_run.tags,
+            since=since,
+        ) as changed:
+            yield changed
 
     def set_state(self, state: State[R], force: bool = False) -> State[R]:
         last_state = self.state
@@ -936,6 +973,7 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             flow_run = flow_run_context.flow_run
             self.task_run.flow_run_run_count = flow_run.run_count
 
+        proposed_at = time.monotonic()
         state = await self.set_state(new_state)
 
         # TODO: this is temporary until the API stops rejecting state transitions
@@ -948,17 +986,50 @@ class AsyncTaskRunEngine(BaseTaskRunEngine[P, R]):
             except Exception:
                 state = await self.set_state(new_state, force=True)
 
+        if not (state.is_pending() or state.is_paused()):
+            return
+
         backoff_count = 0
 
-        # TODO: Could this listen for state change events instead of polling?
-        while state.is_pending() or state.is_paused():
-            if backoff_count < BACKOFF_MAX:
-                backoff_count += 1
-            interval = clamped_poisson_interval(
-                average_interval=backoff_count, clamping_factor=0.3
-            )
-            await anyio.sleep(interval)
-            state = await self.set_state(new_state)
+        async with self._watch_for_state_changes(since=proposed_at) as changed:
+            while state.is_pending() or state.is_paused():
+                if backoff_count < BACKOFF_MAX:
+                    backoff_count += 1
+                average_interval = backoff_count
+                if (
+                    changed is not None
+                    and TaskRunStateChangeWaiter.instance().subscribed
+                ):
+                    # Only propose again when something that may unblock the task
+                    # run happened, or rarely in case an event was missed
+                    average_interval = STATE_CHANGE_FALLBACK_INTERVAL
+                interval = clamped_poisson_interval(
+                    average_interval=average_interval, clamping_factor=0.3
+                )
+                if changed is None:
+                    await anyio.sleep(interval)
+                else:
+                    with anyio.move_on_after(interval):
+                        await changed.wait()
+                    changed.clear()
+                state = await self.set_state(new_state)
+
+    @asynccontextmanager
+    async def _watch_for_state_changes(
+        self, since: float
+    ) -> AsyncGenerator[Optional[asyncio.Event], None]:
+        if get_current_settings().tasks.pending_wait_mode != "events":
+            yield None
+            return
+
+        assert self.task_run is not None
+        async with TaskRunStateChangeWaiter.watch_async(
+            task_run_id=self.task_run.id,
+            flow_run_id=self.task_run.flow_run_id,
+            tags=self.task_run.tags,
+            since=since,
+        ) as changed:
+            yield changed
 
     async def set_state(self, state: State, force: bool = False) -> State:
         last_state = self.state
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import atexit
+import concurrent.futures
+import logging
+import logging.handlers
+import multiprocessing
+import os
 import sys
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from contextvars import copy_context
 from typing import (
     TYPE_CHECKING,
@@ -19,6 +26,7 @@ from typing import (
     overload,
 )
 
+import cloudpickle  # type: ignore  # no stubs available
 from typing_extensions import ParamSpec, Self, TypeVar
 
 from prefect.client.schemas.objects import TaskRunInput
@@ -30,18 +38,24 @@ from prefect.futures import (
     PrefectFutureList,
 )
 from prefect.logging.loggers import get_logger, get_run_logger
-from prefect.settings import PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS
+from prefect.settings import (
+    PREFECT_API_URL,
+    PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
+    temporary_settings,
+)
 from prefect.utilities.annotations import allow_failure, quote, unmapped
 from prefect.utilities.callables import (
+    cloudpickle_wrapped_call,
     collapse_variadic_parameters,
     explode_variadic_parameter,
     get_parameter_defaults,
 )
-from prefect.utilities.collections import isiterable
+from prefect.utilities.collections import StopVisiting, isiterable, visit_collection
 
 if TYPE_CHECKING:
-    import logging
-
+    from prefect.client.schemas.objects import State
+    from prefect.context import AsyncClientContext
     from prefect.tasks import Task
 
 P = ParamSpec("P")
@@ -230,10 +244,77 @@ class TaskRunner(abc.ABC, Generic[F]):
         self._started = False
 
 
+class _WorkerEventLoop:
+    """
+    A long-lived event loop owned by a single worker thread of a
+    `ThreadPoolTaskRunner`, along with a Prefect client that is opened on that loop
+    once and reused by every async task run in the thread.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._client_context: Optional["AsyncClientContext"] = None
+
+    def run(self, coroutine: Coroutine[Any, Any, R]) -> R:
+        """
+        Run a coroutine to completion on this loop. Must be called from the owning
+        worker thread, within the context the coroutine should run in.
+        """
+        from prefect.context import AsyncClientContext
+
+        if self._client_context is None:
+            # Don't pick up a client from the submitting context; it belongs to a
+            # different event loop
+            AsyncClientContext.__var__.set(None)
+            self._client_context = self.loop.run_until_complete(self._open_client())
+
+        AsyncClientContext.__var__.set(self._client_context)
+        return self.loop.run_until_complete(coroutine)
+
+    async def _open_client(self) -> "AsyncClientContext":
+        from prefect.client.orchestration import get_client
+        from prefect.context import AsyncClientContext
+
+        client = get_client()
+        await client.__aenter__()
+        try:
+            await client.raise_for_api_version_mismatch()
+        except BaseException:
+            await client.__aexit__(*sys.exc_info())
+            raise
+        return AsyncClientContext.model_construct(client=client)
+
+    def close(self) -> None:
+        """
+        Close the client and shut down the loop, cancelling anything task runs left
+        behind on it. Must not be called from a thread with a running event loop.
+        """
+        try:
+            if self._client_context is not None:
+                self.loop.run_until_complete(
+                    self._client_context.client.__aexit__(None, None, None)
+                )
+                self._client_context = None
+
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        finally:
+            self.loop.close()
+
+
 class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
     def __init__(self, max_workers: Optional[int] = None):
         super().__init__()
         self._executor: Optional[ThreadPoolExecutor] = None
+        # Keyed by worker thread ident; each thread only ever adds its own entry
+        self._worker_loops: Dict[int, _WorkerEventLoop] = {}
         self._max_workers = (
             (PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS.value() or sys.maxsize)
             if max_workers is None
@@ -313,11 +394,9 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         )
 
         if task.isasync:
-            # TODO: Explore possibly using a long-lived thread with an event loop
-            # for better performance
             future = self._executor.submit(
                 context.run,
-                asyncio.run,
+                self._run_async_in_worker,
                 run_task_async(**submit_kwargs),
             )
         else:
@@ -357,6 +436,38 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
     ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
         return super().map(task, parameters, wait_for)
 
+    def _run_async_in_worker(self, coroutine: Coroutine[Any, Any, R]) -> R:
+        """
+        Run a coroutine on the calling worker thread's long-lived event loop,
+        creating the loop the first time the thread runs an async task.
+        """
+        thread_id = threading.get_ident()
+        worker_loop = self._worker_loops.get(thread_id)
+        if worker_loop is None:
+            worker_loop = self._worker_loops[thread_id] = _WorkerEventLoop()
+        return worker_loop.run(coroutine)
+
+    def _close_worker_loops(self) -> None:
+        worker_loops = list(self._worker_loops.values())
+        self._worker_loops.clear()
+        if not worker_loops:
+            return
+
+        def close_all():
+            for worker_loop in worker_loops:
+                try:
+                    worker_loop.close()
+                except Exception:
+                    self.logger.debug(
+                        "Failed to close worker event loop", exc_info=True
+                    )
+
+        # The worker threads have exited, but the loops can't be closed from the
+        # calling thread if it is running an event loop of its own
+        closer = threading.Thread(target=close_all, name="TaskRunnerLoopCloser")
+        closer.start()
+        closer.join()
+
     def cancel_all(self) -> None:
         for event in self._cancel_events.values():
             event.set()
@@ -365,6 +476,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         if self._executor is not None:
             self._executor.shutdown(cancel_futures=True)
             self._executor = None
+        self._close_worker_loops()
 
     def __enter__(self) -> Self:
         super().__enter__()
@@ -376,6 +488,7 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
         if self._executor is not None:
             self._executor.shutdown(cancel_futures=True)
             self._executor = None
+        self._close_worker_loops()
         super().__exit__(exc_type, exc_value, traceback)
 
     def __eq__(self, value: object) -> bool:
@@ -388,6 +501,389 @@ class ThreadPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
 ConcurrentTaskRunner = ThreadPoolTaskRunner
 
 
+# The event loop async task runs share within a `ProcessPoolTaskRunner` worker process
+_process_worker_loop: Optional[_WorkerEventLoop] = None
+
+
+class _ForwardedLogDispatcher(logging.Handler):
+    """
+    Hands log records forwarded from worker processes to the logger they were emitted
+    on in this process, so they are displayed and sent to the API as if they had been
+    emitted here.
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        logging.getLogger(record.name).handle(record)
+        return True
+
+
+def _initialize_process_worker(log_queue: "multiprocessing.Queue[Any]") -> None:
+    """
+    Prepare a `ProcessPoolTaskRunner` worker process by routing all of its log records
+    to the parent process instead of handling them here.
+    """
+    import prefect.main  # noqa: F401  # configures logging
+    from prefect.logging.handlers import APILogHandler
+
+    for logger in [
+        logging.getLogger(name) for name in logging.Logger.manager.loggerDict
+    ]:
+        if not isinstance(logger, logging.Logger):
+            continue
+        api_handlers = [h for h in logger.handlers if isinstance(h, APILogHandler)]
+        for handler in api_handlers:
+            logger.removeHandler(handler)
+        if api_handlers and not logger.handlers:
+            # Let these records reach the forwarding handler on the root logger;
+            # the parent will only send them to the API
+            logger.propagate = True
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def _run_task_in_process(task: "Task[P, R]", **run_task_kwargs: Any) -> "State[R]":
+    """
+    Run a task in a `ProcessPoolTaskRunner` worker process, returning its final state.
+    """
+    from prefect.task_engine import run_task_async, run_task_sync
+
+    if not task.isasync:
+        return run_task_sync(task=task, **run_task_kwargs)
+
+    from prefect.context import SettingsContext
+
+    global _process_worker_loop
+    if _process_worker_loop is None:
+        _process_worker_loop = _WorkerEventLoop()
+        atexit.register(_process_worker_loop.close)
+    worker_loop = _process_worker_loop
+
+    def run_on_worker_loop() -> "State[R]":
+        # The loop's client is opened with the parent's settings, so it talks to the
+        # same API
+        settings_context = run_task_kwargs["context"].get("settings_context")
+        with SettingsContext(**settings_context) if settings_context else nullcontext():
+            return worker_loop.run(run_task_async(task=task, **run_task_kwargs))
+
+    # Keep the loop's client out of the context sync task runs in this process use
+    return copy_context().run(run_on_worker_loop)
+
+
+def _futures_to_states(expr: Any) -> Any:
+    """
+    Replace the futures in an expression with their final states so it can be sent to
+    a worker process. Expressions inside quotes are left untouched.
+    """
+
+    def visit_fn(expr: Any, context: dict[str, Any]) -> Any:
+        if isinstance(context.get("annotation"), quote):
+            raise StopVisiting()
+        if isinstance(expr, PrefectFuture):
+            try:
+                # Completed futures record their final state when waited on
+                expr.wait()
+            except Exception:
+                pass
+            return expr.state
+        return expr
+
+    return visit_collection(
+        expr, visit_fn=visit_fn, return_data=True, context={}, max_depth=-1
+    )
+
+
+class ProcessPoolTaskRunner(TaskRunner[PrefectConcurrentFuture[R]]):
+    """
+    A task runner that runs tasks in a pool of worker processes, so CPU-bound tasks
+    are not limited by the GIL.
+
+    Worker processes are started on demand and kept alive between task runs until the
+    task runner exits, so process startup is only paid once per worker. Tasks,
+    parameters, and results must be serializable with `cloudpickle`.
+
+    Worker processes report task run states to the same API as the parent process and
+    forward their log records to the parent, which displays them and sends them to the
+    API. Futures passed as parameters or in `wait_for` are resolved in the parent
+    before the task is sent to a worker.
+
+    Examples:
+        Use a process pool to run CPU-bound tasks in parallel:
+        ```python
+        from prefect import flow, task
+        from prefect.task_runners import ProcessPoolTaskRunner
+
+        @task
+        def fib(n):
+            return n if n < 2 else fib.fn(n - 1) + fib.fn(n - 2)
+
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=4))
+        def my_flow():
+            return fib.map(range(20, 30)).result()
+        ```
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        super().__init__()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._max_workers: int = (
+            (
+                PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS.value()
+                or os.cpu_count()
+                or 1
+            )
+            if max_workers is None
+            else max_workers
+        )
+        self._log_queue: Optional["multiprocessing.Queue[Any]"] = None
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._api_url: Optional[str] = None
+        # Futures for task runs that are waiting on upstream futures
+        self._waiting: Dict[uuid.UUID, concurrent.futures.Future[Any]] = {}
+
+    def duplicate(self) -> "ProcessPoolTaskRunner[R]":
+        return type(self)(max_workers=self._max_workers)
+
+    @overload
+    def submit(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[TaskRunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]:
+        ...
+
+    @overload
+    def submit(
+        self,
+        task: "Task[Any, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[TaskRunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]:
+        ...
+
+    def submit(
+        self,
+        task: "Task[P, R | Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+        dependencies: dict[str, set[TaskRunInput]] | None = None,
+    ) -> PrefectConcurrentFuture[R]:
+        """
+        Submit a task to the task run engine running in a worker process.
+
+        Args:
+            task: The task to submit.
+            parameters: The parameters to use when running the task.
+            wait_for: A list of futures that the task depends on.
+
+        Returns:
+            A future object that can be used to wait for the task to complete and
+            retrieve the result.
+        """
+        if not self._started or self._executor is None:
+            raise RuntimeError("Task runner is not started")
+
+        from prefect.context import FlowRunContext
+
+        task_run_id = uuid.uuid4()
+
+        flow_run_ctx = FlowRunContext.get()
+        if flow_run_ctx:
+            get_run_logger(flow_run_ctx).debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+        else:
+            self.logger.debug(
+                f"Submitting task {task.name} to process pool executor..."
+            )
+
+        self._start_log_forwarding()
+
+        submit_kwargs: dict[str, Any] = dict(
+            task=task,
+            task_run_id=task_run_id,
+            parameters=parameters,
+            wait_for=wait_for,
+            return_type="state",
+            dependencies=dependencies,
+            context=self._serialize_context(),
+        )
+        future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+
+        upstream_futures: Dict[int, PrefectFuture[Any]] = {}
+
+        def collect_futures(expr: Any, context: dict[str, Any]) -> Any:
+            if isinstance(context.get("annotation"), quote):
+                raise StopVisiting()
+            if isinstance(expr, PrefectFuture):
+                upstream_futures[id(expr)] = expr
+            return expr
+
+        visit_collection(
+            (parameters, wait_for),
+            visit_fn=collect_futures,
+            return_data=False,
+            context={},
+            max_depth=-1,
+        )
+
+        if not upstream_futures:
+            self._dispatch(future, submit_kwargs)
+        else:
+            self._waiting[task_run_id] = future
+            remaining = len(upstream_futures)
+            lock = threading.Lock()
+
+            def on_upstream_done(_: PrefectFuture[Any]) -> None:
+                nonlocal remaining
+                with lock:
+                    remaining -= 1
+                    if remaining:
+                        return
+                self._waiting.pop(task_run_id, None)
+                self._dispatch(future, submit_kwargs)
+
+            for upstream_future in upstream_futures.values():
+                upstream_future.add_done_callback(on_upstream_done)
+
+        return PrefectConcurrentFuture(task_run_id=task_run_id, wrapped_future=future)
+
+    def _dispatch(
+        self, future: concurrent.futures.Future[Any], submit_kwargs: dict[str, Any]
+    ) -> None:
+        """
+        Send a task run whose upstream futures are all complete to a worker process,
+        resolving `future` with its final state.
+        """
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            if self._executor is None:
+                raise RuntimeError("Task runner is not started")
+            submit_kwargs["parameters"] = _futures_to_states(
+                submit_kwargs["parameters"]
+            )
+            submit_kwargs["wait_for"] = _futures_to_states(submit_kwargs["wait_for"])
+            process_future = self._executor.submit(
+                cloudpickle_wrapped_call(_run_task_in_process, **submit_kwargs)
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            return
+
+        def on_process_done(process_future: concurrent.futures.Future[bytes]) -> None:
+            if process_future.cancelled():
+                future.set_exception(concurrent.futures.CancelledError())
+            elif (exc := process_future.exception()) is not None:
+                future.set_exception(exc)
+            else:
+                try:
+                    future.set_result(cloudpickle.loads(process_future.result()))
+                except BaseException as exc:
+                    future.set_exception(exc)
+
+        process_future.add_done_callback(on_process_done)
+
+    def _serialize_context(self) -> dict[str, Any]:
+        from prefect.context import serialize_context
+
+        if PREFECT_API_URL.value():
+            return serialize_context()
+
+        # Point workers at the API this process is using rather than letting each of
+        # them start their own ephemeral server
+        if self._api_url is None:
+            from prefect.client.orchestration import get_client
+            from prefect.context import FlowRunContext
+
+            flow_run_ctx = FlowRunContext.get()
+            client = flow_run_ctx.client if flow_run_ctx else None
+            self._api_url = str((client or get_client(sync_client=True)).api_url)
+
+        with temporary_settings(updates={PREFECT_API_URL: self._api_url}):
+            return serialize_context()
+
+    def _start_log_forwarding(self) -> None:
+        if self._log_listener is not None:
+            return
+
+        assert self._log_queue is not None
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, _ForwardedLogDispatcher()
+        )
+        self._log_listener.start()
+
+    @overload
+    def map(
+        self,
+        task: "Task[P, Coroutine[Any, Any, R]]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        ...
+
+    @overload
+    def map(
+        self,
+        task: "Task[Any, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        ...
+
+    def map(
+        self,
+        task: "Task[P, R]",
+        parameters: dict[str, Any],
+        wait_for: Iterable[PrefectFuture[Any]] | None = None,
+    ) -> PrefectFutureList[PrefectConcurrentFuture[R]]:
+        return super().map(task, parameters, wait_for)
+
+    def cancel_all(self) -> None:
+        for future in list(self._waiting.values()):
+            future.cancel()
+        self._waiting.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+        # Worker processes have exited, so every forwarded record is in the queue
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
+    def __enter__(self) -> Self:
+        super().__enter__()
+        context = multiprocessing.get_context("spawn")
+        self._log_queue = context.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_initialize_process_worker,
+            initargs=(self._log_queue,),
+        )
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.cancel_all()
+        if self._log_queue is not None:
+            self._log_queue.close()
+            self._log_queue = None
+        super().__exit__(exc_type, exc_value, traceback)
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, ProcessPoolTaskRunner):
+            return False
+        return self._max_workers == value._max_workers
+
+
 class PrefectTaskRunner(TaskRunner[PrefectDistributedFuture[R]]):
     def __init__(self):
         super().__init__()
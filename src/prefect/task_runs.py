@@ -3,10 +3,23 @@ from __future__ import annotations
 import asyncio
 import atexit
 import threading
+import time
 import uuid
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
 
 import anyio
+import anyio.to_thread
 from cachetools import TTLCache
 from typing_extensions import Self
 
@@ -21,6 +34,18 @@ if TYPE_CHECKING:
     import logging
 
 
+# How long events received about a resource are remembered, so that a task run
+# that starts watching shortly after one is still woken
+_RECEIVED_EVENTS_TTL = 60
+_RECEIVED_EVENTS_SIZE = 10_000
+_SUBSCRIBE_TIMEOUT_SECONDS = 10
+_RESUBSCRIBE_SECONDS = 10
+
+_TERMINAL_TASK_RUN_EVENTS = {
+    f"prefect.task-run.{state.name.title()}" for state in TERMINAL_STATES
+}
+
+
 class TaskRunWaiter:
     """
     A service used for waiting for a task run to finish.
@@ -247,3 +272,250 @@ class TaskRunWaiter:
             from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
 
         return instance
+
+
+class TaskRunStateChangeWaiter:
+    """
+    A service used by task runs that were prevented from starting to wait until
+    something that could unblock them has happened, instead of repeatedly proposing a
+    `Running` state on a timer.
+
+    A watching task run is woken when:
+    - any state change event for the task run itself is received
+    - its flow run changes state, for example when a paused flow run is resumed
+    - another task run sharing one of its tags reaches a terminal state, which may
+      have freed a concurrency slot
+
+    Like `TaskRunWaiter`, this is a singleton that shares a single websocket
+    connection between every watching task run in the process. The subscription is
+    opened once, for every task run and flow run event, and events are matched to
+    watching task runs in the client so that new watchers never renew it. Events
+    received shortly before a task run starts watching are remembered, so a change
+    between a rejected proposal and the start of the watch is not missed.
+    """
+
+    _instance: Optional[Self] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.logger: "logging.Logger" = get_logger("TaskRunStateChangeWaiter")
+        self._consumer_task: "asyncio.Task[None] | None" = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribed = threading.Event()
+        # Callbacks of watching task runs, keyed by the resource IDs they wake on
+        self._callbacks: Dict[str, Set[Callable[[], None]]] = {}
+        # When an event about each resource was last received, by `time.monotonic`
+        self._received: TTLCache[str, float] = TTLCache(
+            maxsize=_RECEIVED_EVENTS_SIZE, ttl=_RECEIVED_EVENTS_TTL
+        )
+        self._callbacks_lock = threading.Lock()
+        self._started = False
+
+    def start(self) -> None:
+        """
+        Start the TaskRunStateChangeWaiter service.
+        """
+        if self._started:
+            return
+        self.logger.debug("Starting TaskRunStateChangeWaiter")
+        loop_thread = get_global_loop()
+
+        if not asyncio.get_running_loop() == loop_thread.loop:
+            raise RuntimeError(
+                "TaskRunStateChangeWaiter must run on the global loop thread."
+            )
+
+        self._loop = loop_thread.loop
+        if TYPE_CHECKING:
+            assert self._loop is not None
+
+        self._consumer_task = self._loop.create_task(self._consume_events())
+
+        loop_thread.add_shutdown_call(create_call(self.stop))
+        atexit.register(self.stop)
+        self._started = True
+
+    @property
+    def subscribed(self) -> bool:
+        """
+        Whether events are currently being received. While they aren't, watching
+        task runs should fall back to proposing on their polling backoff.
+        """
+        return self._subscribed.is_set()
+
+    async def _consume_events(self):
+        while True:
+            try:
+                async with get_events_subscriber(
+                    filter=EventFilter(
+                        event=EventNameFilter(
+                            prefix=["prefect.task-run.", "prefect.flow-run."]
+                        )
+                    )
+                ) as subscriber:
+                    self._subscribed.set()
+                    async for event in subscriber:
+                        ids = [event.resource.id]
+                        if event.event in _TERMINAL_TASK_RUN_EVENTS:
+                            ids += [
+                                related.id
+                                for related in event.related
+                                if related.role == "tag"
+                            ]
+                        self._wake(ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.logger.error(f"Error consuming state change events: {exc}")
+            finally:
+                self._subscribed.clear()
+
+            # Watching task runs fall back to polling on their backoff until the
+            # subscription is restored
+            await asyncio.sleep(_RESUBSCRIBE_SECONDS)
+
+    def _wake(self, resource_ids: Iterable[str]) -> None:
+        received = time.monotonic()
+        with self._callbacks_lock:
+            callbacks: Set[Callable[[], None]] = set()
+            for resource_id in resource_ids:
+                self._received[resource_id] = received
+                callbacks.update(self._callbacks.get(resource_id, ()))
+        self._call(callbacks)
+
+    def _call(self, callbacks: Iterable[Callable[[], None]]) -> None:
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as exc:
+                self.logger.debug(f"Error waking waiting task run: {exc}")
+
+    @contextmanager
+    def _watching(
+        self,
+        resource_ids: Iterable[str],
+        callback: Callable[[], None],
+        since: Optional[float],
+    ) -> Generator[None, None, None]:
+        resource_ids = set(resource_ids)
+        with self._callbacks_lock:
+            for resource_id in resource_ids:
+                self._callbacks.setdefault(resource_id, set()).add(callback)
+            missed = since is not None and any(
+                self._received.get(resource_id, since - 1) >= since
+                for resource_id in resource_ids
+            )
+        if missed:
+            self._call([callback])
+        try:
+            yield
+        finally:
+            with self._callbacks_lock:
+                for resource_id in resource_ids:
+                    callbacks = self._callbacks.get(resource_id)
+                    if callbacks is not None:
+                        callbacks.discard(callback)
+                        if not callbacks:
+                            del self._callbacks[resource_id]
+
+    def stop(self) -> None:
+        """
+        Stop the TaskRunStateChangeWaiter service.
+        """
+        self.logger.debug("Stopping TaskRunStateChangeWaiter")
+        if self._consumer_task:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+        self._subscribed.clear()
+        self.__class__._instance = None
+        self._started = False
+
+    @staticmethod
+    def _resource_ids(
+        task_run_id: uuid.UUID, flow_run_id: Optional[uuid.UUID], tags: Iterable[str]
+    ) -> List[str]:
+        resource_ids = [f"prefect.task-run.{task_run_id}"]
+        if flow_run_id:
+            resource_ids.append(f"prefect.flow-run.{flow_run_id}")
+        resource_ids += [f"prefect.tag.{tag}" for tag in tags]
+        return resource_ids
+
+    @classmethod
+    @contextmanager
+    def watch(
+        cls,
+        task_run_id: uuid.UUID,
+        flow_run_id: Optional[uuid.UUID],
+        tags: Iterable[str],
+        since: Optional[float] = None,
+    ) -> Generator[threading.Event, None, None]:
+        """
+        Watch for anything that may unblock a task run.
+
+        Returns once the subscription is receiving events, or after a short timeout
+        if it can't be opened, in which case `subscribed` is `False`. The yielded
+        event is set whenever something happens; clear it before each new proposal.
+
+        Args:
+            task_run_id: The ID of the waiting task run.
+            flow_run_id: The ID of the task run's flow run, if any.
+            tags: The tags of the task run.
+            since: A `time.monotonic` timestamp taken before the proposal that was
+                rejected. Events received since then also set the yielded event.
+        """
+        instance = cls.instance()
+        changed = threading.Event()
+
+        with instance._watching(
+            cls._resource_ids(task_run_id, flow_run_id, tags), changed.set, since
+        ):
+            instance._subscribed.wait(_SUBSCRIBE_TIMEOUT_SECONDS)
+            yield changed
+
+    @classmethod
+    @asynccontextmanager
+    async def watch_async(
+        cls,
+        task_run_id: uuid.UUID,
+        flow_run_id: Optional[uuid.UUID],
+        tags: Iterable[str],
+        since: Optional[float] = None,
+    ) -> AsyncGenerator[asyncio.Event, None]:
+        """
+        Like `watch`, but yields an event that can be awaited on the running loop.
+        """
+        instance = cls.instance()
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        with instance._watching(
+            cls._resource_ids(task_run_id, flow_run_id, tags),
+            lambda: loop.call_soon_threadsafe(changed.set),
+            since,
+        ):
+            if not instance.subscribed:
+                await anyio.to_thread.run_sync(
+                    instance._subscribed.wait, _SUBSCRIBE_TIMEOUT_SECONDS
+                )
+            yield changed
+
+    @classmethod
+    def instance(cls) -> Self:
+        """
+        Get the singleton instance of TaskRunStateChangeWaiter.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls._new_instance()
+            return cls._instance
+
+    @classmethod
+    def _new_instance(cls):
+        instance = cls()
+
+        if threading.get_ident() == get_global_loop().thread.ident:
+            instance.start()
+        else:
+            from_sync.call_soon_in_loop_thread(create_call(instance.start)).result()
+
+        return instance
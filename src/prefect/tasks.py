@@ -27,6 +27,7 @@ from typing import (
 )
 from uuid import UUID, uuid4
 
+import httpx
 from typing_extensions import Literal, ParamSpec, Self, TypeAlias, TypeIs
 
 import prefect.states
@@ -743,6 +744,62 @@ class Task(Generic[P, R]):
         self.on_rollback_hooks.append(fn)
         return fn
 
+    def _dynamic_key_and_name(
+        self, flow_run_context: Optional[FlowRunContext]
+    ) -> tuple[str, str]:
+        from prefect.utilities._engine import dynamic_key_for_task_run
+
+        if not flow_run_context:
+            return f"{self.task_key}-{str(uuid4().hex)}", self.name
+
+        dynamic_key = dynamic_key_for_task_run(context=flow_run_context, task=self)
+        return str(dynamic_key), f"{self.name}-{dynamic_key}"
+
+    async def _get_parameters_store(self) -> ResultStore:
+        """
+        Get the result store that background task parameters are written to, so
+        that task workers can retrieve them at runtime.
+        """
+        # TODO: Improve use of result storage for parameter storage / reference
+        self.persist_result = True
+
+        return await ResultStore(
+            result_storage=await get_or_create_default_task_scheduling_storage()
+        ).update_for_task(self)
+
+    def _collect_task_inputs(
+        self,
+        parameters: dict[str, Any],
+        flow_run_context: Optional[FlowRunContext],
+        parent_task_run_context: Optional[TaskRunContext],
+        wait_for_inputs: Optional[set[TaskRunInput]],
+        extra_task_inputs: Optional[dict[str, set[TaskRunInput]]],
+    ) -> dict[str, set[TaskRunInput]]:
+        from prefect.utilities.engine import collect_task_run_inputs_sync
+
+        # collect task inputs
+        task_inputs = {
+            k: collect_task_run_inputs_sync(v) for k, v in parameters.items()
+        }
+
+        # collect all parent dependencies
+        if task_parents := _infer_parent_task_runs(
+            flow_run_context=flow_run_context,
+            task_run_context=parent_task_run_context,
+            parameters=parameters,
+        ):
+            task_inputs["__parents__"] = task_parents
+
+        # check wait for dependencies
+        if wait_for_inputs:
+            task_inputs["wait_for"] = wait_for_inputs
+
+        # Join extra task inputs
+        for k, extras in (extra_task_inputs or {}).items():
+            task_inputs[k] = task_inputs[k].union(extras)
+
+        return task_inputs
+
     async def create_run(
         self,
         client: Optional["PrefectClient"] = None,
@@ -754,7 +811,6 @@ class Task(Generic[P, R]):
         extra_task_inputs: Optional[dict[str, set[TaskRunInput]]] = None,
         deferred: bool = False,
     ) -> TaskRun:
-        from prefect.utilities._engine import dynamic_key_for_task_run
         from prefect.utilities.engine import collect_task_run_inputs_sync
 
         if flow_run_context is None:
@@ -767,14 +823,7 @@ class Task(Generic[P, R]):
             client = get_client()
 
         async with client:
-            if not flow_run_context:
-                dynamic_key = f"{self.task_key}-{str(uuid4().hex)}"
-                task_run_name = self.name
-            else:
-                dynamic_key = dynamic_key_for_task_run(
-                    context=flow_run_context, task=self
-                )
-                task_run_name = f"{self.name}-{dynamic_key}"
+            dynamic_key, task_run_name = self._dynamic_key_and_name(flow_run_context)
 
             if deferred:
                 state = Scheduled()
@@ -788,12 +837,7 @@ class Task(Generic[P, R]):
                 parameters_id = uuid4()
                 state.state_details.task_parameters_id = parameters_id
 
-                # TODO: Improve use of result storage for parameter storage / reference
-                self.persist_result = True
-
-                store = await ResultStore(
-                    result_storage=await get_or_create_default_task_scheduling_storage()
-                ).update_for_task(self)
+                store = await self._get_parameters_store()
                 context = serialize_context()
                 data: dict[str, Any] = {"context": context}
                 if parameters:
@@ -802,26 +846,15 @@ class Task(Generic[P, R]):
                     data["wait_for"] = wait_for
                 await store.store_parameters(parameters_id, data)
 
-            # collect task inputs
-            task_inputs = {
-                k: collect_task_run_inputs_sync(v) for k, v in parameters.items()
-            }
-
-            # collect all parent dependencies
-            if task_parents := _infer_parent_task_runs(
+            task_inputs = self._collect_task_inputs(
+                parameters,
                 flow_run_context=flow_run_context,
-                task_run_context=parent_task_run_context,
-                parameters=parameters,
-            ):
-                task_inputs["__parents__"] = task_parents
-
-            # check wait for dependencies
-            if wait_for:
-                task_inputs["wait_for"] = collect_task_run_inputs_sync(wait_for)
-
-            # Join extra task inputs
-            for k, extras in (extra_task_inputs or {}).items():
-                task_inputs[k] = task_inputs[k].union(extras)
+                parent_task_run_context=parent_task_run_context,
+                wait_for_inputs=(
+                    collect_task_run_inputs_sync(wait_for) if wait_for else None
+                ),
+                extra_task_inputs=extra_task_inputs,
+            )
 
             # create the task run
             task_run = client.create_task_run(
@@ -832,7 +865,7 @@ class Task(Generic[P, R]):
                     if flow_run_context and flow_run_context.flow_run
                     else None
                 ),
-                dynamic_key=str(dynamic_key),
+                dynamic_key=dynamic_key,
                 id=id,
                 state=state,
                 task_inputs=task_inputs,
@@ -844,6 +877,88 @@ class Task(Generic[P, R]):
 
             return task_run
 
+    async def create_deferred_runs(
+        self,
+        parameters_list: list[dict[str, Any]],
+        client: Optional["PrefectClient"] = None,
+        wait_for: Optional[OneOrManyFutureOrResult[Any]] = None,
+        extra_task_inputs: Optional[dict[str, set[TaskRunInput]]] = None,
+    ) -> list[TaskRun]:
+        """
+        Create scheduled task runs for task workers to execute, one for each set of
+        parameters, in a single request.
+        """
+        from prefect.client.orchestration import _task_run_create
+        from prefect.utilities.engine import collect_task_run_inputs_sync
+
+        flow_run_context = FlowRunContext.get()
+        parent_task_run_context = TaskRunContext.get()
+        if client is None:
+            client = get_client()
+
+        async with client:
+            store = None
+            data: dict[str, Any] = {}
+            if wait_for or any(parameters_list):
+                store = await self._get_parameters_store()
+                data["context"] = serialize_context()
+                if wait_for:
+                    data["wait_for"] = wait_for
+
+            flow_run_id = (
+                getattr(flow_run_context.flow_run, "id", None)
+                if flow_run_context and flow_run_context.flow_run
+                else None
+            )
+            extra_tags = TagsContext.get().current_tags
+            wait_for_inputs = (
+                collect_task_run_inputs_sync(wait_for) if wait_for else None
+            )
+
+            task_runs = []
+            writes: list[Awaitable[Any]] = []
+            for parameters in parameters_list:
+                dynamic_key, task_run_name = self._dynamic_key_and_name(
+                    flow_run_context
+                )
+
+                state = Scheduled()
+                state.state_details.deferred = True
+
+                if store is not None and (parameters or wait_for):
+                    parameters_id = uuid4()
+                    state.state_details.task_parameters_id = parameters_id
+                    run_data = dict(data)
+                    if parameters:
+                        run_data["parameters"] = parameters
+                    writes.append(store.store_parameters(parameters_id, run_data))
+
+                task_inputs = self._collect_task_inputs(
+                    parameters,
+                    flow_run_context=flow_run_context,
+                    parent_task_run_context=parent_task_run_context,
+                    wait_for_inputs=wait_for_inputs,
+                    extra_task_inputs=extra_task_inputs,
+                )
+
+                task_runs.append(
+                    _task_run_create(
+                        self,
+                        flow_run_id=flow_run_id,
+                        dynamic_key=dynamic_key,
+                        name=task_run_name,
+                        extra_tags=extra_tags,
+                        state=state,
+                        task_inputs=task_inputs,
+                    )
+                )
+
+            # parameters must be stored before task workers can pick up the runs, but
+            # they are independent of each other and can be written concurrently
+            await asyncio.gather(*writes)
+
+            return await client.create_task_runs(task_runs)
+
     async def create_local_run(
         self,
         client: Optional["PrefectClient"] = None,
@@ -1416,10 +1531,7 @@ class Task(Generic[P, R]):
 
         if deferred:
             parameters_list = expand_mapping_parameters(self.fn, parameters)
-            futures = [
-                self.apply_async(kwargs=parameters, wait_for=wait_for)
-                for parameters in parameters_list
-            ]
+            futures = self.apply_async_many(parameters_list, wait_for=wait_for)
         elif task_runner := getattr(flow_run_context, "task_runner", None):
             assert isinstance(task_runner, TaskRunner)
             futures = task_runner.map(self, parameters, wait_for)
@@ -1544,6 +1656,109 @@ class Task(Generic[P, R]):
 
         return PrefectDistributedFuture(task_run_id=task_run.id)
 
+    def apply_async_many(
+        self,
+        parameters: Iterable[dict[str, Any]],
+        wait_for: Optional[Iterable[PrefectFuture[R]]] = None,
+        dependencies: Optional[dict[str, set[TaskRunInput]]] = None,
+        batch_size: int = 200,
+    ) -> PrefectFutureList[R]:
+        """
+        Create pending task runs for task workers to execute, one for each set of
+        keyword arguments.
+
+        Task runs are created in batches of `batch_size` with a single request per
+        batch, and the parameters of each batch are stored concurrently. Servers
+        that can't create task runs in bulk have them created one at a time with
+        `apply_async` instead.
+
+        Args:
+            parameters: Keyword arguments to run the task with, one dictionary per
+                task run
+            wait_for: Upstream task futures to wait for before starting the task runs
+            batch_size: The maximum number of task runs to create per request, up to
+                the server's `PREFECT_API_DEFAULT_LIMIT`
+
+        Returns:
+            A PrefectFutureList of PrefectDistributedFuture objects, in the order of
+                the given parameters
+
+        Examples:
+
+            Define a task
+
+            >>> from prefect import task
+            >>> @task
+            >>> def my_task(name: str = "world"):
+            >>>     return f"hello {name}"
+
+            Create many pending task runs for the task
+
+            >>> futures = my_task.apply_async_many(
+            >>>     [{"name": "marvin"}, {"name": "arthur"}]
+            >>> )
+            >>> futures.result()
+            ['hello marvin', 'hello arthur']
+        """
+        from prefect.utilities.collections import batched_iterable
+        from prefect.utilities.engine import emit_task_run_state_change_event
+        from prefect.utilities.visualization import (
+            VisualizationUnsupportedError,
+            get_task_viz_tracker,
+        )
+
+        task_viz_tracker = get_task_viz_tracker()
+        if task_viz_tracker:
+            raise VisualizationUnsupportedError(
+                "`task.apply_async_many()` is not currently supported by"
+                " `flow.visualize()`"
+            )
+
+        # Convert each set of kwargs to a parameter dict
+        kwargs_list = list(parameters)
+        parameters_list = [
+            get_call_parameters(self.fn, (), kwargs) for kwargs in kwargs_list
+        ]
+
+        futures: PrefectFutureList[R] = PrefectFutureList()
+        for batch in batched_iterable(parameters_list, batch_size):
+            try:
+                task_runs: list[TaskRun] = run_coro_as_sync(
+                    self.create_deferred_runs(
+                        list(batch),
+                        wait_for=wait_for,
+                        extra_task_inputs=dependencies,
+                    )
+                )  # type: ignore
+            except httpx.HTTPStatusError as exc:
+                # servers older than the bulk endpoint don't route it
+                if exc.response.status_code not in (404, 405):
+                    raise
+                logger.debug(
+                    "Creating task runs in bulk is not supported by the server."
+                    " Creating them one at a time."
+                )
+                for kwargs in kwargs_list[len(futures) :]:
+                    futures.append(
+                        self.apply_async(
+                            kwargs=kwargs, wait_for=wait_for, dependencies=dependencies
+                        )
+                    )
+                break
+
+            for task_run in task_runs:
+                # emit a `SCHEDULED` event for the task run
+                emit_task_run_state_change_event(
+                    task_run=task_run,
+                    initial_state=None,
+                    validated_state=task_run.state,
+                )
+                futures.append(PrefectDistributedFuture(task_run_id=task_run.id))
+
+        logger.info(f"Created {len(futures)} task runs for task {self.name!r}")
+
+        return futures
+
     def delay(self, *args: P.args, **kwargs: P.kwargs) -> PrefectDistributedFuture[R]:
         """
         An alias for `apply_async` with simpler calling semantics.
@@ -18,6 +18,7 @@ from websockets.legacy.server import WebSocketServer, WebSocketServerProtocol, s
 
 from prefect.events import Event
 from prefect.events.clients import (
+    BATCHED_EVENTS_SUBPROTOCOL,
     AssertingEventsClient,
     AssertingPassthroughEventsClient,
 )
@@ -258,6 +259,7 @@ def mock_anyio_sleep(
 class Recorder:
     connections: int
     path: Optional[str]
+    frames: int
     events: List[Event]
     token: Optional[str]
     filter: Optional[EventFilter]
@@ -265,6 +267,7 @@ class Recorder:
     def __init__(self):
         self.connections = 0
         self.path = None
+        self.frames = 0
         self.events = []
 
 
@@ -320,11 +323,18 @@ async def events_server(
             except ConnectionClosed:
                 return
 
-            event = Event.model_validate_json(message)
-            recorder.events.append(event)
+            recorder.frames += 1
+            if message.startswith("["):
+                events = [Event.model_validate(e) for e in json.loads(message)]
+            else:
+                events = [Event.model_validate_json(message)]
 
-            if puppeteer.hard_disconnect_after == event.id:
-                raise ValueError("zonk")
+            for event in events:
+                recorder.events.append(event)
+
+                if puppeteer.hard_disconnect_after == event.id:
+                    puppeteer.hard_disconnect_after = None
+                    raise ValueError("zonk")
 
     async def outgoing_events(socket: WebSocketServerProtocol):
         # 1. authentication
@@ -361,7 +371,12 @@ async def events_server(
                 puppeteer.hard_disconnect_after = None
                 raise ValueError("zonk")
 
-    async with serve(handler, host="localhost", port=unused_tcp_port) as server:
+    async with serve(
+        handler,
+        host="localhost",
+        port=unused_tcp_port,
+        subprotocols=[BATCHED_EVENTS_SUBPROTOCOL],
+    ) as server:
         yield server
 
 
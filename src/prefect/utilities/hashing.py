@@ -1,7 +1,7 @@
 import hashlib
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import cloudpickle  # type: ignore  # no stubs available
 
@@ -10,11 +10,22 @@ from prefect.serializers import JSONSerializer
 
 _md5 = partial(hashlib.md5, usedforsecurity=False)
 
+# A content hasher returns a hex digest of an object's data computed with the given
+# hash algorithm, or `None` to fall back to serializing the object
+ContentHasher = Callable[[Any, Callable[..., Any]], Optional[str]]
 
-def stable_hash(*args: Union[str, bytes], hash_algo: Callable[..., Any] = _md5) -> str:
+_CONTENT_HASHERS: Dict[str, ContentHasher] = {}
+
+# Marks an object that was replaced by the digest of its contents before serializing
+_CONTENT_DIGEST_PREFIX = "__prefect_content_digest__"
+
+
+def stable_hash(
+    *args: Union[str, bytes, memoryview], hash_algo: Callable[..., Any] = _md5
+) -> str:
     """Given some arguments, produces a stable 64-bit hash of their contents.
 
-    Supports bytes and strings. Strings will be UTF-8 encoded.
+    Supports strings and bytes-like objects. Strings will be UTF-8 encoded.
 
     Args:
         *args: Items to include in the hash.
@@ -89,3 +100,216 @@ def hash_objects(
         raise HashError(msg)
 
     return None
+
+
+def get_hash_algorithm(name: str) -> Callable[..., Any]:
+    """
+    Look up a hash algorithm by name.
+
+    `md5`, `sha256` and `blake2b` come from `hashlib`. `xxhash` is a much faster
+    non-cryptographic algorithm that requires the `xxhash` package.
+
+    Args:
+        name: The name of the hash algorithm
+
+    Returns:
+        A callable returning a new hash object
+
+    Raises:
+        ValueError: If the algorithm is unknown
+        ImportError: If the algorithm requires a package that is not installed
+    """
+    if name == "md5":
+        return _md5
+    if name == "sha256":
+        return hashlib.sha256
+    if name == "blake2b":
+        return partial(hashlib.blake2b, digest_size=16)
+    if name == "xxhash":
+        try:
+            import xxhash  # type: ignore
+        except ImportError as exc:
+            raise ImportError(
+                "The `xxhash` hash algorithm requires the `xxhash` package. "
+                "Install it with `pip install xxhash`."
+            ) from exc
+        return xxhash.xxh3_128  # type: ignore
+    raise ValueError(f"Unknown hash algorithm {name!r}.")
+
+
+def register_content_hasher(
+    type_: Union[type, str], hasher: Optional[ContentHasher] = None
+) -> Any:
+    """
+    Register a function that hashes instances of a type directly from their data
+    when computing cache keys with `hash_inputs`. Can be used as a decorator.
+
+    The type may be given as a dotted path, e.g. `"numpy.ndarray"`, so that
+    hashers for optional libraries can be registered without importing them.
+    Only instances of exactly this type are hashed with the function; subclasses
+    may hold state it doesn't know about, such as the mask of a NumPy masked array,
+    so they are serialized unless registered themselves.
+
+    Args:
+        type_: The type, or the dotted path of the type where it is defined
+        hasher: A callable accepting an instance and a hash algorithm and returning
+            a hex digest, or `None` to fall back to serializing the instance
+    """
+    if hasher is None:
+        return partial(register_content_hasher, type_)
+
+    key = type_ if isinstance(type_, str) else _type_path(type_)
+    _CONTENT_HASHERS[key] = hasher
+    _find_content_hasher.cache_clear()
+    return hasher
+
+
+def _type_path(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+@lru_cache(maxsize=1024)
+def _find_content_hasher(cls: type) -> Optional[ContentHasher]:
+    return _CONTENT_HASHERS.get(_type_path(cls))
+
+
+class _ReferenceCycle(Exception):
+    pass
+
+
+def _digest_contents(obj: Any, hash_algo: Callable[..., Any]) -> Any:
+    """
+    Replace objects with a registered content hasher by the digest of their contents,
+    searching through dicts, lists and tuples. Collections without such objects are
+    returned as-is, and so is `obj` if it contains a reference cycle or is nested too
+    deeply, leaving it to be serialized whole like `hash_objects` does.
+    """
+    try:
+        return _digest_nested(obj, hash_algo, set())
+    except (_ReferenceCycle, RecursionError):
+        return obj
+
+
+def _digest_nested(obj: Any, hash_algo: Callable[..., Any], visiting: set[int]) -> Any:
+    if isinstance(obj, (dict, list, tuple)):
+        if id(obj) in visiting:
+            raise _ReferenceCycle()
+        visiting.add(id(obj))
+        try:
+            if isinstance(obj, dict):
+                digested = {
+                    key: _digest_nested(value, hash_algo, visiting)
+                    for key, value in obj.items()  # type: ignore
+                }
+                if any(digested[key] is not value for key, value in obj.items()):  # type: ignore
+                    return digested
+                return obj
+
+            items = [_digest_nested(item, hash_algo, visiting) for item in obj]  # type: ignore
+            if any(new is not old for new, old in zip(items, obj)):  # type: ignore
+                if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+                    return type(obj)(*items)  # namedtuple
+                return type(obj)(items)  # type: ignore
+            return obj
+        finally:
+            visiting.discard(id(obj))
+
+    hasher = _find_content_hasher(type(obj))
+    if hasher is not None:
+        try:
+            digest = hasher(obj, hash_algo)
+        except Exception:
+            digest = None
+        if digest is not None:
+            return f"{_CONTENT_DIGEST_PREFIX}:{_type_path(type(obj))}:{digest}"
+    return obj
+
+
+def hash_inputs(
+    *args: Any,
+    hash_algo: Callable[..., Any] = _md5,
+    raise_on_failure: bool = False,
+    **kwargs: Any,
+) -> Optional[str]:
+    """
+    Hash the inputs to a task or flow.
+
+    Works like `hash_objects`, except that objects with a registered content hasher
+    (bytes-like objects, NumPy arrays and pandas objects by default) are hashed
+    directly from memory instead of being serialized.
+
+    Args:
+        *args: Positional arguments to hash
+        hash_algo: Hash algorithm to use
+        raise_on_failure: If True, raise exceptions instead of returning None
+        **kwargs: Keyword arguments to hash
+
+    Returns:
+        A hash string or None if hashing failed
+
+    Raises:
+        HashError: If objects cannot be hashed and raise_on_failure is True
+    """
+    args, kwargs = _digest_contents((args, kwargs), hash_algo)
+    return hash_objects(
+        *args, hash_algo=hash_algo, raise_on_failure=raise_on_failure, **kwargs
+    )
+
+
+@register_content_hasher(bytes)
+@register_content_hasher(bytearray)
+@register_content_hasher(memoryview)
+def _hash_buffer(obj: Any, hash_algo: Callable[..., Any]) -> Optional[str]:
+    view = memoryview(obj)
+    if not view.c_contiguous:
+        return None
+    return stable_hash(view.cast("B"), hash_algo=hash_algo)
+
+
+@register_content_hasher("numpy.ndarray")
+def _hash_ndarray(array: Any, hash_algo: Callable[..., Any]) -> Optional[str]:
+    import numpy as np
+
+    if array.dtype.hasobject:
+        return None
+
+    contiguous = np.ascontiguousarray(array)
+    return stable_hash(
+        f"{array.dtype!r}{array.shape}",
+        # viewing as bytes supports dtypes that can't be exported as buffers
+        contiguous.reshape(-1).view(np.uint8).data,
+        hash_algo=hash_algo,
+    )
+
+
+def _pandas_values_digest(values: Any, hash_algo: Callable[..., Any]) -> str:
+    import numpy as np
+    import pandas as pd  # type: ignore
+
+    if isinstance(values.dtype, np.dtype) and not values.dtype.hasobject:
+        digest = _hash_ndarray(values.to_numpy(), hash_algo)
+        if digest is not None:
+            return digest
+    # object and extension dtypes are reduced to one 64-bit hash per element
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return stable_hash(f"{values.dtype}", hashes.data, hash_algo=hash_algo)
+
+
+@register_content_hasher("pandas.core.series.Series")
+def _hash_series(series: Any, hash_algo: Callable[..., Any]) -> Optional[str]:
+    return stable_hash(
+        repr(series.name),
+        _pandas_values_digest(series.index, hash_algo),
+        _pandas_values_digest(series, hash_algo),
+        hash_algo=hash_algo,
+    )
+
+
+@register_content_hasher("pandas.core.frame.DataFrame")
+def _hash_dataframe(frame: Any, hash_algo: Callable[..., Any]) -> Optional[str]:
+    return stable_hash(
+        repr(list(frame.columns)),
+        _pandas_values_digest(frame.index, hash_algo),
+        *(_pandas_values_digest(column, hash_algo) for _, column in frame.items()),
+        hash_algo=hash_algo,
+    )
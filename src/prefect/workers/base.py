@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import heapq
 import threading
+import time
 from contextlib import AsyncExitStack
 from functools import partial
 from typing import (
@@ -16,6 +18,7 @@ from typing import (
     Set,
     Type,
     Union,
+    cast,
 )
 from uuid import UUID, uuid4
 
@@ -29,6 +32,7 @@ from pydantic.json_schema import GenerateJsonSchema
 from typing_extensions import Literal, Self, TypeVar
 
 import prefect
+from prefect._internal.schemas.bases import IDBaseModel
 from prefect._internal.schemas.validators import return_v_or_none
 from prefect.client.base import ServerType
 from prefect.client.orchestration import PrefectClient, get_client
@@ -39,8 +43,10 @@ from prefect.client.schemas.objects import (
     WorkerMetadata,
     WorkPool,
 )
+from prefect.client.subscriptions import Subscription
 from prefect.client.utilities import inject_client
-from prefect.events import Event, RelatedResource, emit_event
+from prefect.events import Event, RelatedResource, emit_event, get_events_subscriber
+from prefect.events.filters import EventFilter, EventResourceFilter
 from prefect.events.related import object_as_related_resource, tags_as_related_resources
 from prefect.exceptions import (
     Abort,
@@ -55,9 +61,12 @@ from prefect.plugins import load_prefect_collections
 from prefect.settings import (
     PREFECT_API_URL,
     PREFECT_TEST_MODE,
+    PREFECT_WORKER_CLAIM_FLOW_RUNS,
     PREFECT_WORKER_HEARTBEAT_SECONDS,
+    PREFECT_WORKER_JOB_CONFIGURATION_CACHE_SECONDS,
     PREFECT_WORKER_PREFETCH_SECONDS,
     PREFECT_WORKER_QUERY_SECONDS,
+    PREFECT_WORKER_SUBSCRIBE_TO_FLOW_RUNS,
     get_current_settings,
 )
 from prefect.states import (
@@ -65,7 +74,7 @@ from prefect.states import (
     Pending,
     exception_to_failed_state,
 )
-from prefect.types import KeyValueLabels
+from prefect.types import DateTime, KeyValueLabels
 from prefect.utilities.dispatch import get_registry_for_type, register_base_type
 from prefect.utilities.engine import propose_state
 from prefect.utilities.services import critical_service_loop
@@ -76,6 +85,7 @@ from prefect.utilities.templating import (
     resolve_variables,
 )
 from prefect.utilities.urls import url_for
+from prefect.workers.cache import JobConfigurationCache
 
 if TYPE_CHECKING:
     from prefect.client.schemas.objects import Flow, FlowRun
@@ -385,6 +395,14 @@ class BaseWorkerResult(BaseModel, abc.ABC):
         return self.status_code == 0
 
 
+class ScheduledFlowRunNotification(IDBaseModel):
+    """
+    A flow run moving to a `Scheduled` state in the queues a worker polls.
+    """
+
+    next_scheduled_start_time: Optional[DateTime] = None
+
+
 C = TypeVar("C", bound=BaseJobConfiguration)
 V = TypeVar("V", bound=BaseVariables)
 R = TypeVar("R", bound=BaseWorkerResult)
@@ -458,9 +476,12 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         self._exit_stack: AsyncExitStack = AsyncExitStack()
         self._runs_task_group: Optional[anyio.abc.TaskGroup] = None
         self._client: Optional[PrefectClient] = None
+        self._job_configuration_cache: Optional[JobConfigurationCache] = None
         self._last_polled_time: pendulum.DateTime = pendulum.now("utc")
         self._limit = limit
         self._limiter: Optional[anyio.CapacityLimiter] = None
+        self._claim_flow_runs: bool = PREFECT_WORKER_CLAIM_FLOW_RUNS.value()
+        self._claimed_flow_run_ids: Set[UUID] = set()
         self._submitting_flow_run_ids = set()
         self._cancelling_flow_run_ids = set()
         self._scheduled_task_scopes = set()
@@ -580,6 +601,15 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
                             backoff=4,  # Up to ~1 minute interval during backoff
                         )
                     )
+                    if PREFECT_WORKER_SUBSCRIBE_TO_FLOW_RUNS.value() and not run_once:
+                        # poll as soon as runs are scheduled, between polling loops
+                        loops_task_group.start_soon(
+                            self._subscribe_to_scheduled_flow_runs
+                        )
+                    if self._job_configuration_cache and not run_once:
+                        loops_task_group.start_soon(
+                            self._invalidate_job_configuration_cache
+                        )
                     # schedule the sync loop
                     loops_task_group.start_soon(
                         partial(
@@ -655,6 +685,11 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         await self._exit_stack.enter_async_context(self._client)
         await self._exit_stack.enter_async_context(self._runs_task_group)
 
+        if cache_seconds := PREFECT_WORKER_JOB_CONFIGURATION_CACHE_SECONDS.value():
+            self._job_configuration_cache = JobConfigurationCache(
+                self._client, ttl_seconds=cache_seconds
+            )
+
         self.is_setup = True
 
     async def teardown(self, *exc_info: Any) -> None:
@@ -674,6 +709,7 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         await self._exit_stack.__aexit__(*exc_info)
         self._runs_task_group = None
         self._client = None
+        self._job_configuration_cache = None
 
     def is_worker_still_polling(self, query_interval_seconds: float) -> bool:
         """
@@ -704,6 +740,15 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
 
         return is_still_polling
 
+    def job_configuration_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the number of hits and misses of the job configuration cache for
+        each kind of object it caches, or an empty dictionary if caching is disabled.
+        """
+        if not self._job_configuration_cache:
+            return {}
+        return self._job_configuration_cache.stats()
+
     async def get_and_submit_flow_runs(self) -> list["FlowRun"]:
         runs_response = await self._get_scheduled_flow_runs()
 
@@ -711,6 +756,136 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
 
         return await self._submit_scheduled_flow_runs(flow_run_response=runs_response)
 
+    async def _subscribe_to_scheduled_flow_runs(self) -> None:
+        """
+        Queries for scheduled flow runs whenever the API notifies the worker that
+        flow runs were scheduled in its work pool queues. The polling loop keeps
+        running on its own interval, so flow runs are still submitted while the
+        worker is disconnected.
+        """
+        base_url = PREFECT_API_URL.value()
+        if base_url is None:
+            self._logger.debug(
+                "Not subscribing to scheduled flow runs with the ephemeral API"
+            )
+            return
+
+        wake = anyio.Event()
+        notified = False
+        # When notified flow runs that are scheduled after the prefetch window will
+        # enter it, by `time.monotonic`
+        due: list[float] = []
+
+        async def poll_when_notified() -> None:
+            nonlocal wake, notified
+            while True:
+                with anyio.move_on_after(due[0] - time.monotonic() if due else None):
+                    await wake.wait()
+                wake = anyio.Event()
+                now = time.monotonic()
+                while due and due[0] <= now:
+                    heapq.heappop(due)
+                    notified = True
+                if not notified:
+                    # woken to wait for a flow run that is due sooner instead
+                    continue
+                # Notifications that arrive while polling are handled by a single
+                # subsequent poll
+                notified = False
+                try:
+                    await self.get_and_submit_flow_runs()
+                except Exception:
+                    self._logger.exception(
+                        "Failed to submit flow runs after a notification"
+                    )
+
+        query_seconds = PREFECT_WORKER_QUERY_SECONDS.value()
+        log_failure = self._logger.warning
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(poll_when_notified)
+            while True:
+                try:
+                    async for flow_run in Subscription(
+                        model=ScheduledFlowRunNotification,
+                        path=(
+                            f"/work_pools/{self._work_pool_name}"
+                            "/subscriptions/scheduled"
+                        ),
+                        keys=self._work_queues,
+                        client_id=self.name,
+                        base_url=base_url,
+                    ):
+                        delay = self._seconds_until_prefetch_window(flow_run)
+                        if delay > 0:
+                            # A poll would not return the flow run yet, so poll
+                            # once it enters the prefetch window instead
+                            self._logger.debug(
+                                f"Notified of flow run {flow_run.id} scheduled for"
+                                f" {flow_run.next_scheduled_start_time}; polling for"
+                                f" it in {delay:.0f} seconds"
+                            )
+                            heapq.heappush(due, time.monotonic() + delay)
+                        else:
+                            self._logger.debug(
+                                f"Notified of scheduled flow run {flow_run.id}"
+                            )
+                            notified = True
+                        wake.set()
+                except Exception as exc:
+                    log_failure(
+                        "Unable to subscribe to scheduled flow runs; polling every"
+                        f" {query_seconds} seconds until subscribed: {exc}"
+                    )
+                    # Only the first failure is a warning, since a server without
+                    # subscriptions will fail every attempt
+                    log_failure = self._logger.debug
+                    await anyio.sleep(query_seconds)
+
+    def _seconds_until_prefetch_window(
+        self, notification: ScheduledFlowRunNotification
+    ) -> float:
+        """
+        The number of seconds until a notified flow run would be returned by a poll,
+        which only includes flow runs scheduled to start within the prefetch window.
+        """
+        if notification.next_scheduled_start_time is None:
+            return 0
+        return (
+            notification.next_scheduled_start_time - pendulum.now("utc")
+        ).total_seconds() - self._prefetch_seconds
+
+    async def _invalidate_job_configuration_cache(self) -> None:
+        """
+        Evicts objects from the job configuration cache when the API emits events
+        about them, such as a deployment's status changing.
+        """
+        if PREFECT_API_URL.value() is None:
+            return
+
+        try:
+            async with get_events_subscriber(
+                filter=EventFilter(
+                    resource=EventResourceFilter(
+                        id_prefix=[
+                            "prefect.deployment.",
+                            "prefect.flow.",
+                            "prefect.block-document.",
+                            "prefect.variable.",
+                        ]
+                    )
+                )
+            ) as subscriber:
+                async for event in subscriber:
+                    if self._job_configuration_cache:
+                        self._job_configuration_cache.invalidate(event)
+        except Exception:
+            self._logger.warning(
+                "Unable to subscribe to events; cached deployments, flows, blocks"
+                " and variables will only expire after"
+                f" {PREFECT_WORKER_JOB_CONFIGURATION_CACHE_SECONDS.value()} seconds",
+                exc_info=True,
+            )
+
     async def _update_local_work_pool_info(self) -> None:
         if TYPE_CHECKING:
             assert self._client is not None
@@ -861,6 +1036,9 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
             f"Querying for flow runs scheduled before {scheduled_before}"
         )
         try:
+            if self._claim_flow_runs:
+                return await self._claim_scheduled_flow_runs(scheduled_before)
+
             scheduled_flow_runs = (
                 await self._client.get_scheduled_flow_runs_for_work_pool(
                     work_pool_name=self._work_pool_name,
@@ -877,6 +1055,34 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
             # heartbeat (or an appropriate warning will be logged)
             return []
 
+    async def _claim_scheduled_flow_runs(
+        self, scheduled_before: pendulum.DateTime
+    ) -> List["WorkerFlowRunResponse"]:
+        """
+        Claim scheduled flow runs from the work pool's queues. The API moves claimed
+        flow runs to a `Pending` state, so they don't race other workers' runs.
+        """
+        limit = None
+        if self._limiter:
+            # Claimed flow runs can't be left for other workers, so no more are
+            # claimed than can be submitted
+            limit = int(self._limiter.available_tokens)
+            if not limit:
+                self._logger.debug("Flow run limit reached; not claiming flow runs")
+                return []
+
+        claimed_flow_runs = await self._client.claim_flow_runs_for_work_pool(
+            work_pool_name=self._work_pool_name,
+            scheduled_before=scheduled_before,
+            work_queue_names=list(self._work_queues),
+            limit=limit,
+        )
+        self._claimed_flow_run_ids.update(
+            entry.flow_run.id for entry in claimed_flow_runs
+        )
+        self._logger.debug(f"Claimed {len(claimed_flow_runs)} scheduled flow runs")
+        return claimed_flow_runs
+
     async def _submit_scheduled_flow_runs(
         self, flow_run_response: List["WorkerFlowRunResponse"]
     ) -> List["FlowRun"]:
@@ -956,9 +1162,12 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         """
         run_logger = self.get_flow_run_logger(flow_run)
 
+        claimed = flow_run.id in self._claimed_flow_run_ids
+        self._claimed_flow_run_ids.discard(flow_run.id)
+
         try:
             await self._check_flow_run(flow_run)
-        except (ValueError, ObjectNotFound):
+        except (ValueError, ObjectNotFound) as exc:
             self._logger.exception(
                 (
                     "Flow run %s did not pass checks and will not be submitted for"
@@ -966,10 +1175,15 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
                 ),
                 flow_run.id,
             )
+            if claimed:
+                # Other workers won't pick up a claimed flow run, so it's failed
+                # rather than left pending
+                await self._propose_failed_state(flow_run, exc)
             self._submitting_flow_run_ids.remove(flow_run.id)
             return
 
-        ready_to_submit = await self._propose_pending_state(flow_run)
+        # Claimed flow runs were already moved to a `Pending` state by the API
+        ready_to_submit = claimed or await self._propose_pending_state(flow_run)
         self._logger.debug(f"Ready to submit {flow_run.id}: {ready_to_submit}")
         if ready_to_submit:
             readiness_result = await self._runs_task_group.start(
@@ -1086,12 +1300,14 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         flow_run: "FlowRun",
         deployment: Optional["DeploymentResponse"] = None,
     ) -> BaseJobConfiguration:
+        # The cache reads through to the client for anything it doesn't cache
+        client = cast(PrefectClient, self._job_configuration_cache or self._client)
         deployment = (
             deployment
             if deployment
-            else await self._client.read_deployment(flow_run.deployment_id)
+            else await client.read_deployment(flow_run.deployment_id)
         )
-        flow = await self._client.read_flow(flow_run.flow_id)
+        flow = await client.read_flow(flow_run.flow_id)
 
         deployment_vars = deployment.job_variables or {}
         flow_run_vars = flow_run.job_variables or {}
@@ -1105,7 +1321,7 @@ class BaseWorker(abc.ABC, Generic[C, V, R]):
         configuration = await self.job_configuration.from_template_and_values(
             base_job_template=self._work_pool.base_job_template,
             values=job_variables,
-            client=self._client,
+            client=client,
         )
         configuration.prepare_for_flow_run(
             flow_run=flow_run, deployment=deployment, flow=flow
@@ -0,0 +1,163 @@
+"""
+A cache for the objects that workers read from the API to build the job
+configuration of each flow run.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+if TYPE_CHECKING:
+    import datetime
+
+    from prefect.client.orchestration import PrefectClient
+    from prefect.client.schemas.objects import BlockDocument, Flow, Variable
+    from prefect.client.schemas.responses import DeploymentResponse
+    from prefect.events import Event
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires", "resource_id", "updated")
+
+    def __init__(
+        self,
+        value: Any,
+        expires: float,
+        resource_id: Optional[str],
+        updated: Optional["datetime.datetime"],
+    ):
+        self.value = value
+        self.expires = expires
+        self.resource_id = resource_id
+        self.updated = updated
+
+
+class JobConfigurationCache:
+    """
+    Caches the deployments, flows, block documents, and variables that a worker
+    reads to build job configurations, so that submitting many runs of the same
+    deployment doesn't read the same objects for every run.
+
+    Objects are cached for `ttl_seconds`, and evicted sooner when `invalidate` is
+    called with an event about them that occurred after they were last updated.
+
+    The cache can be passed in place of a `PrefectClient` to the templating
+    utilities, since any other attribute is read from the wrapped client.
+    """
+
+    def __init__(self, client: "PrefectClient", ttl_seconds: float):
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, Any], _CacheEntry] = {}
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def _read(
+        self,
+        kind: str,
+        key: Any,
+        read: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        entry = self._entries.get((kind, key))
+        if entry is not None and entry.expires > time.monotonic():
+            self.hits[kind] += 1
+        else:
+            self.misses[kind] += 1
+            value = await read()
+            entry = _CacheEntry(
+                value=value,
+                expires=time.monotonic() + self._ttl_seconds,
+                resource_id=(
+                    f"prefect.{kind}.{value.id}" if value is not None else None
+                ),
+                updated=getattr(value, "updated", None),
+            )
+            # Re-inserting keeps the entries ordered by when they expire
+            self._entries.pop((kind, key), None)
+            self._entries[(kind, key)] = entry
+            self._prune()
+
+        # Callers modify parts of these objects while building job configurations,
+        # so each caller gets its own copy
+        return entry.value.model_copy(deep=True) if entry.value is not None else None
+
+    def _prune(self) -> None:
+        """
+        Removes expired entries, which are the oldest entries since every entry is
+        cached for the same number of seconds.
+        """
+        now = time.monotonic()
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires > now:
+                break
+            del self._entries[key]
+
+    async def read_deployment(
+        self, deployment_id: "UUID | str"
+    ) -> "DeploymentResponse":
+        return await self._read(
+            "deployment",
+            UUID(str(deployment_id)),
+            lambda: self._client.read_deployment(deployment_id),
+        )
+
+    async def read_flow(self, flow_id: UUID) -> "Flow":
+        return await self._read(
+            "flow", flow_id, lambda: self._client.read_flow(flow_id)
+        )
+
+    async def read_block_document(
+        self, block_document_id: UUID, include_secrets: bool = True
+    ) -> "BlockDocument":
+        return await self._read(
+            "block-document",
+            (block_document_id, include_secrets),
+            lambda: self._client.read_block_document(
+                block_document_id, include_secrets=include_secrets
+            ),
+        )
+
+    async def read_block_document_by_name(
+        self, name: str, block_type_slug: str, include_secrets: bool = True
+    ) -> "BlockDocument":
+        return await self._read(
+            "block-document",
+            (block_type_slug, name, include_secrets),
+            lambda: self._client.read_block_document_by_name(
+                name=name,
+                block_type_slug=block_type_slug,
+                include_secrets=include_secrets,
+            ),
+        )
+
+    async def read_variable_by_name(self, name: str) -> "Optional[Variable]":
+        return await self._read(
+            "variable", name, lambda: self._client.read_variable_by_name(name=name)
+        )
+
+    def invalidate(self, event: "Event") -> None:
+        """
+        Evicts the cached objects that the given event is about, unless they were
+        updated after the event occurred.
+        """
+        resource_id = event.resource.id
+        for key, entry in list(self._entries.items()):
+            if entry.resource_id != resource_id:
+                continue
+            if entry.updated is not None and entry.updated > event.occurred:
+                continue
+            del self._entries[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns the number of cache hits and misses for each kind of object"""
+        return {
+            kind: {"hits": self.hits[kind], "misses": self.misses[kind]}
+            for kind in sorted(set(self.hits) | set(self.misses))
+        }
@@ -41,6 +41,14 @@ def build_healthcheck_server(
 
     router.add_api_route("/health", perform_health_check, methods=["GET"])
 
+    def read_cache_stats():
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=worker.job_configuration_cache_stats(),
+        )
+
+    router.add_api_route("/cache", read_cache_stats, methods=["GET"])
+
     app.include_router(router)
 
     config = uvicorn.Config(
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -429,6 +430,63 @@ def test_batched_queue_service_min_interval():
     )
 
 
+def test_batched_queue_service_takes_queued_items_in_one_hop():
+    instance = MockBatchedService()
+    for i in range(5):
+        instance._queue.put_nowait(i)
+
+    assert instance._get_items(2, timeout=0) == ([0, 1], 2, False)
+    assert instance._get_items(10, timeout=0) == ([2, 3, 4], 3, False)
+    with pytest.raises(queue.Empty):
+        instance._get_items(10, timeout=0)
+
+
+def test_batched_queue_service_wait_until_empty():
+    instance = MockBatchedService.instance()
+    for i in range(4):
+        instance.send(i)
+
+    instance.wait_until_empty()
+    assert [c.args[1] for c in MockBatchedService.mock.call_args_list] == [
+        [0, 1],
+        [2, 3],
+    ]
+
+
+def test_batched_queue_service_takes_items_up_to_stop():
+    instance = MockBatchedService()
+    instance._queue.put_nowait(1)
+    instance._queue.put_nowait(None)
+
+    assert instance._get_items(10, timeout=0) == ([1], 1, True)
+
+
+def test_batched_queue_service_handles_queued_items_in_batches():
+    class LargeBatchService(MockBatchedService):
+        _max_batch_size = 1000
+
+    instance = LargeBatchService.instance()
+    for i in range(100):
+        instance.send(i)
+    instance.drain()
+
+    batches = [c.args[1] for c in LargeBatchService.mock.call_args_list]
+    assert sum(batches, []) == list(range(100))
+    assert len(batches) < 100
+
+
+def test_batched_queue_service_with_zero_interval_does_not_wait_for_full_batch():
+    class ImmediateBatchService(MockBatchedService):
+        _max_batch_size = 1000
+        _min_interval = 0
+
+    instance = ImmediateBatchService.instance()
+    instance.send(1)
+    instance.wait_until_empty()
+
+    assert [c.args[1] for c in ImmediateBatchService.mock.call_args_list] == [[1]]
+
+
 @pytest.mark.parametrize(
     "level,expected", [("DEBUG", True), ("INFO", False), ("WARNING", False)]
 )
@@ -1,3 +1,7 @@
+import subprocess
+import sys
+from textwrap import dedent
+
 import pytest
 import rich
 import typer
@@ -87,3 +91,31 @@ def test_prompt_cli_takes_precendence_over_setting_false(test_app):
 def test_prompt_cli_takes_precendence_over_setting_true(test_app):
     with temporary_settings({PREFECT_CLI_PROMPT: False}):
         assert_interactive(test_app, "--prompt")
+
+
+def test_command_modules_are_imported_when_their_command_is_used():
+    code = dedent(
+        """\
+        import sys
+
+        from prefect.cli import app
+
+        assert "prefect.cli.deploy" not in sys.modules
+        assert "prefect.cli.config" not in sys.modules
+
+        app(["config", "--help"], standalone_mode=False)
+
+        assert "prefect.cli.config" in sys.modules
+        assert "prefect.cli.deploy" not in sys.modules
+        """
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+
+def test_help_lists_lazy_commands():
+    result = CliRunner().invoke(APP, ["--help"])
+
+    assert result.exit_code == 0
+    for command in ("deploy", "config", "work-pool", "automation"):
+        assert command in result.output
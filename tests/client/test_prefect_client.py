@@ -73,6 +73,7 @@ from prefect.client.schemas.responses import (
     SetStateStatus,
 )
 from prefect.client.schemas.schedules import CronSchedule, IntervalSchedule
+from prefect.client.schemas.sorting import LogSort
 from prefect.client.utilities import inject_client
 from prefect.events import AutomationCore, EventTrigger, Posture
 from prefect.server.api.server import create_app
@@ -1487,6 +1488,38 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_stream_logs(prefect_client):
+    flow_run_id = uuid4()
+    now = DateTime.now("UTC")
+    await prefect_client.create_logs(
+        [
+            LogCreate(
+                name="prefect.flow_runs",
+                level=20,
+                message=f"Log {i}",
+                timestamp=now.add(seconds=i),
+                flow_run_id=flow_run_id,
+            )
+            for i in range(5)
+        ]
+    )
+    log_filter = LogFilter(flow_run_id=LogFilterFlowRunId(any_=[flow_run_id]))
+
+    logs = [
+        log
+        async for log in prefect_client.stream_logs(log_filter=log_filter, page_size=2)
+    ]
+    assert [log.message for log in logs] == [f"Log {i}" for i in range(5)]
+
+    logs = [
+        log
+        async for log in prefect_client.stream_logs(
+            log_filter=log_filter, limit=3, sort=LogSort.TIMESTAMP_DESC, page_size=2
+        )
+    ]
+    assert [log.message for log in logs] == ["Log 4", "Log 3", "Log 2"]
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
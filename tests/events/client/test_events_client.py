@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Type
 from unittest import mock
@@ -234,6 +235,101 @@ async def test_giving_up_after_negative_one_tries_is_a_noop(
     assert recorder.events == []
 
 
+async def test_events_client_sends_batches_in_one_frame(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+):
+    events = [example_event_1, example_event_2, example_event_3]
+    async with PrefectEventsClient(events_api_url) as client:
+        await client.emit_many(events)
+
+    assert recorder.frames == 1
+    assert recorder.events == events
+
+
+async def test_cloud_client_sends_batches_as_separate_events(
+    events_cloud_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    recorder: Recorder,
+):
+    events = [example_event_1, example_event_2]
+    async with PrefectCloudEventsClient(events_cloud_api_url, "my-token") as client:
+        await client.emit_many(events)
+
+    assert recorder.frames == 2
+    assert recorder.events == events
+
+
+async def test_batches_do_not_wait_for_checkpoints(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    recorder: Recorder,
+):
+    async with PrefectEventsClient(events_api_url, checkpoint_every=2) as client:
+        assert client._websocket
+        pong = asyncio.get_running_loop().create_future()
+        with mock.patch.object(
+            client._websocket, "ping", mock.AsyncMock(return_value=pong)
+        ):
+            await client.emit_many([example_event_1, example_event_2])
+            assert client._unconfirmed_events == [example_event_1, example_event_2]
+
+            pong.set_result(0.0)
+            await client.emit_many([example_event_3])
+            assert client._unconfirmed_events == [example_event_3]
+
+    assert recorder.events == [example_event_1, example_event_2, example_event_3]
+
+
+async def test_batches_wait_for_checkpoints_when_too_far_ahead(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    recorder: Recorder,
+):
+    async with PrefectEventsClient(events_api_url, checkpoint_every=1) as client:
+        assert client._websocket
+        pong = asyncio.get_running_loop().create_future()
+        with mock.patch.object(
+            client._websocket, "ping", mock.AsyncMock(return_value=pong)
+        ):
+            await client.emit_many([example_event_1])
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.emit_many([example_event_2]), 0.1)
+
+
+async def test_reconnects_after_a_batch_and_resends_unconfirmed_events(
+    events_api_url: str,
+    example_event_1: Event,
+    example_event_2: Event,
+    example_event_3: Event,
+    example_event_4: Event,
+    recorder: Recorder,
+    puppeteer: Puppeteer,
+):
+    async with PrefectEventsClient(events_api_url, checkpoint_every=1) as client:
+        puppeteer.hard_disconnect_after = example_event_3.id
+        await client.emit_many([example_event_1, example_event_2, example_event_3])
+
+        await client.emit(example_event_4)
+
+    assert recorder.connections == 2
+    assert recorder.events == [
+        example_event_1,
+        example_event_2,
+        example_event_3,
+        example_event_4,  # resent due to the hard disconnect after event 3
+        example_event_4,
+    ]
+
+
 async def test_handles_api_url_with_trailing_slash(
     events_cloud_api_url: str, example_event_1: Event, recorder: Recorder
 ):
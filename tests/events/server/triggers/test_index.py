@@ -0,0 +1,130 @@
+from typing import Dict, List, Set, Union
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server.events import actions, triggers
+from prefect.server.events.schemas.automations import (
+    Automation,
+    EventTrigger,
+    Posture,
+)
+from prefect.server.events.schemas.events import ReceivedEvent
+
+
+def automation_with(
+    expect: Set[str],
+    match: Dict[str, Union[str, List[str]]],
+    after: Set[str] = set(),
+) -> Automation:
+    return Automation(
+        name="indexed",
+        trigger=EventTrigger(
+            expect=expect,
+            after=after,
+            match=match,
+            posture=Posture.Reactive,
+            threshold=1,
+        ),
+        actions=[actions.DoNothing()],
+    )
+
+
+def event(name: str, resource_id: str, **labels: str) -> ReceivedEvent:
+    return ReceivedEvent(
+        occurred=pendulum.now("UTC"),
+        event=name,
+        resource={"prefect.resource.id": resource_id, **labels},
+        id=uuid4(),
+    )
+
+
+@pytest.fixture
+def loaded() -> List[Automation]:
+    automations = [
+        automation_with({"animal.walked"}, {}),
+        automation_with({"animal.*"}, {"prefect.resource.id": "spider"}),
+        automation_with({"animal.walked"}, {"prefect.resource.id": ["woodchuck"]}),
+        automation_with({"animal.ran"}, {"prefect.resource.id": "animal.*"}),
+        automation_with({"animal.ran"}, {"prefect.resource.id": "!spider"}),
+        automation_with(set(), {"prefect.resource.id": "spider"}),
+        automation_with(
+            {"animal.ran"}, {"prefect.resource.id": "spider"}, after={"animal.woke"}
+        ),
+        automation_with({"animal.walked"}, {"class": "Arachnida"}),
+        automation_with({"*.walked"}, {}),
+    ]
+    for automation in automations:
+        triggers.load_automation(automation)
+    return automations
+
+
+@pytest.mark.parametrize(
+    "received",
+    [
+        event("animal.walked", "spider", **{"class": "Arachnida"}),
+        event("animal.walked", "woodchuck"),
+        event("animal.ran", "spider"),
+        event("animal.ran", "animal.dog"),
+        event("animal.woke", "spider"),
+        event("animal.walkedabout", "woodchuck"),
+        event("plant.grew", "spider"),
+        event("plant.grew", "fern"),
+        event("plant.walked", "ent"),
+    ],
+)
+def test_index_agrees_with_a_linear_scan(
+    loaded: List[Automation], received: ReceivedEvent
+):
+    expected = [
+        trigger for trigger in triggers.triggers.values() if trigger.covers(received)
+    ]
+    assert triggers.find_interested_triggers(received) == expected
+
+
+def test_index_is_a_superset_of_interested_triggers(loaded: List[Automation]):
+    received = event("animal.walked", "woodchuck")
+
+    candidates = set(triggers.trigger_index.candidates(received))
+    interested = {t.id for t in triggers.find_interested_triggers(received)}
+
+    assert interested <= candidates
+    assert candidates < set(triggers.triggers)
+
+
+def test_forgotten_automations_are_removed_from_the_index(loaded: List[Automation]):
+    spider_walks = event("animal.walked", "spider", **{"class": "Arachnida"})
+    before = triggers.find_interested_triggers(spider_walks)
+    assert loaded[0].trigger in before
+
+    triggers.forget_automation(loaded[0].id)
+
+    assert loaded[0].trigger.id not in triggers.trigger_index
+    after = triggers.find_interested_triggers(spider_walks)
+    assert loaded[0].trigger not in after
+    assert len(after) == len(before) - 1
+
+
+def test_disabled_automations_are_removed_from_the_index(loaded: List[Automation]):
+    disabled = loaded[1].model_copy(update={"enabled": False})
+    triggers.load_automation(disabled)
+
+    assert loaded[1].trigger.id not in triggers.trigger_index
+
+
+def test_reloading_an_automation_preserves_its_order(loaded: List[Automation]):
+    triggers.load_automation(loaded[0])
+
+    received = event("animal.walked", "woodchuck")
+    interested = triggers.find_interested_triggers(received)
+    assert interested[0].id == loaded[0].trigger.id
+
+
+async def test_reset_clears_the_index(loaded: List[Automation]):
+    assert len(triggers.trigger_index) == len(loaded)
+
+    await triggers.reset()
+
+    assert len(triggers.trigger_index) == 0
+    assert not triggers.find_interested_triggers(event("animal.walked", "spider"))
@@ -1,10 +1,26 @@
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
 from prefect.filesystems import NullFileSystem
-from prefect.results import ResultRecord, ResultRecordMetadata, ResultStore
-from prefect.serializers import JSONSerializer
-from prefect.settings import PREFECT_LOCAL_STORAGE_PATH
+from prefect.results import (
+    BINARY_RECORD_MARKER,
+    ResultRecord,
+    ResultRecordMetadata,
+    ResultStore,
+    is_binary_record,
+)
+from prefect.serializers import (
+    CompressedSerializer,
+    JSONSerializer,
+    PickleSerializer,
+    Serializer,
+)
+from prefect.settings import (
+    PREFECT_LOCAL_STORAGE_PATH,
+    PREFECT_RESULTS_RECORD_FORMAT,
+    temporary_settings,
+)
 
 
 class TestResultRecord:
@@ -58,3 +74,98 @@ class TestResultRecord:
             )
             == "The results are in..."
         )
+
+
+class TestBinaryResultRecord:
+    @pytest.mark.parametrize(
+        "serializer",
+        [
+            PickleSerializer(),
+            PickleSerializer(picklelib="pickle"),
+            JSONSerializer(),
+            CompressedSerializer(serializer="pickle"),
+        ],
+    )
+    def test_round_trip(self, serializer: Serializer):
+        record = ResultRecord(
+            result={"the results": ["are", "in"]},
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=serializer
+            ),
+        )
+
+        serialized = record.serialize_binary()
+        assert is_binary_record(serialized)
+
+        deserialized = ResultRecord.deserialize(serialized)
+        assert deserialized == record
+
+    def test_json_records_are_not_binary(self):
+        record = ResultRecord(
+            result="The results are in...",
+            metadata=ResultRecordMetadata(storage_key="my-storage-key"),
+        )
+        assert not is_binary_record(record.serialize())
+
+    def test_pickled_results_are_not_base64_encoded(self):
+        payload = b"x" * 1_000_000
+        record = ResultRecord(
+            result=payload,
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=PickleSerializer()
+            ),
+        )
+
+        binary = record.serialize_binary()
+
+        assert len(binary) < len(record.serialize())
+        assert len(binary) < len(payload) + 1_000
+        assert ResultRecord.deserialize(binary).result == payload
+
+    def test_large_arrays_are_stored_out_of_band(self):
+        array = np.arange(1_000_000, dtype=np.float64)
+        record = ResultRecord(
+            result={"array": array},
+            metadata=ResultRecordMetadata(
+                storage_key="my-storage-key", serializer=PickleSerializer()
+            ),
+        )
+
+        frames = record.serializer.dumps_frames(record.result)
+        assert len(frames) == 2
+        assert memoryview(frames[1]).nbytes == array.nbytes
+
+        loaded = ResultRecord.deserialize(record.serialize_binary()).result["array"]
+        np.testing.assert_array_equal(loaded, array)
+
+        # arrays loaded from out-of-band buffers are writable like any other
+        loaded[0] = 42.0
+        assert loaded[0] == 42.0
+
+    def test_unsupported_version_raises(self):
+        record = ResultRecord(
+            result="The results are in...",
+            metadata=ResultRecordMetadata(storage_key="my-storage-key"),
+        )
+        serialized = bytearray(record.serialize_binary())
+        serialized[len(BINARY_RECORD_MARKER)] = 99
+
+        with pytest.raises(ValueError, match="Unsupported binary result record"):
+            ResultRecord.deserialize(bytes(serialized))
+
+    async def test_result_store_writes_binary_records_when_configured(self):
+        with temporary_settings({PREFECT_RESULTS_RECORD_FORMAT: "binary"}):
+            store = ResultStore()
+
+        assert store.record_format == "binary"
+        result_record = store.create_result_record(
+            "The results are in...", "the-binary-key"
+        )
+        await store.apersist_result_record(result_record)
+
+        persisted = (PREFECT_LOCAL_STORAGE_PATH.value() / "the-binary-key").read_bytes()
+        assert is_binary_record(persisted)
+
+        # records in either format can be read by any store
+        loaded = await ResultStore(cache_result_in_memory=False).aread("the-binary-key")
+        assert loaded.result == "The results are in..."
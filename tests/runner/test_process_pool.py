@@ -0,0 +1,205 @@
+import asyncio
+import os
+import socket
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import List
+from uuid import UUID
+
+import anyio
+import pytest
+
+from prefect import flow
+from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas.objects import StateType
+from prefect.runner.process_pool import FlowRunProcessPool, _serve
+from prefect.runner.runner import Runner
+from prefect.settings import (
+    PREFECT_RUNNER_PROCESS_POOL_MAX_RUNS,
+    PREFECT_RUNNER_PROCESS_POOL_SIZE,
+    temporary_settings,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Process pools are not supported on Windows",
+)
+
+
+@pytest.fixture
+def flow_code(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "flows.py").write_text(
+        dedent(
+            """\
+            import os
+            from time import sleep
+
+            from prefect import flow
+
+            @flow
+            def pid_flow():
+                with open("pids.txt", "a") as f:
+                    f.write(f"{os.getpid()}\\n")
+
+            @flow
+            def sleepy_flow(sleep_time: int = 100):
+                sleep(sleep_time)
+            """
+        )
+    )
+    return tmp_path
+
+
+def read_pids(path: Path) -> List[int]:
+    return [int(pid) for pid in (path / "pids.txt").read_text().split()]
+
+
+async def run_flow_runs(
+    runner: Runner, prefect_client: PrefectClient, deployment_id: UUID, count: int
+):
+    flow_run_ids = []
+    async with runner:
+        for _ in range(count):
+            flow_run = await prefect_client.create_flow_run_from_deployment(
+                deployment_id=deployment_id
+            )
+            await runner.execute_flow_run(flow_run.id)
+            flow_run_ids.append(flow_run.id)
+
+    for flow_run_id in flow_run_ids:
+        flow_run = await prefect_client.read_flow_run(flow_run_id)
+        assert flow_run.state and flow_run.state.is_completed()
+
+
+class TestRunnerWithProcessPool:
+    def test_process_pool_size_can_be_disabled_over_the_setting(self):
+        with temporary_settings({PREFECT_RUNNER_PROCESS_POOL_SIZE: 2}):
+            assert Runner().process_pool_size == 2
+            assert Runner(process_pool_size=0).process_pool_size == 0
+
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    async def test_flow_runs_reuse_warm_processes(
+        self, prefect_client: PrefectClient, flow_code: Path
+    ):
+        runner = Runner(process_pool_size=1)
+        deployment_id = await runner.add_flow(
+            await flow.from_source(
+                source=str(flow_code), entrypoint="flows.py:pid_flow"
+            ),
+            name="pooled",
+        )
+
+        await run_flow_runs(runner, prefect_client, deployment_id, count=3)
+
+        assert len(set(read_pids(flow_code))) == 1
+
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    async def test_processes_are_replaced_after_max_runs(
+        self, prefect_client: PrefectClient, flow_code: Path
+    ):
+        with temporary_settings({PREFECT_RUNNER_PROCESS_POOL_MAX_RUNS: 2}):
+            runner = Runner(process_pool_size=1)
+        deployment_id = await runner.add_flow(
+            await flow.from_source(
+                source=str(flow_code), entrypoint="flows.py:pid_flow"
+            ),
+            name="pooled",
+        )
+
+        await run_flow_runs(runner, prefect_client, deployment_id, count=3)
+
+        pids = read_pids(flow_code)
+        assert pids[0] == pids[1]
+        assert pids[2] != pids[0]
+
+    @pytest.mark.usefixtures("use_hosted_api_server")
+    async def test_cancelling_a_flow_run_kills_its_process(
+        self, prefect_client: PrefectClient, flow_code: Path
+    ):
+        runner = Runner(query_seconds=1, process_pool_size=1)
+        deployment_id = await runner.add_flow(
+            await flow.from_source(
+                source=str(flow_code), entrypoint="flows.py:sleepy_flow"
+            ),
+            name="pooled",
+        )
+
+        async with runner:
+            flow_run = await prefect_client.create_flow_run_from_deployment(
+                deployment_id=deployment_id
+            )
+            execute_task = asyncio.create_task(runner.execute_flow_run(flow_run.id))
+
+            while True:
+                await anyio.sleep(0.5)
+                flow_run = await prefect_client.read_flow_run(flow_run_id=flow_run.id)
+                assert flow_run.state
+                if flow_run.state.is_running():
+                    break
+
+            assert runner._process_pool is not None
+            (process,) = runner._process_pool._processes
+
+            await prefect_client.set_flow_run_state(
+                flow_run_id=flow_run.id,
+                state=flow_run.state.model_copy(
+                    update={"name": "Cancelling", "type": StateType.CANCELLING}
+                ),
+            )
+            await execute_task
+
+            assert not process.is_alive
+
+        flow_run = await prefect_client.read_flow_run(flow_run_id=flow_run.id)
+        assert flow_run.state.is_cancelled()
+
+
+class TestFlowRunProcessPool:
+    async def test_idle_processes_are_closed_on_exit(self, tmp_path: Path):
+        async with FlowRunProcessPool(size=1, max_runs=1) as pool:
+            process = await pool._start(
+                (str(tmp_path), tuple(sorted(os.environ.items())), None)
+            )
+
+        assert process.process.returncode == 0
+        assert not pool._processes
+
+    async def test_process_exit_is_reported_as_the_flow_runs_exit_code(
+        self, tmp_path: Path
+    ):
+        async with FlowRunProcessPool(size=1, max_runs=1) as pool:
+            process = await pool._start(
+                (str(tmp_path), tuple(sorted(os.environ.items())), None)
+            )
+            process.process.terminate()
+
+            assert await process.run(UUID(int=0)) == -15
+            assert not process.is_alive
+
+    def test_serve_restores_working_directory_and_import_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.delenv("PREFECT__FLOW_RUN_ID", raising=False)
+        cwd, path = os.getcwd(), list(sys.path)
+        started_in = []
+
+        def execute_flow_run(flow_run_id: UUID) -> int:
+            started_in.append((os.getcwd(), list(sys.path)))
+            os.chdir(tmp_path)
+            sys.path.insert(0, ".")
+            return 0
+
+        monkeypatch.setattr("prefect.engine.execute_flow_run", execute_flow_run)
+
+        parent, child = socket.socketpair()
+        with parent, parent.makefile("rb") as replies:
+            parent.sendall(f"{UUID(int=1)}\n{UUID(int=2)}\n".encode())
+            parent.shutdown(socket.SHUT_WR)
+            _serve(child, None)
+
+            assert replies.read() == b"0\n0\n"
+
+        assert started_in == [(cwd, path), (cwd, path)]
+        assert (os.getcwd(), sys.path) == (cwd, path)
@@ -51,8 +51,10 @@ from prefect.settings import (
     PREFECT_RUNNER_POLL_FREQUENCY,
     PREFECT_RUNNER_PROCESS_LIMIT,
     PREFECT_RUNNER_SERVER_ENABLE,
+    get_current_settings,
     temporary_settings,
 )
+from prefect.settings.snapshot import SETTINGS_SNAPSHOT_ENV_VAR, load_settings_snapshot
 from prefect.testing.utilities import AsyncMock
 from prefect.utilities.dockerutils import parse_image_tag
 from prefect.utilities.filesystem import tmpchdir
@@ -956,6 +958,70 @@ class TestRunner:
         assert env_var_value == str(flow_run.id)
         assert env_var_value != flow_run.id.hex
 
+    async def test_runner_passes_settings_snapshot_to_flow_run_process(
+        self, monkeypatch, prefect_client
+    ):
+        env = {}
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.pid = 4242
+
+        def capture_env(*args, **kwargs):
+            env.update(kwargs["env"])
+            return mock_process
+
+        monkeypatch.setattr(
+            prefect.runner.runner, "run_process", AsyncMock(side_effect=capture_env)
+        )
+
+        runner = Runner()
+
+        deployment_id = await (await dummy_flow_1.to_deployment(__file__)).apply()
+
+        flow_run = await prefect_client.create_flow_run_from_deployment(
+            deployment_id=deployment_id
+        )
+        await runner._run_process(flow_run)
+
+        assert SETTINGS_SNAPSHOT_ENV_VAR in env
+        assert load_settings_snapshot(env) == get_current_settings()
+
+    async def test_runner_does_not_pass_settings_snapshot_to_other_directories(
+        self, monkeypatch, prefect_client, tmp_path
+    ):
+        # The flow run process reads the settings files in the pulled code's
+        # directory, which the runner's settings were not resolved from
+        (tmp_path / "prefect.toml").write_text('[logging]\nlevel = "DEBUG"\n')
+        calls = []
+
+        mock_process = AsyncMock()
+        mock_process.returncode = 0
+        mock_process.pid = 4242
+
+        def capture_call(*args, **kwargs):
+            calls.append(kwargs)
+            return mock_process
+
+        monkeypatch.setattr(
+            prefect.runner.runner, "run_process", AsyncMock(side_effect=capture_call)
+        )
+
+        runner = Runner()
+
+        deployment_id = await (await dummy_flow_1.to_deployment(__file__)).apply()
+        runner._deployment_storage_map[deployment_id] = MagicMock(
+            destination=tmp_path, pull_interval=None
+        )
+
+        flow_run = await prefect_client.create_flow_run_from_deployment(
+            deployment_id=deployment_id
+        )
+        await runner._run_process(flow_run)
+
+        assert calls[0]["cwd"] == str(tmp_path)
+        assert SETTINGS_SNAPSHOT_ENV_VAR not in calls[0]["env"]
+
     @pytest.mark.usefixtures("use_hosted_api_server")
     async def test_runner_runs_a_remotely_stored_flow(
         self,
@@ -4,7 +4,9 @@ from pathlib import Path
 from textwrap import dedent
 from typing import Optional
 
+import fsspec
 import pytest
+from anyio import run_process
 from pydantic import SecretStr
 
 from prefect.blocks.core import Block, BlockNotSavedError
@@ -252,7 +254,9 @@ class TestGitRepository:
                 ["git", "sparse-checkout", "set", "dir_1", "dir_2"],
                 cwd=Path.cwd() / "repo",
             ),
-            call(["git", "pull", "origin", "--depth", "1"], cwd=Path.cwd() / "repo"),
+            call(["git", "ls-remote", "origin", "HEAD"], cwd=Path.cwd() / "repo"),
+            call(["git", "rev-parse", "HEAD"], cwd=Path.cwd() / "repo"),
+            call(["git", "pull", "origin", "--ff-only"], cwd=Path.cwd() / "repo"),
         ]
 
         mock_run_process.assert_has_awaits(expected_calls)
@@ -260,6 +264,108 @@ class TestGitRepository:
             mock_run_process.await_args_list == expected_calls
         ), f"Unexpected calls: {mock_run_process.await_args_list}"
 
+    @pytest.mark.parametrize(
+        "branch, ls_remote_output",
+        [
+            (None, "abc123\tHEAD\n"),
+            ("dev", "abc123\trefs/heads/dev\n"),
+            ("v1.0", "def456\trefs/tags/v1.0\nabc123\trefs/tags/v1.0^{}\n"),
+        ],
+    )
+    async def test_pull_code_skips_pull_when_remote_is_unchanged(
+        self, mock_run_process: AsyncMock, monkeypatch, branch, ls_remote_output
+    ):
+        monkeypatch.setattr("pathlib.Path.exists", lambda x: ".git" in str(x))
+
+        outputs = {
+            "config": b"https://github.com/org/repo.git",
+            "ls-remote": ls_remote_output.encode(),
+            "rev-parse": b"abc123\n",
+        }
+
+        async def run_process(cmd, **kwargs):
+            return MagicMock(stdout=outputs[cmd[1]])
+
+        mock_run_process.side_effect = run_process
+
+        repo = GitRepository(url="https://github.com/org/repo.git", branch=branch)
+        await repo.pull_code()
+
+        assert [c.args[0][1] for c in mock_run_process.await_args_list] == [
+            "config",
+            "ls-remote",
+            "rev-parse",
+        ]
+
+    async def test_pull_code_pulls_when_remote_has_moved(
+        self, mock_run_process: AsyncMock, monkeypatch
+    ):
+        monkeypatch.setattr("pathlib.Path.exists", lambda x: ".git" in str(x))
+
+        outputs = {
+            "config": b"https://github.com/org/repo.git",
+            "ls-remote": b"def456\trefs/heads/dev\n",
+            "rev-parse": b"abc123\n",
+            "pull": b"",
+        }
+
+        async def run_process(cmd, **kwargs):
+            return MagicMock(stdout=outputs[cmd[1]])
+
+        mock_run_process.side_effect = run_process
+
+        repo = GitRepository(url="https://github.com/org/repo.git", branch="dev")
+        await repo.pull_code()
+
+        mock_run_process.assert_awaited_with(
+            ["git", "pull", "origin", "dev", "--ff-only"], cwd=Path.cwd() / "repo-dev"
+        )
+
+    async def test_pull_code_only_fetches_new_commits(self, tmp_path: Path):
+        if not shutil.which("git"):
+            pytest.skip("git is not installed")
+
+        async def git(*args, cwd):
+            return await run_process(
+                [
+                    "git",
+                    "-c",
+                    "user.name=test",
+                    "-c",
+                    "user.email=test@example.com",
+                    *args,
+                ],
+                cwd=cwd,
+            )
+
+        remote = tmp_path / "remote"
+        remote.mkdir()
+        await git("init", "-b", "main", cwd=remote)
+        for i in range(3):
+            (remote / f"file-{i}.txt").write_text(str(i))
+            await git("add", ".", cwd=remote)
+            await git("commit", "-m", f"commit {i}", cwd=remote)
+
+        repo = GitRepository(url=remote.as_uri(), branch="main", name="local")
+        repo.set_base_path(tmp_path)
+        await repo.pull_code()
+        assert (repo.destination / "file-2.txt").read_text() == "2"
+
+        # nothing has changed, so the repository is left as is
+        await repo.pull_code()
+
+        (remote / "file-3.txt").write_text("3")
+        await git("add", ".", cwd=remote)
+        await git("commit", "-m", "commit 3", cwd=remote)
+
+        await repo.pull_code()
+        assert (repo.destination / "file-3.txt").read_text() == "3"
+
+        # the new commit was fast-forwarded onto the shallow clone rather than
+        # recloning the repository
+        log = await git("log", "--format=%s", cwd=repo.destination)
+        assert log.stdout.decode().split("\n")[:2] == ["commit 3", "commit 2"]
+
     async def test_pull_code_with_username_and_password(
         self,
         monkeypatch,
@@ -333,8 +439,7 @@ class TestGitRepository:
                 "pull",
                 "origin",
                 "--recurse-submodules",
-                "--depth",
-                "1",
+                "--ff-only",
             ],
             cwd=Path.cwd() / "repo",
         )
@@ -377,8 +482,7 @@ class TestGitRepository:
                 "pull",
                 "origin",
                 "--recurse-submodules",
-                "--depth",
-                "1",
+                "--ff-only",
             ],
             cwd=Path.cwd() / "repo",
         )
@@ -701,30 +805,88 @@ class TestRemoteStorage:
         rs = RemoteStorage("s3://bucket/path")
         assert rs.destination == Path.cwd() / Path("bucket") / Path("path")
 
-    async def test_pull_code(self, monkeypatch):
+    @pytest.fixture
+    def remote_files(self):
+        filesystem = fsspec.filesystem("memory")
+        filesystem.pipe("/path/to/directory/flow.py", b"flow")
+        filesystem.pipe("/path/to/directory/nested/module.py", b"module")
+        yield filesystem
+        filesystem.rm("/path/to/directory", recursive=True)
+
+    async def test_pull_code(self, remote_files):
         rs = RemoteStorage("memory://path/to/directory/")
 
-        mock_mkdir = MagicMock()
-        monkeypatch.setattr("pathlib.Path.mkdir", mock_mkdir)
+        await rs.pull_code()
 
-        mock_get = MagicMock()
-        monkeypatch.setattr(rs._filesystem, "get", mock_get)
+        assert (rs.destination / "flow.py").read_bytes() == b"flow"
+        assert (rs.destination / "nested" / "module.py").read_bytes() == b"module"
+
+    async def test_pull_code_only_copies_changed_files(self, remote_files, monkeypatch):
+        rs = RemoteStorage("memory://path/to/directory/")
+        await rs.pull_code()
+
+        mock_get = MagicMock(wraps=remote_files.get)
+        monkeypatch.setattr(type(remote_files), "get", mock_get)
+
+        await rs.pull_code()
+        mock_get.assert_not_called()
+
+        remote_files.pipe("/path/to/directory/nested/module.py", b"changed")
+        remote_files.pipe("/path/to/directory/new.py", b"new")
 
         await rs.pull_code()
-        mock_mkdir.assert_called_once()
         mock_get.assert_called_once_with(
-            "path/to/directory/", str(rs.destination), recursive=True
+            ["/path/to/directory/nested/module.py", "/path/to/directory/new.py"],
+            [
+                str(rs.destination / "nested" / "module.py"),
+                str(rs.destination / "new.py"),
+            ],
         )
+        assert (rs.destination / "flow.py").read_bytes() == b"flow"
+        assert (rs.destination / "nested" / "module.py").read_bytes() == b"changed"
+        assert (rs.destination / "new.py").read_bytes() == b"new"
+
+    async def test_pull_code_copies_files_removed_locally(self, remote_files):
+        rs = RemoteStorage("memory://path/to/directory/")
+        await rs.pull_code()
+
+        (rs.destination / "flow.py").unlink()
 
-    async def test_pull_code_fails(self, monkeypatch):
+        await rs.pull_code()
+        assert (rs.destination / "flow.py").read_bytes() == b"flow"
+
+    async def test_pull_code_always_copies_files_without_version_details(
+        self, remote_files, monkeypatch
+    ):
         rs = RemoteStorage("memory://path/to/directory/")
 
-        mock_mkdir = MagicMock()
-        monkeypatch.setattr("pathlib.Path.mkdir", mock_mkdir)
+        find = remote_files.find
+
+        def find_without_versions(self, path, detail=False, **kwargs):
+            found = find(path, detail=detail, **kwargs)
+            if not detail:
+                return found
+            return {
+                name: {"name": name, "size": info["size"], "type": "file"}
+                for name, info in found.items()
+            }
+
+        monkeypatch.setattr(type(remote_files), "find", find_without_versions)
+        await rs.pull_code()
+
+        mock_get = MagicMock(wraps=remote_files.get)
+        monkeypatch.setattr(type(remote_files), "get", mock_get)
+
+        await rs.pull_code()
+        mock_get.assert_called_once()
+        assert len(mock_get.call_args.args[0]) == 2
+
+    async def test_pull_code_fails(self, remote_files, monkeypatch):
+        rs = RemoteStorage("memory://path/to/directory/")
 
         mock_get = MagicMock()
         mock_get.side_effect = Exception("oops")
-        monkeypatch.setattr(rs._filesystem, "get", mock_get)
+        monkeypatch.setattr(type(remote_files), "get", mock_get)
 
         with pytest.raises(
             RuntimeError,
@@ -734,10 +896,7 @@ class TestRemoteStorage:
             ),
         ):
             await rs.pull_code()
-        mock_mkdir.assert_called_once()
-        mock_get.assert_called_once_with(
-            "path/to/directory/", str(rs.destination), recursive=True
-        )
+        mock_get.assert_called_once()
 
     async def test_to_pull_step(self, monkeypatch):
         # saving blocks for this test
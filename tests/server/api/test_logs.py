@@ -175,3 +175,14 @@ class TestReadLogs:
         api_logs = [Log(**log_data) for log_data in response.json()]
         assert api_logs[0].timestamp > api_logs[1].timestamp
         assert api_logs[0].message == "Black flag ahead, captain!"
+
+    async def test_read_logs_after(self, client, logs):
+        response = await client.post(READ_LOGS_URL, json={"limit": 1})
+        (first,) = response.json()
+
+        response = await client.post(
+            READ_LOGS_URL,
+            json={"after": {"timestamp": first["timestamp"], "id": first["id"]}},
+        )
+        api_logs = [Log(**log_data) for log_data in response.json()]
+        assert [log.message for log in api_logs] == ["Black flag ahead, captain!"]
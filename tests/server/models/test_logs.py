@@ -7,7 +7,7 @@ from sqlalchemy import select
 
 from prefect.server import models
 from prefect.server.schemas.actions import LogCreate
-from prefect.server.schemas.core import Log
+from prefect.server.schemas.core import Log, LogCursor
 from prefect.server.schemas.filters import LogFilter, LogFilterTaskRunId
 from prefect.server.schemas.sorting import LogSort
 
@@ -138,3 +138,68 @@ class TestReadLogs:
 
         assert len(logs) == 1
         assert all([log.task_run_id is not None for log in logs])
+
+    @pytest.mark.parametrize(
+        "sort", [LogSort.TIMESTAMP_ASC, LogSort.TIMESTAMP_DESC], ids=str
+    )
+    async def test_read_logs_after(self, session, flow_run_id, sort):
+        # Some logs share a timestamp, so they are ordered by ID
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                LogCreate(
+                    name="prefect.flow_run",
+                    level=20,
+                    message=f"Log {i}",
+                    timestamp=NOW + timedelta(seconds=i // 2),
+                    flow_run_id=flow_run_id,
+                )
+                for i in range(7)
+            ],
+        )
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        expected = await models.logs.read_logs(
+            session=session, log_filter=log_filter, sort=sort
+        )
+
+        pages = []
+        after = None
+        while page := await models.logs.read_logs(
+            session=session, log_filter=log_filter, sort=sort, limit=3, after=after
+        ):
+            pages.append([log.id for log in page])
+            after = LogCursor(timestamp=page[-1].timestamp, id=page[-1].id)
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert sum(pages, []) == [log.id for log in expected]
+
+
+class TestStreamLogs:
+    async def test_stream_logs_in_batches(self, session, logs, flow_run_id, log_data):
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+
+        streamed = [
+            log
+            async for log in models.logs.stream_logs(
+                session=session, log_filter=log_filter, batch_size=2
+            )
+        ]
+
+        assert [log.message for log in streamed] == [log.message for log in log_data]
+
+    async def test_stream_logs_descending(self, session, logs, flow_run_id, log_data):
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+
+        streamed = [
+            log
+            async for log in models.logs.stream_logs(
+                session=session,
+                log_filter=log_filter,
+                sort=LogSort.TIMESTAMP_DESC,
+                batch_size=1,
+            )
+        ]
+
+        assert [log.message for log in streamed] == [
+            log.message for log in reversed(log_data)
+        ]
@@ -6,6 +6,12 @@ import pytest
 import sqlalchemy as sa
 
 from prefect.server import models, schemas
+from prefect.server.orchestration.core_policy import CoreFlowPolicy
+from prefect.server.orchestration.policies import FlowRunOrchestrationPolicy
+from prefect.server.orchestration.rules import (
+    ALL_ORCHESTRATION_STATES,
+    BaseOrchestrationRule,
+)
 
 
 class TestCreateWorkPool:
@@ -860,6 +866,69 @@ class TestGetScheduledRuns:
         )
         assert len(runs) == 0
 
+    async def test_claim_runs_moves_them_to_pending(self, session, work_pools):
+        claimed = await models.workers.claim_scheduled_flow_runs(
+            session=session,
+            work_pool_ids=[work_pools["wp_a"].id],
+            flow_policy=CoreFlowPolicy,
+        )
+        await session.commit()
+
+        assert len(claimed) == 15
+        for run in claimed:
+            assert run.flow_run.state.type == schemas.states.StateType.PENDING
+            flow_run = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=run.flow_run.id
+            )
+            assert flow_run.state.type == schemas.states.StateType.PENDING
+
+    async def test_claimed_runs_are_not_claimed_again(self, session, work_pools):
+        first = await models.workers.claim_scheduled_flow_runs(
+            session=session, work_pool_ids=[work_pools["wp_a"].id], limit=10
+        )
+        second = await models.workers.claim_scheduled_flow_runs(
+            session=session, work_pool_ids=[work_pools["wp_a"].id]
+        )
+
+        assert len(first) == 10
+        assert len(second) == 5
+        assert not {run.flow_run.id for run in first} & {
+            run.flow_run.id for run in second
+        }
+
+    async def test_claim_runs_collects_rejected_runs(self, session, work_pools):
+        class RejectPending(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = [schemas.states.StateType.PENDING]
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                await self.reject_transition(None, reason="for testing")
+
+        class RejectPendingPolicy(FlowRunOrchestrationPolicy):
+            @staticmethod
+            def priority():
+                return [RejectPending]
+
+        rejected = []
+        claimed = await models.workers.claim_scheduled_flow_runs(
+            session=session,
+            work_pool_ids=[work_pools["wp_a"].id],
+            limit=4,
+            flow_policy=RejectPendingPolicy,
+            rejected_flow_run_ids=rejected,
+        )
+
+        assert claimed == []
+        assert len(set(rejected)) == 4
+
+    async def test_claim_runs_scheduled_before(self, session, work_pools):
+        claimed = await models.workers.claim_scheduled_flow_runs(
+            session=session,
+            work_pool_ids=[work_pools["wp_a"].id],
+            scheduled_before=pendulum.now("UTC"),
+        )
+        assert len(claimed) == 6
+
 
 class TestDeleteWorker:
     async def test_delete_worker(self, session, work_pool):
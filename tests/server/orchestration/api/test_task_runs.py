@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from uuid import uuid4
 
@@ -11,6 +12,8 @@ from prefect.server import models, schemas
 from prefect.server.database.orm_models import TaskRun
 from prefect.server.schemas import responses, states
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.task_queue import TaskQueue
+from prefect.settings import PREFECT_API_DEFAULT_LIMIT, temporary_settings
 from prefect.states import Pending
 
 
@@ -186,6 +189,120 @@ class TestCreateTaskRun:
         assert response.status_code == 409
 
 
+class TestCreateTaskRuns:
+    async def test_create_task_runs(self, flow_run, client, session):
+        task_runs_data = [
+            {
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "name": f"my-task-run-{i}",
+                "dynamic_key": str(i),
+            }
+            for i in range(3)
+        ]
+        response = await client.post("/task_runs/bulk", json=task_runs_data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [task_run["name"] for task_run in response.json()] == [
+            "my-task-run-0",
+            "my-task-run-1",
+            "my-task-run-2",
+        ]
+
+        for task_run in response.json():
+            assert task_run["state"]["type"] == "PENDING"
+            assert await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run["id"]
+            )
+
+    async def test_create_task_runs_gracefully_upserts(self, flow_run, client):
+        task_run_data = {
+            "flow_run_id": str(flow_run.id),
+            "task_key": "my-task-key",
+            "dynamic_key": "my-dynamic-key",
+        }
+        task_run_response = await client.post("/task_runs/", json=task_run_data)
+
+        response = await client.post("/task_runs/bulk", json=[task_run_data])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["id"] == task_run_response.json()["id"]
+
+        # any new task run in the batch makes it a creation
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[task_run_data, {**task_run_data, "dynamic_key": "another-key"}],
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+    async def test_create_task_runs_limits_the_batch_size(self, flow_run, client):
+        task_runs_data = [
+            {
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "dynamic_key": str(i),
+            }
+            for i in range(3)
+        ]
+        with temporary_settings({PREFECT_API_DEFAULT_LIMIT: 2}):
+            response = await client.post("/task_runs/bulk", json=task_runs_data)
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+            response = await client.post("/task_runs/bulk", json=task_runs_data[:2])
+            assert response.status_code == status.HTTP_201_CREATED
+
+    async def test_create_deferred_task_runs(self, client):
+        state = {"type": "SCHEDULED", "state_details": {"deferred": True}}
+        task_runs_data = [
+            {"task_key": "my-task-key", "dynamic_key": str(i), "state": state}
+            for i in range(3)
+        ]
+        response = await client.post("/task_runs/bulk", json=task_runs_data)
+        assert response.status_code == status.HTTP_201_CREATED
+        for task_run in response.json():
+            assert task_run["flow_run_id"] is None
+            assert task_run["state"]["type"] == "SCHEDULED"
+            assert task_run["state"]["state_details"]["deferred"] is True
+
+    @pytest.fixture
+    def clear_task_queues(self):
+        TaskQueue.reset()
+        yield
+        TaskQueue.reset()
+
+    async def test_create_deferred_task_runs_enqueues_them(
+        self, client, clear_task_queues
+    ):
+        state = {"type": "SCHEDULED", "state_details": {"deferred": True}}
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[{"task_key": "my-task-key", "dynamic_key": "0", "state": state}],
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        enqueued = TaskQueue.for_key("my-task-key").get_nowait()
+        assert str(enqueued.id) == response.json()[0]["id"]
+
+    async def test_failed_batch_does_not_enqueue_task_runs(
+        self, client, clear_task_queues
+    ):
+        state = {"type": "SCHEDULED", "state_details": {"deferred": True}}
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[
+                {"task_key": "my-task-key", "dynamic_key": "0", "state": state},
+                {
+                    "flow_run_id": str(uuid4()),
+                    "task_key": "my-task-key",
+                    "dynamic_key": "1",
+                    "state": state,
+                },
+            ],
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+        with pytest.raises(asyncio.QueueEmpty):
+            TaskQueue.for_key("my-task-key").get_nowait()
+
+
 class TestReadTaskRun:
     async def test_read_task_run(self, flow_run, task_run, client):
         # make sure we we can read the task run correctly
@@ -1,10 +1,14 @@
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import List
+from uuid import uuid4
 
 import pendulum
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
 
 import prefect
 import prefect.server
@@ -12,6 +16,9 @@ from prefect.client.schemas.actions import WorkPoolCreate
 from prefect.client.schemas.objects import WorkPool, WorkQueue
 from prefect.server import models, schemas
 from prefect.server.events.clients import AssertingEventsClient
+from prefect.server.events.filters import EventFilter
+from prefect.server.events.schemas.events import ReceivedEvent
+from prefect.server.schemas.states import StateType
 from prefect.server.schemas.statuses import DeploymentStatus, WorkQueueStatus
 from prefect.utilities.pydantic import parse_obj_as
 
@@ -1990,3 +1997,159 @@ class TestGetScheduledRuns:
         updated_deployment_response = await client.get(f"/deployments/{deployment.id}")
         assert updated_deployment_response.status_code == status.HTTP_200_OK
         assert updated_deployment_response.json()["status"] == "READY"
+
+    async def test_claim_runs(self, client, work_pools):
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/claim_flow_runs",
+            json=dict(limit=7),
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert response.headers["X-Prefect-Rejected-Claims"] == "0"
+
+        data = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(data) == 7
+        for run in data:
+            assert run.flow_run.state.type == StateType.PENDING
+            flow_run_response = await client.get(f"/flow_runs/{run.flow_run.id}")
+            assert flow_run_response.json()["state"]["type"] == "PENDING"
+
+        # claimed runs are no longer scheduled
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/get_scheduled_flow_runs",
+        )
+        assert len(response.json()) == 8
+
+    async def test_claim_runs_wq_aa(self, client, work_pools, work_queues):
+        response = await client.post(
+            f"/work_pools/{work_pools['wp_a'].name}/claim_flow_runs",
+            json=dict(work_queue_names=[work_queues["wq_aa"].name]),
+        )
+
+        data = parse_obj_as(
+            List[schemas.responses.WorkerFlowRunResponse], response.json()
+        )
+        assert len(data) == 5
+        assert {run.work_queue_id for run in data} == {work_queues["wq_aa"].id}
+
+    async def test_repeated_claims_return_each_run_once(self, client, work_pools):
+        claimed = []
+        for _ in range(5):
+            response = await client.post(
+                f"/work_pools/{work_pools['wp_a'].name}/claim_flow_runs",
+                json=dict(limit=4),
+            )
+            assert response.status_code == 200, response.text
+            claimed.extend(run["flow_run"]["id"] for run in response.json())
+
+        # wp_a has 15 scheduled runs in total
+        assert len(claimed) == 15
+        assert len(set(claimed)) == 15
+
+
+class TestScheduledFlowRunSubscription:
+    @pytest.fixture
+    def scheduled_time(self) -> pendulum.DateTime:
+        return pendulum.now("UTC").add(hours=1)
+
+    @pytest.fixture
+    def scheduled_events(self, work_pool, scheduled_time):
+        def scheduled_event(work_pool_id, payload) -> ReceivedEvent:
+            return ReceivedEvent(
+                occurred=pendulum.now("UTC"),
+                event="prefect.flow-run.Scheduled",
+                resource={
+                    "prefect.resource.id": f"prefect.flow-run.{uuid4()}",
+                    "prefect.state-type": "SCHEDULED",
+                },
+                related=[
+                    {
+                        "prefect.resource.id": f"prefect.work-pool.{work_pool_id}",
+                        "prefect.resource.role": "work-pool",
+                    }
+                ],
+                payload=payload,
+                id=uuid4(),
+            )
+
+        payload = {
+            "validated_state": {
+                "type": "SCHEDULED",
+                "name": "Scheduled",
+                "scheduled_time": scheduled_time.isoformat(),
+            }
+        }
+        return [
+            scheduled_event(work_pool.id, payload),
+            scheduled_event(work_pool.id, {}),
+            scheduled_event(uuid4(), payload),
+            scheduled_event(work_pool.id, payload),
+        ]
+
+    @pytest.fixture
+    def stream_mock(self, monkeypatch: pytest.MonkeyPatch, scheduled_events):
+        @asynccontextmanager
+        async def mock_stream(filter: EventFilter):
+            assert filter.resource.labels.matches(scheduled_events[0].resource)
+
+            async def _fake_stream():
+                for event in scheduled_events:
+                    yield event
+
+            yield _fake_stream()
+
+        monkeypatch.setattr("prefect.server.api.workers.stream.events", mock_stream)
+
+    def test_notifies_of_runs_scheduled_in_the_work_pool(
+        self,
+        test_client: TestClient,
+        work_pool,
+        scheduled_events,
+        scheduled_time,
+        stream_mock,
+    ):
+        flow_run_ids = [
+            event.resource.id.removeprefix("prefect.flow-run.")
+            for event in scheduled_events
+        ]
+        with test_client.websocket_connect(
+            f"/api/work_pools/{work_pool.name}/subscriptions/scheduled",
+            subprotocols=["prefect"],
+        ) as websocket:
+            websocket.send_json({"type": "auth", "token": None})
+            assert websocket.receive_json() == {"type": "auth_success"}
+
+            websocket.send_json({"type": "subscribe", "keys": []})
+            assert websocket.receive_json() == {
+                "id": flow_run_ids[0],
+                "next_scheduled_start_time": scheduled_time.isoformat(),
+            }
+            websocket.send_json({"type": "ack"})
+
+            # the scheduled time is taken from the event, when it has one
+            assert websocket.receive_json() == {
+                "id": flow_run_ids[1],
+                "next_scheduled_start_time": None,
+            }
+            websocket.send_json({"type": "ack"})
+
+            # the run scheduled in another work pool is skipped
+            assert websocket.receive_json() == {
+                "id": flow_run_ids[3],
+                "next_scheduled_start_time": scheduled_time.isoformat(),
+            }
+            websocket.send_json({"type": "ack"})
+
+    def test_unknown_work_pool(self, test_client: TestClient, stream_mock):
+        with pytest.raises(WebSocketDisconnect) as exception:
+            with test_client.websocket_connect(
+                "/api/work_pools/not-a-pool/subscriptions/scheduled",
+                subprotocols=["prefect"],
+            ) as websocket:
+                websocket.send_json({"type": "auth", "token": None})
+                websocket.receive_json()
+                websocket.send_json({"type": "subscribe", "keys": []})
+                websocket.receive_json()
+
+        assert exception.value.code == 4404
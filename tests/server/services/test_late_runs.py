@@ -243,10 +243,19 @@ async def test_mark_late_runs_fires_flow_run_state_change_events(
     assert event.resource.id == f"prefect.flow-run.{late_run.id}"
     assert event.event == "prefect.flow-run.Late"
     assert event.resource["prefect.state-type"] == "SCHEDULED"
+    scheduled_time = updated_flow_run.next_scheduled_start_time.isoformat()
     assert event.payload == {
         "intended": {"from": "SCHEDULED", "to": "SCHEDULED"},
-        "initial_state": {"type": "SCHEDULED", "name": "Scheduled"},
-        "validated_state": {"type": "SCHEDULED", "name": "Late"},
+        "initial_state": {
+            "type": "SCHEDULED",
+            "name": "Scheduled",
+            "scheduled_time": scheduled_time,
+        },
+        "validated_state": {
+            "type": "SCHEDULED",
+            "name": "Late",
+            "scheduled_time": scheduled_time,
+        },
     }
 
     # The events should use the state IDs to help track the ordering of events
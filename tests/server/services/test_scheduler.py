@@ -1,4 +1,5 @@
 import datetime
+from uuid import uuid4
 
 import pendulum
 import pytest
@@ -369,6 +370,207 @@ async def test_only_looks_at_deployments_with_active_schedules(
     assert deployment_ids[0] == deployment_with_active_schedules.id
 
 
+async def test_reads_deployments_and_active_schedules_in_bulk(
+    session,
+    deployment_without_schedules,
+    deployment_with_inactive_schedules,
+    deployment_with_active_schedules,
+):
+    deployment_ids = [
+        deployment_with_active_schedules.id,
+        uuid4(),
+        deployment_without_schedules.id,
+        deployment_with_inactive_schedules.id,
+    ]
+
+    loaded = await models.deployments._read_deployments_with_active_schedules(
+        session=session, deployment_ids=deployment_ids
+    )
+
+    assert [(d.id, len(s)) for d, s in loaded] == [
+        (deployment_with_active_schedules.id, 2),
+        (deployment_without_schedules.id, 0),
+        (deployment_with_inactive_schedules.id, 0),
+    ]
+    assert all(s.active for _, schedules in loaded for s in schedules)
+
+
+async def test_bulk_generation_matches_per_deployment_generation(
+    db, session, deployment_with_active_schedules
+):
+    now = pendulum.now("UTC")
+    kwargs = dict(
+        start_time=now,
+        end_time=now + datetime.timedelta(days=100),
+        min_time=datetime.timedelta(days=1),
+        min_runs=3,
+        max_runs=100,
+    )
+
+    (
+        (deployment, schedules),
+    ) = await models.deployments._read_deployments_with_active_schedules(
+        session=session, deployment_ids=[deployment_with_active_schedules.id]
+    )
+    bulk = await models.deployments._generate_scheduled_flow_runs(
+        db,
+        session=session,
+        deployment_id=deployment.id,
+        deployment=deployment,
+        deployment_schedules=schedules,
+        **kwargs,
+    )
+    individual = await models.deployments._generate_scheduled_flow_runs(
+        db,
+        session=session,
+        deployment_id=deployment_with_active_schedules.id,
+        **kwargs,
+    )
+
+    assert len(bulk) == len(individual) > 0
+    assert [r["idempotency_key"] for r in bulk] == [
+        r["idempotency_key"] for r in individual
+    ]
+
+
+async def test_one_bad_schedule_does_not_prevent_scheduling_others(
+    session, deployment_with_active_schedules, monkeypatch, caplog
+):
+    original = models.deployments._generate_flow_runs_from_schedules
+
+    def flaky(deployment, **kwargs):
+        if deployment.id == deployment_with_active_schedules.id:
+            raise ValueError("bad schedule")
+        return original(deployment=deployment, **kwargs)
+
+    monkeypatch.setattr(models.deployments, "_generate_flow_runs_from_schedules", flaky)
+
+    another = await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="another",
+            flow_id=deployment_with_active_schedules.flow_id,
+            schedules=[
+                schemas.core.DeploymentSchedule(
+                    schedule=schemas.schedules.IntervalSchedule(
+                        interval=datetime.timedelta(hours=1)
+                    ),
+                    active=True,
+                ),
+            ],
+        ),
+    )
+    await session.commit()
+
+    service = Scheduler()
+    await service.start(loops=1)
+
+    assert "Error scheduling deployment" in caplog.text
+    runs = await models.flow_runs.read_flow_runs(session)
+    assert len(runs) == service.min_runs
+    assert {run.deployment_id for run in runs} == {another.id}
+
+
+async def test_invalid_stored_schedule_does_not_prevent_scheduling_others(
+    db, session, deployment_with_active_schedules, caplog
+):
+    another = await models.deployments.create_deployment(
+        session=session,
+        deployment=schemas.core.Deployment(
+            name="another",
+            flow_id=deployment_with_active_schedules.flow_id,
+            schedules=[
+                schemas.core.DeploymentSchedule(
+                    schedule=schemas.schedules.IntervalSchedule(
+                        interval=datetime.timedelta(hours=1)
+                    ),
+                    active=True,
+                ),
+            ],
+        ),
+    )
+    # a stored value that no longer passes validation
+    await session.execute(
+        sa.update(db.DeploymentSchedule)
+        .where(
+            db.DeploymentSchedule.deployment_id == deployment_with_active_schedules.id
+        )
+        .values(max_scheduled_runs=0)
+    )
+    await session.commit()
+
+    service = Scheduler()
+    await service.start(loops=1)
+
+    assert "Error scheduling deployment" in caplog.text
+    runs = await models.flow_runs.read_flow_runs(session)
+    assert len(runs) == service.min_runs
+    assert {run.deployment_id for run in runs} == {another.id}
+
+
+async def test_generate_scheduled_flow_runs_can_be_overridden(
+    session, deployment_with_active_schedules
+):
+    generated = []
+
+    class NoRunsScheduler(Scheduler):
+        async def _generate_scheduled_flow_runs(self, session, deployment_id, **kwargs):
+            generated.append(deployment_id)
+            return []
+
+    await NoRunsScheduler().start(loops=1)
+
+    assert generated == [deployment_with_active_schedules.id]
+    assert await models.flow_runs.count_flow_runs(session) == 0
+
+
+async def test_generate_scheduled_flow_runs_overrides_keep_their_signature(
+    session, deployment_with_active_schedules
+):
+    generated = []
+
+    class CountingScheduler(Scheduler):
+        async def _generate_scheduled_flow_runs(
+            self,
+            session,
+            deployment_id,
+            start_time,
+            end_time,
+            min_time,
+            min_runs,
+            max_runs,
+        ):
+            runs = await super()._generate_scheduled_flow_runs(
+                session=session,
+                deployment_id=deployment_id,
+                start_time=start_time,
+                end_time=end_time,
+                min_time=min_time,
+                min_runs=min_runs,
+                max_runs=max_runs,
+            )
+            generated.extend(runs)
+            return runs
+
+    await CountingScheduler().start(loops=1)
+
+    assert generated
+    assert await models.flow_runs.count_flow_runs(session) == len(generated)
+
+
+async def test_scheduler_records_loop_stats(session, deployment_with_active_schedules):
+    service = Scheduler()
+    assert service.last_loop_stats is None
+
+    await service.start(loops=1)
+
+    stats = service.last_loop_stats
+    assert stats is not None
+    assert stats.deployments == 1
+    assert stats.inserted_runs == await models.flow_runs.count_flow_runs(session) > 0
+    assert stats.total_seconds >= stats.select_seconds + stats.insert_seconds > 0
+
+
 class TestRecentDeploymentsScheduler:
     async def test_tight_loop_by_default(self):
         assert RecentDeploymentsScheduler().loop_seconds == 5
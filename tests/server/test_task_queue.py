@@ -0,0 +1,106 @@
+import asyncio
+import gc
+from typing import Generator
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.schemas.core import TaskRun
+from prefect.server.task_queue import MultiQueue, TaskQueue
+
+
+@pytest.fixture(autouse=True)
+def reset_task_queues() -> Generator[None, None, None]:
+    TaskQueue.reset()
+
+    yield
+
+    TaskQueue.reset()
+
+
+def task_run(task_key: str) -> TaskRun:
+    return TaskRun(id=uuid4(), flow_run_id=None, task_key=task_key, dynamic_key="1")
+
+
+async def test_get_returns_queued_task_runs_without_waiting():
+    queued = task_run("mytasks.taskA")
+    await TaskQueue.enqueue(queued)
+
+    multi_queue = MultiQueue(["mytasks.taskA", "mytasks.taskB"])
+
+    received = await asyncio.wait_for(multi_queue.get(), timeout=1)
+    assert received.id == queued.id
+
+
+async def test_get_wakes_when_any_subscribed_key_receives_a_run():
+    multi_queue = MultiQueue(["mytasks.taskA", "mytasks.taskB"])
+    getter = asyncio.create_task(multi_queue.get())
+
+    await TaskQueue.enqueue(task_run("mytasks.taskC"))
+    await asyncio.sleep(0.05)
+    assert not getter.done()
+
+    queued = task_run("mytasks.taskB")
+    await TaskQueue.enqueue(queued)
+
+    received = await asyncio.wait_for(getter, timeout=1)
+    assert received.id == queued.id
+
+
+async def test_get_does_not_poll_while_idle(monkeypatch: pytest.MonkeyPatch):
+    multi_queue = MultiQueue(["mytasks.taskA"])
+    getter = asyncio.create_task(multi_queue.get())
+    await asyncio.sleep(0)
+
+    checks = 0
+    get_nowait = TaskQueue.get_nowait
+
+    def counting_get_nowait(self: TaskQueue) -> TaskRun:
+        nonlocal checks
+        checks += 1
+        return get_nowait(self)
+
+    monkeypatch.setattr(TaskQueue, "get_nowait", counting_get_nowait)
+
+    await asyncio.sleep(0.1)
+    assert checks == 0
+
+    await TaskQueue.enqueue(task_run("mytasks.taskA"))
+    await asyncio.wait_for(getter, timeout=1)
+    assert checks == 1
+
+
+async def test_retries_are_delivered_before_scheduled_runs():
+    multi_queue = MultiQueue(["mytasks.taskA"])
+
+    scheduled = task_run("mytasks.taskA")
+    retried = task_run("mytasks.taskA")
+    await TaskQueue.enqueue(scheduled)
+    await TaskQueue.for_key("mytasks.taskA").retry(retried)
+
+    assert (await multi_queue.get()).id == retried.id
+    assert (await multi_queue.get()).id == scheduled.id
+
+
+async def test_retries_wake_waiting_subscribers():
+    multi_queue = MultiQueue(["mytasks.taskA"])
+    getter = asyncio.create_task(multi_queue.get())
+    await asyncio.sleep(0)
+
+    retried = task_run("mytasks.taskA")
+    await TaskQueue.for_key("mytasks.taskA").retry(retried)
+
+    received = await asyncio.wait_for(getter, timeout=1)
+    assert received.id == retried.id
+
+
+async def test_subscriptions_end_with_the_multi_queue():
+    queue = TaskQueue.for_key("mytasks.taskA")
+
+    multi_queue = MultiQueue(["mytasks.taskA"])
+    assert len(queue._subscribers) == 1
+
+    del multi_queue
+    gc.collect()
+
+    assert len(queue._subscribers) == 0
@@ -22,6 +22,7 @@ from prefect.server.events.schemas.events import Event, ReceivedEvent, Resource
 from prefect.server.utilities.messaging import (
     BrokerModule,
     Cache,
+    CapturedMessage,
     Consumer,
     Message,
     Publisher,
@@ -29,6 +30,7 @@ from prefect.server.utilities.messaging import (
     create_cache,
     create_consumer,
     create_publisher,
+    decode_message,
     ephemeral_subscription,
 )
 from prefect.server.utilities.messaging.memory import (
@@ -534,3 +536,53 @@ async def test_can_be_used_as_event_publisher(broker: str, cache: Cache):
         await consumer_task
 
     assert captured_events == [emitted_event]
+
+
+def test_decoding_a_message_without_a_decoded_cache():
+    event = ReceivedEvent(
+        id=uuid.uuid4(),
+        occurred=datetime.now(tz=timezone.utc),
+        event="testing",
+        resource=Resource({"prefect.resource.id": "testing"}),
+    )
+    message = CapturedMessage(event.model_dump_json().encode(), {})
+
+    decoded = decode_message(message, ReceivedEvent)
+
+    assert decoded == event
+    assert decode_message(message, ReceivedEvent) is not decoded
+
+
+async def test_subscribers_share_one_decoded_event(broker: str, cache: Cache):
+    """Each message is validated once, no matter how many subscriptions receive it"""
+    captured: list[ReceivedEvent] = []
+
+    async def handler(message: Message):
+        captured.append(decode_message(message, ReceivedEvent))
+        raise StopConsumer(ack=True)
+
+    async with ephemeral_subscription("events") as first_kwargs:
+        async with ephemeral_subscription("events") as second_kwargs:
+            consumers = [
+                create_consumer(**first_kwargs),
+                create_consumer(**second_kwargs),
+            ]
+            consumer_tasks = [
+                asyncio.create_task(consumer.run(handler)) for consumer in consumers
+            ]
+
+            async with PrefectServerEventsClient() as client:
+                emitted_event = await client.emit(
+                    Event(
+                        id=uuid.uuid4(),
+                        occurred=datetime.now(tz=timezone.utc),
+                        event="testing",
+                        resource=Resource({"prefect.resource.id": "testing"}),
+                    )
+                )
+
+            await asyncio.gather(*consumer_tasks)
+
+    assert len(captured) == 2
+    assert captured[0] == emitted_event
+    assert captured[0] is captured[1]
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, AsyncGenerator, Iterable, Tuple
 from unittest import mock
 
+import httpx
 import pytest
 
 import prefect.results
@@ -337,3 +338,82 @@ class TestMap:
                 "parameters": {"x": i + 1, "mappable": ["some", "iterable"]},
                 "context": mock.ANY,
             }
+
+
+class TestApplyAsyncMany:
+    async def test_apply_async_many(self, async_foo_task, prefect_client):
+        futures = async_foo_task.apply_async_many([{"x": 1}, {"x": 2}, {"x": 3}])
+
+        assert len(futures) == 3
+
+        result_store = await result_store_from_task(async_foo_task)
+
+        for i, future in enumerate(futures):
+            task_run = await prefect_client.read_task_run(future.task_run_id)
+            assert task_run.state.is_scheduled()
+            assert task_run.state.state_details.deferred is True
+            assert await result_store.read_parameters(
+                task_run.state.state_details.task_parameters_id
+            ) == {"parameters": {"x": i + 1}, "context": mock.ANY}
+
+    async def test_apply_async_many_in_batches(self, foo_task, monkeypatch):
+        create_task_runs = mock.AsyncMock(
+            wraps=prefect.client.orchestration.PrefectClient.create_task_runs
+        )
+        monkeypatch.setattr(
+            prefect.client.orchestration.PrefectClient,
+            "create_task_runs",
+            lambda self, task_runs: create_task_runs(self, task_runs),
+        )
+
+        futures = foo_task.apply_async_many([{"x": i} for i in range(5)], batch_size=2)
+
+        assert len(futures) == 5
+        assert len({future.task_run_id for future in futures}) == 5
+        batch_sizes = [len(call.args[1]) for call in create_task_runs.await_args_list]
+        assert batch_sizes == [2, 2, 1]
+
+    @pytest.mark.parametrize("status_code", [404, 405])
+    async def test_apply_async_many_falls_back_to_apply_async(
+        self, async_foo_task, prefect_client, monkeypatch, status_code
+    ):
+        async def create_task_runs(self, task_runs):
+            request = httpx.Request("POST", "http://test/task_runs/bulk")
+            raise httpx.HTTPStatusError(
+                "Not supported",
+                request=request,
+                response=httpx.Response(status_code, request=request),
+            )
+
+        monkeypatch.setattr(
+            prefect.client.orchestration.PrefectClient,
+            "create_task_runs",
+            create_task_runs,
+        )
+
+        futures = async_foo_task.apply_async_many([{"x": 1}, {"x": 2}, {"x": 3}])
+
+        assert len(futures) == 3
+        result_store = await result_store_from_task(async_foo_task)
+        for i, future in enumerate(futures):
+            task_run = await prefect_client.read_task_run(future.task_run_id)
+            assert task_run.state.is_scheduled()
+            assert await result_store.read_parameters(
+                task_run.state.state_details.task_parameters_id
+            ) == {"parameters": {"x": i + 1}, "context": mock.ANY}
+
+    async def test_apply_async_many_enqueues_task_runs_server_side(
+        self,
+        foo_task_with_result_storage: Task,
+        in_memory_prefect_client: "PrefectClient",
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            prefect.tasks, "get_client", lambda: in_memory_prefect_client
+        )
+
+        futures = foo_task_with_result_storage.apply_async_many([{"x": 1}, {"x": 2}])
+
+        queue = TaskQueue.for_key(foo_task_with_result_storage.task_key)
+        enqueued_ids = {(await queue.get()).id, (await queue.get()).id}
+        assert enqueued_ids == {future.task_run_id for future in futures}
@@ -15,6 +15,11 @@ from prefect.cache_policies import (
     _None,
 )
 from prefect.context import TaskRunContext
+from prefect.settings import (
+    PREFECT_TASKS_CACHE_KEY_HASH_ALGORITHM,
+    temporary_settings,
+)
+from prefect.tasks import task
 
 
 class TestBaseClass:
@@ -93,6 +98,18 @@ class TestInputsPolicy:
             )
             assert new_key == key
 
+    def test_key_uses_configured_hash_algorithm(self):
+        policy = Inputs()
+        key = policy.compute_key(task_ctx=None, inputs={"x": 42}, flow_parameters=None)
+
+        with temporary_settings({PREFECT_TASKS_CACHE_KEY_HASH_ALGORITHM: "sha256"}):
+            sha_key = policy.compute_key(
+                task_ctx=None, inputs={"x": 42}, flow_parameters=None
+            )
+
+        assert sha_key != key
+        assert len(sha_key) == 64
+
     def test_subtraction_results_in_new_policy_for_inputs(self):
         policy = Inputs()
         new_policy = policy - "foo"
@@ -289,6 +306,43 @@ class TestTaskSourcePolicy:
             assert fallback_key_a and fallback_key_b
             assert fallback_key_a != fallback_key_b
 
+    def test_key_is_computed_once_per_function(self):
+        policy = TaskSource()
+
+        def my_func():
+            pass
+
+        task_ctx = TaskRunContext.model_construct(task=task(my_func))
+        key = policy.compute_key(task_ctx=task_ctx, inputs=None, flow_parameters=None)
+
+        with patch("inspect.getsource") as getsource:
+            assert (
+                policy.compute_key(task_ctx=task_ctx, inputs=None, flow_parameters=None)
+                == key
+            )
+        getsource.assert_not_called()
+
+    def test_replacing_the_code_object_changes_key(self):
+        policy = TaskSource()
+
+        def my_func():
+            pass
+
+        def other_func():
+            return 1
+
+        task_ctx = TaskRunContext.model_construct(task=task(my_func))
+        key = policy.compute_key(task_ctx=task_ctx, inputs=None, flow_parameters=None)
+
+        my_func.__code__ = other_func.__code__
+
+        with patch("inspect.getsource", return_value="def my_func():\n    return 1"):
+            new_key = policy.compute_key(
+                task_ctx=task_ctx, inputs=None, flow_parameters=None
+            )
+
+        assert key != new_key
+
 
 class TestDefaultPolicy:
     def test_changing_the_inputs_busts_the_cache(self):
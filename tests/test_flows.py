@@ -1622,6 +1622,33 @@ class TestFlowParameterTypes:
 
         assert my_flow(data) == data
 
+    def test_parameter_validators_are_reused(self):
+        @flow
+        def my_flow(x: int):
+            return x
+
+        with mock.patch(
+            "prefect.flows.V2ValidatedFunction", wraps=prefect.flows.V2ValidatedFunction
+        ) as validated_function:
+            assert my_flow.validate_parameters({"x": "1"}) == {"x": 1}
+            assert my_flow.validate_parameters({"x": "2"}) == {"x": 2}
+
+        validated_function.assert_called_once()
+
+    def test_parameters_without_block_references_are_not_visited(self):
+        @flow
+        def my_flow(x, y):
+            return x
+
+        with mock.patch(
+            "prefect.flows.visit_collection", wraps=prefect.flows.visit_collection
+        ) as visit_collection:
+            my_flow.validate_parameters({"x": [1, {"a": "b"}], "y": "foo"})
+            visit_collection.assert_not_called()
+
+            my_flow.validate_parameters({"x": ParameterTestModel(data=1), "y": "foo"})
+            visit_collection.assert_called_once()
+
     is_python_38 = sys.version_info[:2] == (3, 8)
 
     def test_type_container_flow_inputs(self):
@@ -37,6 +37,7 @@ from prefect.logging.handlers import (
     APILogWorker,
     PrefectConsoleHandler,
     WorkerAPILogHandler,
+    _serialize_log,
 )
 from prefect.logging.highlighters import PrefectConsoleHighlighter
 from prefect.logging.loggers import (
@@ -356,15 +357,14 @@ class TestAPILogHandler:
         with TaskRunContext.model_construct(task_run=task_run):
             logger.info("test-task")
 
-        expected = LogCreate.model_construct(
-            flow_run_id=task_run.flow_run_id,
-            task_run_id=task_run.id,
-            name=logger.name,
-            level=logging.INFO,
-            message="test-task",
-        ).model_dump(mode="json")
-        expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected = {
+            "name": logger.name,
+            "level": logging.INFO,
+            "message": "test-task",
+            "timestamp": ANY,  # Tested separately
+            "flow_run_id": task_run.flow_run_id,
+            "task_run_id": task_run.id,
+        }
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -372,15 +372,14 @@ class TestAPILogHandler:
         with FlowRunContext.model_construct(flow_run=flow_run):
             logger.info("test-flow")
 
-        expected = LogCreate.model_construct(
-            flow_run_id=flow_run.id,
-            task_run_id=None,
-            name=logger.name,
-            level=logging.INFO,
-            message="test-flow",
-        ).model_dump(mode="json")
-        expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected = {
+            "name": logger.name,
+            "level": logging.INFO,
+            "message": "test-flow",
+            "timestamp": ANY,  # Tested separately
+            "flow_run_id": flow_run.id,
+            "task_run_id": None,
+        }
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -397,15 +396,14 @@ class TestAPILogHandler:
         with context:
             logger.info("test-task", extra={"flow_run_id": flow_run_id})
 
-        expected = LogCreate.model_construct(
-            flow_run_id=flow_run_id,
-            task_run_id=None,
-            name=logger.name,
-            level=logging.INFO,
-            message="test-task",
-        ).model_dump(mode="json")
-        expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected = {
+            "name": logger.name,
+            "level": logging.INFO,
+            "message": "test-task",
+            "timestamp": ANY,  # Tested separately
+            "flow_run_id": flow_run_id,
+            "task_run_id": None,
+        }
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -423,15 +421,14 @@ class TestAPILogHandler:
             with context:
                 logger.warning("test-task", extra={"task_run_id": task_run_id})
 
-        expected = LogCreate.model_construct(
-            flow_run_id=flow_run.id,
-            task_run_id=task_run_id,
-            name=logger.name,
-            level=logging.WARNING,
-            message="test-task",
-        ).model_dump(mode="json")
-        expected["timestamp"] = ANY  # Tested separately
-        expected["__payload_size__"] = ANY  # Tested separately
+        expected = {
+            "name": logger.name,
+            "level": logging.WARNING,
+            "message": "test-task",
+            "timestamp": ANY,  # Tested separately
+            "flow_run_id": flow_run.id,
+            "task_run_id": task_run_id,
+        }
 
         mock_log_worker.instance().send.assert_called_once_with(expected)
 
@@ -463,10 +460,7 @@ class TestAPILogHandler:
         record = handler.emit.call_args[0][0]
         log_dict = mock_log_worker.instance().send.call_args[0][0]
 
-        assert (
-            log_dict["timestamp"]
-            == pendulum.from_timestamp(record.created).to_iso8601_string()
-        )
+        assert log_dict["timestamp"] == record.created
 
     def test_sets_timestamp_from_time_if_missing_from_recrod(
         self, logger, mock_log_worker, flow_run, handler, monkeypatch
@@ -487,7 +481,7 @@ class TestAPILogHandler:
 
         log_dict = mock_log_worker.instance().send.call_args[0][0]
 
-        assert log_dict["timestamp"] == pendulum.from_timestamp(now).to_iso8601_string()
+        assert log_dict["timestamp"] == now
 
     def test_does_not_send_logs_that_opt_out(self, logger, mock_log_worker, task_run):
         with TaskRunContext.model_construct(task_run=task_run):
@@ -669,32 +663,36 @@ class TestAPILogHandler:
             not in output.err
         )
 
-    async def test_does_not_enqueue_logs_that_are_too_big(
-        self, task_run, logger, capsys, mock_log_worker
-    ):
+    def test_prepared_logs_serialize_like_log_create(self, handler, task_run):
+        record = logging.LogRecord(
+            "prefect.test", logging.INFO, __file__, 1, "hello", None, None
+        )
         with TaskRunContext.model_construct(task_run=task_run):
-            with temporary_settings(updates={PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: "1"}):
-                logger.info("test")
+            log = handler.prepare(record)
 
-        mock_log_worker.instance().send.assert_not_called()
-        output = capsys.readouterr()
-        assert "ValueError" in output.err
-        assert "is greater than the max size of 1" in output.err
+        expected = LogCreate(
+            flow_run_id=task_run.flow_run_id,
+            task_run_id=task_run.id,
+            name="prefect.test",
+            level=logging.INFO,
+            timestamp=pendulum.from_timestamp(record.created),
+            message="hello",
+        ).model_dump(mode="json")
 
-    def test_handler_knows_how_large_logs_are(self):
-        dict_log = {
-            "name": "prefect.flow_runs",
-            "level": 20,
-            "message": "Finished in state Completed()",
-            "timestamp": "2023-02-08T17:55:52.993831+00:00",
-            "flow_run_id": "47014fb1-9202-4a78-8739-c993d8c24415",
-            "task_run_id": None,
-        }
+        _serialize_log(log)
+        assert pendulum.parse(log.pop("timestamp")) == pendulum.parse(
+            expected.pop("timestamp")
+        )
+        assert log == expected
 
-        log_size = len(json.dumps(dict_log))
-        assert log_size == 211
-        handler = APILogHandler()
-        assert handler._get_payload_size(dict_log) == log_size
+    def test_malformed_task_run_ids_are_not_enqueued(
+        self, logger, mock_log_worker, flow_run, capsys
+    ):
+        with FlowRunContext.model_construct(flow_run=flow_run):
+            logger.info("test", extra={"task_run_id": "not-a-uuid"})
+
+        mock_log_worker.instance().send.assert_not_called()
+        assert "ValueError" in capsys.readouterr().err
 
 
 WORKER_ID = uuid.uuid4()
@@ -795,7 +793,7 @@ class TestWorkerLogging:
         ]
 
         assert len(log_statement) == 1
-        assert log_statement[0]["worker_id"] == str(worker.backend_id)
+        assert log_statement[0]["worker_id"] == worker.backend_id
 
     async def test_worker_logger_does_not_send_logs_when_not_connected_to_cloud(
         self, mock_log_worker, worker_handler, logging_to_api_enabled
@@ -825,6 +823,23 @@ class TestAPILogWorker:
             message="hello",
         ).model_dump(mode="json")
 
+    async def test_worker_knows_how_large_prepared_logs_are(self, worker):
+        log = {
+            "name": "prefect.flow_runs",
+            "level": 20,
+            "message": "Finished in state Completed()",
+            "timestamp": 1675878952.5,
+            "flow_run_id": uuid.UUID("47014fb1-9202-4a78-8739-c993d8c24415"),
+            "task_run_id": None,
+        }
+
+        log_size = worker._get_size(log)
+
+        # logs are measured as they will be sent, once serialized
+        assert log["timestamp"] == "2023-02-08T17:55:52.500000Z"
+        assert log["flow_run_id"] == "47014fb1-9202-4a78-8739-c993d8c24415"
+        assert log_size == 206
+
     async def test_send_logs_single_record(self, log_dict, prefect_client, worker):
         worker.send(log_dict)
         await worker.drain()
@@ -875,7 +890,9 @@ class TestAPILogWorker:
             "prefect.client.orchestration.PrefectClient.create_logs", mock_create_logs
         )
 
-        log_size = APILogHandler()._get_payload_size(log_dict)
+        log = dict(log_dict)
+        _serialize_log(log)
+        log_size = len(json.dumps(log).encode())
 
         with temporary_settings(
             updates={
@@ -891,6 +908,20 @@ class TestAPILogWorker:
 
         assert mock_create_logs.call_count == 3
 
+    async def test_drops_logs_that_are_too_big(self, log_dict, capsys, monkeypatch):
+        mock_create_logs = AsyncMock()
+        monkeypatch.setattr(
+            "prefect.client.orchestration.PrefectClient.create_logs", mock_create_logs
+        )
+
+        with temporary_settings(updates={PREFECT_LOGGING_TO_API_MAX_LOG_SIZE: "1"}):
+            worker = APILogWorker.instance()
+            worker.send(log_dict)
+            await worker.drain()
+
+        mock_create_logs.assert_not_called()
+        assert "is greater than the max size of 1" in capsys.readouterr().err
+
     async def test_logs_are_sent_immediately_when_stopped(
         self, log_dict, prefect_client
     ):
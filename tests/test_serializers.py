@@ -162,6 +162,12 @@ class TestPickleSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_frames_roundtrip(self, data):
+        serializer = PickleSerializer()
+        frames = serializer.dumps_frames(data)
+        assert serializer.loads_frames([memoryview(f) for f in frames]) == data
+
     def test_picklelib_must_be_string(self):
         import pickle
 
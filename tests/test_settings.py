@@ -14,6 +14,7 @@ import toml
 from pydantic_core import to_jsonable_python
 from sqlalchemy import make_url
 
+import prefect
 import prefect.context
 import prefect.settings
 from prefect.exceptions import ProfileSettingsValidationError
@@ -71,6 +72,11 @@ from prefect.settings.models.server.database import (
     ServerDatabaseSettings,
     SQLAlchemySettings,
 )
+from prefect.settings.snapshot import (
+    SETTINGS_SNAPSHOT_ENV_VAR,
+    create_settings_snapshot,
+    load_settings_snapshot,
+)
 from prefect.utilities.collections import get_from_dict, set_in_dict
 from prefect.utilities.filesystem import tmpchdir
 
@@ -277,9 +283,12 @@ SUPPORTED_SETTINGS = {
     "PREFECT_RESULTS_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
     "PREFECT_RESULTS_LOCAL_STORAGE_PATH": {"test_value": Path("/path/to/storage")},
     "PREFECT_RESULTS_PERSIST_BY_DEFAULT": {"test_value": True},
+    "PREFECT_RESULTS_RECORD_FORMAT": {"test_value": "binary"},
     "PREFECT_RUNNER_HEARTBEAT_FREQUENCY": {"test_value": 30},
     "PREFECT_RUNNER_POLL_FREQUENCY": {"test_value": 10},
     "PREFECT_RUNNER_PROCESS_LIMIT": {"test_value": 10},
+    "PREFECT_RUNNER_PROCESS_POOL_MAX_RUNS": {"test_value": 5},
+    "PREFECT_RUNNER_PROCESS_POOL_SIZE": {"test_value": 2},
     "PREFECT_RUNNER_SERVER_ENABLE": {"test_value": True},
     "PREFECT_RUNNER_SERVER_HOST": {"test_value": "host"},
     "PREFECT_RUNNER_SERVER_LOG_LEVEL": {"test_value": "INFO"},
@@ -409,10 +418,13 @@ SUPPORTED_SETTINGS = {
     "PREFECT_SILENCE_API_URL_MISCONFIGURATION": {"test_value": True},
     "PREFECT_SQLALCHEMY_MAX_OVERFLOW": {"test_value": 10, "legacy": True},
     "PREFECT_SQLALCHEMY_POOL_SIZE": {"test_value": 10, "legacy": True},
+    "PREFECT_TASKS_CACHE_KEY_HASH_ALGORITHM": {"test_value": "sha256"},
     "PREFECT_TASKS_DEFAULT_PERSIST_RESULT": {"test_value": True},
     "PREFECT_TASKS_DEFAULT_RETRIES": {"test_value": 10},
     "PREFECT_TASKS_DEFAULT_RETRY_DELAY_SECONDS": {"test_value": 10},
+    "PREFECT_TASKS_PENDING_WAIT_MODE": {"test_value": "poll"},
     "PREFECT_TASKS_REFRESH_CACHE": {"test_value": True},
+    "PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5},
     "PREFECT_TASKS_SCHEDULING_DEFAULT_STORAGE_BLOCK": {"test_value": "block"},
     "PREFECT_TASKS_SCHEDULING_DELETE_FAILED_SUBMISSIONS": {"test_value": True},
@@ -452,9 +464,12 @@ SUPPORTED_SETTINGS = {
     "PREFECT_UI_URL": {"test_value": "https://ui.prefect.io"},
     "PREFECT_UNIT_TEST_LOOP_DEBUG": {"test_value": True, "legacy": True},
     "PREFECT_UNIT_TEST_MODE": {"test_value": True, "legacy": True},
+    "PREFECT_WORKER_CLAIM_FLOW_RUNS": {"test_value": True},
     "PREFECT_WORKER_HEARTBEAT_SECONDS": {"test_value": 10.0},
+    "PREFECT_WORKER_JOB_CONFIGURATION_CACHE_SECONDS": {"test_value": 60.0},
     "PREFECT_WORKER_PREFETCH_SECONDS": {"test_value": 10.0},
     "PREFECT_WORKER_QUERY_SECONDS": {"test_value": 10.0},
+    "PREFECT_WORKER_SUBSCRIBE_TO_FLOW_RUNS": {"test_value": True},
     "PREFECT_WORKER_WEBSERVER_HOST": {"test_value": "host"},
     "PREFECT_WORKER_WEBSERVER_PORT": {"test_value": 8080},
     "PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS": {"test_value": 5, "legacy": True},
@@ -1260,6 +1275,131 @@ class TestTemporarySettings:
         assert PREFECT_TEST_MODE.value() is True
 
 
+class TestSettingsSnapshot:
+    @pytest.fixture
+    def child_env(self) -> dict[str, str]:
+        env = get_current_settings().to_environment_variables(exclude_unset=True)
+        env.update(os.environ)
+        return env
+
+    def test_snapshot_loads_the_same_settings(self, child_env: dict[str, str]):
+        with temporary_settings(
+            updates={PREFECT_API_KEY: "secret", PREFECT_LOGGING_LEVEL: "DEBUG"}
+        ) as settings:
+            env = {
+                **settings.to_environment_variables(exclude_unset=True),
+                **child_env,
+                "PREFECT_API_KEY": "secret",
+                "PREFECT_LOGGING_LEVEL": "DEBUG",
+            }
+            snapshot = create_settings_snapshot(settings, env)
+
+        assert snapshot is not None
+        loaded = load_settings_snapshot({**env, SETTINGS_SNAPSHOT_ENV_VAR: snapshot})
+        assert loaded == settings
+        assert loaded.api.key and loaded.api.key.get_secret_value() == "secret"
+
+    def test_snapshot_does_not_read_other_sources(
+        self,
+        child_env: dict[str, str],
+        temporary_env_file: Callable[[str], None],
+    ):
+        snapshot = create_settings_snapshot(get_current_settings(), child_env)
+        assert snapshot is not None
+
+        temporary_env_file("PREFECT_CLIENT_RETRY_EXTRA_CODES=420")
+        loaded = load_settings_snapshot(
+            {**child_env, SETTINGS_SNAPSHOT_ENV_VAR: snapshot}
+        )
+
+        assert loaded is not None
+        assert loaded.client.retry_extra_codes == set()
+
+    def test_environment_values_may_be_formatted_differently(
+        self, child_env: dict[str, str]
+    ):
+        with temporary_settings(updates={PREFECT_DEBUG_MODE: True}) as settings:
+            env = {
+                **settings.to_environment_variables(exclude_unset=True),
+                **child_env,
+                "PREFECT_DEBUG_MODE": "1",
+            }
+            assert create_settings_snapshot(settings, env) is not None
+
+    def test_no_snapshot_when_environment_disagrees(self, child_env: dict[str, str]):
+        env = {**child_env, "PREFECT_API_URL": "http://other.example/api"}
+
+        assert create_settings_snapshot(get_current_settings(), env) is None
+
+    def test_no_snapshot_when_environment_is_missing_settings(self):
+        with temporary_settings(updates={PREFECT_DEBUG_MODE: True}) as settings:
+            env = dict(os.environ)
+            env.pop("PREFECT_DEBUG_MODE", None)
+            assert create_settings_snapshot(settings, env) is None
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"PREFECT_API_URL": "http://other.example/api"},
+            {"PREFECT_UNKNOWN_SETTING": "1"},
+        ],
+    )
+    def test_snapshot_is_ignored_when_the_environment_changes(
+        self, child_env: dict[str, str], change: dict[str, str]
+    ):
+        snapshot = create_settings_snapshot(get_current_settings(), child_env)
+        assert snapshot is not None
+
+        env = {**child_env, **change, SETTINGS_SNAPSHOT_ENV_VAR: snapshot}
+        assert load_settings_snapshot(env) is None
+
+    def test_snapshot_ignores_internal_environment_variables(
+        self, child_env: dict[str, str]
+    ):
+        snapshot = create_settings_snapshot(get_current_settings(), child_env)
+        assert snapshot is not None
+
+        env = {
+            **child_env,
+            "PREFECT__FLOW_RUN_ID": "abc",
+            SETTINGS_SNAPSHOT_ENV_VAR: snapshot,
+        }
+        assert load_settings_snapshot(env) == get_current_settings()
+
+    def test_snapshot_is_ignored_in_another_directory(
+        self, child_env: dict[str, str], tmp_path: Path
+    ):
+        snapshot = create_settings_snapshot(get_current_settings(), child_env)
+        assert snapshot is not None
+
+        with tmpchdir(str(tmp_path)):
+            env = {**child_env, SETTINGS_SNAPSHOT_ENV_VAR: snapshot}
+            assert load_settings_snapshot(env) is None
+
+    def test_no_snapshot_for_another_directory(
+        self, child_env: dict[str, str], tmp_path: Path
+    ):
+        # the child would read `.env` and TOML files in its own directory
+        settings = get_current_settings()
+        assert create_settings_snapshot(settings, child_env, cwd=str(tmp_path)) is None
+        assert create_settings_snapshot(settings, child_env, cwd=os.getcwd())
+
+    def test_snapshot_from_another_version_is_ignored(
+        self, child_env: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ):
+        snapshot = create_settings_snapshot(get_current_settings(), child_env)
+        assert snapshot is not None
+
+        monkeypatch.setattr(prefect, "__version__", "0.0.0")
+        env = {**child_env, SETTINGS_SNAPSHOT_ENV_VAR: snapshot}
+        assert load_settings_snapshot(env) is None
+
+    def test_invalid_snapshot_is_ignored(self, child_env: dict[str, str]):
+        env = {**child_env, SETTINGS_SNAPSHOT_ENV_VAR: "not json"}
+
+        assert load_settings_snapshot(env) is None
+
+
 class TestSettingsSources:
     def test_env_source(self, temporary_env_file: Callable[[str], None]):
         temporary_env_file("PREFECT_CLIENT_RETRY_EXTRA_CODES=420,500")
@@ -2,7 +2,9 @@ import asyncio
 import logging
 import os
 import random
+import threading
 import time
+from contextlib import asynccontextmanager, contextmanager
 from datetime import timedelta
 from pathlib import Path
 from typing import List, Optional
@@ -13,6 +15,7 @@ from uuid import UUID, uuid4
 import anyio
 import pytest
 
+import prefect.task_engine
 from prefect import Task, flow, tags, task
 from prefect.cache_policies import FLOW_PARAMETERS, INPUTS, TASK_SOURCE
 from prefect.client.orchestration import PrefectClient, SyncPrefectClient
@@ -34,8 +37,12 @@ from prefect.filesystems import LocalFileSystem
 from prefect.logging import get_run_logger
 from prefect.results import ResultRecord, ResultStore
 from prefect.server.schemas.core import ConcurrencyLimitV2
-from prefect.settings import PREFECT_TASK_DEFAULT_RETRIES, temporary_settings
-from prefect.states import Completed, Running, State
+from prefect.settings import (
+    PREFECT_TASK_DEFAULT_RETRIES,
+    PREFECT_TASKS_PENDING_WAIT_MODE,
+    temporary_settings,
+)
+from prefect.states import Completed, Paused, Running, State
 from prefect.task_engine import (
     AsyncTaskRunEngine,
     SyncTaskRunEngine,
@@ -43,6 +50,7 @@ from prefect.task_engine import (
     run_task_sync,
 )
 from prefect.task_runners import ThreadPoolTaskRunner
+from prefect.task_runs import TaskRunStateChangeWaiter
 from prefect.testing.utilities import exceptions_equal
 from prefect.transactions import transaction
 from prefect.utilities.callables import get_call_parameters
@@ -2678,6 +2686,172 @@ class TestTaskConcurrencyLimits:
             assert len(limits) == 0
 
 
+class TestWaitingWhileBlocked:
+    @pytest.fixture
+    def paused(self):
+        """Hold the first `times` proposed `Running` states in `Paused`, like a
+        paused flow"""
+
+        def paused(set_state, times=1):
+            proposals = []
+
+            def wrapper(self, state, force=False):
+                if state.is_running():
+                    proposals.append(state)
+                    if len(proposals) <= times:
+                        self.task_run.state = Paused(name="NotReady")
+                        return self.task_run.state
+                return set_state(self, state, force=force)
+
+            wrapper.proposals = proposals
+            return wrapper
+
+        return paused
+
+    @pytest.fixture
+    def intervals(self, monkeypatch):
+        """Record the average intervals waited for, without waiting for them"""
+        intervals = []
+
+        def clamped_poisson_interval(average_interval, clamping_factor):
+            intervals.append(average_interval)
+            return 0.01
+
+        monkeypatch.setattr(
+            prefect.task_engine, "clamped_poisson_interval", clamped_poisson_interval
+        )
+        return intervals
+
+    @pytest.fixture
+    def subscribed(self, monkeypatch):
+        waiter = MagicMock(subscribed=True)
+        monkeypatch.setattr(
+            TaskRunStateChangeWaiter, "instance", classmethod(lambda cls: waiter)
+        )
+        return waiter
+
+    @pytest.fixture
+    def watches(self, monkeypatch, subscribed):
+        """Record watches instead of subscribing to events, as if the task run's
+        state changed once right after each watch started"""
+        watches = []
+
+        @contextmanager
+        def watch(cls, **kwargs):
+            watches.append(kwargs)
+            changed = threading.Event()
+            changed.set()
+            yield changed
+
+        monkeypatch.setattr(TaskRunStateChangeWaiter, "watch", classmethod(watch))
+        return watches
+
+    def test_sync_task_watches_for_state_changes(self, monkeypatch, paused, watches):
+        monkeypatch.setattr(
+            SyncTaskRunEngine, "set_state", paused(SyncTaskRunEngine.set_state)
+        )
+
+        @task(tags=["limited"])
+        def foo():
+            return TaskRunContext.get().task_run.id
+
+        before = time.monotonic()
+        task_run_id = foo()
+
+        assert len(watches) == 1
+        assert watches[0]["task_run_id"] == task_run_id
+        assert watches[0]["tags"] == ["limited"]
+        # changes since the rejected proposal wake the task run
+        assert before <= watches[0]["since"] <= time.monotonic()
+
+    def test_sync_task_proposes_again_only_when_changed(
+        self, monkeypatch, paused, watches, intervals
+    ):
+        set_state = paused(SyncTaskRunEngine.set_state, times=3)
+        monkeypatch.setattr(SyncTaskRunEngine, "set_state", set_state)
+
+        @task
+        def foo():
+            return 42
+
+        assert foo() == 42
+        # one proposal before watching, one when the state changed, and one for
+        # each fallback interval after that
+        assert len(set_state.proposals) == 4
+        assert intervals == [prefect.task_engine.STATE_CHANGE_FALLBACK_INTERVAL] * 3
+
+    def test_sync_task_waits_on_the_polling_backoff_while_not_subscribed(
+        self, monkeypatch, paused, watches, intervals, subscribed
+    ):
+        subscribed.subscribed = False
+        monkeypatch.setattr(
+            SyncTaskRunEngine,
+            "set_state",
+            paused(SyncTaskRunEngine.set_state, times=4),
+        )
+
+        @task
+        def foo():
+            return 42
+
+        assert foo() == 42
+        assert intervals == [1, 2, 3, 4]
+
+    async def test_async_task_watches_for_state_changes(
+        self, monkeypatch, subscribed, intervals
+    ):
+        watches = []
+
+        @asynccontextmanager
+        async def watch_async(cls, **kwargs):
+            watches.append(kwargs)
+            changed = asyncio.Event()
+            changed.set()
+            yield changed
+
+        monkeypatch.setattr(
+            TaskRunStateChangeWaiter, "watch_async", classmethod(watch_async)
+        )
+
+        original = AsyncTaskRunEngine.set_state
+        proposals = 0
+
+        async def set_state(self, state, force=False):
+            nonlocal proposals
+            if state.is_running():
+                proposals += 1
+                if proposals == 1:
+                    self.task_run.state = Paused(name="NotReady")
+                    return self.task_run.state
+            return await original(self, state, force=force)
+
+        monkeypatch.setattr(AsyncTaskRunEngine, "set_state", set_state)
+
+        @task
+        async def foo():
+            return TaskRunContext.get().task_run.id
+
+        task_run_id = await foo()
+
+        assert len(watches) == 1
+        assert watches[0]["task_run_id"] == task_run_id
+        assert proposals == 2
+
+    def test_poll_mode_does_not_watch_for_events(self, monkeypatch, paused, watches):
+        monkeypatch.setattr(
+            SyncTaskRunEngine, "set_state", paused(SyncTaskRunEngine.set_state)
+        )
+
+        @task
+        def foo():
+            return 42
+
+        with temporary_settings({PREFECT_TASKS_PENDING_WAIT_MODE: "poll"}):
+            assert foo() == 42
+
+        assert watches == []
+
+
 class TestRunStateIsDenormalized:
     async def test_state_attributes_are_denormalized_async_success(
         self, prefect_client, events_pipeline
@@ -1,25 +1,34 @@
+import asyncio
+import os
 import time
 import uuid
 from concurrent.futures import Future
 from typing import Any, Iterable, Optional
 from uuid import UUID
 
+import cloudpickle
 import pytest
 
-from prefect.client.orchestration import PrefectClient
+from prefect.client.orchestration import PrefectClient, get_client
 from prefect.context import TagsContext, tags
 from prefect.filesystems import LocalFileSystem
 from prefect.flows import flow
 from prefect.futures import PrefectFuture, PrefectWrappedFuture
+from prefect.logging import get_run_logger
 from prefect.results import _default_storages
 from prefect.settings import (
     PREFECT_DEFAULT_RESULT_STORAGE_BLOCK,
     PREFECT_TASK_RUNNER_THREAD_POOL_MAX_WORKERS,
     PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK,
+    PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS,
     temporary_settings,
 )
 from prefect.states import Completed, Running
-from prefect.task_runners import PrefectTaskRunner, ThreadPoolTaskRunner
+from prefect.task_runners import (
+    PrefectTaskRunner,
+    ProcessPoolTaskRunner,
+    ThreadPoolTaskRunner,
+)
 from prefect.task_worker import TaskWorker
 from prefect.tasks import task
 
@@ -194,6 +203,41 @@ class TestThreadPoolTaskRunner:
                 results = [future.result() for future in futures]
                 assert results == [{"tag1", "tag2"}] * 3
 
+    def test_async_tasks_in_a_thread_share_an_event_loop_and_client(self):
+        @task
+        async def loop_and_client():
+            return asyncio.get_running_loop(), get_client()
+
+        with ThreadPoolTaskRunner(max_workers=1) as runner:
+            first = runner.submit(loop_and_client, {}).result()
+            second = runner.submit(loop_and_client, {}).result()
+
+            assert first[0] is second[0]
+            assert first[1] is second[1]
+            assert len(runner._worker_loops) == 1
+
+    def test_worker_event_loops_are_closed_on_exit(self):
+        with ThreadPoolTaskRunner(max_workers=2) as runner:
+            runner.map(my_test_async_task, {"param1": [1, 2], "param2": [3, 4]}).wait()
+            worker_loops = list(runner._worker_loops.values())
+            assert worker_loops
+
+        assert runner._worker_loops == {}
+        assert all(worker_loop.loop.is_closed() for worker_loop in worker_loops)
+
+    async def test_worker_event_loops_are_closed_from_a_running_loop(self):
+        with ThreadPoolTaskRunner(max_workers=1) as runner:
+            assert runner.submit(my_test_async_task, {"param1": 1, "param2": 2}).result(
+                timeout=10
+            ) == (1, 2)
+            (worker_loop,) = runner._worker_loops.values()
+
+        assert worker_loop.loop.is_closed()
+
+    def test_runner_can_be_pickled(self):
+        runner = ThreadPoolTaskRunner(max_workers=2)
+        assert cloudpickle.loads(cloudpickle.dumps(runner)) == runner
+
     def test_map_with_future_resolved_to_list(self):
         with ThreadPoolTaskRunner() as runner:
             future = MockFuture(data=[1, 2, 3])
@@ -232,6 +276,116 @@ class TestThreadPoolTaskRunner:
         assert test_flow().result() == 0
 
 
+@task
+def process_id(param=None):
+    return os.getpid()
+
+
+@task
+def log_and_return(message):
+    get_run_logger().info(message)
+    return message
+
+
+class TestProcessPoolTaskRunner:
+    @pytest.fixture(autouse=True)
+    def default_storage_setting(self, tmp_path):
+        name = str(uuid.uuid4())
+        LocalFileSystem(basepath=tmp_path).save(name)
+        with temporary_settings(
+            {
+                PREFECT_DEFAULT_RESULT_STORAGE_BLOCK: f"local-file-system/{name}",
+                PREFECT_TASK_SCHEDULING_DEFAULT_STORAGE_BLOCK: f"local-file-system/{name}",
+            }
+        ):
+            yield
+
+    def test_duplicate(self):
+        runner = ProcessPoolTaskRunner(max_workers=4)
+        duplicate_runner = runner.duplicate()
+        assert isinstance(duplicate_runner, ProcessPoolTaskRunner)
+        assert duplicate_runner is not runner
+        assert duplicate_runner == runner
+
+    def test_runner_must_be_started(self):
+        runner = ProcessPoolTaskRunner()
+        with pytest.raises(RuntimeError, match="Task runner is not started"):
+            runner.submit(my_test_task, {})
+
+    def test_set_max_workers_through_settings(self):
+        with temporary_settings({PREFECT_TASKS_RUNNER_PROCESS_POOL_MAX_WORKERS: 3}):
+            with ProcessPoolTaskRunner() as runner:
+                assert runner._executor._max_workers == 3
+
+    def test_submit_sync_and_async_tasks(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            sync_future = runner.submit(my_test_task, {"param1": 1, "param2": 2})
+            async_future = runner.submit(my_test_async_task, {"param1": 3, "param2": 4})
+            assert isinstance(sync_future, PrefectFuture)
+            assert isinstance(sync_future.task_run_id, UUID)
+
+            assert sync_future.result() == (1, 2)
+            assert async_future.result() == (3, 4)
+
+    def test_tasks_run_in_warm_worker_processes(self):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            first = runner.submit(process_id, {}).result()
+            second = runner.submit(process_id, {}).result()
+
+        assert first != os.getpid()
+        assert first == second
+
+    def test_submit_task_receives_context(self):
+        with tags("tag1", "tag2"):
+            with ProcessPoolTaskRunner(max_workers=1) as runner:
+                future = runner.submit(context_matters, {})
+                assert future.result() == {"tag1", "tag2"}
+
+    def test_map_with_futures_and_wait_for(self):
+        with ProcessPoolTaskRunner(max_workers=2) as runner:
+            upstream = runner.submit(my_test_task, {"param1": 1, "param2": 2})
+            gate = runner.submit(process_id, {})
+            futures = runner.map(
+                my_test_task,
+                {"param1": [upstream, 3], "param2": [4, 5]},
+                wait_for=[gate],
+            )
+
+            results = [future.result() for future in futures]
+            assert results == [((1, 2), 4), (3, 5)]
+
+    def test_failed_upstream_fails_downstream(self):
+        @task
+        def fails():
+            raise ValueError("upstream failed")
+
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            upstream = runner.submit(fails, {})
+            downstream = runner.submit(my_test_task, {"param1": upstream, "param2": 1})
+
+            with pytest.raises(ValueError, match="upstream failed"):
+                upstream.result()
+            downstream.wait()
+            assert downstream.state.name == "NotReady"
+
+    def test_worker_logs_are_forwarded(self, caplog):
+        with ProcessPoolTaskRunner(max_workers=1) as runner:
+            assert runner.submit(log_and_return, {"message": "hi"}).result() == "hi"
+
+        forwarded = [r for r in caplog.records if r.getMessage() == "hi"]
+        assert len(forwarded) == 1
+        assert forwarded[0].process != os.getpid()
+
+    def test_flow_with_process_pool(self):
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=2))
+        def test_flow():
+            return process_id.map(range(4)).result()
+
+        process_ids = test_flow()
+        assert len(process_ids) == 4
+        assert os.getpid() not in process_ids
+
+
 class TestPrefectTaskRunner:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
@@ -1,11 +1,16 @@
 import asyncio
+import threading
+import time
 import uuid
+from contextlib import asynccontextmanager
 
+import anyio
 import pytest
 
+import prefect.task_runs
 from prefect import task
 from prefect.task_engine import run_task_async
-from prefect.task_runs import TaskRunWaiter
+from prefect.task_runs import TaskRunStateChangeWaiter, TaskRunWaiter
 
 
 class TestTaskRunWaiter:
@@ -119,3 +124,151 @@ class TestTaskRunWaiter:
 
         assert task_run_1.state.is_completed()
         assert task_run_2.state.is_completed()
+
+
+class TestTaskRunStateChangeWaiter:
+    @pytest.fixture(autouse=True)
+    def filters(self, monkeypatch):
+        """Subscribe to a stream without events instead of the API, recording the
+        filters subscribed with"""
+        filters = []
+
+        class Subscriber:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                await anyio.sleep_forever()
+
+        @asynccontextmanager
+        async def get_events_subscriber(filter):
+            filters.append(filter)
+            yield Subscriber()
+
+        monkeypatch.setattr(
+            prefect.task_runs, "get_events_subscriber", get_events_subscriber
+        )
+        return filters
+
+    @pytest.fixture(autouse=True)
+    def teardown(self):
+        yield
+
+        TaskRunStateChangeWaiter.instance().stop()
+
+    def test_instance_returns_singleton(self):
+        assert (
+            TaskRunStateChangeWaiter.instance() is TaskRunStateChangeWaiter.instance()
+        )
+
+    @pytest.mark.parametrize(
+        "resource_id",
+        [
+            "prefect.task-run.{task_run_id}",
+            "prefect.flow-run.{flow_run_id}",
+            "prefect.tag.limited",
+        ],
+    )
+    def test_watch_wakes_on_related_resources(self, resource_id: str):
+        task_run_id, flow_run_id = uuid.uuid4(), uuid.uuid4()
+        instance = TaskRunStateChangeWaiter.instance()
+
+        with TaskRunStateChangeWaiter.watch(
+            task_run_id=task_run_id, flow_run_id=flow_run_id, tags=["limited"]
+        ) as changed:
+            threading.Timer(
+                0.1,
+                instance._wake,
+                args=(
+                    [
+                        resource_id.format(
+                            task_run_id=task_run_id, flow_run_id=flow_run_id
+                        )
+                    ],
+                ),
+            ).start()
+
+            assert changed.wait(5)
+
+        assert not instance._callbacks
+
+    async def test_watch_async_wakes_on_related_resources(self):
+        task_run_id = uuid.uuid4()
+        instance = TaskRunStateChangeWaiter.instance()
+
+        async with TaskRunStateChangeWaiter.watch_async(
+            task_run_id=task_run_id, flow_run_id=None, tags=[]
+        ) as changed:
+            asyncio.get_running_loop().call_later(
+                0.1, instance._wake, [f"prefect.task-run.{task_run_id}"]
+            )
+
+            with anyio.fail_after(5):
+                await changed.wait()
+
+        assert not instance._callbacks
+
+    async def test_watch_ignores_unrelated_resources(self):
+        instance = TaskRunStateChangeWaiter.instance()
+
+        async with TaskRunStateChangeWaiter.watch_async(
+            task_run_id=uuid.uuid4(), flow_run_id=uuid.uuid4(), tags=["y"]
+        ) as changed:
+            instance._wake([f"prefect.task-run.{uuid.uuid4()}", "prefect.tag.x"])
+            await asyncio.sleep(0.1)
+
+            assert not changed.is_set()
+
+    def test_watch_returns_once_subscribed(self):
+        with TaskRunStateChangeWaiter.watch(
+            task_run_id=uuid.uuid4(), flow_run_id=None, tags=[]
+        ):
+            assert TaskRunStateChangeWaiter.instance().subscribed
+
+    async def test_subscribes_once_for_every_watch(self, filters):
+        for _ in range(3):
+            async with TaskRunStateChangeWaiter.watch_async(
+                task_run_id=uuid.uuid4(), flow_run_id=uuid.uuid4(), tags=["limited"]
+            ):
+                pass
+
+        assert len(filters) == 1
+        assert filters[0].event.prefix == ["prefect.task-run.", "prefect.flow-run."]
+        assert filters[0].any_resource is None
+
+    def test_watch_wakes_on_events_received_since_the_proposal(self):
+        task_run_id = uuid.uuid4()
+        instance = TaskRunStateChangeWaiter.instance()
+
+        instance._wake([f"prefect.task-run.{task_run_id}"])
+        after_event = time.monotonic()
+
+        with TaskRunStateChangeWaiter.watch(
+            task_run_id=task_run_id, flow_run_id=None, tags=[], since=after_event
+        ) as changed:
+            assert not changed.is_set()
+
+        with TaskRunStateChangeWaiter.watch(
+            task_run_id=task_run_id, flow_run_id=None, tags=[], since=after_event - 5
+        ) as changed:
+            assert changed.is_set()
+
+    async def test_subscription_errors_are_logged(self, monkeypatch, caplog):
+        @asynccontextmanager
+        async def get_events_subscriber(filter):
+            raise RuntimeError("no websockets here")
+            yield
+
+        monkeypatch.setattr(
+            prefect.task_runs, "get_events_subscriber", get_events_subscriber
+        )
+        monkeypatch.setattr(prefect.task_runs, "_SUBSCRIBE_TIMEOUT_SECONDS", 0.1)
+
+        async with TaskRunStateChangeWaiter.watch_async(
+            task_run_id=uuid.uuid4(), flow_run_id=None, tags=[]
+        ) as changed:
+            # waiting task runs fall back to their polling backoff
+            assert not TaskRunStateChangeWaiter.instance().subscribed
+            assert not changed.is_set()
+
+        assert "Error consuming state change events" in caplog.text
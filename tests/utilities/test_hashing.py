@@ -1,11 +1,22 @@
 import hashlib
 import threading
+from collections import namedtuple
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from prefect.exceptions import HashError
-from prefect.utilities.hashing import file_hash, hash_objects, stable_hash
+from prefect.utilities.hashing import (
+    _CONTENT_HASHERS,
+    _find_content_hasher,
+    file_hash,
+    get_hash_algorithm,
+    hash_inputs,
+    hash_objects,
+    register_content_hasher,
+    stable_hash,
+)
 
 
 @pytest.mark.parametrize(
@@ -83,3 +94,142 @@ class TestHashObjects:
         assert "Unable to create hash" in error_msg
         assert "JSON error" in error_msg
         assert "Pickle error" in error_msg
+
+
+@pytest.fixture
+def content_hashers(monkeypatch):
+    monkeypatch.setattr(
+        "prefect.utilities.hashing._CONTENT_HASHERS", dict(_CONTENT_HASHERS)
+    )
+    _find_content_hasher.cache_clear()
+    yield
+    _find_content_hasher.cache_clear()
+
+
+class TestHashInputs:
+    def test_matches_hash_objects_for_serializable_inputs(self):
+        inputs = {"x": 1, "y": ["a", {"b": 2.0}]}
+        assert hash_inputs(inputs) == hash_objects(inputs)
+
+    def test_bytes_are_hashed_by_content(self):
+        assert hash_inputs({"x": b"abc"}) == hash_inputs({"x": b"abc"})
+        assert hash_inputs({"x": b"abc"}) != hash_inputs({"x": b"abd"})
+
+    def test_content_hashers_are_found_in_nested_collections(self, content_hashers):
+        Point = namedtuple("Point", ["x", "y"])
+        calls = []
+
+        @register_content_hasher(bytes)
+        def hasher(obj, hash_algo):
+            calls.append(obj)
+            return "digest"
+
+        assert hash_inputs({"x": [1, (b"abc",)], "y": Point(b"a", 2)})
+        assert calls == [b"abc", b"a"]
+
+    def test_falls_back_to_serialization_when_hasher_fails(self, content_hashers):
+        @register_content_hasher(bytes)
+        def hasher(obj, hash_algo):
+            raise TypeError("nope")
+
+        assert hash_inputs({"x": b"abc"}) == hash_objects({"x": b"abc"})
+
+    def test_registered_hashers_do_not_apply_to_subclasses(self, content_hashers):
+        class Blob:
+            def __init__(self, data):
+                self.data = data
+                self.lock = threading.Lock()
+
+        class SubBlob(Blob):
+            pass
+
+        assert hash_inputs(Blob(b"a")) is None
+
+        @register_content_hasher(Blob)
+        def hash_blob(blob, hash_algo):
+            return stable_hash(blob.data, hash_algo=hash_algo)
+
+        assert hash_inputs(Blob(b"a")) == hash_inputs(Blob(b"a"))
+        assert hash_inputs(Blob(b"a")) != hash_inputs(Blob(b"b"))
+        # subclasses are serialized, which fails on the lock
+        assert hash_inputs(SubBlob(b"a")) is None
+
+    def test_self_referencing_inputs_are_serialized(self):
+        cyclic = []
+        cyclic.append(cyclic)
+        cyclic.append(b"abc")
+
+        assert hash_inputs(cyclic) == hash_objects(cyclic)
+        assert hash_inputs({"x": cyclic}) == hash_objects({"x": cyclic})
+
+    def test_shared_references_are_not_cycles(self, content_hashers):
+        calls = []
+
+        @register_content_hasher(bytes)
+        def hasher(obj, hash_algo):
+            calls.append(obj)
+            return "digest"
+
+        shared = [b"abc"]
+        assert hash_inputs([shared, shared])
+        assert calls == [b"abc", b"abc"]
+
+    def test_hashers_can_be_registered_by_path(self, content_hashers):
+        register_content_hasher("threading.Event", lambda event, hash_algo: "event")
+
+        assert hash_inputs(threading.Event()) == hash_inputs(threading.Event())
+
+    @pytest.mark.parametrize("name", ["sha256", "blake2b"])
+    def test_hash_algorithms(self, name):
+        hash_algo = get_hash_algorithm(name)
+
+        key = hash_inputs({"x": b"abc"}, hash_algo=hash_algo)
+        assert key == hash_inputs({"x": b"abc"}, hash_algo=hash_algo)
+        assert key != hash_inputs({"x": b"abc"})
+
+    def test_unknown_hash_algorithm(self):
+        with pytest.raises(ValueError, match="Unknown hash algorithm"):
+            get_hash_algorithm("crc32")
+
+
+class TestHashNumpyInputs:
+    def test_equal_arrays_hash_equally(self):
+        assert hash_inputs({"x": np.arange(10)}) == hash_inputs({"x": np.arange(10)})
+
+    def test_different_arrays_hash_differently(self):
+        assert hash_inputs({"x": np.arange(10)}) != hash_inputs({"x": np.arange(1, 11)})
+
+    def test_dtype_and_shape_are_part_of_the_hash(self):
+        array = np.arange(12, dtype=np.int32)
+
+        assert hash_inputs(array) != hash_inputs(array.astype(np.uint32))
+        assert hash_inputs(array) != hash_inputs(array.reshape(3, 4))
+        assert hash_inputs(np.array(5)) != hash_inputs(np.array([5]))
+
+    def test_non_contiguous_arrays(self):
+        array = np.arange(12).reshape(3, 4)
+        assert hash_inputs(array.T) == hash_inputs(np.ascontiguousarray(array.T))
+        assert hash_inputs(array.T) != hash_inputs(array)
+
+    def test_datetime_arrays(self):
+        array = np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]")
+        assert hash_inputs(array) != hash_inputs(array + 1)
+
+    def test_masked_arrays_are_serialized(self):
+        data = np.arange(4)
+        masked = np.ma.MaskedArray(data, mask=[0, 0, 1, 0])
+        unmasked = np.ma.MaskedArray(data, mask=[0, 0, 0, 0])
+
+        assert hash_inputs(masked) == hash_objects(masked)
+        assert hash_inputs(masked) != hash_inputs(unmasked)
+
+    def test_object_arrays_are_serialized(self):
+        array = np.array([{"a": 1}, None], dtype=object)
+        assert hash_inputs(array) == hash_objects(array)
+
+    def test_arrays_are_not_serialized(self, monkeypatch):
+        dumps = MagicMock(side_effect=AssertionError("serialized"))
+        monkeypatch.setattr("cloudpickle.dumps", dumps)
+
+        assert hash_inputs({"x": np.zeros(1_000_000)})
+        dumps.assert_not_called()
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional, Type
 from unittest import mock
 from unittest.mock import MagicMock, Mock
 
+import anyio
 import httpx
 import pendulum
 import pytest
@@ -29,7 +30,11 @@ from prefect.server.schemas.responses import DeploymentResponse
 from prefect.settings import (
     PREFECT_API_URL,
     PREFECT_TEST_MODE,
+    PREFECT_WORKER_CLAIM_FLOW_RUNS,
+    PREFECT_WORKER_JOB_CONFIGURATION_CACHE_SECONDS,
     PREFECT_WORKER_PREFETCH_SECONDS,
+    PREFECT_WORKER_QUERY_SECONDS,
+    PREFECT_WORKER_SUBSCRIBE_TO_FLOW_RUNS,
     get_current_settings,
     temporary_settings,
 )
@@ -46,6 +51,7 @@ from prefect.workers.base import (
     BaseJobConfiguration,
     BaseVariables,
     BaseWorker,
+    ScheduledFlowRunNotification,
 )
 
 
@@ -483,6 +489,68 @@ async def test_worker_with_work_pool_and_limit(
         )
 
 
+async def test_worker_claims_flow_runs(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    def create_run_with_deployment(state):
+        return prefect_client.create_flow_run_from_deployment(
+            worker_deployment_wq1.id, state=state
+        )
+
+    flow_runs = [
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").subtract(days=1))
+        ),
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").add(seconds=5))
+        ),
+        await create_run_with_deployment(
+            Scheduled(scheduled_time=pendulum.now("utc").add(seconds=8))
+        ),
+    ]
+    flow_run_ids = [run.id for run in flow_runs]
+
+    with temporary_settings({PREFECT_WORKER_CLAIM_FLOW_RUNS: True}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name, limit=2) as worker:
+            worker._submit_run = AsyncMock()  # don't run anything
+
+            submitted_flow_runs = await worker.get_and_submit_flow_runs()
+            assert {flow_run.id for flow_run in submitted_flow_runs} == set(
+                flow_run_ids[0:2]
+            )
+
+            # the limit is reached, so no more flow runs are claimed
+            submitted_flow_runs = await worker.get_and_submit_flow_runs()
+            assert submitted_flow_runs == []
+
+    for flow_run_id in flow_run_ids[0:2]:
+        flow_run = await prefect_client.read_flow_run(flow_run_id)
+        assert flow_run.state.is_pending()
+    flow_run = await prefect_client.read_flow_run(flow_run_ids[2])
+    assert flow_run.state.is_scheduled()
+
+
+async def test_worker_caches_objects_for_job_configurations(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    flow_run = await prefect_client.create_flow_run_from_deployment(
+        worker_deployment_wq1.id
+    )
+
+    with temporary_settings({PREFECT_WORKER_JOB_CONFIGURATION_CACHE_SECONDS: 60}):
+        async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+            await worker.sync_with_backend()
+            assert worker.job_configuration_cache_stats() == {}
+
+            await worker._get_configuration(flow_run)
+            await worker._get_configuration(flow_run)
+
+            assert worker.job_configuration_cache_stats() == {
+                "deployment": {"hits": 1, "misses": 1},
+                "flow": {"hits": 1, "misses": 1},
+            }
+
+
 async def test_worker_calls_run_with_expected_arguments(
     prefect_client: PrefectClient, worker_deployment_wq1, work_pool, monkeypatch
 ):
@@ -1861,6 +1929,164 @@ class TestBaseWorkerStart:
         assert worker.run.call_args[1]["flow_run"].id == flow_run.id
 
 
+class TestScheduledFlowRunSubscription:
+    @pytest.fixture
+    def api_url(self):
+        with temporary_settings({PREFECT_API_URL: "http://127.0.0.1:4200/api"}):
+            yield
+
+    @pytest.fixture
+    def subscribe(self, monkeypatch: pytest.MonkeyPatch):
+        """Replaces the subscription with the given async generator function"""
+
+        def subscribe(messages):
+            monkeypatch.setattr(
+                "prefect.workers.base.Subscription", lambda **kwargs: messages()
+            )
+
+        return subscribe
+
+    @staticmethod
+    def notification(
+        next_scheduled_start_time: Optional[pendulum.DateTime] = None,
+    ) -> ScheduledFlowRunNotification:
+        return ScheduledFlowRunNotification(
+            id=uuid.uuid4(), next_scheduled_start_time=next_scheduled_start_time
+        )
+
+    @staticmethod
+    async def wait_for_calls(calls: list, count: int):
+        with anyio.fail_after(5):
+            while len(calls) < count:
+                await anyio.sleep(0.01)
+
+    async def test_notifications_wake_the_poll_loop(self, api_url, subscribe):
+        async def messages():
+            yield self.notification(pendulum.now("utc"))
+            await anyio.sleep_forever()
+
+        subscribe(messages)
+        polled = []
+        worker = WorkerTestImpl(work_pool_name="test-work-pool")
+        worker.get_and_submit_flow_runs = AsyncMock(
+            side_effect=lambda: polled.append(True)
+        )
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(worker._subscribe_to_scheduled_flow_runs)
+            await self.wait_for_calls(polled, 1)
+            tg.cancel_scope.cancel()
+
+    async def test_notifications_during_a_poll_are_coalesced(self, api_url, subscribe):
+        polling = anyio.Event()
+        release = anyio.Event()
+        polled = []
+
+        async def get_and_submit_flow_runs():
+            polled.append(True)
+            polling.set()
+            await release.wait()
+            return []
+
+        async def messages():
+            yield self.notification()
+            await polling.wait()
+            for _ in range(3):
+                yield self.notification()
+            release.set()
+            await anyio.sleep_forever()
+
+        subscribe(messages)
+        worker = WorkerTestImpl(work_pool_name="test-work-pool")
+        worker.get_and_submit_flow_runs = get_and_submit_flow_runs
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(worker._subscribe_to_scheduled_flow_runs)
+            await self.wait_for_calls(polled, 2)
+            await anyio.sleep(0.1)
+            tg.cancel_scope.cancel()
+
+        # the burst received during the first poll only triggers one more poll
+        assert len(polled) == 2
+
+    async def test_runs_scheduled_after_the_prefetch_window_are_polled_when_due(
+        self, api_url, subscribe
+    ):
+        async def messages():
+            yield self.notification(pendulum.now("utc").add(days=1))
+            yield self.notification(pendulum.now("utc").add(seconds=10.5))
+            await anyio.sleep_forever()
+
+        subscribe(messages)
+        polled = []
+        with temporary_settings({PREFECT_WORKER_PREFETCH_SECONDS: 10}):
+            worker = WorkerTestImpl(work_pool_name="test-work-pool")
+        worker.get_and_submit_flow_runs = AsyncMock(
+            side_effect=lambda: polled.append(True)
+        )
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(worker._subscribe_to_scheduled_flow_runs)
+            await anyio.sleep(0.1)
+            assert not polled
+
+            # the run due in 10.5 seconds enters the prefetch window in 0.5 seconds
+            await self.wait_for_calls(polled, 1)
+            await anyio.sleep(0.5)
+            tg.cancel_scope.cancel()
+
+        # the run due tomorrow is not polled for yet
+        assert len(polled) == 1
+
+    def test_seconds_until_prefetch_window(self):
+        with temporary_settings({PREFECT_WORKER_PREFETCH_SECONDS: 10}):
+            worker = WorkerTestImpl(work_pool_name="test-work-pool")
+
+        assert worker._seconds_until_prefetch_window(self.notification()) == 0
+        assert worker._seconds_until_prefetch_window(
+            self.notification(pendulum.now("utc").add(seconds=70))
+        ) == pytest.approx(60, abs=1)
+        assert (
+            worker._seconds_until_prefetch_window(
+                self.notification(pendulum.now("utc").add(seconds=5))
+            )
+            < 0
+        )
+
+    async def test_worker_keeps_polling_on_its_interval_when_subscriptions_fail(
+        self, use_hosted_api_server, subscribe, work_pool, caplog
+    ):
+        attempts = []
+
+        async def messages():
+            attempts.append(True)
+            raise RuntimeError("websocket failed")
+            yield
+
+        subscribe(messages)
+        polled = []
+
+        with temporary_settings(
+            {
+                PREFECT_WORKER_QUERY_SECONDS: 0.1,
+                PREFECT_WORKER_SUBSCRIBE_TO_FLOW_RUNS: True,
+            }
+        ):
+            worker = WorkerTestImpl(work_pool_name=work_pool.name)
+            worker.get_and_submit_flow_runs = AsyncMock(
+                side_effect=lambda: polled.append(True)
+            )
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(worker.start)
+                # the subscription is retried while the worker keeps polling
+                await self.wait_for_calls(attempts, 2)
+                await self.wait_for_calls(polled, 2)
+                tg.cancel_scope.cancel()
+
+        assert "Unable to subscribe to scheduled flow runs" in caplog.text
+
+
 @pytest.mark.parametrize(
     "work_pool_env, deployment_env, flow_run_env, expected_env",
     [
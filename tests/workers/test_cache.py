@@ -0,0 +1,119 @@
+import uuid
+
+import pendulum
+import pytest
+
+from prefect.client.schemas.objects import Flow, Variable
+from prefect.events import Event
+from prefect.testing.utilities import AsyncMock
+from prefect.workers.cache import JobConfigurationCache
+
+
+@pytest.fixture
+def flow() -> Flow:
+    return Flow(
+        id=uuid.uuid4(),
+        name="my-flow",
+        updated=pendulum.now("UTC").subtract(minutes=1),
+        tags=["a"],
+    )
+
+
+@pytest.fixture
+def client(flow: Flow) -> AsyncMock:
+    client = AsyncMock()
+    client.read_flow.return_value = flow
+    client.read_variable_by_name.return_value = None
+    return client
+
+
+def flow_event(flow: Flow, occurred: pendulum.DateTime) -> Event:
+    return Event(
+        occurred=occurred,
+        event="prefect.flow.updated",
+        resource={"prefect.resource.id": f"prefect.flow.{flow.id}"},
+    )
+
+
+async def test_reads_each_object_once(client: AsyncMock, flow: Flow):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+
+    for _ in range(3):
+        assert (await cache.read_flow(flow.id)).id == flow.id
+
+    client.read_flow.assert_awaited_once_with(flow.id)
+    assert cache.stats() == {"flow": {"hits": 2, "misses": 1}}
+
+
+async def test_caches_missing_variables(client: AsyncMock):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+
+    assert await cache.read_variable_by_name("missing") is None
+    assert await cache.read_variable_by_name("missing") is None
+
+    client.read_variable_by_name.assert_awaited_once_with(name="missing")
+
+
+async def test_returns_copies_of_cached_objects(client: AsyncMock, flow: Flow):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+
+    (await cache.read_flow(flow.id)).tags.append("b")
+
+    assert (await cache.read_flow(flow.id)).tags == ["a"]
+
+
+async def test_objects_expire(client: AsyncMock, flow: Flow):
+    cache = JobConfigurationCache(client, ttl_seconds=0)
+
+    await cache.read_flow(flow.id)
+    await cache.read_flow(flow.id)
+
+    assert client.read_flow.await_count == 2
+
+
+async def test_expired_objects_are_removed(client: AsyncMock, flow: Flow):
+    cache = JobConfigurationCache(client, ttl_seconds=0)
+
+    await cache.read_flow(flow.id)
+    await cache.read_variable_by_name("missing")
+
+    assert not cache._entries
+
+
+async def test_unexpired_objects_are_kept(client: AsyncMock, flow: Flow):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+
+    await cache.read_flow(flow.id)
+    await cache.read_variable_by_name("missing")
+
+    assert len(cache._entries) == 2
+
+
+async def test_events_evict_objects(client: AsyncMock, flow: Flow):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+    await cache.read_flow(flow.id)
+
+    cache.invalidate(flow_event(flow, occurred=pendulum.now("UTC")))
+    await cache.read_flow(flow.id)
+
+    assert client.read_flow.await_count == 2
+
+
+async def test_events_before_the_last_update_do_not_evict_objects(
+    client: AsyncMock, flow: Flow
+):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+    await cache.read_flow(flow.id)
+
+    cache.invalidate(flow_event(flow, occurred=flow.updated.subtract(minutes=1)))
+    await cache.read_flow(flow.id)
+
+    client.read_flow.assert_awaited_once()
+
+
+async def test_reads_through_to_the_client(client: AsyncMock):
+    cache = JobConfigurationCache(client, ttl_seconds=60)
+    variable = Variable(name="my_var", value="hi")
+    client.read_variables.return_value = [variable]
+
+    assert await cache.read_variables() == [variable]